@@ -18,11 +18,30 @@ import numpy as np
 import yaml
 
 from ..core.model_component import Component
-from ..grid import RasterModelGrid
+from ..grid import RasterModelGrid, HexModelGrid, RadialModelGrid
 
 __all__ = ['TimeStepper', 'wrap_as_bmi']
 
 
+_GRID_TYPES = {
+    'raster': RasterModelGrid,
+    'hex': HexModelGrid,
+    'radial': RadialModelGrid,
+}
+
+_BMI_LOCATION = {
+    'node': 'node',
+    'link': 'edge',
+    'patch': 'face',
+    'corner': 'node',
+    'face': 'edge',
+    'cell': 'face',
+}
+
+_PRIMAL_GRID = 0
+_DUAL_GRID = 1
+
+
 class TimeStepper(object):
 
     """Step through time.
@@ -72,7 +91,6 @@ class TimeStepper(object):
             while self._time < self._stop:
                 yield self._time
                 self._time += self._step
-        raise StopIteration()
 
     @property
     def time(self):
@@ -166,6 +184,58 @@ def wrap_as_bmi(cls):
     >>> dz = flexure.get_value('lithosphere_surface__elevation_increment')
     >>> np.all(dz == 0.)
     False
+
+    Values can be copied into a buffer owned by the caller, and read or
+    written at just some of their elements.
+
+    >>> flexure.get_var_type('lithosphere_surface__elevation_increment')
+    'float64'
+    >>> flexure.get_var_nbytes('lithosphere_surface__elevation_increment')
+    6400
+    >>> buffer = np.empty(800)
+    >>> _ = flexure.get_value('lithosphere_surface__elevation_increment',
+    ...                       buffer)
+    >>> np.all(buffer == dz)
+    True
+    >>> edge = np.arange(40)
+    >>> strip = flexure.get_value_at_indices(
+    ...     'lithosphere_surface__elevation_increment', np.empty(40), edge)
+    >>> np.all(strip == dz[:40])
+    True
+    >>> flexure.set_value_at_indices(
+    ...     'lithosphere__overlying_pressure_increment', edge, 2.)
+    >>> flexure.get_value('lithosphere__overlying_pressure_increment')[:3]
+    array([ 2.,  2.,  2.])
+
+    Components on hex and radial grids are on unstructured grids, which
+    are described by the coordinates of their nodes and the nodes of each
+    of their faces.
+
+    >>> from landlab.components import ExponentialWeatherer
+    >>> weatherer = wrap_as_bmi(ExponentialWeatherer)()
+    >>> weatherer.initialize(\"\"\"
+    ... clock:
+    ...     start: 0.
+    ...     stop: 10.
+    ...     step: 1.
+    ... grid:
+    ...     type: hex
+    ...     shape: [3, 2]
+    ... \"\"\")
+    >>> weatherer.get_grid_type(0)
+    'unstructured'
+    >>> weatherer.get_grid_size(0)
+    7
+    >>> weatherer.get_grid_x(0)
+    array([ 0. ,  1. , -0.5,  0.5,  1.5,  0. ,  1. ])
+    >>> weatherer.get_grid_nodes_per_face(0)
+    array([3, 3, 3, 3, 3, 3])
+    >>> weatherer.get_grid_face_nodes(0)[:6]
+    array([3, 0, 1, 3, 2, 0])
+    >>> weatherer.get_grid_shape(0)
+    Traceback (most recent call last):
+    ...
+    ValueError: grid 0 is unstructured, so has no shape, spacing or origin
     """
     if not issubclass(cls, Component):
         raise TypeError('class must inherit from Component')
@@ -232,7 +302,8 @@ def wrap_as_bmi(cls):
                     spacing: [1000., 2000.]
 
             In this case, a `RasterModelGrid` is created (with the given shape
-            and spacing) and passed to the underlying landlab component. The
+            and spacing) and passed to the underlying landlab component. Grids
+            of type *hex* and *radial* are also understood. The
             `eet=15000.` is also given to the component but as a keyword
             parameter. The BMI clock is initialized with the given parameters.
 
@@ -243,15 +314,15 @@ def wrap_as_bmi(cls):
             """
             if os.path.isfile(fname):
                 with open(fname, 'r') as fp:
-                    params = yaml.load(fp)
+                    params = yaml.safe_load(fp)
             else:
-                params = yaml.load(fname)
+                params = yaml.safe_load(fname)
 
             grid_params = params.pop('grid')
             gtype = grid_params.pop('type')
-            if gtype == 'raster':
-                cls = RasterModelGrid
-            else:
+            try:
+                cls = _GRID_TYPES[gtype]
+            except KeyError:
                 raise ValueError(
                     'unrecognized grid type {gtype}'.format(gtype=gtype))
 
@@ -286,21 +357,52 @@ def wrap_as_bmi(cls):
             """Clean-up the component."""
             pass
 
+        def _get_var_location(self, name):
+            """Get the landlab grid element where a variable is defined."""
+            try:
+                return self._cls.var_loc(name)
+            except (AttributeError, KeyError):
+                return 'node'
+
+        def _get_field(self, name):
+            """Get the array that holds a variable's values."""
+            return self._base.grid[self._get_var_location(name)][name]
+
         def get_var_grid(self, name):
-            """Get the grid id for a variable."""
-            return 0
+            """Get the grid id for a variable.
+
+            Variables defined on nodes, links and patches are on grid 0.
+            Those on corners, faces and cells are on its dual, grid 1.
+            """
+            if self._get_var_location(name) in ('node', 'link', 'patch'):
+                return _PRIMAL_GRID
+            else:
+                return _DUAL_GRID
+
+        def get_var_location(self, name):
+            """Get the element of its grid ('node', 'edge' or 'face') on
+            which a variable is defined."""
+            return _BMI_LOCATION[self._get_var_location(name)]
 
         def get_var_itemsize(self, name):
             """Get the size of elements of a variable."""
-            return np.dtype('float').itemsize
+            return np.dtype(self.get_var_type(name)).itemsize
 
         def get_var_nbytes(self, name):
             """Get the total number of bytes used by a variable."""
-            return self.get_itemsize(name) * self._base.grid.number_of_nodes
+            try:
+                return self._get_field(name).nbytes
+            except KeyError:
+                return (self.get_var_itemsize(name) *
+                        self._base.grid.number_of_elements(
+                            self._get_var_location(name)))
 
         def get_var_type(self, name):
             """Get the data type for a variable."""
-            return str(np.dtype('float'))
+            try:
+                return str(self._get_field(name).dtype)
+            except KeyError:
+                return str(np.dtype(self._cls.var_type(name)))
 
         def get_var_units(self, name):
             """Get the unit used by a variable."""
@@ -308,25 +410,105 @@ def wrap_as_bmi(cls):
 
         def get_value_ref(self, name):
             """Get a reference to a variable's data."""
-            return self._base.grid.at_node[name]
+            return self._get_field(name)
+
+        def get_value(self, name, dest=None):
+            """Get a copy of a variable's data.
+
+            Parameters
+            ----------
+            name : str
+                Name of the variable.
+            dest : ndarray, optional
+                Buffer to copy values into. If not given, a new array is
+                allocated.
+
+            Returns
+            -------
+            ndarray
+                The variable's values.
+            """
+            values = self._get_field(name)
+            if dest is None:
+                return values.copy()
+            np.copyto(dest, values.reshape(dest.shape))
+            return dest
+
+        def get_value_at_indices(self, name, dest, inds):
+            """Get a variable's values at some of its elements.
 
-        def get_value(self, name):
-            """Get a copy of a variable's data."""
-            return self._base.grid.at_node[name].copy()
+            Parameters
+            ----------
+            name : str
+                Name of the variable.
+            dest : ndarray or None
+                Buffer, the same size as *inds*, to copy values into. If
+                ``None``, a new array is allocated.
+            inds : array_like of int
+                Elements to get values for.
+
+            Returns
+            -------
+            ndarray
+                Values at *inds*.
+            """
+            return np.take(self._get_field(name), inds, out=dest)
+
+        def _check_is_input(self, name):
+            if name not in self.get_input_var_names():
+                raise KeyError('{name} is not an input item'.format(name=name))
 
         def set_value(self, name, vals):
             """Set the values of a variable."""
-            if name in self.get_input_var_names():
-                if name in self._base.grid.at_node:
-                    self._base.grid.at_node[name][:] = vals.flat
-                else:
-                    self._base.grid.at_node[name] = vals
+            self._check_is_input(name)
+            at = self._base.grid[self._get_var_location(name)]
+            if name in at:
+                at[name][:] = np.reshape(vals, -1)
             else:
-                raise KeyError('{name} is not an input item'.format(name=name))
+                at[name] = np.reshape(vals, -1)
+
+        def set_value_at_indices(self, name, inds, src):
+            """Set a variable's values at some of its elements.
+
+            Parameters
+            ----------
+            name : str
+                Name of the variable.
+            inds : array_like of int
+                Elements to set values for.
+            src : array_like
+                New values, the same size as *inds* (or a scalar).
+            """
+            self._check_is_input(name)
+            at = self._base.grid[self._get_var_location(name)]
+            if name not in at:
+                self._base.grid.add_zeros(self._get_var_location(name), name,
+                                          dtype=self._cls.var_type(name))
+            at[name][inds] = src
+
+        def get_grid_size(self, gid):
+            """Get the number of nodes of a grid."""
+            if gid == _PRIMAL_GRID:
+                return self._base.grid.number_of_nodes
+            else:
+                return self._base.grid.number_of_corners
+
+        def _structured_grid(self, gid):
+            """Get the landlab grid, if a structured one."""
+            grid = self._base.grid
+            if not isinstance(grid, RasterModelGrid):
+                raise ValueError(
+                    'grid {gid} is unstructured, so has no shape, spacing or '
+                    'origin'.format(gid=gid))
+            return grid
 
         def get_grid_origin(self, gid):
             """Get the origin for a structured grid."""
-            return (self._base.grid.node_y[0], self._base.grid.node_x[0])
+            grid = self._structured_grid(gid)
+            origin = (grid.node_y[0], grid.node_x[0])
+            if gid == _DUAL_GRID:
+                origin = (origin[0] + .5 * grid.dy, origin[1] + .5 * grid.dx)
+            return origin
 
         def get_grid_rank(self, gid):
             """Get the number of dimensions of a grid."""
@@ -334,17 +516,149 @@ def wrap_as_bmi(cls):
 
         def get_grid_shape(self, gid):
             """Get the shape of a structured grid."""
-            return (self._base.grid.number_of_node_rows,
-                    self._base.grid.number_of_node_columns)
+            grid = self._structured_grid(gid)
+            shape = (grid.number_of_node_rows, grid.number_of_node_columns)
+            if gid == _DUAL_GRID:
+                shape = (shape[0] - 1, shape[1] - 1)
+            return shape
 
         def get_grid_spacing(self, gid):
             """Get the row and column spacing of a structured grid."""
-            return (self._base.grid.dy, self._base.grid.dx)
+            grid = self._structured_grid(gid)
+            return (grid.dy, grid.dx)
+
+        def _check_has_geometry(self, gid):
+            """Raise an error if the nodes of a grid have no coordinates.
+
+            Corners of landlab grids have no coordinates, so only the dual
+            grid of a raster, whose corners lie on a uniform lattice, can
+            be described.
+            """
+            if (gid == _DUAL_GRID and
+                    not isinstance(self._base.grid, RasterModelGrid)):
+                raise NotImplementedError(
+                    'grid {gid} of a {name} has no node coordinates'.format(
+                        gid=gid, name=self._base.grid.__class__.__name__))
+
+        def _node_coords(self, gid):
+            """Get the x and y coordinates of the nodes of a grid."""
+            self._check_has_geometry(gid)
+            if gid == _PRIMAL_GRID:
+                return self._base.grid.node_x, self._base.grid.node_y
+            n_rows, n_cols = self.get_grid_shape(gid)
+            y0, x0 = self.get_grid_origin(gid)
+            dy, dx = self.get_grid_spacing(gid)
+            y, x = np.meshgrid(y0 + dy * np.arange(n_rows),
+                               x0 + dx * np.arange(n_cols), indexing='ij')
+            return x.reshape((-1, )), y.reshape((-1, ))
+
+        def _nodes_at_face(self, gid):
+            """Get the nodes of each face of a grid, padded with -1."""
+            self._check_has_geometry(gid)
+            if gid == _PRIMAL_GRID:
+                return self._base.grid.nodes_at_patch
+            n_rows, n_cols = self.get_grid_shape(gid)
+            face = np.arange((n_rows - 1) * (n_cols - 1))
+            bottom_left = face + face // (n_cols - 1)
+            return np.column_stack((bottom_left + n_cols + 1,
+                                    bottom_left + n_cols,
+                                    bottom_left,
+                                    bottom_left + 1))
+
+        def get_grid_x(self, gid, dest=None):
+            """Get the x coordinates of the nodes of a grid.
+
+            Parameters
+            ----------
+            gid : int
+                Grid id.
+            dest : ndarray, optional
+                Buffer to copy values into. If not given, a new array is
+                allocated.
+
+            Returns
+            -------
+            ndarray
+                x coordinate of each node.
+            """
+            x = self._node_coords(gid)[0]
+            if dest is None:
+                return x.copy()
+            np.copyto(dest, x)
+            return dest
+
+        def get_grid_y(self, gid, dest=None):
+            """Get the y coordinates of the nodes of a grid.
+
+            Parameters
+            ----------
+            gid : int
+                Grid id.
+            dest : ndarray, optional
+                Buffer to copy values into. If not given, a new array is
+                allocated.
+
+            Returns
+            -------
+            ndarray
+                y coordinate of each node.
+            """
+            y = self._node_coords(gid)[1]
+            if dest is None:
+                return y.copy()
+            np.copyto(dest, y)
+            return dest
+
+        def get_grid_nodes_per_face(self, gid, dest=None):
+            """Get the number of nodes of each face of a grid.
+
+            Parameters
+            ----------
+            gid : int
+                Grid id.
+            dest : ndarray, optional
+                Buffer to copy values into. If not given, a new array is
+                allocated.
+
+            Returns
+            -------
+            ndarray of int
+                Number of nodes of each face.
+            """
+            return np.sum(self._nodes_at_face(gid) != -1, axis=1, out=dest)
+
+        def get_grid_face_nodes(self, gid, dest=None):
+            """Get the nodes of each face of a grid.
+
+            Nodes are listed counter-clockwise around each face, one face
+            after the other.
+
+            Parameters
+            ----------
+            gid : int
+                Grid id.
+            dest : ndarray, optional
+                Buffer to copy values into. If not given, a new array is
+                allocated.
+
+            Returns
+            -------
+            ndarray of int
+                Nodes of each face.
+            """
+            nodes_at_face = self._nodes_at_face(gid)
+            face_nodes = nodes_at_face[nodes_at_face != -1]
+            if dest is None:
+                return face_nodes
+            np.copyto(dest, face_nodes)
+            return dest
 
         def get_grid_type(self, gid):
             """Get the type of grid."""
-            return 'uniform_rectilinear'
-
+            if isinstance(self._base.grid, RasterModelGrid):
+                return 'uniform_rectilinear'
+            else:
+                return 'unstructured'
 
     BmiWrapper.__name__ = cls.__name__
     return BmiWrapper
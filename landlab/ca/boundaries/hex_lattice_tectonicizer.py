@@ -16,7 +16,7 @@ Created on Mon Nov 17 08:01:49 2014
 """
 
 from landlab import HexModelGrid
-from numpy import amax, zeros, arange, array, sqrt
+from numpy import amax, zeros, arange, array, sqrt, concatenate
 
 _DEFAULT_NUM_ROWS = 5
 _DEFAULT_NUM_COLS = 5
@@ -249,6 +249,12 @@ class LatticeNormalFault(HexLatticeTectonicizer):
                 self.num_fw_rows[c] += 1
                 current_row += 1
 
+        # Each offset moves the same nodes, so find them once: the footwall
+        # nodes that take the contents of the node offset from them, and the
+        # base nodes that are filled with new rock.
+        self._shifted_node, self._source_node, self._base_node = \
+            self._find_offset_nodes()
+
         # If we're handling properties and property IDs, we need to do some
         # setup
         if self.propid is not None:
@@ -338,6 +344,63 @@ class LatticeNormalFault(HexLatticeTectonicizer):
             # this object
             self.outgoing_node = array(outgoing_node_list, dtype=int)
 
+    def _find_offset_nodes(self):
+        """Find the nodes whose contents move with each fault offset.
+
+        Returns
+        -------
+        tuple of ndarray of int
+            Nodes that take the contents of another node, the nodes whose
+            contents they take, and the base nodes that are filled with rock.
+
+        Examples
+        --------
+        >>> from landlab import HexModelGrid
+        >>> from landlab.ca.boundaries.hex_lattice_tectonicizer import LatticeNormalFault
+        >>> grid = HexModelGrid(4, 4, 1.0, orientation='vertical', shape='rect', reorient_links=True)
+        >>> lnf = LatticeNormalFault(0.0, grid)
+        >>> shifted, source, base = lnf._find_offset_nodes()
+        >>> shifted
+        array([ 7, 11, 15,  9])
+        >>> source
+        array([1, 5, 9, 2])
+        >>> base
+        array([3, 1, 5, 2])
+        """
+        shifted, source, base = [], [], []
+
+        # Go column-by-column, starting from the right side
+        for c in range(self.nc - 1, self.first_fw_col - 1, -1):
+
+            # Odd-numbered rows are shifted up in the hexagonal, vertically
+            # oriented lattice
+            row_offset = 2 - (c % 2)
+
+            # Number of base nodes in the footwall in this column (1 or 2).
+            n_base_nodes = max(min(self.num_fw_rows[c], row_offset), 1)
+
+            # IDs of the footwall nodes in this column, from the bottom up
+            bottom_node = (c // 2) + ((c % 2) * self.n_even_cols)
+            column = bottom_node + self.nc * arange(max(self.num_fw_rows[c],
+                                                        1))
+
+            # There is nothing to the left of the first column, so all of its
+            # footwall nodes get rock. Elsewhere, the bottom 1 or 2 nodes get
+            # rock, and the rest get the contents of the nodes in the column
+            # to the left and down one or two nodes.
+            if c == 0:
+                base.append(column)
+            else:
+                offset = (self.nc + ((self.nc + 1) // 2) +
+                          ((c + 1) % 2) * ((self.nc + 1) % 2))
+                base.append(column[:n_base_nodes])
+                shifted.append(column[n_base_nodes:])
+                source.append(column[n_base_nodes:] - offset)
+
+        empty = [zeros(0, dtype=int)]
+        return (concatenate(empty + shifted), concatenate(empty + source),
+                concatenate(empty + base))
+
     def do_offset(self, rock_state=1):
         """Apply 60-degree normal-fault offset.
 
@@ -371,55 +434,22 @@ class LatticeNormalFault(HexLatticeTectonicizer):
         # If we need to shift the property ID numbers, we'll first need to
         # record the property IDs in those nodes that are about to "shift off
         # the grid" (or rather, their contents will shift) due to tectonic
-        # motion. We'll call these "nodes to replace".
+        # motion.
         if self.propid is not None:
-
-            # Now, remember the property IDs of the nodes along the right side
-            # and possibly top that are about to shift off the grid
             propids_for_incoming_nodes = self.propid[self.outgoing_node]
-            #print 'pid for new base:',propids_for_incoming_nodes
-
-        # We go column-by-column, starting from the right side
-        for c in range(self.grid.number_of_node_columns - 1,
-                       self.first_fw_col - 1, -1):
-
-            # Odd-numbered rows are shifted up in the hexagonal, vertically
-            # oriented lattice
-            row_offset = 2 - (c % 2)
 
-            # Number of base nodes in the footwall in this column (1 or 2).
-            n_base_nodes = min(self.num_fw_rows[c], row_offset)
-
-            # ID of the bottom footwall node in this column
-            bottom_node = (c // 2) + ((c % 2) * self.n_even_cols)
-
-            # The bottom 1 or 2 nodes in this column are set to rock
-            self.node_state[bottom_node] = rock_state
-            if n_base_nodes == 2:
-                self.node_state[bottom_node+self.nc] = rock_state
-
-            # "indices" here contains the array indices of those nodes in this
-            # column that are to be replaced by the ones in the column to the
-            # left and down one or two nodes. We do this replacement if indices
-            # contains any data.
-            first_repl = bottom_node + n_base_nodes * self.nc
-            last_repl = first_repl + (self.num_fw_rows[c] - \
-                        (n_base_nodes + 1)) * self.nc
-            indices = arange(first_repl, last_repl + 1, self.nc)
-
-            if len(indices) > 0:
-                offset = (self.nc + ((self.nc + 1) // 2) +
-                          ((c + 1) % 2) * ((self.nc + 1) % 2))
-                self.node_state[indices] = self.node_state[indices-offset]
-                if self.propid is not None:
-                    self.propid[indices] = self.propid[indices-offset]
+        # Shift all of the footwall at once. Each column takes the contents
+        # of the column to its left before that column is itself shifted, so
+        # every node gets the old contents of its source.
+        self.node_state[self._shifted_node] = \
+            self.node_state[self._source_node]
+        self.node_state[self._base_node] = rock_state
 
         if self.propid is not None:
+            self.propid[self._shifted_node] = self.propid[self._source_node]
             self.propid[self.incoming_node] = propids_for_incoming_nodes
-            self.prop_data[self.propid[self.incoming_node]] = self.prop_reset_value
-
-        if self.first_fw_col==0:
-            self.node_state[:self.n_footwall_rows[0]] = rock_state
+            self.prop_data[self.propid[self.incoming_node]] = \
+                self.prop_reset_value
 
 
 class LatticeUplifter(HexLatticeTectonicizer):
@@ -455,11 +485,16 @@ class LatticeUplifter(HexLatticeTectonicizer):
                                                         upper_start + \
                                                         n_in_upper)
 
+        # Interior nodes above the bottom row, which take the contents of the
+        # node one full row down with each uplift step.
+        self._uplifted_node = (self.inner_base_row_nodes +
+                               self.nc * arange(1, self.nr).reshape((-1, 1))
+                               ).flatten()
+
         if self.propid is not None:
             self.inner_top_row_nodes = self.inner_base_row_nodes + \
                                        ((self.nr - 1) * self.nc)
 
-
     def uplift_interior_nodes(self, rock_state=1):
         """
         Simulate 'vertical' displacement by shifting contents of node_state
@@ -478,11 +513,10 @@ class LatticeUplifter(HexLatticeTectonicizer):
         """
 
         # Shift the node states up by a full row. A "full row" includes two
-        # staggered rows.
-        for r in range(self.nr - 1, 0, -1):
-            # This row gets the contents of the nodes 1 row down
-            self.node_state[self.inner_base_row_nodes+self.nc*r] = \
-                    self.node_state[self.inner_base_row_nodes+self.nc*(r-1)]
+        # staggered rows. Every row takes the old contents of the row below,
+        # so all rows are shifted at once.
+        self.node_state[self._uplifted_node] = \
+            self.node_state[self._uplifted_node - self.nc]
 
         # Fill the bottom rows with "fresh material" (code = rock_state)
         self.node_state[self.inner_base_row_nodes] = rock_state
@@ -495,11 +529,11 @@ class LatticeUplifter(HexLatticeTectonicizer):
         # If propid (property ID or index) is defined, shift that too.
         if self.propid is not None:
             top_row_propid = self.propid[self.inner_top_row_nodes]
-            for r in range(self.nr-1, 1, -1):
-                self.propid[self.inner_base_row_nodes+self.nc*r] =  \
-                            self.propid[self.inner_base_row_nodes+self.nc*(r-2)]
+            shifted = self._uplifted_node[len(self.inner_base_row_nodes):]
+            self.propid[shifted] = self.propid[shifted - 2 * self.nc]
             self.propid[self.inner_base_row_nodes] = top_row_propid
-            self.prop_data[self.propid[self.inner_base_row_nodes]] = self.prop_reset_value
+            self.prop_data[self.propid[self.inner_base_row_nodes]] = \
+                self.prop_reset_value
 
 
 if __name__=='__main__':
@@ -132,7 +132,7 @@ import pylab as plt
 _USE_CYTHON = True
 
 if _USE_CYTHON:
-    from .cfuncs import do_transition, update_link_states_and_transitions
+    from .cfuncs import TransitionKernel
 
 _NEVER = 1e50
 
@@ -412,10 +412,9 @@ class CellLabCTSModel(object):
 
         # Create an array that knows which links are connected to a boundary
         # node
-        self.bnd_lnk = np.zeros(self.grid.number_of_links, dtype=bool)
-        for link_id in range(self.grid.number_of_links):
-            if self.grid.status_at_node[self.grid.node_at_link_tail[link_id]] != _CORE or self.grid.status_at_node[self.grid.node_at_link_head[link_id]] != _CORE:
-                self.bnd_lnk[link_id] = True
+        self.bnd_lnk = (
+            (self.grid.status_at_node[self.grid.node_at_link_tail] != _CORE) |
+            (self.grid.status_at_node[self.grid.node_at_link_head] != _CORE))
 
         # TEMP DEBUG/PERF TEST
         self.san = np.zeros(self.grid.number_of_nodes, dtype=np.int8)
@@ -618,12 +617,12 @@ class CellLabCTSModel(object):
         """
         self.link_state = np.zeros(self.grid.number_of_links, dtype=int)
 
-        for i in self.grid.active_links:
-            orientation = self.link_orientation[i]
-            node_pair = (self.node_state[self.grid.node_at_link_tail[i]],
-                         self.node_state[self.grid.node_at_link_head[i]],
-                         orientation)
-            self.link_state[i] = self.link_state_dict[node_pair]
+        links = self.grid.active_links
+        self.link_state[links] = (
+            self.link_orientation[links] * self.num_node_states_sq +
+            self.node_state[self.grid.node_at_link_tail[links]] *
+            self.num_node_states +
+            self.node_state[self.grid.node_at_link_head[links]])
 
         if False and _DEBUG:
             print()
@@ -727,11 +726,19 @@ class CellLabCTSModel(object):
         return (orientation * self.num_node_states_sq +
                 tail_node_state * self.num_node_states + head_node_state)
 
-    def update_link_states_and_transitions(self, current_time):
+    def update_link_states_and_transitions(self, current_time, nodes=None):
         """
         Following an "external" change to the node state grid, updates link
         states where necessary and creates any needed events.
 
+        Parameters
+        ----------
+        current_time : float
+            Current time in simulation.
+        nodes : array_like of int, optional
+            IDs of the nodes whose states were changed. If given, only the
+            links attached to these nodes are checked.
+
         Notes
         -----
         **Algorithm**::
@@ -740,29 +747,32 @@ class CellLabCTSModel(object):
                 if the actual node pair is different from the link's code:
                     change the link state to be correct
                     schedule an event
+
+        The links whose node pair has changed are found all at once, so only
+        those links are updated and given new events.
         """
+        if nodes is None:
+            links = self.grid.active_links
+        else:
+            nodes = np.asarray(nodes, dtype=int)
+            links = self.grid.links_at_node[nodes]
+            links = np.unique(
+                links[self.grid.active_link_dirs_at_node[nodes] != 0])
+
+        current_state = (self.link_orientation[links] *
+                         self.num_node_states_sq +
+                         self.node_state[self.grid.node_at_link_tail[links]] *
+                         self.num_node_states +
+                         self.node_state[self.grid.node_at_link_head[links]])
+        changed = current_state != self.link_state[links]
+        links, current_state = links[changed], current_state[changed]
+
         if _USE_CYTHON:
-            update_link_states_and_transitions(self.grid.active_links,
-                                               self.node_state, 
-                                               self.grid.node_at_link_tail,
-                                               self.grid.node_at_link_head,
-                                               self.link_orientation,
-                                               self.bnd_lnk,
-                                               self.link_state,
-                                               self.n_xn,
-                                               self.event_queue,
-                                               self.next_update,
-                                               self.xn_to, self.xn_rate,
-                                               self.num_node_states,
-                                               self.num_node_states_sq,
-                                               current_time,
-                                               self.xn_propswap,
-                                               self.xn_prop_update_fn)
+            TransitionKernel(self).update_links(
+                np.asarray(links, dtype=int), current_time)
         else:
-            for i in self.grid.active_links:
-                current_state = self.current_link_state(i)
-                if current_state != self.link_state[i]:
-                    self.update_link_state(i, current_state, current_time)
+            for i, state in zip(links, current_state):
+                self.update_link_state(i, state, current_time)
 
     def get_next_event(self, link, current_state, current_time):
         """Get the next event for a link.
@@ -1126,6 +1136,9 @@ class CellLabCTSModel(object):
         if node_state_grid is not None:
             self.set_node_state_grid(node_state_grid)
        
+        if _USE_CYTHON:
+            kernel = TransitionKernel(self)
+
         # Continue until we've run out of either time or events
         while self.current_time < run_to and self.event_queue:
 
@@ -1143,22 +1156,7 @@ class CellLabCTSModel(object):
     
                 # ... and execute the transition
                 if _USE_CYTHON:
-                    do_transition(ev, self.next_update,
-                                  self.grid.node_at_link_tail,
-                                  self.grid.node_at_link_head,
-                                  self.node_state, self.link_state,
-                                  self.san, self.link_orientation,
-                                  self.propid, self.prop_data,
-                                  self.n_xn, self.xn_to, self.xn_rate,
-                                  self.grid.links_at_node,
-                                  self.grid.active_link_dirs_at_node,
-                                  self.num_node_states, self.num_node_states_sq,
-                                  self.prop_reset_value, self.xn_propswap,
-                                  self.xn_prop_update_fn,
-                                  self.bnd_lnk, self.event_queue,
-                                  self,
-                                  plot_each_transition,
-                                  plotter)
+                    kernel.do_transition(ev, plot_each_transition, plotter)
                 else:
                     self.do_transition(ev, self.current_time,
                                        plot_each_transition, plotter)
@@ -10,6 +10,8 @@ cimport cython
 from landlab import CORE_NODE
 from _heapq import heappush
 
+_exponential = np.random.exponential
+
 _NEVER = 1.0e50
 
 cdef int _CORE = CORE_NODE
@@ -27,7 +29,7 @@ _DEBUG = False
 
 
 
-class Event():
+cdef class Event:
     """
     Represents a transition event at a link. The transition occurs at a given
     link and a given time, and it involves a transition into the state xn_to
@@ -64,6 +66,12 @@ class Event():
     True
     """
 
+    cdef public DTYPE_t time
+    cdef public DTYPE_INT_t link
+    cdef public DTYPE_INT_t xn_to
+    cdef public object propswap
+    cdef public object prop_update_fn
+
     def __init__(self, time, link, xn_to, propswap=False, prop_update_fn=None):
         """
         Event() constructor sets 3 required properties and one optional
@@ -87,7 +95,7 @@ class Event():
         self.propswap = propswap
         self.prop_update_fn = prop_update_fn
 
-    def __lt__(self, other):
+    def __lt__(self, Event other):
         """
         Overridden less-than operator: returns true if the event on the left
         has an earlier scheduled time than the event on the right
@@ -133,54 +141,6 @@ def current_link_state(DTYPE_INT_t link_id,
             tail_node_state * num_node_states + head_node_state)
 
 
-@cython.boundscheck(False)
-def update_link_states_and_transitions(
-                             np.ndarray[DTYPE_INT_t, ndim=1] active_links,
-                             np.ndarray[DTYPE_INT_t, ndim=1] node_state, 
-                             np.ndarray[DTYPE_INT_t, ndim=1] node_at_link_tail,
-                             np.ndarray[DTYPE_INT_t, ndim=1] node_at_link_head,
-                             np.ndarray[DTYPE_INT8_t, ndim=1] link_orientation,
-                             bnd_lnk,
-                             np.ndarray[DTYPE_INT_t, ndim=1] link_state,
-                             np.ndarray[DTYPE_INT_t, ndim=1] n_xn,
-                             event_queue,
-                             np.ndarray[DTYPE_t, ndim=1] next_update,
-                             np.ndarray[DTYPE_INT_t, ndim=2] xn_to,
-                             np.ndarray[DTYPE_t, ndim=2] xn_rate, 
-                             DTYPE_INT_t num_node_states,
-                             DTYPE_INT_t num_node_states_sq,
-                             DTYPE_t current_time,
-                             xn_propswap, xn_prop_update_fn):
-        """
-        Following an "external" change to the node state grid, updates link
-        states where necessary and creates any needed events.
-
-        Notes
-        -----
-        **Algorithm**::
-
-            FOR each active link:
-                if the actual node pair is different from the link's code:
-                    change the link state to be correct
-                    schedule an event
-        """
-        for i in active_links:
-            current_state = current_link_state(i, node_state,
-                                               node_at_link_tail,
-                                               node_at_link_head,
-                                               link_orientation,
-                                               num_node_states,
-                                               num_node_states_sq)
-            if current_state != link_state[i]:
-                update_link_state(i, current_state, current_time, bnd_lnk,
-                                  node_state, node_at_link_tail,
-                                  node_at_link_head, link_orientation, 
-                                  num_node_states, num_node_states_sq,
-                                  link_state, n_xn, event_queue, next_update, 
-                                  xn_to, xn_rate,xn_propswap,
-                                  xn_prop_update_fn)
-
-
 @cython.boundscheck(False)
 def update_node_states(np.ndarray[DTYPE_INT_t, ndim=1] node_state,
                        np.ndarray[DTYPE_INT8_t, ndim=1] status_at_node,
@@ -197,6 +157,86 @@ def update_node_states(np.ndarray[DTYPE_INT_t, ndim=1] node_state,
 
 
 @cython.boundscheck(False)
+@cython.wraparound(False)
+cdef Event _next_event(DTYPE_INT_t link, DTYPE_INT_t current_state,
+                       DTYPE_t current_time,
+                       DTYPE_INT_t [:] n_xn,
+                       DTYPE_INT_t [:, :] xn_to,
+                       DTYPE_t [:, :] xn_rate,
+                       np.uint8_t [:, :] xn_propswap,
+                       object [:, :] xn_prop_update_fn):
+    """Choose the next event for a link (see get_next_event)."""
+    cdef int i
+    cdef int first = 0
+    cdef double next_time = _NEVER
+    cdef double this_next
+    cdef Event event
+
+    # Find next event time for each potential transition
+    if n_xn[current_state] == 1:
+        next_time = _exponential(1.0 / xn_rate[current_state, 0])
+    else:
+        for i in range(n_xn[current_state]):
+            this_next = _exponential(1.0 / xn_rate[current_state, i])
+            if this_next < next_time:
+                next_time = this_next
+                first = i
+
+    event = Event.__new__(Event)
+    event.time = next_time + current_time
+    event.link = link
+    event.xn_to = xn_to[current_state, first]
+    event.propswap = xn_propswap[current_state, first] != 0
+    event.prop_update_fn = xn_prop_update_fn[current_state, first]
+
+    return event
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef int _update_link_state(DTYPE_INT_t link, DTYPE_INT_t new_link_state,
+                            DTYPE_t current_time,
+                            np.uint8_t [:] bnd_lnk,
+                            DTYPE_INT_t [:] node_state,
+                            const DTYPE_INT_t [:] node_at_link_tail,
+                            const DTYPE_INT_t [:] node_at_link_head,
+                            const DTYPE_INT8_t [:] link_orientation,
+                            DTYPE_INT_t num_node_states,
+                            DTYPE_INT_t num_node_states_sq,
+                            DTYPE_INT_t [:] link_state,
+                            DTYPE_INT_t [:] n_xn,
+                            list event_queue,
+                            DTYPE_t [:] next_update,
+                            DTYPE_INT_t [:, :] xn_to,
+                            DTYPE_t [:, :] xn_rate,
+                            np.uint8_t [:, :] xn_propswap,
+                            object [:, :] xn_prop_update_fn) except -1:
+    """Change the state of a link, and schedule its next event (see
+    update_link_state)."""
+    cdef Event event
+
+    if _DEBUG:
+        print('update_link_state() link ' + str(link) + ' to state ' + str(new_link_state))
+    # If the link connects to a boundary, we might have a different state
+    # than the one we planned
+    if bnd_lnk[link]:
+        new_link_state = (
+            link_orientation[link] * num_node_states_sq +
+            node_state[node_at_link_tail[link]] * num_node_states +
+            node_state[node_at_link_head[link]])
+
+    link_state[link] = new_link_state
+    if n_xn[new_link_state] > 0:
+        event = _next_event(link, new_link_state, current_time, n_xn, xn_to,
+                            xn_rate, xn_propswap, xn_prop_update_fn)
+        heappush(event_queue, event)
+        next_update[link] = event.time
+    else:
+        next_update[link] = _NEVER
+
+    return 0
+
+
 def get_next_event(DTYPE_INT_t link, DTYPE_INT_t current_state, 
                    DTYPE_t current_time, 
                    np.ndarray[DTYPE_INT_t, ndim=1] n_xn,
@@ -235,35 +275,12 @@ def get_next_event(DTYPE_INT_t link, DTYPE_INT_t current_state,
     Assumes that there is at least one potential transition from the
     current state.
     """
-    cdef int my_xn_to
-    cdef int i
-    cdef bint propswap
-    cdef double next_time, this_next
-
     assert (n_xn[current_state] > 0), \
         'must have at least one potential transition'
 
-    # Find next event time for each potential transition
-    if n_xn[current_state] == 1:
-        my_xn_to = xn_to[current_state][0]
-        propswap = xn_propswap[current_state][0]
-        next_time = np.random.exponential(1.0 / xn_rate[current_state][0])
-        prop_update_fn = xn_prop_update_fn[current_state][0]
-    else:
-        next_time = _NEVER
-        my_xn_to = 0
-        propswap = False
-        for i in range(n_xn[current_state]):
-            this_next = np.random.exponential(1.0 / xn_rate[current_state][i])
-            if this_next < next_time:
-                next_time = this_next
-                my_xn_to = xn_to[current_state][i]
-                propswap = xn_propswap[current_state][i]
-                prop_update_fn = xn_prop_update_fn[current_state][i]
-
-    # Create and setup event, and return it
-    my_event = Event(next_time + current_time, link,
-                     my_xn_to, propswap, prop_update_fn)
+    my_event = _next_event(link, current_state, current_time, n_xn, xn_to,
+                           xn_rate, np.asarray(xn_propswap).view(np.uint8),
+                           xn_prop_update_fn)
 
     if _DEBUG:
         print('get_next_event():')
@@ -275,7 +292,6 @@ def get_next_event(DTYPE_INT_t link, DTYPE_INT_t current_state,
     return my_event
 
 
-@cython.boundscheck(False)
 def update_link_state(DTYPE_INT_t link, DTYPE_INT_t new_link_state, 
                       DTYPE_t current_time,
                       bnd_lnk,
@@ -305,181 +321,201 @@ def update_link_state(DTYPE_INT_t link, DTYPE_INT_t new_link_state,
     current_time : float
         Current time in simulation
     """
-    cdef int fns, tns
-    cdef int orientation
-
-    if _DEBUG:
-        print('update_link_state() link ' + str(link) + ' to state ' + str(new_link_state))
-    # If the link connects to a boundary, we might have a different state
-    # than the one we planned
-    # if self.grid.status_at_node[self.grid.link_fromnode[link]]!=_CORE or \
-    #   self.grid.status_at_node[self.grid.link_tonode[link]]!=_CORE:
-    if bnd_lnk[link]:
-        fns = node_state[node_at_link_tail[link]]
-        tns = node_state[node_at_link_head[link]]
-        orientation = link_orientation[link]
-        new_link_state = orientation * num_node_states_sq + \
-            fns * num_node_states + tns
-
-    link_state[link] = new_link_state
-    if n_xn[new_link_state] > 0:
-        event = get_next_event(link, new_link_state, current_time, n_xn, xn_to,
-                               xn_rate, xn_propswap, xn_prop_update_fn)
-        heappush(event_queue, event)
-        next_update[link] = event.time
-    else:
-        next_update[link] = _NEVER
+    _update_link_state(link, new_link_state, current_time,
+                       np.asarray(bnd_lnk).view(np.uint8), node_state,
+                       node_at_link_tail, node_at_link_head, link_orientation,
+                       num_node_states, num_node_states_sq, link_state, n_xn,
+                       event_queue, next_update, xn_to, xn_rate,
+                       np.asarray(xn_propswap).view(np.uint8),
+                       xn_prop_update_fn)
 
 
 @cython.boundscheck(False)
-def do_transition(event,
-                  np.ndarray[DTYPE_t, ndim=1] next_update,                  
-                  np.ndarray[DTYPE_INT_t, ndim=1] node_at_link_tail,                  
-                  np.ndarray[DTYPE_INT_t, ndim=1] node_at_link_head,                  
-                  np.ndarray[DTYPE_INT_t, ndim=1] node_state,            
-                  np.ndarray[DTYPE_INT_t, ndim=1] link_state,
-                  np.ndarray[DTYPE_INT8_t, ndim=1] status_at_node,
-                  np.ndarray[DTYPE_INT8_t, ndim=1] link_orientation,
-                  np.ndarray[DTYPE_INT_t, ndim=1] propid,
-                  prop_data,
-                  np.ndarray[DTYPE_INT_t, ndim=1] n_xn,
-                  np.ndarray[DTYPE_INT_t, ndim=2] xn_to,
-                  np.ndarray[DTYPE_t, ndim=2] xn_rate, 
-                  np.ndarray[DTYPE_INT_t, ndim=2] links_at_node,
-                  np.ndarray[DTYPE_INT8_t, ndim=2] active_link_dirs_at_node,
-                  DTYPE_INT_t num_node_states,
-                  DTYPE_INT_t num_node_states_sq,
-                  DTYPE_INT_t prop_reset_value,
-                  xn_propswap,
-                  xn_prop_update_fn,
-                  bnd_lnk, event_queue,
-                  this_cts_model,
-                  plot_each_transition=False,
-                  plotter=None):
-    """Transition state.
-
-    Implements a state transition.
+@cython.wraparound(False)
+cdef class TransitionKernel:
+    """Carry out the transitions of a CellLab-CTS model.
+
+    A TransitionKernel holds typed views of the arrays of a CTS model so
+    that each transition, and the rescheduling of the links around it, is
+    done without going back to Python for each link.
 
     Parameters
     ----------
-    event : Event object
-        Event object containing the data for the current transition event
-    plot_each_transition : bool (optional)
-        True if caller wants to show a plot of the grid after this
-        transition
-    plotter : CAPlotter object
-        Sent if caller wants a plot after this transition
+    ca : CellLabCTSModel
+        The model whose transitions to carry out.
+    """
 
-    Notes
-    -----
-    First checks that the transition is still valid by comparing the
-    link's next_update time with the corresponding update time in the
-    event object.
+    cdef DTYPE_INT_t [:] node_state
+    cdef const DTYPE_INT_t [:] node_at_link_tail
+    cdef const DTYPE_INT_t [:] node_at_link_head
+    cdef DTYPE_INT_t [:] link_state
+    cdef DTYPE_INT8_t [:] status_at_node
+    cdef const DTYPE_INT8_t [:] link_orientation
+    cdef np.uint8_t [:] bnd_lnk
+    cdef DTYPE_t [:] next_update
+    cdef DTYPE_INT_t [:] propid
+    cdef DTYPE_INT_t [:] n_xn
+    cdef DTYPE_INT_t [:, :] xn_to
+    cdef DTYPE_t [:, :] xn_rate
+    cdef np.uint8_t [:, :] xn_propswap
+    cdef object [:, :] xn_prop_update_fn
+    cdef const DTYPE_INT_t [:, :] links_at_node
+    cdef const DTYPE_INT8_t [:, :] active_link_dirs_at_node
+    cdef DTYPE_INT_t num_node_states
+    cdef DTYPE_INT_t num_node_states_sq
+    cdef list event_queue
+    cdef object prop_data
+    cdef object prop_reset_value
+    cdef object ca
+
+    def __init__(self, ca):
+        self.node_state = ca.node_state
+        # The grid's id arrays may be narrower than the platform integer
+        self.node_at_link_tail = np.asarray(ca.grid.node_at_link_tail,
+                                            dtype=DTYPE_INT)
+        self.node_at_link_head = np.asarray(ca.grid.node_at_link_head,
+                                            dtype=DTYPE_INT)
+        self.link_state = ca.link_state
+        self.status_at_node = ca.san
+        self.link_orientation = ca.link_orientation
+        self.bnd_lnk = np.asarray(ca.bnd_lnk).view(np.uint8)
+        self.next_update = ca.next_update
+        self.propid = ca.propid
+        self.n_xn = ca.n_xn
+        self.xn_to = ca.xn_to
+        self.xn_rate = ca.xn_rate
+        self.xn_propswap = np.asarray(ca.xn_propswap).view(np.uint8)
+        self.xn_prop_update_fn = ca.xn_prop_update_fn
+        self.links_at_node = np.asarray(ca.grid.links_at_node,
+                                        dtype=DTYPE_INT)
+        self.active_link_dirs_at_node = ca.grid.active_link_dirs_at_node
+        self.num_node_states = ca.num_node_states
+        self.num_node_states_sq = ca.num_node_states_sq
+        self.event_queue = ca.event_queue
+        self.prop_data = ca.prop_data
+        self.prop_reset_value = ca.prop_reset_value
+        self.ca = ca
+
+    cdef DTYPE_INT_t current_link_state(self, DTYPE_INT_t link):
+        """State of a link from the states of its nodes."""
+        return (self.link_orientation[link] * self.num_node_states_sq +
+                self.node_state[self.node_at_link_tail[link]] *
+                self.num_node_states +
+                self.node_state[self.node_at_link_head[link]])
+
+    cdef int update_link_state(self, DTYPE_INT_t link,
+                               DTYPE_INT_t new_link_state,
+                               DTYPE_t current_time) except -1:
+        """Change the state of a link, and schedule its next event."""
+        return _update_link_state(link, new_link_state, current_time,
+                                  self.bnd_lnk, self.node_state,
+                                  self.node_at_link_tail,
+                                  self.node_at_link_head,
+                                  self.link_orientation,
+                                  self.num_node_states,
+                                  self.num_node_states_sq, self.link_state,
+                                  self.n_xn, self.event_queue,
+                                  self.next_update, self.xn_to, self.xn_rate,
+                                  self.xn_propswap, self.xn_prop_update_fn)
+
+    cdef int update_links_at_node(self, DTYPE_INT_t node,
+                                  DTYPE_INT_t skip_link,
+                                  DTYPE_t current_time) except -1:
+        """Update the states of the active links of a node, but one."""
+        cdef int i
+        cdef DTYPE_INT_t link
+
+        for i in range(self.links_at_node.shape[1]):
+            link = self.links_at_node[node, i]
+            if self.active_link_dirs_at_node[node, i] != 0 and link != skip_link:
+                self.update_link_state(link, self.current_link_state(link),
+                                       current_time)
+        return 0
+
+    def update_links(self, np.ndarray[DTYPE_INT_t, ndim=1] links,
+                     DTYPE_t current_time):
+        """Update links whose states no longer match their nodes.
 
-    If the transition is valid, we:
+        Parameters
+        ----------
+        links : ndarray of int
+            IDs of the links to check.
+        current_time : float
+            Current time in simulation.
+        """
+        cdef int i
+        cdef DTYPE_INT_t link, current_state
 
-    1. Update the states of the two nodes attached to the link
-    2. Update the link's state, choose its next transition, and push
-       it on the event queue.
-    3. Update the states of the other links attached to the two nodes,
-       choose their next transitions, and push them on the event queue.
-    """
-    cdef int tail_node, head_node  # IDs of tail and head nodes at link
-    cdef int this_link_tail_node   # Tail ID for an adjacent link
-    cdef int this_link_head_node   # Head ID for an adjacent link
-    cdef int link                  # ID of a link
-    cdef int new_link_state        # New link state after transition
-    cdef int tmp                   # Used to exchange property IDs
-    cdef char tail_changed, head_changed,  # Booleans
-    cdef char dir_code             # Direction code for link at node
-    cdef char orientation          # Orientation code for link
-    cdef int i
+        for i in range(links.shape[0]):
+            link = links[i]
+            current_state = self.current_link_state(link)
+            if current_state != self.link_state[link]:
+                self.update_link_state(link, current_state, current_time)
+
+    def do_transition(self, Event event, plot_each_transition=False,
+                      plotter=None):
+        """Transition state.
+
+        Implements a state transition.
+
+        Parameters
+        ----------
+        event : Event object
+            Event object containing the data for the current transition event
+        plot_each_transition : bool (optional)
+            True if caller wants to show a plot of the grid after this
+            transition
+        plotter : CAPlotter object
+            Sent if caller wants a plot after this transition
 
-    # We'll process the event if its update time matches the one we have
-    # recorded for the link in question. If not, it means that the link has
-    # changed state since the event was pushed onto the event queue, and
-    # in that case we'll ignore it.
-    if event.time == next_update[event.link]:
-
-        tail_node = node_at_link_tail[event.link]
-        head_node = node_at_link_head[event.link]
-
-        # Remember the previous state of each node so we can detect whether the
-        # state has changed
-        old_tail_node_state = node_state[tail_node]
-        old_head_node_state = node_state[head_node]
-
-        update_node_states(node_state, status_at_node, tail_node,
-                           head_node, event.xn_to, num_node_states)
-        update_link_state(event.link, event.xn_to, event.time,
-                          bnd_lnk, node_state,
-                          node_at_link_tail,
-                          node_at_link_head,
-                          link_orientation, num_node_states,
-                          num_node_states_sq, link_state,
-                          n_xn, event_queue,
-                          next_update, xn_to, xn_rate,
-                          xn_propswap, xn_prop_update_fn)
+        Notes
+        -----
+        First checks that the transition is still valid by comparing the
+        link's next_update time with the corresponding update time in the
+        event object.
+
+        If the transition is valid, we:
+
+        1. Update the states of the two nodes attached to the link
+        2. Update the link's state, choose its next transition, and push
+           it on the event queue.
+        3. Update the states of the other links attached to the two nodes,
+           choose their next transitions, and push them on the event queue.
+        """
+        cdef DTYPE_INT_t tail_node, head_node
+        cdef DTYPE_INT_t old_tail_node_state, old_head_node_state
+        cdef DTYPE_INT_t tmp
+
+        # We'll process the event if its update time matches the one we have
+        # recorded for the link in question. If not, it means that the link
+        # has changed state since the event was pushed onto the event queue,
+        # and in that case we'll ignore it.
+        if event.time != self.next_update[event.link]:
+            return
+
+        tail_node = self.node_at_link_tail[event.link]
+        head_node = self.node_at_link_head[event.link]
+
+        # Remember the previous state of each node so we can detect whether
+        # the state has changed
+        old_tail_node_state = self.node_state[tail_node]
+        old_head_node_state = self.node_state[head_node]
+
+        if self.status_at_node[tail_node] == _CORE:
+            self.node_state[tail_node] = (
+                (event.xn_to // self.num_node_states) % self.num_node_states)
+        if self.status_at_node[head_node] == _CORE:
+            self.node_state[head_node] = event.xn_to % self.num_node_states
+
+        self.update_link_state(event.link, event.xn_to, event.time)
 
         # Next, when the state of one of the link's nodes changes, we have
         # to update the states of the OTHER links attached to it. This
         # could happen to one or both nodes.
-        if node_state[tail_node] != old_tail_node_state:
-
-            for i in range(links_at_node.shape[1]):
-
-                link = links_at_node[tail_node, i]
-                dir_code = active_link_dirs_at_node[tail_node, i]
-
-                if dir_code != 0 and link != event.link:
-
-                    this_link_tail_node = node_at_link_tail[link]
-                    this_link_head_node = node_at_link_head[link]
-                    orientation = link_orientation[link]
-                    current_pair = (node_state[this_link_tail_node],
-                                    node_state[this_link_head_node],
-                                    orientation)
-                    new_link_state = (
-                        orientation * num_node_states_sq +
-                        node_state[this_link_tail_node] * num_node_states +
-                        node_state[this_link_head_node])
-                    update_link_state(link, new_link_state, event.time,
-                                      bnd_lnk, node_state,
-                                      node_at_link_tail,
-                                      node_at_link_head,
-                                      link_orientation, num_node_states,
-                                      num_node_states_sq, link_state,
-                                      n_xn, event_queue,
-                                      next_update, xn_to, xn_rate,
-                                      xn_propswap, xn_prop_update_fn)
-
-        if node_state[head_node] != old_head_node_state:
-
-            for i in range(links_at_node.shape[1]):
-
-                link = links_at_node[head_node, i]
-                dir_code = active_link_dirs_at_node[head_node, i]
-
-                if dir_code != 0 and link != event.link:
-                    this_link_tail_node = node_at_link_tail[link]
-                    this_link_head_node = node_at_link_head[link]
-                    orientation = link_orientation[link]
-                    current_pair = (node_state[this_link_tail_node],
-                                    node_state[this_link_head_node],
-                                    orientation)
-                    new_link_state = (
-                        orientation * num_node_states_sq +
-                        node_state[this_link_tail_node] * num_node_states +
-                        node_state[this_link_head_node])
-                    update_link_state(link, new_link_state, event.time,
-                                      bnd_lnk, node_state,
-                                      node_at_link_tail,
-                                      node_at_link_head,
-                                      link_orientation, num_node_states,
-                                      num_node_states_sq, link_state,
-                                      n_xn, event_queue,
-                                      next_update, xn_to, xn_rate,
-                                      xn_propswap, xn_prop_update_fn)
+        if self.node_state[tail_node] != old_tail_node_state:
+            self.update_links_at_node(tail_node, event.link, event.time)
+        if self.node_state[head_node] != old_head_node_state:
+            self.update_links_at_node(head_node, event.link, event.time)
 
         # If requested, display a plot of the grid
         if plot_each_transition and (plotter is not None):
@@ -491,14 +527,12 @@ def do_transition(event,
         #   If the event requires a call to a user-defined callback
         # function, we handle that here too.
         if event.propswap:
-            tmp = propid[tail_node]
-            propid[tail_node] = propid[head_node]
-            propid[head_node] = tmp
-            if status_at_node[tail_node] != _CORE:
-                prop_data[propid[tail_node]] = prop_reset_value
-            if status_at_node[head_node] != _CORE:
-                prop_data[propid[head_node]] = prop_reset_value
+            tmp = self.propid[tail_node]
+            self.propid[tail_node] = self.propid[head_node]
+            self.propid[head_node] = tmp
+            if self.status_at_node[tail_node] != _CORE:
+                self.prop_data[self.propid[tail_node]] = self.prop_reset_value
+            if self.status_at_node[head_node] != _CORE:
+                self.prop_data[self.propid[head_node]] = self.prop_reset_value
             if event.prop_update_fn is not None:
-                event.prop_update_fn(
-                    this_cts_model, tail_node, head_node, event.time)
-
+                event.prop_update_fn(self.ca, tail_node, head_node, event.time)
@@ -125,21 +125,14 @@ class OrientedHexCTS(CellLabCTSModel):
         * 1 = up and right (30 degrees clockwise from vertical)
         * 2 = horizontal (90 degrees clockwise from vertical)
         """
-        self.link_orientation = np.zeros(self.grid.number_of_links,
-                                         dtype=np.int8)
-        for i in range(self.grid.number_of_links):
-            dy = self.grid.node_y[self.grid.node_at_link_head[
-                i]] - self.grid.node_y[self.grid.node_at_link_tail[i]]
-            dx = self.grid.node_x[self.grid.node_at_link_head[
-                i]] - self.grid.node_x[self.grid.node_at_link_tail[i]]
-            if dx <= 0.:
-                self.link_orientation[i] = 0
-            elif dy <= 0.:
-                self.link_orientation[i] = 2
-            elif dx > 0. and dy > 0.:
-                self.link_orientation[i] = 1
-            else:
-                assert (False), 'Non-handled link orientation case'
+        dy = (self.grid.node_y[self.grid.node_at_link_head] -
+              self.grid.node_y[self.grid.node_at_link_tail])
+        dx = (self.grid.node_x[self.grid.node_at_link_head] -
+              self.grid.node_x[self.grid.node_at_link_tail])
+        self.link_orientation = np.ones(self.grid.number_of_links,
+                                        dtype=np.int8)
+        self.link_orientation[dy <= 0.] = 2
+        self.link_orientation[dx <= 0.] = 0
 
 
 if __name__ == '__main__':
@@ -127,11 +127,10 @@ class OrientedRasterCTS(CellLabCTSModel):
                                          dtype=np.int8)
 
         # Set its value according to the different in y coordinate between each
-        # link's TO and FROM nodes (the numpy "astype" method turns the
-        # resulting array into integer format)
+        # link's TO and FROM nodes (vertical links rise from tail to head)
         dy = (self.grid.node_y[self.grid.node_at_link_head] -
               self.grid.node_y[self.grid.node_at_link_tail])
-        self.link_orientation = dy.astype(int)
+        self.link_orientation[:] = dy > 0.
 
         if _DEBUG:
             print(self.link_orientation)
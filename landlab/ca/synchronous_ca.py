@@ -0,0 +1,259 @@
+#! /usr/env/python
+"""Synchronous (time-stepped) Landlab cellular automata.
+
+This file defines SynchronousCA, which updates a CellLab-CTS lattice in
+discrete time steps rather than one event at a time. It uses the same
+lattices, node states and Transition lists as the continuous-time models,
+but rather than keeping a queue of events it finds the transitions of all
+links at once in each step.
+
+Within a step of length *dt*, each link draws a time to each of the
+transitions out of its state, just as in the continuous-time model, and
+the earliest of these occurs if it comes within the step. A node can only
+take part in one transition in a step: where the transitions of two links
+share a node, the one that comes first wins and the other is dropped.
+Because its transitions are decided all at once, a synchronous model is
+only a good approximation of the continuous-time one if *dt* is small
+compared with the time between transitions at a link.
+
+Subclasses
+----------
+
+-  SynchronousRasterCA: a RasterCTS lattice
+-  SynchronousOrientedRasterCA: an OrientedRasterCTS lattice
+-  SynchronousHexCA: a HexCTS lattice
+-  SynchronousOrientedHexCA: an OrientedHexCTS lattice
+"""
+
+import numpy as np
+
+from .celllab_cts import _CORE
+from .raster_cts import RasterCTS
+from .oriented_raster_cts import OrientedRasterCTS
+from .hex_cts import HexCTS
+from .oriented_hex_cts import OrientedHexCTS
+
+
+class SynchronousCA(object):
+    """Update a CellLab-CTS lattice in discrete time steps.
+
+    SynchronousCA is a mix-in that is used along with one of the
+    CellLab-CTS lattice classes, which sets up the lattice, its link states
+    and the transition data. It takes the same parameters as the lattice
+    class.
+
+    Examples
+    --------
+    >>> from landlab import RasterModelGrid
+    >>> from landlab.ca.celllab_cts import Transition
+    >>> from landlab.ca.synchronous_ca import SynchronousRasterCA
+
+    >>> mg = RasterModelGrid((5, 6))
+    >>> mg.set_closed_boundaries_at_grid_edges(True, True, True, True)
+    >>> nsd = {0 : 'empty', 1 : 'full'}
+    >>> xnlist = [Transition((1, 0, 0), (0, 1, 0), 1.0, 'right', True),
+    ...           Transition((0, 1, 0), (1, 0, 0), 1.0, 'left', True)]
+    >>> nsg = mg.add_zeros('node', 'node_state_grid', dtype=int)
+    >>> nsg[mg.core_nodes[:6]] = 1
+    >>> ca = SynchronousRasterCA(mg, nsd, xnlist, nsg)
+    >>> ca.run(10., dt=0.1)
+    >>> ca.current_time
+    10.0
+
+    Particles move about, but none are gained or lost.
+
+    >>> nsg[mg.core_nodes].sum()
+    6
+    """
+
+    def __init__(self, *args, **kwds):
+        super(SynchronousCA, self).__init__(*args, **kwds)
+
+        links = self.grid.active_links
+        self._active_links = links
+        self._tail_at_link = self.grid.node_at_link_tail[links]
+        self._head_at_link = self.grid.node_at_link_head[links]
+        self._orientation_state = (self.link_orientation[links] *
+                                   self.num_node_states_sq)
+        self._is_core = self.grid.status_at_node == _CORE
+
+    def push_transitions_to_event_queue(self):
+        """Transitions are found with each step, so there is no queue."""
+        pass
+
+    def update_link_states_and_transitions(self, current_time=None,
+                                           nodes=None):
+        """Update link states after an "external" change to node states.
+
+        Parameters
+        ----------
+        current_time : float, optional
+            Ignored; transitions are found with each step.
+        nodes : array_like of int, optional
+            Ignored; all active links are updated.
+        """
+        self.link_state[self._active_links] = (
+            self._orientation_state +
+            self.node_state[self._tail_at_link] * self.num_node_states +
+            self.node_state[self._head_at_link])
+
+    def _find_transitions(self, dt):
+        """Find the earliest transition of each link within a step.
+
+        Returns
+        -------
+        tuple of ndarray
+            Indices into the active links of those with a transition, the
+            time of each transition, the state of the link and the index of
+            its transition among those out of that state.
+        """
+        state = self.link_state[self._active_links]
+        first_time = np.full(len(state), np.inf)
+        which = np.zeros(len(state), dtype=int)
+
+        for i in range(self.xn_to.shape[1]):
+            (can_change, ) = np.where(self.n_xn[state] > i)
+            time = (np.random.standard_exponential(len(can_change)) /
+                    self.xn_rate[state[can_change], i])
+            is_first = time < first_time[can_change]
+            first_time[can_change[is_first]] = time[is_first]
+            which[can_change[is_first]] = i
+
+        (changes, ) = np.where(first_time < dt)
+        return changes, first_time[changes], state[changes], which[changes]
+
+    def _resolve_conflicts(self, changes, time):
+        """Drop transitions that share a node with an earlier one.
+
+        Returns
+        -------
+        ndarray of bool
+            True for the transitions that occur.
+        """
+        tail = self._tail_at_link[changes]
+        head = self._head_at_link[changes]
+        occurs = np.zeros(len(changes), dtype=bool)
+        is_taken = np.zeros(self.grid.number_of_nodes, dtype=bool)
+
+        # In each round, a transition occurs if it is the earliest of those
+        # at both of its nodes. Its nodes are then taken, and transitions
+        # that share them are dropped.
+        pending = np.arange(len(changes))
+        while len(pending) > 0:
+            earliest = np.full(self.grid.number_of_nodes, np.inf)
+            np.minimum.at(earliest, tail[pending], time[pending])
+            np.minimum.at(earliest, head[pending], time[pending])
+
+            is_first = ((earliest[tail[pending]] == time[pending]) &
+                        (earliest[head[pending]] == time[pending]))
+            occurs[pending[is_first]] = True
+            is_taken[tail[pending[is_first]]] = True
+            is_taken[head[pending[is_first]]] = True
+
+            pending = pending[~(is_taken[tail[pending]] |
+                                is_taken[head[pending]])]
+
+        return occurs
+
+    def step(self, dt, plot_each_step=False, plotter=None):
+        """Advance the model by one time step.
+
+        Parameters
+        ----------
+        dt : float
+            Length of the time step.
+        plot_each_step : bool (optional)
+            Option to display the grid after the step
+        plotter : CAPlotter object (optional)
+            Needed if caller wants to plot after the step
+        """
+        changes, time, state, which = self._find_transitions(dt)
+
+        occurs = self._resolve_conflicts(changes, time)
+        changes, time = changes[occurs], time[occurs]
+        state, which = state[occurs], which[occurs]
+
+        tail = self._tail_at_link[changes]
+        head = self._head_at_link[changes]
+        new_state = self.xn_to[state, which]
+
+        # Only core nodes change state
+        is_core = self._is_core[tail]
+        self.node_state[tail[is_core]] = (
+            (new_state[is_core] // self.num_node_states) %
+            self.num_node_states)
+        is_core = self._is_core[head]
+        self.node_state[head[is_core]] = (new_state[is_core] %
+                                          self.num_node_states)
+
+        self.update_link_states_and_transitions()
+
+        # If requested, display a plot of the grid
+        if plot_each_step and (plotter is not None):
+            plotter.update_plot()
+
+        # If a transition involves an exchange of properties, swap them. No
+        # two transitions share a node, so they can all be swapped at once.
+        swaps = self.xn_propswap[state, which]
+        if np.any(swaps):
+            tail, head = tail[swaps], head[swaps]
+            self.propid[tail], self.propid[head] = (self.propid[head],
+                                                    self.propid[tail])
+            for nodes in (tail, head):
+                is_boundary = ~self._is_core[nodes]
+                self.prop_data[self.propid[nodes[is_boundary]]] = \
+                    self.prop_reset_value
+
+            update_fns = self.xn_prop_update_fn[state[swaps], which[swaps]]
+            for fn, t, tail_node, head_node in zip(
+                    update_fns, time[swaps], tail, head):
+                if fn is not None:
+                    fn(self, tail_node, head_node, self.current_time + t)
+
+        self.current_time += dt
+
+    def run(self, run_to, dt=1., node_state_grid=None, plot_each_step=False,
+            plotter=None):
+        """Run the model forward for a specified period of time.
+
+        Parameters
+        ----------
+        run_to : float
+            Time to run to, starting from self.current_time
+        dt : float, optional
+            Length of each time step. The last step is shortened so as to
+            end at *run_to*.
+        node_state_grid : 1D array of ints (x number of nodes) (optional)
+            Node states (if given, replaces model's current node state grid)
+        plot_each_step : bool (optional)
+            Option to display the grid after each step
+        plotter : CAPlotter object (optional)
+            Needed if caller wants to plot after every step
+        """
+        if node_state_grid is not None:
+            self.set_node_state_grid(node_state_grid)
+            self.update_link_states_and_transitions()
+
+        while self.current_time < run_to:
+            self.step(min(dt, run_to - self.current_time),
+                      plot_each_step=plot_each_step, plotter=plotter)
+
+
+class SynchronousRasterCA(SynchronousCA, RasterCTS):
+    """A RasterCTS lattice that is updated in discrete time steps."""
+    pass
+
+
+class SynchronousOrientedRasterCA(SynchronousCA, OrientedRasterCTS):
+    """An OrientedRasterCTS lattice that is updated in discrete time steps."""
+    pass
+
+
+class SynchronousHexCA(SynchronousCA, HexCTS):
+    """A HexCTS lattice that is updated in discrete time steps."""
+    pass
+
+
+class SynchronousOrientedHexCA(SynchronousCA, OrientedHexCTS):
+    """An OrientedHexCTS lattice that is updated in discrete time steps."""
+    pass
@@ -7,6 +7,7 @@ Created on Thu Jul  9 08:20:06 2015
 @author: gtucker
 """
 
+import numpy as np
 from nose.tools import assert_equal
 from numpy.testing import assert_array_equal
 from landlab import RasterModelGrid, HexModelGrid
@@ -169,5 +170,61 @@ def test_oriented_hex_cts():
     #assert_array_equal(ohcts.link_orientation, [2, 1, 0, 0, 0, 2, 1, 0, 2, 1, 0])
     assert_array_equal(ohcts.link_orientation, [2, 0, 1, 0, 2, 0, 1, 0, 2, 0, 1])
 
+
+def test_update_link_states_after_offset():
+    """Only links whose nodes change state get new events after an offset."""
+    from landlab.ca.boundaries.hex_lattice_tectonicizer import \
+        LatticeNormalFault
+
+    mg = HexModelGrid(6, 6, 1.0, orientation='vertical', shape='rect',
+                      reorient_links=True)
+    nsd = {0 : 'air', 1 : 'rock'}
+    xnlist = []
+    xnlist.append(Transition((1,0,0), (0,1,0), 1.0, 'falling'))
+    nsg = mg.add_zeros('node', 'node_state_grid', dtype=int)
+    nsg[mg.node_y < 2.] = 1
+    hcts = HexCTS(mg, nsd, xnlist, nsg)
+
+    old_next_update = hcts.next_update.copy()
+    old_link_state = hcts.link_state.copy()
+
+    fault = LatticeNormalFault(1.0, mg, nsg)
+    fault.do_offset(rock_state=1)
+    hcts.update_link_states_and_transitions(0.)
+
+    links = mg.active_links
+    expected = (hcts.num_node_states * nsg[mg.node_at_link_tail[links]] +
+                nsg[mg.node_at_link_head[links]])
+    assert_array_equal(hcts.link_state[links], expected)
+
+    unchanged = hcts.link_state == old_link_state
+    assert_array_equal(hcts.next_update[unchanged],
+                       old_next_update[unchanged])
+
+
+def test_update_link_states_at_nodes():
+    """Updating links at changed nodes matches updating all links."""
+    def changed_model():
+        np.random.seed(0)
+        mg = HexModelGrid(6, 6, 1.0, orientation='vertical', shape='rect',
+                          reorient_links=True)
+        nsd = {0 : 'air', 1 : 'rock'}
+        xnlist = []
+        xnlist.append(Transition((1,0,0), (0,1,0), 1.0, 'falling'))
+        nsg = mg.add_zeros('node', 'node_state_grid', dtype=int)
+        nsg[mg.node_y < 2.] = 1
+        hcts = HexCTS(mg, nsd, xnlist, nsg)
+        nsg[[14, 15, 20]] = 1 - nsg[[14, 15, 20]]
+        return hcts
+
+    all_links = changed_model()
+    all_links.update_link_states_and_transitions(0.)
+    at_nodes = changed_model()
+    at_nodes.update_link_states_and_transitions(0., nodes=[14, 15, 20])
+
+    assert_array_equal(at_nodes.link_state, all_links.link_state)
+    assert_array_equal(at_nodes.next_update, all_links.next_update)
+
+
 if __name__ == '__main__':
     test_raster_cts()
\ No newline at end of file
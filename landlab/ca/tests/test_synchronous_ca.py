@@ -0,0 +1,67 @@
+"""Test the synchronous cellular automata."""
+import numpy as np
+from numpy.testing import assert_array_equal
+from nose.tools import assert_equal, assert_true
+
+from landlab import RasterModelGrid, HexModelGrid
+from landlab.ca.celllab_cts import Transition
+from landlab.ca.synchronous_ca import (SynchronousRasterCA,
+                                       SynchronousOrientedHexCA)
+
+
+def test_particles_conserved_on_hex():
+    """Swapping particles neither makes nor loses any, or their properties."""
+    mg = HexModelGrid(12, 10, 1.0, orientation='vertical', shape='rect',
+                      reorient_links=True)
+    mg.set_closed_nodes(mg.boundary_nodes)
+    nsd = {0 : 'empty', 1 : 'full'}
+    xnlist = []
+    xnlist.append(Transition((1,0,0), (0,1,0), 1.0, 'falling', True))
+    xnlist.append(Transition((0,1,1), (1,0,1), 2.0, 'right', True))
+    xnlist.append(Transition((1,0,2), (0,1,2), 0.5, 'left', True))
+    nsg = mg.add_zeros('node', 'node_state_grid', dtype=int)
+    full = mg.core_nodes[::3]
+    nsg[full] = 1
+
+    ca = SynchronousOrientedHexCA(mg, nsd, xnlist, nsg)
+    ca.run(5., dt=0.25)
+
+    assert_equal(ca.current_time, 5.)
+    assert_equal(nsg.sum(), len(full))
+    assert_array_equal(np.sort(ca.propid), np.arange(mg.number_of_nodes))
+    assert_array_equal(np.sort(ca.propid[nsg == 1]), full)
+
+
+def test_one_transition_per_node():
+    """A node takes part in no more than one transition in a step."""
+    mg = RasterModelGrid((8, 9))
+    mg.set_closed_boundaries_at_grid_edges(True, True, True, True)
+    nsd = {0 : 'off', 1 : 'on'}
+    xnlist = []
+    xnlist.append(Transition((0,0,0), (1,1,0), 1000., 'pair'))
+    nsg = mg.add_zeros('node', 'node_state_grid', dtype=int)
+
+    ca = SynchronousRasterCA(mg, nsd, xnlist, nsg)
+    ca.step(1.)
+
+    assert_true(nsg.sum() > 0)
+    assert_equal(nsg.sum() % 2, 0)
+
+
+def test_link_states_after_change():
+    """Link states follow an external change to node states."""
+    mg = RasterModelGrid((4, 5))
+    nsd = {0 : 'off', 1 : 'on'}
+    xnlist = []
+    xnlist.append(Transition((0,1,0), (1,1,0), 1.0, 'spread'))
+    nsg = mg.add_zeros('node', 'node_state_grid', dtype=int)
+    ca = SynchronousRasterCA(mg, nsd, xnlist, nsg)
+
+    nsg[6] = 1
+    ca.update_link_states_and_transitions()
+
+    links = mg.active_links
+    assert_array_equal(ca.link_state[links],
+                       2 * nsg[mg.node_at_link_tail[links]] +
+                       nsg[mg.node_at_link_head[links]])
+    assert_equal(len(ca.event_queue), 0)
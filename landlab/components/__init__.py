@@ -3,7 +3,8 @@ from .diffusion import LinearDiffuser
 from .fire_generator import FireGenerator
 from .detachment_ltd_erosion import DetachmentLtdErosion
 from .flexure import Flexure
-from .flow_routing import FlowRouter, DepressionFinderAndRouter
+from .flow_routing import (FlowRouter, MultipleFlowRouter,
+                           DepressionFinderAndRouter)
 from .nonlinear_diffusion import PerronNLDiffuse
 from .overland_flow import OverlandFlowBates, OverlandFlow
 from .overland_flow import KinematicWaveRengers
@@ -26,7 +27,8 @@ from .depth_dependent_diffusion import DepthDependentDiffuser
 
 
 COMPONENTS = [ChiFinder, LinearDiffuser,
-              Flexure, FlowRouter, DepressionFinderAndRouter,
+              Flexure, FlowRouter, MultipleFlowRouter,
+              DepressionFinderAndRouter,
               PerronNLDiffuse, OverlandFlowBates, OverlandFlow,
               PotentialEvapotranspiration, PotentialityFlowRouter,
               Radiation, SinkFiller, StreamPowerEroder,
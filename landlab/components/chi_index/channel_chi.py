@@ -15,6 +15,8 @@ try:
 except ImportError:
     izip = zip
 
+from landlab.utils.flow_tree import integrate_downstream
+
 
 class ChiFinder(Component):
     """
@@ -355,19 +357,13 @@ class ChiFinder(Component):
         receivers = self.grid.at_node['flow__receiver_node']
         links = self.grid.at_node['flow__link_to_receiver_node']
         link_lengths = self.grid._length_of_link_with_diagonals
-        # because chi_array is all zeros, BC cases where node is receiver
-        # resolve themselves
+        # trapezium rule over the link from each node to its receiver; chi is
+        # zero where nodes are their own receivers
         half_integrand = 0.5 * chi_integrand_at_nodes
-        for node in valid_upstr_order:
-            dstr_node = receivers[node]
-            dstr_link = links[node]
-            if dstr_link != BAD_INDEX_VALUE:
-                dstr_length = link_lengths[dstr_link]
-                half_head_val = half_integrand[node]
-                half_tail_val = half_integrand[dstr_node]
-                mean_val = half_head_val + half_tail_val
-                chi_to_add = mean_val * dstr_length
-                chi_array[node] = chi_array[dstr_node] + chi_to_add
+        chi_to_add = ((half_integrand + half_integrand[receivers]) *
+                      link_lengths[links])
+        integrate_downstream(valid_upstr_order, receivers, chi_to_add,
+                             out=chi_array)
 
     def mean_channel_node_spacing(self, ch_nodes):
         """
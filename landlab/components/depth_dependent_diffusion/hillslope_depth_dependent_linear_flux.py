@@ -220,6 +220,10 @@ class DepthDependentDiffuser(Component):
         self.elev[self._active_nodes] = (self.depth[self._active_nodes]
                                          + self.bedrock[self._active_nodes])
 
+        for name in ('soil__depth', 'bedrock__elevation',
+                     'topographic__elevation'):
+            self.grid.mark_modified('node', name)
+
 
     def run_one_step(self, dt, **kwds):
         """
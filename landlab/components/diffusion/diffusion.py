@@ -547,6 +547,9 @@ class LinearDiffuser(Component):
             vals[self.fixed_grad_nodes] = (vals[self.fixed_grad_anchors] +
                                            self.fixed_grad_offsets)
 
+        if loops > 0:
+            self.grid.mark_modified('node', self.values_to_diffuse)
+
         return self.grid
 
     def run_one_step(self, dt, **kwds):
@@ -12,6 +12,7 @@ import numpy as np
 
 from landlab import Component
 from landlab import FieldError
+from landlab.utils.flow_tree import calc_flow_length
 
 
 class DrainageDensity(Component):
@@ -89,6 +90,7 @@ class DrainageDensity(Component):
 
     _input_var_names = (
         'flow__receiver_node',
+        'flow__upstream_node_order',
         'flow__link_to_receiver_node',
         'channel__mask',
     )
@@ -99,6 +101,7 @@ class DrainageDensity(Component):
 
     _var_units = {
         'flow__receiver_node': '-',
+        'flow__upstream_node_order': '-',
         'flow__link_to_receiver_node': '-',
         'channel__mask': '-',
         'surface_to_channel__minimum_distance': 'm',
@@ -106,6 +109,7 @@ class DrainageDensity(Component):
 
     _var_mapping = {
         'flow__receiver_node': 'node',
+        'flow__upstream_node_order': 'node',
         'flow__link_to_receiver_node': 'node',
         'channel__mask': 'node',
         'surface_to_channel__minimum_distance': 'node',
@@ -115,6 +119,9 @@ class DrainageDensity(Component):
         'flow__receiver_node':
             'Node array of receivers (node that receives flow from current '
             'node)',
+        'flow__upstream_node_order':
+            'Node array containing downstream-to-upstream ordered list of '
+            'node IDs',
         'flow__link_to_receiver_node':
             'ID of link downstream of each node, which carries the discharge',
         'channel__mask':
@@ -142,8 +149,8 @@ class DrainageDensity(Component):
 
             grid.at_node['channel__mask'] = channel__mask
 
-        required = ('flow__receiver_node', 'flow__link_to_receiver_node',
-                    'channel__mask')
+        required = ('flow__receiver_node', 'flow__upstream_node_order',
+                    'flow__link_to_receiver_node', 'channel__mask')
         for name in required:
             if name not in grid.at_node:
                 raise FieldError(
@@ -152,14 +159,14 @@ class DrainageDensity(Component):
         # Store grid
         self._grid = grid
 
-        # for this component to work with Cython acceleration,
-        # the channel_network must be uint8, not bool...
-        self.channel_network = (
-            grid.at_node['channel__mask'].view(dtype=np.uint8))
+        self.channel_network = grid.at_node['channel__mask']
 
         # Flow receivers
         self.flow_receivers = grid.at_node['flow__receiver_node']
 
+        # Nodes ordered from downstream to upstream
+        self.upstream_order = grid.at_node['flow__upstream_node_order']
+
         # Links to receiver nodes
         self.stack_links = grid.at_node['flow__link_to_receiver_node']
 
@@ -184,18 +191,17 @@ class DrainageDensity(Component):
         """Calculate distance to channel and drainage density, after
         Tucker et al., 2001.
 
+        Distances are found in a single pass over nodes, from downstream to
+        upstream: a node is its link length farther from a channel than its
+        receiver. Outlets and pits are treated as channels.
+
         Returns
         -------
         landscape_drainage_density : float (1/m)
             Drainage density over the model domain.
         """
-        from .cfuncs import _calc_dists_to_channel
-        _calc_dists_to_channel(self.channel_network,
-                               self.flow_receivers,
-                               self.grid._length_of_link_with_diagonals,
-                               self.stack_links,
-                               self.distance_to_channel,
-                               self.grid.number_of_nodes)
+        calc_flow_length(self.grid, is_sink=self.channel_network,
+                         out=self.distance_to_channel)
         landscape_drainage_density = 1. / (2.0 * np.mean(self.grid.at_node[
             'surface_to_channel__minimum_distance'][self.grid.core_nodes]))
         # self.distance_to_channel))  # this is THE drainage density
@@ -29,6 +29,8 @@ from .cfuncs import _add_to_stack
 
 import numpy
 
+from landlab.utils.flow_tree import accumulate_upstream
+
 
 class _DrainageStack():
     """
@@ -279,22 +281,18 @@ def find_drainage_area_and_discharge(s, r, node_cell_area=1.0, runoff=1.0,
     # out as the area of the cell in question, then (unless the cell has no
     # donors) grows from there. Discharge starts out as the cell's local runoff
     # rate times the cell's surface area.
-    drainage_area = numpy.zeros(np, dtype=int) + node_cell_area
-    discharge = numpy.zeros(np, dtype=int) + node_cell_area*runoff
+    drainage_area = numpy.zeros(np, dtype=float) + node_cell_area
+    discharge = numpy.zeros(np, dtype=float) + node_cell_area*runoff
 
     # Optionally zero out drainage area and discharge at boundary nodes
     if boundary_nodes is not None:
         drainage_area[boundary_nodes] = 0
         discharge[boundary_nodes] = 0
 
-    # Iterate backward through the list, which means we work from upstream to
-    # downstream.
-    for i in range(np-1, -1, -1):
-        donor = s[i]
-        recvr = r[donor]
-        if donor != recvr:
-            drainage_area[recvr] += drainage_area[donor]
-            discharge[recvr] += discharge[donor]
+    # Work from upstream to downstream, adding each node's values to those of
+    # its receiver.
+    accumulate_upstream(s, r, drainage_area, out=drainage_area)
+    accumulate_upstream(s, r, discharge, out=discharge)
 
     return drainage_area, discharge
 
@@ -1,6 +1,8 @@
 from .route_flow_dn import FlowRouter
+from .route_flow_mfd import MultipleFlowRouter
 from .lake_mapper import DepressionFinderAndRouter
 from .flow_direction_DN import grid_flow_directions, flow_directions
 
-__all__ = ['FlowRouter', 'DepressionFinderAndRouter', 'grid_flow_directions',
+__all__ = ['FlowRouter', 'MultipleFlowRouter', 'DepressionFinderAndRouter',
+           'grid_flow_directions',
            'flow_directions']
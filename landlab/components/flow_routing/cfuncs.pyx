@@ -10,13 +10,25 @@ DTYPE_INT = np.int
 #ctypedef np.longlong_t DTYPE_INT_t
 ctypedef np.int_t DTYPE_INT_t
 
+ctypedef fused DTYPE_FIELD_t:
+    np.float32_t
+    np.float64_t
+
+ctypedef fused DTYPE_SLOPE_t:
+    np.float32_t
+    np.float64_t
+
+ctypedef fused DTYPE_ID_t:
+    np.int32_t
+    np.int64_t
+
 
 @cython.boundscheck(False)
-def adjust_flow_receivers(np.ndarray[DTYPE_INT_t, ndim=1] src_nodes,
-                          np.ndarray[DTYPE_INT_t, ndim=1] dst_nodes,
-                          np.ndarray[DTYPE_FLOAT_t, ndim=1] z,
-                          np.ndarray[DTYPE_FLOAT_t, ndim=1] link_slope,
-                          np.ndarray[DTYPE_INT_t, ndim=1] active_links,
+def adjust_flow_receivers(np.ndarray[DTYPE_ID_t, ndim=1] src_nodes,
+                          np.ndarray[DTYPE_ID_t, ndim=1] dst_nodes,
+                          np.ndarray[DTYPE_FIELD_t, ndim=1] z,
+                          np.ndarray[DTYPE_SLOPE_t, ndim=1] link_slope,
+                          np.ndarray[DTYPE_ID_t, ndim=1] active_links,
                           np.ndarray[DTYPE_INT_t, ndim=1] receiver,
                           np.ndarray[DTYPE_INT_t, ndim=1] receiver_link,
                           np.ndarray[DTYPE_FLOAT_t, ndim=1] steepest_slope):
@@ -25,11 +37,12 @@ def adjust_flow_receivers(np.ndarray[DTYPE_INT_t, ndim=1] src_nodes,
     Parameters
     ----------
     src_nodes : array_like
-        Ordered upstream node ids.
+        Ordered upstream node ids. Node and link ids are either 32 or
+        64-bit integers.
     dst_nodes : array_like
         Node ids of nodes receiving flow.
     z : array_like
-        Node elevations.
+        Node elevations, either single or double precision.
     link_slope : array_like
         Link gradients.
     active_links : array_like
@@ -12,7 +12,8 @@ from six.moves import range
 import numpy as np
 import inspect
 
-from landlab import RasterModelGrid, BAD_INDEX_VALUE, CLOSED_BOUNDARY
+from landlab import (RasterModelGrid, BAD_INDEX_VALUE, CLOSED_BOUNDARY,
+                     CORE_NODE, LOOPED_BOUNDARY)
 from landlab.grid.raster_steepest_descent import (
     _calc_steepest_descent_across_cell_faces)
 from landlab.core.utils import as_id_array
@@ -260,6 +261,226 @@ def flow_directions(elev, active_links, tail_node, head_node, link_slope,
     return receiver, steepest_slope, sink, receiver_link
 
 
+class RasterD8Stencil(object):
+
+    """Steepest-descent (D8) flow directions on a raster grid.
+
+    Slopes from each node with a cell to its eight neighbors are found from
+    shifted views of the elevations, rather than link by link. Neighbors
+    are visited in turn and one replaces the steepest found so far only if
+    its slope is strictly greater, so, in the case of equal slopes, the
+    neighbor visited first is kept. Neighbors are visited in the order
+    that :func:`flow_directions` meets their links. Only neighbors
+    connected by an active link (including diagonal links) can receive
+    flow, so the result is that of :func:`flow_directions` given the
+    raster's D8 active links.
+
+    The stencil holds the buffers that it works in, so finding flow
+    directions allocates no arrays the size of the grid other than the list
+    of sinks. Create a new stencil when the grid's boundary conditions
+    change.
+
+    Nodes on the perimeter of the grid are never given receivers, so the
+    stencil cannot be used if any are core (or looped) nodes (see
+    :meth:`can_route`).
+
+    Parameters
+    ----------
+    grid : RasterModelGrid
+        A raster grid with at least three rows and columns.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab import RasterModelGrid
+    >>> from landlab.components.flow_routing.flow_direction_DN import (
+    ...     RasterD8Stencil)
+    >>> mg = RasterModelGrid((4, 5))
+    >>> z = np.array([5., 0., 5., 5., 5.,
+    ...               5., 1., 2., 2., 5.,
+    ...               5., 3., 4., 3., 5.,
+    ...               5., 5., 5., 5., 5.])
+    >>> stencil = RasterD8Stencil(mg)
+    >>> receiver, slope, sink, link = stencil.flow_directions(
+    ...     z, baselevel_nodes=mg.boundary_nodes)
+    >>> receiver.reshape(mg.shape)
+    array([[ 0,  1,  2,  3,  4],
+           [ 5,  1,  1,  8,  9],
+           [10,  6,  6,  8, 14],
+           [15, 16, 17, 18, 19]])
+    >>> sink
+    array([ 0,  1,  2,  3,  4,  5,  8,  9, 10, 14, 15, 16, 17, 18, 19])
+
+    Node 7 drains along a diagonal link.
+
+    >>> link[[6, 7, 8]]
+    array([ 5, 33, -1])
+    """
+
+    # Neighbors, as (row, column) shifts, in the order that the link-based
+    # search meets them: S, W, E, N by link ID, then SW, SE, NW, NE.
+    _SHIFTS = ((-1, 0), (0, -1), (0, 1), (1, 0),
+               (-1, -1), (-1, 1), (1, -1), (1, 1))
+
+    # Columns of links_at_node (E, N, W, S) and _diagonal_links_at_node
+    # (NE, NW, SW, SE) that hold the link to each neighbor.
+    _ORTHOGONAL_COLUMNS = (3, 2, 0, 1)
+    _DIAGONAL_COLUMNS = (2, 3, 1, 0)
+
+    def __init__(self, grid):
+        n_rows, n_cols = grid.shape
+        self._shape = (n_rows, n_cols)
+        interior_shape = (n_rows - 2, n_cols - 2)
+        n_interior = interior_shape[0] * interior_shape[1]
+
+        self._nodes = np.arange(grid.number_of_nodes)
+        self._interior = as_id_array(
+            self._nodes.reshape(self._shape)[1:-1, 1:-1].flatten())
+
+        # the last direction is for nodes that drain nowhere
+        self._offsets = np.array([row * n_cols + col
+                                  for row, col in self._SHIFTS] + [0])
+        diagonal_length = np.sqrt(grid.dx ** 2. + grid.dy ** 2.)
+        self._lengths = ((grid.dy, grid.dx, grid.dx, grid.dy) +
+                         (diagonal_length, ) * 4)
+
+        links = np.full((9, n_interior), UNDEFINED_INDEX, dtype=int)
+        links[:4] = grid.links_at_node[self._interior][
+            :, self._ORTHOGONAL_COLUMNS].T
+        links[4:8] = grid._diagonal_links_at_node[self._interior][
+            :, self._DIAGONAL_COLUMNS].T
+        self._links = links.reshape(-1)
+
+        is_active = np.zeros(grid._number_of_d8_links, dtype=bool)
+        is_active[grid._d8_active_links()[0]] = True
+        self._is_active = is_active[links[:8]].reshape((8, ) + interior_shape)
+
+        self._slope = np.empty(interior_shape, dtype=float)
+        self._is_steeper = np.empty(interior_shape, dtype=bool)
+        self._steepest = np.empty(n_interior, dtype=float)
+        self._direction = np.empty(n_interior, dtype=np.intp)
+        self._index = np.empty(n_interior, dtype=np.intp)
+        self._receiver = np.empty(n_interior, dtype=int)
+        self._link = np.empty(n_interior, dtype=int)
+        self._first_index = np.arange(n_interior)
+
+        self._buffers = None
+
+    @staticmethod
+    def can_route(grid):
+        """Check if a grid's flow directions can be found with a stencil.
+
+        Parameters
+        ----------
+        grid : ModelGrid
+            A grid.
+
+        Returns
+        -------
+        bool
+            True if the grid is a raster with at least three rows and
+            columns whose perimeter nodes are all boundary nodes (other than
+            looped boundaries).
+
+        Examples
+        --------
+        >>> from landlab import RasterModelGrid, CORE_NODE
+        >>> from landlab.components.flow_routing.flow_direction_DN import (
+        ...     RasterD8Stencil)
+        >>> mg = RasterModelGrid((3, 4))
+        >>> RasterD8Stencil.can_route(mg)
+        True
+        >>> mg.status_at_node[0] = CORE_NODE
+        >>> RasterD8Stencil.can_route(mg)
+        False
+        """
+        if not isinstance(grid, RasterModelGrid) or min(grid.shape) < 3:
+            return False
+        status = grid.status_at_node.reshape(grid.shape)
+        perimeter_status = np.concatenate((status[0], status[-1],
+                                           status[:, 0], status[:, -1]))
+        return not np.any((perimeter_status == CORE_NODE) |
+                          (perimeter_status == LOOPED_BOUNDARY))
+
+    def _buffers_for(self, n_nodes):
+        """Buffers for results, reused from call to call."""
+        if self._buffers is None:
+            self._buffers = (np.empty(n_nodes, dtype=int),
+                             np.empty(n_nodes, dtype=float),
+                             np.empty(n_nodes, dtype=int))
+        return self._buffers
+
+    def flow_directions(self, elev, baselevel_nodes=None, out=None):
+        """Find flow directions.
+
+        Parameters
+        ----------
+        elev : ndarray of float
+            Elevations at nodes.
+        baselevel_nodes : array_like, optional
+            IDs of open boundary (baselevel) nodes.
+        out : tuple of ndarray, optional
+            Arrays in which to place the receivers, steepest slopes and
+            receiver links (for instance, the router's output fields).
+
+        Returns
+        -------
+        tuple of ndarray
+            Receivers, steepest slopes, sinks and receiver links, as for
+            :func:`flow_directions`.
+        """
+        if out is None:
+            out = self._buffers_for(len(elev))
+        receiver, steepest_slope, receiver_link = out
+
+        n_rows, n_cols = self._shape
+        z = elev.reshape(self._shape)
+        center = z[1:-1, 1:-1]
+        slope = self._slope
+        is_steeper = self._is_steeper
+        steepest = self._steepest.reshape(center.shape)
+        direction = self._direction.reshape(center.shape)
+
+        # only a strictly steeper downhill slope replaces the one found so
+        # far, so ties go to the first neighbor
+        steepest.fill(0.)
+        direction.fill(8)
+        for k, (row, col) in enumerate(self._SHIFTS):
+            neighbor = z[1 + row:n_rows - 1 + row, 1 + col:n_cols - 1 + col]
+            np.subtract(center, neighbor, out=slope)
+            np.divide(slope, self._lengths[k], out=slope)
+            np.greater(slope, steepest, out=is_steeper)
+            is_steeper &= self._is_active[k]
+            np.copyto(steepest, slope, where=is_steeper)
+            np.copyto(direction, k, where=is_steeper)
+
+        np.take(self._offsets, self._direction, out=self._receiver)
+        self._receiver += self._interior
+
+        np.multiply(self._direction, len(self._direction), out=self._index)
+        self._index += self._first_index
+        np.take(self._links, self._index, out=self._link)
+
+        receiver[:] = self._nodes
+        receiver.reshape(self._shape)[1:-1, 1:-1] = self._receiver.reshape(
+            center.shape)
+        steepest_slope.fill(0.)
+        steepest_slope.reshape(self._shape)[1:-1, 1:-1] = steepest
+        receiver_link.fill(UNDEFINED_INDEX)
+        receiver_link.reshape(self._shape)[1:-1, 1:-1] = self._link.reshape(
+            center.shape)
+
+        if baselevel_nodes is not None:
+            receiver[baselevel_nodes] = baselevel_nodes
+            receiver_link[baselevel_nodes] = UNDEFINED_INDEX
+            steepest_slope[baselevel_nodes] = 0.
+
+        (sink, ) = np.where(self._nodes == receiver)
+        sink = as_id_array(sink)
+
+        return receiver, steepest_slope, sink, receiver_link
+
+
 if __name__ == '__main__':
     import doctest
     doctest.testmod()
@@ -21,7 +21,7 @@ from landlab import FieldError, Component
 from landlab import FIXED_VALUE_BOUNDARY, FIXED_GRADIENT_BOUNDARY
 from landlab import ModelParameterDictionary
 from landlab import RasterModelGrid, VoronoiDelaunayGrid  # for type tests
-from landlab.utils.decorators import use_file_name_or_kwds
+from landlab.utils.decorators import use_file_name_or_kwds, memoize_on_fields
 import numpy
 
 
@@ -42,7 +42,7 @@ class FlowRouter(Component):
 
     Construction::
 
-        FlowRouter(grid, method='D8', runoff_rate=None)
+        FlowRouter(grid, method='D8', runoff_rate=None, skip_unchanged=False)
 
     Parameters
     ----------
@@ -57,6 +57,11 @@ class FlowRouter(Component):
         'water__unit_flux_in'. If both the field and argument are present at
         the time of initialization, runoff_rate will *overwrite* the field.
         If neither are set, defaults to spatially constant unit input.
+    skip_unchanged : bool, optional
+        If True, :func:`run_one_step` only routes flow if the input fields
+        (or the boundary conditions) have changed since it last ran. Input
+        fields changed in place must then be marked as modified with the
+        grid's *mark_modified* method.
     """
 
     _name = 'DNFlowRouter'
@@ -119,9 +124,11 @@ class FlowRouter(Component):
     }
 
     @use_file_name_or_kwds
-    def __init__(self, grid, method='D8', runoff_rate=None, **kwds):
+    def __init__(self, grid, method='D8', runoff_rate=None,
+                 skip_unchanged=False, **kwds):
         # We keep a local reference to the grid
         self._grid = grid
+        self._skip_unchanged = skip_unchanged
         self._bc_set_code = self.grid.bc_set_code
         if method in ('D8', 'D4', None):
             self.method = method
@@ -148,10 +155,10 @@ class FlowRouter(Component):
             grid.at_node['water__unit_flux_in']
         except FieldError:
             if runoff_rate is None:
-                grid.add_ones('node', 'water__unit_flux_in', dtype=float)
+                grid.add_ones('node', 'water__unit_flux_in')
             else:
                 if type(runoff_rate) in (float, int):
-                    grid.add_empty('node', 'water__unit_flux_in', dtype=float)
+                    grid.add_empty('node', 'water__unit_flux_in')
                     grid.at_node['water__unit_flux_in'].fill(runoff_rate)
                 else:
                     grid.at_node['water__unit_flux_in'] = runoff_rate
@@ -184,8 +191,7 @@ class FlowRouter(Component):
         #   - drainage area at each node
         #   - receiver of each node
         try:
-            self.drainage_area = grid.add_zeros('drainage_area', at='node',
-                                                dtype=float)
+            self.drainage_area = grid.add_zeros('drainage_area', at='node')
         except FieldError:
             self.drainage_area = grid.at_node['drainage_area']
         try:
@@ -195,12 +201,12 @@ class FlowRouter(Component):
             self.receiver = grid.at_node['flow__receiver_node']
         try:
             self.steepest_slope = grid.add_zeros(
-                'topographic__steepest_slope', at='node', dtype=float)
+                'topographic__steepest_slope', at='node')
         except FieldError:
             self.steepest_slope = grid.at_node['topographic__steepest_slope']
         try:
-            self.discharges = grid.add_zeros('surface_water__discharge', at='node',
-                                             dtype=float)
+            self.discharges = grid.add_zeros('surface_water__discharge',
+                                             at='node')
         except FieldError:
             self.discharges = grid.at_node['surface_water__discharge']
         try:
@@ -225,6 +231,7 @@ class FlowRouter(Component):
         """
         # We'll also keep track of the active links; if raster, then these are
         # the "D8" links; otherwise, it's just activelinks
+        self._d8_stencil = None
         if self._is_raster:
             dal, d8t, d8h = self.grid._d8_active_links()
             self._active_links = dal
@@ -337,36 +344,49 @@ class FlowRouter(Component):
         node_cell_area[self._grid.closed_boundary_nodes] = 0.
         # closed cells can't contribute
 
-        # Calculate the downhill-positive slopes at the d8 active links
-        if self.method == 'D8':
-            link_slope = - self._grid._calculate_gradients_at_d8_active_links(
-                elevs)
-        else:
-            link_slope = - self._grid.calc_grad_of_active_link(
-                elevs)
-
         # Find the baselevel nodes
         (baselevel_nodes, ) = numpy.where(
             numpy.logical_or(self._grid.status_at_node == FIXED_VALUE_BOUNDARY,
                              self._grid.status_at_node == FIXED_GRADIENT_BOUNDARY))
 
+        # On a raster, D8 directions are found from a stencil over the
+        # elevations, unless perimeter nodes can also drain.
+        if (self.method == 'D8' and self._d8_stencil is None and
+                flow_direction_DN.RasterD8Stencil.can_route(self._grid)):
+            self._d8_stencil = flow_direction_DN.RasterD8Stencil(self._grid)
+
         # Calculate flow directions
-        if self.method == 'D4':
-            num_d4_active = self._grid.number_of_active_links  # only d4
-            receiver, steepest_slope, sink, recvr_link = \
-                flow_direction_DN.flow_directions(elevs, self._active_links,
-                                         self._activelink_tail[:num_d4_active],
-                                         self._activelink_head[:num_d4_active],
-                                         link_slope,
-                                         grid=self._grid,
-                                         baselevel_nodes=baselevel_nodes)
-        else:  # Voronoi or D8
+        if self.method == 'D8' and self._d8_stencil is not None:
             receiver, steepest_slope, sink, recvr_link = \
-                flow_direction_DN.flow_directions(elevs, self._active_links,
-                                     self._activelink_tail,
-                                     self._activelink_head, link_slope,
-                                     grid=self._grid,
-                                     baselevel_nodes=baselevel_nodes)
+                self._d8_stencil.flow_directions(
+                    elevs, baselevel_nodes=baselevel_nodes,
+                    out=(self._grid['node']['flow__receiver_node'],
+                         self._grid['node']['topographic__steepest_slope'],
+                         self._grid['node']['flow__link_to_receiver_node']))
+        else:
+            # Calculate the downhill-positive slopes at the d8 active links
+            if self.method == 'D8':
+                link_slope = - \
+                    self._grid._calculate_gradients_at_d8_active_links(elevs)
+            else:
+                link_slope = - self._grid.calc_grad_of_active_link(
+                    elevs)
+
+            if self.method == 'D4':
+                num_d4_active = self._grid.number_of_active_links  # only d4
+                receiver, steepest_slope, sink, recvr_link = \
+                    flow_direction_DN.flow_directions(
+                        elevs, self._active_links,
+                        self._activelink_tail[:num_d4_active],
+                        self._activelink_head[:num_d4_active],
+                        link_slope, grid=self._grid,
+                        baselevel_nodes=baselevel_nodes)
+            else:  # Voronoi or D8
+                receiver, steepest_slope, sink, recvr_link = \
+                    flow_direction_DN.flow_directions(
+                        elevs, self._active_links, self._activelink_tail,
+                        self._activelink_head, link_slope, grid=self._grid,
+                        baselevel_nodes=baselevel_nodes)
 
         # TODO: either need a way to calculate and return the *length* of the
         # flow links, OR the caller has to handle the raster / non-raster case.
@@ -388,8 +408,16 @@ class FlowRouter(Component):
                                                                     dtype=bool)
         self._grid['node']['flow__sink_flag'][sink] = True
 
+        for name in self._output_var_names:
+            self._grid.mark_modified('node', name)
+
         return self._grid
 
+    @memoize_on_fields(*_input_var_names)
+    def _route_flow_if_changed(self, **kwds):
+        """Route flow, unless the input fields are unchanged."""
+        return self.route_flow(**kwds)
+
     def run_one_step(self, **kwds):
         """Route surface-water flow over a landscape.
 
@@ -448,8 +476,26 @@ class FlowRouter(Component):
                    0.,   900.,  3700.,     0.,
                    0.,  1300.,  1400.,     0.,
                    0.,     0.,     0.,     0.])
+
+        A router that skips unchanged inputs only routes flow again once
+        the elevations are marked as modified.
+
+        >>> fr = FlowRouter(mg, skip_unchanged=True)
+        >>> fr.run_one_step()
+        >>> elev = mg.at_node['topographic__elevation']
+        >>> elev[10] = 5.
+        >>> fr.run_one_step()
+        >>> mg.at_node['flow__receiver_node'][10]
+        6
+        >>> mg.mark_modified('node', 'topographic__elevation')
+        >>> fr.run_one_step()
+        >>> mg.at_node['flow__receiver_node'][10]
+        10
         """
-        self.route_flow(**kwds)
+        if self._skip_unchanged:
+            self._route_flow_if_changed(**kwds)
+        else:
+            self.route_flow(**kwds)
 
     @property
     def node_drainage_area(self):
@@ -0,0 +1,389 @@
+#! /usr/env/python
+
+"""Calculate multiple-path flow directions.
+
+Given a ModelGrid, divides the flow out of each node among several
+downhill neighbors, and calculates drainage area and discharge.
+
+Receivers, and the proportion of flow that each gets, are kept in
+fixed-width arrays with a row for each node. Nodes are ordered from
+downstream to upstream with a topological sort of the receivers, and flow
+is then accumulated in a single pass over that order.
+"""
+from __future__ import print_function
+
+import numpy
+
+from landlab import (BAD_INDEX_VALUE, CLOSED_BOUNDARY, FIXED_VALUE_BOUNDARY,
+                     FIXED_GRADIENT_BOUNDARY, RasterModelGrid)
+from landlab.components.flow_routing.route_flow_dn import FlowRouter
+from landlab.utils.decorators import use_file_name_or_kwds
+from landlab.utils.flow_tree import calc_upstream_order, accumulate_upstream
+
+
+# For each of the eight triangular facets around a raster node
+# (counterclockwise from east), the cardinal (E, N, W, S) and diagonal
+# (NE, NW, SW, SE) neighbors at its corners.
+_CARDINAL_AT_FACET = numpy.array([0, 1, 1, 2, 2, 3, 3, 0])
+_DIAGONAL_AT_FACET = numpy.array([0, 0, 1, 1, 2, 2, 3, 3])
+
+
+def _partition_among_links(n_nodes, tail, head, slope, is_donor, width,
+                           exponent):
+    """Divide flow among all of the downhill links of each node.
+
+    Parameters
+    ----------
+    n_nodes : int
+        Number of nodes.
+    tail, head : ndarray of int
+        Nodes at the tail and head of each link.
+    slope : ndarray of float
+        Downhill-positive slope from tail to head of each link.
+    is_donor : ndarray of bool
+        Nodes that are allowed to pass on flow.
+    width : int
+        Largest number of receivers of a node.
+    exponent : float
+        Exponent on slope that weights the flow to each receiver.
+
+    Returns
+    -------
+    tuple of ndarray
+        Receivers, weights of the receivers, index of the link to each
+        receiver (into the given links), and slope to each receiver. Each
+        has shape (n_nodes, width).
+    """
+    donor = numpy.where(slope > 0., tail, head)
+    receiver = numpy.where(slope > 0., head, tail)
+    slope = numpy.abs(slope)
+    link = numpy.arange(len(slope))
+
+    (downhill, ) = numpy.where((slope > 0.) & is_donor[donor])
+    downhill = downhill[numpy.argsort(donor[downhill], kind='mergesort')]
+    donor = donor[downhill]
+
+    n_receivers = numpy.bincount(donor, minlength=n_nodes)
+    first_receiver = numpy.cumsum(n_receivers) - n_receivers
+    column = numpy.arange(len(donor)) - first_receiver[donor]
+
+    receivers = numpy.full((n_nodes, width), -1, dtype=int)
+    weights = numpy.zeros((n_nodes, width), dtype=float)
+    links = numpy.full((n_nodes, width), -1, dtype=int)
+    slopes = numpy.zeros((n_nodes, width), dtype=float)
+
+    receivers[donor, column] = receiver[downhill]
+    weights[donor, column] = slope[downhill] ** exponent
+    links[donor, column] = link[downhill]
+    slopes[donor, column] = slope[downhill]
+
+    return receivers, weights, links, slopes
+
+
+def _partition_among_facets(grid, elev, is_donor):
+    """Divide flow between the two nodes of the steepest facet (D-infinity).
+
+    Each raster node is surrounded by eight triangular facets, each with a
+    cardinal and a diagonal neighbor at its corners. Flow leaves in the
+    direction of steepest descent over the steepest facet and is divided
+    between the facet's two neighbors by how close that direction is to
+    each of them (Tarboton, 1997).
+
+    Parameters
+    ----------
+    grid : RasterModelGrid
+        A raster grid.
+    elev : ndarray of float
+        Elevation at each node.
+    is_donor : ndarray of bool
+        Nodes that are allowed to pass on flow.
+
+    Returns
+    -------
+    tuple of ndarray
+        Receivers, weights of the receivers and links to the receivers, each
+        of shape (n_nodes, 2), and the steepest slope at each node.
+    """
+    dx, dy = grid.dx, grid.dy
+    cardinal = grid.neighbors_at_node[:, _CARDINAL_AT_FACET]
+    diagonal = grid._diagonal_neighbors_at_node[:, _DIAGONAL_AT_FACET]
+
+    is_open = grid.status_at_node != CLOSED_BOUNDARY
+    has_cardinal = (cardinal != BAD_INDEX_VALUE) & is_open[cardinal]
+    has_diagonal = (diagonal != BAD_INDEX_VALUE) & is_open[diagonal]
+
+    # distance to the cardinal neighbor, and from it to the diagonal neighbor
+    to_cardinal = numpy.array([dx, dy, dy, dx, dx, dy, dy, dx])
+    across = numpy.array([dy, dx, dx, dy, dy, dx, dx, dy])
+    to_diagonal = numpy.hypot(dx, dy)
+    max_angle = numpy.arctan2(across, to_cardinal)
+
+    slope_to_cardinal = (elev[:, numpy.newaxis] - elev[cardinal]) / to_cardinal
+    slope_across = (elev[cardinal] - elev[diagonal]) / across
+    angle = numpy.arctan2(slope_across, slope_to_cardinal)
+
+    is_inside = (has_cardinal & has_diagonal & (angle > 0.) &
+                 (angle < max_angle))
+
+    # steepest slope along the cardinal edge, the diagonal edge, and inside
+    # each facet
+    candidates = numpy.stack((
+        numpy.where(has_cardinal, slope_to_cardinal, -numpy.inf),
+        numpy.where(has_diagonal,
+                    (elev[:, numpy.newaxis] - elev[diagonal]) / to_diagonal,
+                    -numpy.inf),
+        numpy.where(is_inside, numpy.hypot(slope_to_cardinal, slope_across),
+                    -numpy.inf)), axis=2).reshape((grid.number_of_nodes, -1))
+
+    steepest = numpy.argmax(candidates, axis=1)
+    nodes = numpy.arange(grid.number_of_nodes)
+    steepest_slope = candidates[nodes, steepest]
+    facet, edge = steepest // 3, steepest % 3
+
+    fraction = numpy.where(edge == 0, 0., 1.)
+    fraction[edge == 2] = (angle[nodes, facet] /
+                           max_angle[facet])[edge == 2]
+
+    is_draining = is_donor & (steepest_slope > 0.)
+    steepest_slope[~is_draining] = 0.
+
+    receivers = numpy.column_stack((cardinal[nodes, facet],
+                                    diagonal[nodes, facet]))
+    weights = numpy.column_stack((1. - fraction, fraction))
+    links = numpy.column_stack((
+        grid.links_at_node[nodes, _CARDINAL_AT_FACET[facet]],
+        grid._diagonal_links_at_node[nodes, _DIAGONAL_AT_FACET[facet]]))
+
+    no_flow = (weights == 0.) | ~is_draining[:, numpy.newaxis]
+    receivers[no_flow] = -1
+    weights[no_flow] = 0.
+    links[no_flow] = -1
+
+    return receivers, weights, links, steepest_slope
+
+
+class MultipleFlowRouter(FlowRouter):
+
+    """Multiple-path flow routing.
+
+    Divides the flow out of each node among its downhill neighbors, and
+    calculates drainage area and discharge. Two methods are available:
+
+    *   'MFD' divides flow among all downhill neighbors in proportion to
+        slope raised to an exponent (Freeman, 1991; Quinn et al., 1991).
+        On a raster, neighbors include the diagonals.
+    *   'Dinf' sends flow in the direction of steepest descent over the
+        triangular facets around each node, dividing it between the two
+        nodes that bound that direction (Tarboton, 1997). This method
+        requires a raster grid.
+
+    Receivers of each node, the proportion of flow that goes to each, and
+    the links to them are available as fixed-width arrays (with a row for
+    each node) through :attr:`receivers_at_node`,
+    :attr:`proportions_at_node` and :attr:`links_to_receivers_at_node`.
+    Unused entries are -1 (with a proportion of zero).
+
+    The output fields are those of :class:`FlowRouter`, so that components
+    that read them work unchanged. Drainage area and discharge are those of
+    the divided flow, while *flow__receiver_node* and
+    *flow__link_to_receiver_node* give the receiver that gets the largest
+    share of the flow. *topographic__steepest_slope* is the steepest
+    downhill slope and *flow__upstream_node_order* orders each node after
+    all of its receivers.
+
+    Construction::
+
+        MultipleFlowRouter(grid, method='MFD', partition_exponent=1.1,
+                           runoff_rate=None, skip_unchanged=False)
+
+    Parameters
+    ----------
+    grid : ModelGrid
+        A grid.
+    method : {'MFD', 'Dinf'}, optional
+        Routing method.
+    partition_exponent : float, optional
+        Exponent on slope that weights the flow to each receiver ('MFD'
+        only).
+    runoff_rate : float, optional (m/time)
+        If provided, sets the (spatially constant) runoff rate. See
+        :class:`FlowRouter`.
+    skip_unchanged : bool, optional
+        If True, :func:`run_one_step` only routes flow if the input fields
+        (or the boundary conditions) have changed since it last ran.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab import RasterModelGrid
+    >>> from landlab.components import MultipleFlowRouter
+
+    Flow drains to the open bottom edge of a grid with a valley down its
+    middle column.
+
+    >>> mg = RasterModelGrid((4, 5))
+    >>> z = mg.add_field('node', 'topographic__elevation',
+    ...                  mg.node_y + np.abs(mg.node_x - 2.))
+    >>> mg.set_closed_boundaries_at_grid_edges(True, True, True, False)
+    >>> router = MultipleFlowRouter(mg, partition_exponent=1.)
+    >>> router.run_one_step()
+
+    Flow from the side of the valley is split between the nodes below it,
+    beside it and diagonally below it.
+
+    >>> router.receivers_at_node[11]
+    array([ 6, 12,  7, -1, -1, -1, -1, -1])
+    >>> np.round(router.proportions_at_node[11], 3)
+    array([ 0.293,  0.293,  0.414,  0.   ,  0.   ,  0.   ,  0.   ,  0.   ])
+    >>> np.round(mg.at_node['drainage_area'].reshape(mg.shape), 3)
+    array([[ 0.   ,  0.379,  5.243,  0.379,  0.   ],
+           [ 0.   ,  1.293,  4.172,  1.293,  0.   ],
+           [ 0.   ,  1.   ,  1.586,  1.   ,  0.   ],
+           [ 0.   ,  0.   ,  0.   ,  0.   ,  0.   ]])
+
+    The field of receivers holds the receiver that gets the most flow.
+
+    >>> mg.at_node['flow__receiver_node'][11]
+    7
+
+    D-infinity sends flow down a plane that slopes toward the south-west
+    to the nodes south and south-west of each node.
+
+    >>> z[:] = 2. * mg.node_y + mg.node_x
+    >>> router = MultipleFlowRouter(mg, method='Dinf')
+    >>> router.run_one_step()
+    >>> router.receivers_at_node[12]
+    array([7, 6])
+    >>> np.round(router.proportions_at_node[12], 3)
+    array([ 0.41,  0.59])
+    >>> np.isclose(mg.at_node['topographic__steepest_slope'][12], np.sqrt(5.))
+    True
+    """
+
+    _name = 'MultipleFlowRouter'
+
+    @use_file_name_or_kwds
+    def __init__(self, grid, method='MFD', partition_exponent=1.1,
+                 runoff_rate=None, skip_unchanged=False, **kwds):
+        if method not in ('MFD', 'Dinf'):
+            raise ValueError("method must be 'MFD' or 'Dinf'")
+        if method == 'Dinf' and not isinstance(grid, RasterModelGrid):
+            raise ValueError('D-infinity routing requires a raster grid')
+
+        super(MultipleFlowRouter, self).__init__(
+            grid, method='D8', runoff_rate=runoff_rate,
+            skip_unchanged=skip_unchanged, **kwds)
+
+        self._partition_method = method
+        self._partition_exponent = partition_exponent
+
+        if method == 'Dinf':
+            self._max_receivers = 2
+        elif self._is_raster:
+            self._max_receivers = 8
+        else:
+            self._max_receivers = grid.links_at_node.shape[1]
+
+        self._receivers = numpy.full((grid.number_of_nodes,
+                                      self._max_receivers), -1, dtype=int)
+        self._proportions = numpy.zeros((grid.number_of_nodes,
+                                         self._max_receivers), dtype=float)
+        self._links_to_receivers = numpy.full((grid.number_of_nodes,
+                                               self._max_receivers), -1,
+                                              dtype=int)
+
+    @property
+    def receivers_at_node(self):
+        """Receivers of each node, with a row for each node."""
+        return self._receivers
+
+    @property
+    def proportions_at_node(self):
+        """Proportion of the flow out of each node that goes to each receiver.
+        """
+        return self._proportions
+
+    @property
+    def links_to_receivers_at_node(self):
+        """Links from each node to its receivers."""
+        return self._links_to_receivers
+
+    def route_flow(self, **kwds):
+        """Route surface-water flow over a landscape.
+
+        Routes surface-water flow by (1) dividing the flow out of each node
+        among its receivers, and then (2) accumulating the flow that each
+        node receives from upstream (including from the node itself).
+
+        Returns
+        -------
+        ModelGrid
+            The modified grid object
+        """
+        if self._bc_set_code != self.grid.bc_set_code:
+            self.updated_boundary_conditions()
+            self._bc_set_code = self.grid.bc_set_code
+
+        grid = self._grid
+        n_nodes = grid.number_of_nodes
+        elevs = grid.at_node['topographic__elevation']
+
+        node_cell_area = grid.cell_area_at_node.copy()
+        node_cell_area[grid.closed_boundary_nodes] = 0.
+
+        # flow leaves the grid at baselevel nodes, and closed nodes have none
+        is_donor = ((grid.status_at_node != FIXED_VALUE_BOUNDARY) &
+                    (grid.status_at_node != FIXED_GRADIENT_BOUNDARY) &
+                    (grid.status_at_node != CLOSED_BOUNDARY))
+
+        if self._partition_method == 'Dinf':
+            receivers, weights, links, steepest_slope = (
+                _partition_among_facets(grid, elevs, is_donor))
+        else:
+            if self._is_raster:
+                link_slope = - grid._calculate_gradients_at_d8_active_links(
+                    elevs)
+            else:
+                link_slope = - grid.calc_grad_of_active_link(elevs)
+            receivers, weights, links, slopes = _partition_among_links(
+                n_nodes, self._activelink_tail, self._activelink_head,
+                link_slope, is_donor, self._max_receivers,
+                self._partition_exponent)
+            links = numpy.where(links >= 0, self._active_links[links], -1)
+            steepest_slope = slopes.max(axis=1)
+
+        # nodes with no downhill neighbors are their own receivers
+        is_sink = receivers.max(axis=1) < 0
+        receivers[is_sink, 0] = numpy.where(is_sink)[0]
+        weights[is_sink, 0] = 1.
+        links[is_sink, 0] = BAD_INDEX_VALUE
+
+        self._receivers[:] = receivers
+        self._proportions[:] = weights / weights.sum(axis=1, keepdims=True)
+        self._links_to_receivers[:] = links
+
+        upstream_order = calc_upstream_order(self._receivers)
+        runoff = grid.at_node['water__unit_flux_in']
+
+        dominant = numpy.argmax(self._proportions, axis=1)
+        nodes = numpy.arange(n_nodes)
+
+        accumulate_upstream(upstream_order, self._receivers, node_cell_area,
+                            proportion=self._proportions,
+                            out=grid.at_node['drainage_area'])
+        accumulate_upstream(upstream_order, self._receivers,
+                            node_cell_area * runoff,
+                            proportion=self._proportions,
+                            out=grid.at_node['surface_water__discharge'])
+        grid.at_node['flow__receiver_node'][:] = self._receivers[nodes,
+                                                                 dominant]
+        grid.at_node['topographic__steepest_slope'][:] = steepest_slope
+        grid.at_node['flow__upstream_node_order'][:] = upstream_order
+        grid.at_node['flow__link_to_receiver_node'][:] = (
+            self._links_to_receivers[nodes, dominant])
+        grid.at_node['flow__sink_flag'][:] = is_sink
+
+        for name in self._output_var_names:
+            grid.mark_modified('node', name)
+
+        return grid
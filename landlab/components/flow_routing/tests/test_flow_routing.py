@@ -426,3 +426,60 @@ def test_voronoi_closedinternal():
     assert_array_almost_equal(vmg.at_node['drainage_area'][vmg.core_nodes],
                               A_target_internal)
     assert_almost_equal(vmg.at_node['drainage_area'][12], A_target_outlet)
+
+
+def test_skip_unchanged():
+    """Test the router reroutes once another component changes elevations.
+    """
+    from landlab.components import LinearDiffuser
+
+    mg = RasterModelGrid((5, 6))
+    mg.add_field('node', 'topographic__elevation',
+                 mg.node_x ** 2 + mg.node_y)
+    diffuse = LinearDiffuser(mg, linear_diffusivity=1.)
+    fr = FlowRouter(mg, skip_unchanged=True)
+
+    fr.run_one_step()
+    mg.at_node['drainage_area'][:] = 0.
+    fr.run_one_step()
+    assert_array_equal(mg.at_node['drainage_area'], 0.)
+
+    diffuse.run_one_step(1.)
+    fr.run_one_step()
+
+    expected = RasterModelGrid((5, 6))
+    expected.add_field('node', 'topographic__elevation',
+                       mg.at_node['topographic__elevation'], copy=True)
+    FlowRouter(expected).run_one_step()
+    assert_array_equal(mg.at_node['drainage_area'],
+                       expected.at_node['drainage_area'])
+
+
+def test_d8_stencil_matches_links():
+    """Test D8 directions from the raster stencil match the link search.
+    """
+    from landlab.components.flow_routing.flow_direction_DN import (
+        flow_directions, RasterD8Stencil)
+
+    np.random.seed(2016)
+    for spacing in ((1., 1.), (2., 3.)):
+        mg = RasterModelGrid((12, 15), spacing=spacing)
+        # integer elevations, so that many slopes are tied
+        z = np.random.randint(0, 5, mg.number_of_nodes).astype(float)
+        mg.set_closed_boundaries_at_grid_edges(True, False, True, False)
+        mg.status_at_node[[40, 41, 100]] = CLOSED_BOUNDARY
+        mg.status_at_node[70] = landlab.FIXED_VALUE_BOUNDARY
+
+        baselevel_nodes = np.where(
+            (mg.status_at_node == landlab.FIXED_VALUE_BOUNDARY) |
+            (mg.status_at_node == landlab.FIXED_GRADIENT_BOUNDARY))[0]
+        links, tails, heads = mg._d8_active_links()
+        expected = flow_directions(
+            z, links, tails, heads,
+            - mg._calculate_gradients_at_d8_active_links(z),
+            baselevel_nodes=baselevel_nodes)
+        actual = RasterD8Stencil(mg).flow_directions(
+            z, baselevel_nodes=baselevel_nodes)
+
+        for expected_values, actual_values in zip(expected, actual):
+            assert_array_equal(actual_values, expected_values)
@@ -0,0 +1,106 @@
+"""Test the multiple-path flow router."""
+import numpy as np
+from numpy.testing import assert_array_almost_equal
+
+from nose.tools import assert_raises, assert_true
+
+from landlab import RasterModelGrid, HexModelGrid
+from landlab.components.flow_routing import MultipleFlowRouter
+
+
+def _rough_slope(grid):
+    """Add rough elevations that rise away from the bottom of a grid."""
+    np.random.seed(1973)
+    grid.add_field('node', 'topographic__elevation',
+                   grid.node_y + np.random.rand(grid.number_of_nodes))
+
+
+def _assert_flow_conserved(grid, router):
+    """All flow reaches a sink, and none is lost on the way."""
+    assert_array_almost_equal(router.proportions_at_node.sum(axis=1), 1.)
+
+    is_sink = grid.at_node['flow__sink_flag'].astype(bool)
+    area = grid.cell_area_at_node.copy()
+    area[grid.closed_boundary_nodes] = 0.
+    assert_array_almost_equal(grid.at_node['drainage_area'][is_sink].sum(),
+                              area.sum())
+
+
+def _assert_upstream_of_receivers(grid, router):
+    """Each node comes after its receivers in the upstream order."""
+    position = np.empty(grid.number_of_nodes, dtype=int)
+    position[grid.at_node['flow__upstream_node_order']] = np.arange(
+        grid.number_of_nodes)
+
+    receivers = router.receivers_at_node
+    donors = np.arange(grid.number_of_nodes).repeat(receivers.shape[1])
+    receivers = receivers.flatten()
+    has_receiver = (receivers >= 0) & (receivers != donors)
+    assert_true(np.all(position[donors[has_receiver]] >
+                       position[receivers[has_receiver]]))
+
+
+def test_mfd_on_raster():
+    """MFD routing on a raster conserves flow."""
+    grid = RasterModelGrid((20, 30))
+    _rough_slope(grid)
+    router = MultipleFlowRouter(grid)
+    router.run_one_step()
+
+    _assert_flow_conserved(grid, router)
+    _assert_upstream_of_receivers(grid, router)
+
+
+def test_mfd_on_hex():
+    """MFD routing on a hex grid conserves flow."""
+    grid = HexModelGrid(12, 15)
+    _rough_slope(grid)
+    router = MultipleFlowRouter(grid)
+    router.run_one_step()
+
+    assert_true(router.receivers_at_node.shape == (grid.number_of_nodes, 6))
+    _assert_flow_conserved(grid, router)
+    _assert_upstream_of_receivers(grid, router)
+
+
+def test_dinf_on_raster():
+    """D-infinity routing sends flow to at most two nodes."""
+    grid = RasterModelGrid((20, 30), spacing=(2., 3.))
+    _rough_slope(grid)
+    grid.set_closed_boundaries_at_grid_edges(True, True, True, False)
+    router = MultipleFlowRouter(grid, method='Dinf')
+    router.run_one_step()
+
+    assert_true(router.receivers_at_node.shape == (grid.number_of_nodes, 2))
+    _assert_flow_conserved(grid, router)
+    _assert_upstream_of_receivers(grid, router)
+
+
+def test_dinf_on_plane():
+    """D-infinity divides flow over a plane by its direction of descent."""
+    grid = RasterModelGrid((5, 6))
+    grid.add_field('node', 'topographic__elevation',
+                   3. * grid.node_y + grid.node_x)
+    router = MultipleFlowRouter(grid, method='Dinf')
+    router.run_one_step()
+
+    fraction = np.arctan(1. / 3.) / (np.pi / 4.)
+    for node in grid.core_nodes:
+        assert_array_almost_equal(router.proportions_at_node[node],
+                                  [1. - fraction, fraction])
+        assert_true(list(router.receivers_at_node[node]) ==
+                    [node - 6, node - 7])
+
+
+def test_dinf_requires_raster():
+    """D-infinity routing is only for rasters."""
+    grid = HexModelGrid(4, 5)
+    grid.add_zeros('node', 'topographic__elevation')
+    assert_raises(ValueError, MultipleFlowRouter, grid, method='Dinf')
+
+
+def test_bad_method():
+    """Only MFD and D-infinity routing are known."""
+    grid = RasterModelGrid((4, 5))
+    grid.add_zeros('node', 'topographic__elevation')
+    assert_raises(ValueError, MultipleFlowRouter, grid, method='D8')
@@ -254,11 +254,11 @@ class PotentialEvapotranspiration(Component):
             Observed radiation (W/m^2)
         """
 
-        if self._method == 'Constant':
-            self._PET_value = const_potential_evapotranspiration
-        elif self._method == 'PriestleyTaylor':
-            self._PET_value = (
-                self._PriestleyTaylor(current_time, Tmax, Tmin, Tavg))
+        self._PET_value = self._calc_pet_value(
+            current_time, const_potential_evapotranspiration, Tmin, Tmax,
+            Tavg, obs_radiation)
+
+        if self._method == 'PriestleyTaylor':
             self._cell_values['radiation__incoming_shortwave_flux'] = (
                 self._Rs *
                 self._cell_values['radiation__ratio_to_flat_surface'])
@@ -271,15 +271,6 @@ class PotentialEvapotranspiration(Component):
             self._cell_values['radiation__net_flux'] = (
                 self._Rn *
                 self._cell_values['radiation__ratio_to_flat_surface'])
-        elif self._method == 'MeasuredRadiationPT':
-            Robs = obs_radiation
-            self._PET_value = self._MeasuredRadPT(Tavg, (1-self._a)*Robs)
-        elif self._method == 'Cosine':
-            self._J = np.floor((current_time - np.floor(current_time)) * 365.)
-            self._PET_value = (
-                max((self._TmaxF_mean + self._DeltaD / 2. *
-                     np.cos((2 * np.pi) * (self._J - self._LT - self._ND / 2) /
-                            self._ND)), 0.0))
 
         self._PET = (
             self._PET_value *
@@ -287,6 +278,101 @@ class PotentialEvapotranspiration(Component):
         self._cell_values['surface__potential_evapotranspiration_rate'][:] = (
             self._PET)
 
+    def calc_potential_evapotranspiration(
+            self, current_time=None, const_potential_evapotranspiration=12.,
+            Tmin=0., Tmax=1., Tavg=0.5, obs_radiation=350.,
+            radiation_factor=None):
+        """Calculate potential evapotranspiration for a series of times.
+
+        Calculate, at once, the potential evapotranspiration of each cell at
+        each of a series of times. This gives the same values as calling
+        :func:`update` at each time, but doesn't set any fields.
+
+        Parameters:
+        ----------
+        current_time: array_like of float, required only for 'Cosine' method
+            Current times (Years)
+        constant_potential_evapotranspiration: array_like of float, optional
+            for 'Constant' method
+            Constant PET value to be spatially distributed.
+        Tmin: array_like of float, required for 'Priestley Taylor' method
+            Minimum temperature of the day (deg C)
+        Tmax: array_like of float, required for 'Priestley Taylor' method
+            Maximum temperature of the day (deg C)
+        Tavg: array_like of float, required for 'Priestley Taylor' and
+            'MeasuredRadiationPT' methods
+            Average temperature of the day (deg C)
+        obs_radiation array_like of float, required for
+            'MeasuredRadiationPT' method
+            Observed radiation (W/m^2)
+        radiation_factor: array_like of float, optional
+            Ratio of radiation on each cell to that on a flat surface, either
+            for all times, `(n_cells, )`, or at each time,
+            `(n_times, n_cells)`. If not given, use the
+            *radiation__ratio_to_flat_surface* field.
+
+        Returns
+        -------
+        ndarray of float, shape `(n_times, n_cells)`
+            Potential evapotranspiration at each time on each cell.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from landlab import RasterModelGrid
+        >>> from landlab.components import Radiation
+        >>> from landlab.components.pet import PotentialEvapotranspiration
+
+        >>> grid = RasterModelGrid((5, 4), spacing=(10., 10.))
+        >>> z = grid.add_field('node', 'topographic__elevation',
+        ...                    grid.node_y * 0.1)
+        >>> rad = Radiation(grid)
+        >>> PET = PotentialEvapotranspiration(grid)
+
+        >>> days = np.arange(365.) / 365.
+        >>> radf = rad.calc_ratio_to_flat_surface(days)
+        >>> pet = PET.calc_potential_evapotranspiration(
+        ...     days, radiation_factor=radf)
+        >>> pet.shape
+        (365, 6)
+
+        >>> rad.update(days[100])
+        >>> PET.update(days[100])
+        >>> rate = grid.at_cell['surface__potential_evapotranspiration_rate']
+        >>> np.all(pet[100] == rate)
+        True
+        """
+        if current_time is None:
+            current_time = 0.
+        args = np.broadcast_arrays(*[np.atleast_1d(arg) for arg in (
+            current_time, const_potential_evapotranspiration, Tmin, Tmax,
+            Tavg, obs_radiation)])
+        pet_value = self._calc_pet_value(*[arg.astype(float) for arg in args])
+
+        if radiation_factor is None:
+            radiation_factor = self._cell_values[
+                'radiation__ratio_to_flat_surface']
+
+        return pet_value[:, np.newaxis] * radiation_factor
+
+    def _calc_pet_value(self, current_time, const_potential_evapotranspiration,
+                        Tmin, Tmax, Tavg, obs_radiation):
+        """PET of a flat surface for the chosen method."""
+        if self._method == 'Constant':
+            return const_potential_evapotranspiration
+        elif self._method == 'PriestleyTaylor':
+            return self._PriestleyTaylor(current_time, Tmax, Tmin, Tavg)
+        elif self._method == 'MeasuredRadiationPT':
+            Robs = obs_radiation
+            return self._MeasuredRadPT(Tavg, (1-self._a)*Robs)
+        elif self._method == 'Cosine':
+            self._J = np.floor((current_time - np.floor(current_time)) * 365.)
+            return (
+                np.maximum((self._TmaxF_mean + self._DeltaD / 2. *
+                            np.cos((2 * np.pi) *
+                                   (self._J - self._LT - self._ND / 2) /
+                                   self._ND)), 0.0))
+
     def _PriestleyTaylor(self, current_time, Tmax, Tmin, Tavg):
 
         # Julian Day - ASCE-EWRI Task Committee Report, Jan-2005 - Eqn 25, (52)
@@ -315,10 +401,9 @@ class PotentialEvapotranspiration(Component):
         # Jan-2005 - Eqn 29,(61)
         self._x = 1.0 - (((np.tan(self._phi)) ** 2.0) *
                          (np.tan(self._sdecl) ** 2.0))
-        if self._x <= 0:
-            self._x = 0.00001
-            # Sunset Hour Angle - ASCE-EWRI Task Committee Report,
-            # Jan-2005 - Eqn 28,(60)
+        self._x = np.where(self._x <= 0, 0.00001, self._x)
+        # Sunset Hour Angle - ASCE-EWRI Task Committee Report,
+        # Jan-2005 - Eqn 28,(60)
         self._ws = ((np.pi / 2.0) -
                     np.arctan((- 1 * np.tan(self._phi) *
                                np.tan(self._sdecl)) / (self._x ** 2.0)))
@@ -334,7 +419,8 @@ class PotentialEvapotranspiration(Component):
         # Clear-sky Solar Radiation - ASCE-EWRI Task Committee Report,
         # Jan-2005 - Eqn 19, (47)
         self._Rso = (0.75 + ((2.0 * (10 ** (- 5.0))) * self._z)) * self._Ra
-        self._Rs = min(self._Krs * self._Ra * np.sqrt(Tmax - Tmin), self._Rso)
+        self._Rs = np.minimum(self._Krs * self._Ra * np.sqrt(Tmax - Tmin),
+                              self._Rso)
 
         # Net Short Wave Radiation - ASCE-EWRI Task Committee Report,
         # Jan-2005 - Eqn 16, (43)
@@ -342,15 +428,10 @@ class PotentialEvapotranspiration(Component):
 
         # Relative Cloudiness - ASCE-EWRI Task Committee Report,
         # Jan-2005 - Page 20,35
-        if self._Rso > 0:
-            self._u = self._Rs / self._Rso
-        else:
-            self._u = 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self._u = np.where(self._Rso > 0, self._Rs / self._Rso, 0)
 
-        if self._u < 0.3:
-            self._u = 0.3
-        elif self._u > 1:
-            self._u = 1.0
+        self._u = np.clip(self._u, 0.3, 1.0)
 
         # Cloudiness Function - ASCE-EWRI Task Committee Report,
         # Jan-2005 - Eqn 18, (45)
@@ -367,8 +448,9 @@ class PotentialEvapotranspiration(Component):
         # Jan-2005 - Eqn 15, (42)
         self._Rn = self._Rns - self._Rnl
 
-        self._ETp = max(self._alpha * (self._delta / (self._delta + self._y)) *
-                        (self._Rn / self._pwhv), 0)
+        self._ETp = np.maximum(
+            self._alpha * (self._delta / (self._delta + self._y)) *
+            (self._Rn / self._pwhv), 0)
 
         return self._ETp
 
@@ -380,6 +462,7 @@ class PotentialEvapotranspiration(Component):
         # Slope of Saturation Vapor Pressure - ASCE-EWRI Task Committee Report,
         # Jan-2005 - Eqn 5, (36)
         self._delta = (4098.0 * self._es) / ((237.3 + Tavg) ** 2.0)
-        self._ETp = max(self._alpha * (self._delta / (self._delta + self._y)) *
-                        (Rnobs / self._pwhv), 0)
+        self._ETp = np.maximum(
+            self._alpha * (self._delta / (self._delta + self._y)) *
+            (Rnobs / self._pwhv), 0)
         return self._ETp
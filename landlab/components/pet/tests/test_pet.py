@@ -105,4 +105,25 @@ def test_field_initialized_to_zero():
         assert_array_almost_equal(field, np.zeros(PET.grid.number_of_nodes))
     for name in PET.grid['cell']:
         field = PET.grid['cell'][name]
-        assert_array_almost_equal(field, np.zeros(PET.grid.number_of_cells))
\ No newline at end of file
+        assert_array_almost_equal(field, np.zeros(PET.grid.number_of_cells))
+
+
+def test_pet_at_many_times():
+    grid = RasterModelGrid((5, 6), spacing=10e0)
+    PET = PotentialEvapotranspiration(grid, method='PriestleyTaylor')
+    grid.at_cell['radiation__ratio_to_flat_surface'][:] = np.linspace(
+        0.5, 1.5, grid.number_of_cells)
+
+    times = np.linspace(0., 1., 13)
+    tmin = np.linspace(-5., 10., 13)
+    tmax = tmin + 15.
+    pet = PET.calc_potential_evapotranspiration(
+        times, Tmin=tmin, Tmax=tmax, Tavg=(tmin + tmax) / 2.)
+    assert_equal(pet.shape, (13, grid.number_of_cells))
+
+    for i in range(len(times)):
+        PET.update(times[i], Tmin=tmin[i], Tmax=tmax[i],
+                   Tavg=(tmin[i] + tmax[i]) / 2.)
+        assert_array_almost_equal(
+            grid.at_cell['surface__potential_evapotranspiration_rate'],
+            pet[i])
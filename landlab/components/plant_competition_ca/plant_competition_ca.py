@@ -280,9 +280,9 @@ class VegCA(Component):
         self._live_index = 1 - self._CumWS      # Plant live index = 1 - WS
         bare_cells = np.where(self._VegType == BARE)[0]
         n_bare = len(bare_cells)
-        first_ring = self.grid.get_looped_cell_neighbor_list(bare_cells)
-        second_ring =                                                   \
-            self.grid.get_second_ring_looped_cell_neighbor_list(bare_cells)
+        first_ring = self.grid.looped_neighbors_at_cell[bare_cells]
+        second_ring = \
+            self.grid.second_ring_looped_neighbors_at_cell[bare_cells]
         veg_type_fr = self._VegType[first_ring]
         veg_type_sr = self._VegType[second_ring]
         Sh_WS_fr = WS_PFT(veg_type_fr, SHRUB, self._live_index[first_ring])
@@ -353,20 +353,53 @@ class VegCA(Component):
 
 
 def count(Arr, value):
-    Res = np.zeros(Arr.shape[0], dtype=int)
-    x, y = Arr.shape
-    for i in range(0, x):
-        for j in range(0, y):
-            if Arr[i][j] == value:
-                Res[i] += 1
-    return Res
+    """Count the neighbors of each cell that are of a plant type.
+
+    Parameters
+    ----------
+    Arr : ndarray of int, shape (n_cells, n_neighbors)
+        Plant types of the neighbors of each cell.
+    value : int
+        Plant type to count.
+
+    Returns
+    -------
+    ndarray of int
+        Number of neighbors of each cell that are of the plant type.
+
+    Examples
+    --------
+    >>> from landlab.components.plant_competition_ca.plant_competition_ca import count
+    >>> count(np.array([[0, 1, 1], [3, 3, 3]]), 1)
+    array([2, 0])
+    """
+    return np.sum(Arr == value, axis=1)
 
 
 def WS_PFT(VegType, PlantType, WS):
-    Phi = np.zeros(WS.shape[0])
-    x, y = WS.shape
-    for i in range(0, x):
-        for j in range(0, y):
-            if VegType[i][j] == PlantType:
-                Phi[i] += WS[i][j]
-    return Phi
+    """Sum a value over the neighbors of each cell that are of a plant type.
+
+    Parameters
+    ----------
+    VegType : ndarray of int, shape (n_cells, n_neighbors)
+        Plant types of the neighbors of each cell.
+    PlantType : int
+        Plant type to sum over.
+    WS : ndarray of float, shape (n_cells, n_neighbors)
+        Values at the neighbors of each cell.
+
+    Returns
+    -------
+    ndarray of float
+        Sum of the values at the neighbors of each cell that are of the
+        plant type.
+
+    Examples
+    --------
+    >>> from landlab.components.plant_competition_ca.plant_competition_ca import WS_PFT
+    >>> phi = WS_PFT(np.array([[0, 1, 1], [3, 3, 3]]), 1,
+    ...              np.array([[.5, .25, .5], [1., 1., 1.]]))
+    >>> phi.tolist()
+    [0.75, 0.0]
+    """
+    return np.sum(np.where(VegType == PlantType, WS, 0.), axis=1)
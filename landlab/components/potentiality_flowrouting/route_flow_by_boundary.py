@@ -12,8 +12,10 @@ Created on Fri Feb 20 09:32:27 2015
 # Could suppress by mirroring the diagonals
 
 import numpy as np
+import scipy.sparse as sparse
+import scipy.sparse.linalg as linalg
 from landlab import RasterModelGrid, Component, FieldError, INACTIVE_LINK, \
-    CLOSED_BOUNDARY, CORE_NODE
+    CLOSED_BOUNDARY, CORE_NODE, BAD_INDEX_VALUE
 import inspect
 from landlab.utils.decorators import use_file_name_or_kwds
 
@@ -51,7 +53,8 @@ class PotentialityFlowRouter(Component):
     Construction::
 
         PotentialityFlowRouter(grid, method='D8', flow_equation='default',
-                     Chezys_C=30., Mannings_n=0.03)
+                     Chezys_C=30., Mannings_n=0.03, tolerance=1.e-12,
+                     max_iterations=10)
 
     Note
     ----
@@ -76,6 +79,10 @@ class PotentialityFlowRouter(Component):
         Required if flow_equation == 'Chezy'.
     Mannings_n : float (optional)
         Required if flow_equation == 'Manning'.
+    tolerance : float (optional)
+        Relative residual to which the flow potential is solved.
+    max_iterations : int (optional)
+        Maximum number of refinements of the flow potential per call.
 
     Examples
     --------
@@ -94,6 +101,15 @@ class PotentialityFlowRouter(Component):
     >>> np.allclose(mg.at_node['surface_water__discharge'][mg.core_nodes],
     ...             Q_at_core_nodes)
     True
+
+    The potential from each step is used as the starting guess for the
+    next, so if nothing has changed no further iterations are needed.
+
+    >>> potfr.iterations > 0
+    True
+    >>> potfr.run_one_step()
+    >>> potfr.iterations
+    0
     """
     _name = 'PotentialityFlowRouter'
 
@@ -140,7 +156,8 @@ class PotentialityFlowRouter(Component):
 
     @use_file_name_or_kwds
     def __init__(self, grid, method='D8', flow_equation='default',
-                 Chezys_C=30., Mannings_n=0.03, **kwds):
+                 Chezys_C=30., Mannings_n=0.03, tolerance=1.e-12,
+                 max_iterations=10, **kwds):
         """Initialize flow router.
         """
         if RasterModelGrid in inspect.getmro(grid.__class__):
@@ -157,6 +174,9 @@ class PotentialityFlowRouter(Component):
             self.chezy_C = Chezys_C
         elif self.equation == 'Manning':
             self.manning_n = Mannings_n
+        self._tolerance = tolerance
+        self._max_iterations = max_iterations
+        self._iterations = 0
         assert method in ('D8', 'D4')
         if method == 'D8':
             self.route_on_diagonals = True
@@ -202,8 +222,6 @@ class PotentialityFlowRouter(Component):
         z = grid.at_node['topographic__elevation']
         qwater_in = grid.at_node['water__unit_flux_in'].copy()
         qwater_in[grid.node_at_cell] *= grid.area_of_cell
-        prev_K = self._K.copy()
-        mismatch = 10000.
         # do the ortho nodes first, in isolation
         g = grid.calc_grad_at_link(z)
         if self.equation != 'default':
@@ -222,13 +240,9 @@ class PotentialityFlowRouter(Component):
         pos_incoming_link_grads = (-link_grad_at_node_w_dir).clip(0.)
 
         if not self.route_on_diagonals or not self._raster:
-            while mismatch > 1.e-6:
-                K_link_ends = self._K[grid.neighbors_at_node]
-                incoming_K_sum = (pos_incoming_link_grads*K_link_ends
-                                  ).sum(axis=1) + self._min_slope_thresh
-                self._K[:] = (incoming_K_sum + qwater_in)/outgoing_sum
-                mismatch = np.sum(np.square(self._K-prev_K))
-                prev_K = self._K.copy()
+            self._solve_for_potential(grid.neighbors_at_node,
+                                      pos_incoming_link_grads, outgoing_sum,
+                                      qwater_in)
 
             upwind_K = grid.map_value_at_max_node_to_link(z, self._K)
             self._discharges_at_link[:] = upwind_K * g
@@ -246,16 +260,11 @@ class PotentialityFlowRouter(Component):
 
             outgoing_sum += np.sum(diag_grad_at_node_w_dir.clip(0.), axis=1)
             pos_incoming_diag_grads = (-diag_grad_at_node_w_dir).clip(0.)
-            while mismatch > 1.e-6:
-                K_link_ends = self._K[grid.neighbors_at_node]
-                K_diag_ends = self._K[grid._diagonal_neighbors_at_node]
-                incoming_K_sum = ((pos_incoming_link_grads * K_link_ends
-                                   ).sum(axis=1) +
-                                  (pos_incoming_diag_grads * K_diag_ends
-                                   ).sum(axis=1) + self._min_slope_thresh)
-                self._K[:] = (incoming_K_sum + qwater_in) / outgoing_sum
-                mismatch = np.sum(np.square(self._K - prev_K))
-                prev_K = self._K.copy()
+            self._solve_for_potential(
+                np.hstack((grid.neighbors_at_node,
+                           grid._diagonal_neighbors_at_node)),
+                np.hstack((pos_incoming_link_grads, pos_incoming_diag_grads)),
+                outgoing_sum, qwater_in)
 
             # ^this is necessary to suppress stupid apparent link Qs at flow
             # edges, if present.
@@ -288,6 +297,66 @@ class PotentialityFlowRouter(Component):
         else:
             pass
 
+    def _solve_for_potential(self, neighbors, incoming_grads, outgoing_sum,
+                             qwater_in):
+        """Solve for the potential field, K.
+
+        At every node the potential satisfies
+        ``K * outgoing_sum = sum(incoming_grads * K[neighbors]) + qwater_in``.
+        Rather than iterating this to convergence, solve the equivalent
+        linear system for the discharge, ``Q = K * outgoing_sum``,
+        ``(I - W) Q = qwater_in``, where ``W`` holds the fraction of the
+        discharge of each donor that goes to each receiver. Water only flows
+        downhill so, with nodes ordered from highest to lowest, the system
+        is lower triangular and factors without fill. The solution is then
+        refined, starting from the potential of the previous call, until
+        the relative residual is less than the tolerance.
+
+        Parameters
+        ----------
+        neighbors : ndarray of int, shape (n_nodes, n_neighbors)
+            Neighbors of each node.
+        incoming_grads : ndarray of float, shape (n_nodes, n_neighbors)
+            Gradients of flow from each neighbor into each node.
+        outgoing_sum : ndarray of float, shape (n_nodes, )
+            Sum of outgoing gradients at each node.
+        qwater_in : ndarray of float, shape (n_nodes, )
+            Water input to each node.
+        """
+        n_nodes = self.grid.number_of_nodes
+        z = self.grid.at_node['topographic__elevation']
+        rank = np.empty(n_nodes, dtype=int)
+        rank[np.argsort(- z, kind='mergesort')] = np.arange(n_nodes)
+
+        is_incoming = (incoming_grads > 0.) & (neighbors != BAD_INDEX_VALUE)
+        receivers = np.where(is_incoming)[0]
+        donors = neighbors[is_incoming]
+        fractions = incoming_grads[is_incoming] / outgoing_sum[donors]
+        flow_matrix = (
+            sparse.identity(n_nodes, format='csc') -
+            sparse.csc_matrix((fractions, (rank[receivers], rank[donors])),
+                              shape=(n_nodes, n_nodes)))
+
+        source = np.empty(n_nodes, dtype=float)
+        source[rank] = qwater_in + self._min_slope_thresh
+        discharge = np.empty(n_nodes, dtype=float)
+        discharge[rank] = self._K * outgoing_sum
+
+        residual = source - flow_matrix.dot(discharge)
+        max_residual = self._tolerance * np.linalg.norm(source)
+        lu = None
+        self._iterations = 0
+        while (np.linalg.norm(residual) > max_residual and
+               self._iterations < self._max_iterations):
+            if lu is None:
+                lu = linalg.splu(flow_matrix, permc_spec='NATURAL',
+                                 diag_pivot_thresh=0.)
+            discharge += lu.solve(residual)
+            residual = source - flow_matrix.dot(discharge)
+            self._iterations += 1
+
+        np.divide(discharge[rank], outgoing_sum, out=self._K)
+
     def run_one_step(self, **kwds):
         """Route surface-water flow over a landscape.
 
@@ -295,6 +364,15 @@ class PotentialityFlowRouter(Component):
         """
         self.route_flow(**kwds)
 
+    @property
+    def iterations(self):
+        """Number of iterations used by the last call to route_flow.
+
+        This is zero if the potential of the previous call was already a
+        solution.
+        """
+        return self._iterations
+
     @property
     def discharges_at_links(self):
         """Return the discharges at links.
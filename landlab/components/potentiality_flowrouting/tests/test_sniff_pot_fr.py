@@ -186,3 +186,23 @@ def test_in_network():
     assert_allclose(mg.at_node['surface_water__discharge'], flux)
     assert_allclose(mg.at_node['flow__potential'][mg.core_nodes],
                     potnt[mg.core_nodes])
+
+
+def test_warm_start():
+    mg = RasterModelGrid((NROWS, NCOLS), (DX, DX))
+    z = mg.add_field('node', 'topographic__elevation',
+                     (3000. - mg.node_x) * 0.5)
+    mg.add_ones('node', 'water__unit_flux_in')
+
+    pfr = PotentialityFlowRouter(mg, method='D4')
+    pfr.route_flow()
+    assert pfr.iterations > 0
+    flux = mg.at_node['surface_water__discharge'].copy()
+
+    pfr.route_flow()
+    assert pfr.iterations == 0
+    assert_array_equal(mg.at_node['surface_water__discharge'], flux)
+
+    z[mg.core_nodes] += 1.
+    pfr.route_flow()
+    assert pfr.iterations > 0
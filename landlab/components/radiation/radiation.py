@@ -1,6 +1,6 @@
 
 from landlab import Component
-from ...utils.decorators import use_file_name_or_kwds
+from ...utils.decorators import use_file_name_or_kwds, memoize_on_fields
 import numpy as np
 
 
@@ -185,85 +185,167 @@ class Radiation(Component):
 
         self._nodal_values = self.grid['node']
         self._cell_values = self.grid['cell']
+        self._calc_slope_and_aspect()
+
+    @memoize_on_fields(*_input_var_names)
+    def _calc_slope_and_aspect(self):
+        """Slope and aspect of cells, unless elevations are unchanged.
+
+        Returns
+        -------
+        tuple of ndarray
+            Cosine of slope, sine of slope, and aspect of each cell.
+        """
         self._slope, self._aspect = \
-            grid.calculate_slope_aspect_at_nodes_burrough(
+            self.grid.calculate_slope_aspect_at_nodes_burrough(
                 vals='topographic__elevation')
-#        self._slope = grid.calc_slope_of_node( \
-#                                elevs = 'topographic__elevation')
-#        self._aspect =
         self._cell_values['Slope'] = self._slope
         self._cell_values['Aspect'] = self._aspect
 
-    def update(self, current_time, hour=12., **kwds):
-        """Update fields with current loading conditions.
+        return np.cos(self._slope), np.sin(self._slope), self._aspect
+
+    def _calc_sun_position(self, current_time, hour):
+        """Altitude and azimuth of the sun.
 
         Parameters
         ----------
-        current_time: float
+        current_time: array_like of float
               Current time (years).
-        hour: float, optional
+        hour: array_like of float
               Hour of the day.
+
+        Returns
+        -------
+        tuple of ndarray
+            Solar altitude and azimuth (radians) at each time.
         """
-        self._t = hour
-        self._radf = self._cell_values['radiation__ratio_to_flat_surface']
-        self._Rs = self._cell_values['radiation__incoming_shortwave_flux']
-        self._Rnet = self._cell_values['radiation__net_shortwave_flux']
+        current_time, hour = np.broadcast_arrays(
+            np.atleast_1d(current_time), np.atleast_1d(hour))
 
-        self._julian = np.floor((current_time - np.floor(current_time)) *
-                                365.25)    # Julian day
+        julian = np.floor((current_time - np.floor(current_time)) *
+                          365.25)    # Julian day
 
-        self._phi = np.radians(self._latitude)    # Latitude in Radians
+        phi = np.radians(self._latitude)    # Latitude in Radians
 
-        self._delta = 23.45 * np.radians(
-            np.cos(2*np.pi / 365 * (172 - self._julian)))   # Declination angle
+        delta = 23.45 * np.radians(
+            np.cos(2*np.pi / 365 * (172 - julian)))   # Declination angle
 
-        self._tau = (self._t + 12.0) * np.pi / 12.0     # Hour angle
+        tau = (hour + 12.0) * np.pi / 12.0     # Hour angle
 
-        self._alpha = np.arcsin(np.sin(self._delta) * np.sin(self._phi) +
-                                np.cos(self._delta) * np.cos(self._phi) *
-                                np.cos(self._tau))     # Solar Altitude
+        alpha = np.arcsin(np.sin(delta) * np.sin(phi) +
+                          np.cos(delta) * np.cos(phi) *
+                          np.cos(tau))     # Solar Altitude
 
-        if self._alpha <= 0.25 * np.pi / 180.0:    # If altitude is -ve,
-            self._alpha = 0.25 * np.pi / 180.0     # sun is beyond the horizon
+        # If altitude is -ve, sun is beyond the horizon
+        alpha[alpha <= 0.25 * np.pi / 180.0] = 0.25 * np.pi / 180.0
 
-        self._Rgl = (self._Io * np.exp((-1) * self._n * (
-            0.128 - 0.054 * np.log10(1. / np.sin(self._alpha)))*(
-                1. / np.sin(self._alpha))))
-        # Counting for Albedo, Cloudiness and Atmospheric turbidity
+        phisun = (np.arctan(- np.sin(tau) / (np.tan(delta) *
+                  np.cos(phi) - np.sin(phi) *
+                  np.cos(tau))))      # Sun's Azhimuth
+        phisun[((phisun >= 0) & (- np.sin(tau) <= 0)) |
+               ((phisun <= 0) & (- np.sin(tau) >= 0))] += np.pi
 
-        self._phisun = (np.arctan(- np.sin(self._tau) / (np.tan(self._delta) *
-                        np.cos(self._phi) - np.sin(self._phi) *
-                        np.cos(self._tau))))      # Sun's Azhimuth
-        if (self._phisun >= 0 and - np.sin(self._tau) <= 0):
-            self._phisun = self._phisun + np.pi
+        return alpha, phisun
 
-        elif (self._phisun <= 0 and - np.sin(self._tau) >= 0):
-            self._phisun = self._phisun + np.pi
+    def _calc_ratio(self, alpha, phisun):
+        """Ratio of radiation on cells to that on a flat surface.
 
-        self._flat = (np.cos(np.arctan(0)) * np.sin(self._alpha) +
-                      np.sin(np.arctan(0)) * np.cos(self._alpha) *
-                      np.cos(self._phisun - 0))   # flat surface reference
+        Returns
+        -------
+        ndarray of float, shape `(n_times, n_cells)`
+            Ratio of incident radiation at each time on each cell.
+        """
+        cos_slope, sin_slope, aspect = self._calc_slope_and_aspect()
+        alpha, phisun = alpha[:, np.newaxis], phisun[:, np.newaxis]
 
-        self._Rsflat = self._Rgl * self._flat
-        # flat surface total incoming shortwave radiation
+        flat = (np.cos(np.arctan(0)) * np.sin(alpha) +
+                np.sin(np.arctan(0)) * np.cos(alpha) *
+                np.cos(phisun - 0))   # flat surface reference
 
-        self._Rnetflat = ((1 - self._A) * (1 - 0.65 * (self._N ** 2)) *
-                          self._Rsflat)
-        # flat surface Net incoming shortwave radiation
+        sloped = (cos_slope * np.sin(alpha) +
+                  sin_slope * np.cos(alpha) *
+                  np.cos(phisun - aspect))
 
-        self._sloped = (np.cos(self._slope) * np.sin(self._alpha) +
-                        np.sin(self._slope) * np.cos(self._alpha) *
-                        np.cos(self._phisun - self._aspect))
+        radf = sloped / flat
 
-        self._radf = self._sloped / self._flat
+        radf[radf <= 0.] = 0.
+        radf[radf > 6.] = 6.
 
-        self._radf[self._radf <= 0.] = 0.
-        self._radf[self._radf > 6.] = 6.
+        return radf
 
-        self._Rs = self._Rsflat * self._radf
-        # Sloped surface Toatl Incoming Shortwave Radn
-        self._Rnet = self._Rnetflat * self._radf
+    def calc_ratio_to_flat_surface(self, current_time, hour=12.):
+        """Ratio of radiation on cells to that on a flat surface.
+
+        Calculate, at once, the ratio of total incident shortwave radiation
+        on each cell to that on a flat surface for a series of times. This
+        gives the same values as calling :func:`update` at each time, but
+        doesn't set any fields.
 
-        self._cell_values['radiation__ratio_to_flat_surface'] = self._radf
-        self._cell_values['radiation__incoming_shortwave_flux'] = self._Rs
-        self._cell_values['radiation__net_shortwave_flux'] = self._Rnet
+        Parameters
+        ----------
+        current_time: array_like of float
+              Current times (years).
+        hour: array_like of float, optional
+              Hour of the day at each time.
+
+        Returns
+        -------
+        ndarray of float, shape `(n_times, n_cells)`
+            Ratio of incident radiation at each time on each cell.
+
+        Examples
+        --------
+        >>> from landlab import RasterModelGrid
+        >>> from landlab.components import Radiation
+        >>> import numpy as np
+
+        >>> grid = RasterModelGrid((5, 4), spacing=(10., 10.))
+        >>> z = grid.add_field('node', 'topographic__elevation',
+        ...                    grid.node_y * 0.1)
+        >>> rad = Radiation(grid)
+
+        >>> days = np.arange(365.) / 365.
+        >>> radf = rad.calc_ratio_to_flat_surface(days)
+        >>> radf.shape
+        (365, 6)
+
+        >>> rad.update(days[100])
+        >>> ratio = grid.at_cell['radiation__ratio_to_flat_surface']
+        >>> np.all(radf[100] == ratio)
+        True
+        """
+        return self._calc_ratio(*self._calc_sun_position(current_time, hour))
+
+    def update(self, current_time, hour=12., **kwds):
+        """Update fields with current loading conditions.
+
+        Parameters
+        ----------
+        current_time: float
+              Current time (years).
+        hour: float, optional
+              Hour of the day.
+
+        Slope and aspect are only recalculated if *topographic__elevation*
+        has been set or marked as modified since they were last found.
+        """
+        alpha, phisun = self._calc_sun_position(current_time, hour)
+
+        Rgl = (self._Io * np.exp((-1) * self._n * (
+            0.128 - 0.054 * np.log10(1. / np.sin(alpha[0])))*(
+                1. / np.sin(alpha[0]))))
+        # Counting for Albedo, Cloudiness and Atmospheric turbidity
+
+        Rsflat = Rgl * np.sin(alpha[0])
+        # flat surface total incoming shortwave radiation
+
+        Rnetflat = ((1 - self._A) * (1 - 0.65 * (self._N ** 2)) * Rsflat)
+        # flat surface Net incoming shortwave radiation
+
+        radf = self._calc_ratio(alpha, phisun)[0]
+
+        # Sloped surface Toatl Incoming Shortwave Radn
+        self._cell_values['radiation__ratio_to_flat_surface'] = radf
+        self._cell_values['radiation__incoming_shortwave_flux'] = (
+            Rsflat * radf)
+        self._cell_values['radiation__net_shortwave_flux'] = Rnetflat * radf
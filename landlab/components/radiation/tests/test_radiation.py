@@ -101,4 +101,35 @@ def test_field_initialized_to_zero():
         if name == 'Slope' or name == 'Aspect':
             continue
         field = rad.grid['cell'][name]
-        assert_array_almost_equal(field, np.zeros(rad.grid.number_of_cells))
\ No newline at end of file
+        assert_array_almost_equal(field, np.zeros(rad.grid.number_of_cells))
+
+
+def test_ratio_at_many_times():
+    grid = RasterModelGrid((10, 12), spacing=10e0)
+    np.random.seed(42)
+    grid.add_field('node', 'topographic__elevation',
+                   np.random.rand(grid.number_of_nodes) * 10.)
+    rad = Radiation(grid)
+
+    times = np.linspace(0., 1., 17)
+    hours = np.linspace(6., 18., 17)
+    radf = rad.calc_ratio_to_flat_surface(times, hours)
+    assert_equal(radf.shape, (17, grid.number_of_cells))
+
+    for t, hour, expected in zip(times, hours, radf):
+        rad.update(t, hour=hour)
+        assert_array_almost_equal(
+            grid.at_cell['radiation__ratio_to_flat_surface'], expected)
+
+
+def test_slope_follows_elevation():
+    grid = RasterModelGrid((5, 6), spacing=10e0)
+    z = grid.add_zeros('node', 'topographic__elevation')
+    rad = Radiation(grid)
+    rad.update(0.5)
+    assert_array_almost_equal(grid.at_cell['Slope'], 0.)
+
+    z[:] = grid.node_y * 0.5
+    grid.mark_modified('node', 'topographic__elevation')
+    rad.update(0.5)
+    assert_array_almost_equal(grid.at_cell['Slope'], np.arctan(0.5))
@@ -11,6 +11,14 @@ ctypedef np.double_t DTYPE_FLOAT_t
 DTYPE_INT = np.int
 ctypedef np.int_t DTYPE_INT_t
 
+ctypedef fused DTYPE_FIELD_t:
+    np.float32_t
+    np.float64_t
+
+ctypedef fused DTYPE_THRESH_t:
+    np.float32_t
+    np.float64_t
+
 
 cdef extern from "math.h":
     double fabs(double x) nogil
@@ -20,8 +28,8 @@ cdef extern from "math.h":
 @cython.boundscheck(False)
 def erode_avoiding_pits(np.ndarray[DTYPE_INT_t, ndim=1] src_nodes,
                         np.ndarray[DTYPE_INT_t, ndim=1] dst_nodes,
-                        np.ndarray[DTYPE_FLOAT_t, ndim=1] node_z,
-                        np.ndarray[DTYPE_FLOAT_t, ndim=1] node_dz):
+                        np.ndarray[DTYPE_FIELD_t, ndim=1] node_z,
+                        np.ndarray[DTYPE_FIELD_t, ndim=1] node_dz):
     """Erode node elevations while avoiding creating pits.
 
     Parameters
@@ -55,10 +63,10 @@ def erode_avoiding_pits(np.ndarray[DTYPE_INT_t, ndim=1] src_nodes,
 
 def erode_with_link_alpha_varthresh(np.ndarray[DTYPE_INT_t, ndim=1] src_nodes,
                                     np.ndarray[DTYPE_INT_t, ndim=1] dst_nodes,
-                                    np.ndarray[DTYPE_FLOAT_t, ndim=1] threshsxdt,
-                                    np.ndarray[DTYPE_FLOAT_t, ndim=1] alpha,
+                                    np.ndarray[DTYPE_THRESH_t, ndim=1] threshsxdt,
+                                    np.ndarray[DTYPE_FIELD_t, ndim=1] alpha,
                                     DTYPE_FLOAT_t n,
-                                    np.ndarray[DTYPE_FLOAT_t, ndim=1] z):
+                                    np.ndarray[DTYPE_FIELD_t, ndim=1] z):
     """Erode node elevations using alpha scaled by link length.
 
     Parameters
@@ -74,7 +82,8 @@ def erode_with_link_alpha_varthresh(np.ndarray[DTYPE_INT_t, ndim=1] src_nodes,
     n : float
         Exponent.
     z : array_like
-        Node elevations.
+        Node elevations, of the same type (single or double precision) as
+        *alpha*.
     """
     cdef unsigned int n_nodes = src_nodes.size
     cdef unsigned int src_id
@@ -121,9 +130,9 @@ def erode_with_link_alpha_varthresh(np.ndarray[DTYPE_INT_t, ndim=1] src_nodes,
 def erode_with_link_alpha_fixthresh(np.ndarray[DTYPE_INT_t, ndim=1] src_nodes,
                                     np.ndarray[DTYPE_INT_t, ndim=1] dst_nodes,
                                     DTYPE_FLOAT_t threshxdt,
-                                    np.ndarray[DTYPE_FLOAT_t, ndim=1] alpha,
+                                    np.ndarray[DTYPE_FIELD_t, ndim=1] alpha,
                                     DTYPE_FLOAT_t n,
-                                    np.ndarray[DTYPE_FLOAT_t, ndim=1] z):
+                                    np.ndarray[DTYPE_FIELD_t, ndim=1] z):
     """Erode node elevations using alpha scaled by link length.
 
     Parameters
@@ -139,7 +148,8 @@ def erode_with_link_alpha_fixthresh(np.ndarray[DTYPE_INT_t, ndim=1] src_nodes,
     n : float
         Exponent.
     z : array_like
-        Node elevations.
+        Node elevations, of the same type (single or double precision) as
+        *alpha*.
     """
     cdef unsigned int n_nodes = src_nodes.size
     cdef unsigned int src_id
@@ -401,6 +401,8 @@ class FastscapeEroder(Component):
             #         if next_z < z[src_id]:
             #             z[src_id] = next_z
 
+        self._grid.mark_modified('node', 'topographic__elevation')
+
         return self._grid
 
     def run_one_step(self, dt, flooded_nodes=None,
@@ -4,6 +4,7 @@ from __future__ import print_function
 import warnings
 
 import numpy as np
+import six
 from landlab import ModelParameterDictionary, CLOSED_BOUNDARY, Component
 
 from landlab.core.model_parameter_dictionary import MissingKeyError, \
@@ -467,7 +468,7 @@ class StreamPowerEroder(Component):
             else:
                 _K_unit_time = self._K_unit_time
 
-        if type(node_elevs) is str:
+        if isinstance(node_elevs, six.string_types):
             node_z = grid.at_node[node_elevs]
         else:
             node_z = node_elevs
@@ -649,6 +650,9 @@ class StreamPowerEroder(Component):
         # 
         # self._grid = grid
 
+        if isinstance(node_elevs, six.string_types):
+            grid.mark_modified('node', node_elevs)
+
         return grid, node_z, self.stream_power_erosion
 
     def run_one_step(self, dt, flooded_nodes=None, **kwds):
@@ -7,7 +7,7 @@ fastscape stream power component.
 import os
 
 import numpy
-from numpy.testing import assert_array_almost_equal
+from numpy.testing import assert_array_almost_equal, assert_array_equal
 
 from landlab import RasterModelGrid
 from landlab import ModelParameterDictionary
@@ -120,3 +120,46 @@ def test_fastscape_new():
                          3.15428351e-04,   3.63710771e-04])
 
     assert_array_almost_equal(mg.at_node['topographic__elevation'], z_trg)
+
+
+def test_fastscape_single_precision():
+    """Test routing and eroding a grid whose fields are single precision."""
+    elevations = {}
+    for dtype in (numpy.float64, numpy.float32):
+        mg = RasterModelGrid((10, 12), 100., float_dtype=dtype)
+        z = mg.add_zeros('node', 'topographic__elevation')
+        z += mg.node_x * 0.001 + mg.node_y * 0.0005
+        fr = FlowRouter(mg)
+        sp = Fsc(mg, K_sp=1.e-5)
+        for _ in range(5):
+            fr.run_one_step()
+            sp.run_one_step(dt=100.)
+            z[mg.core_nodes] += 0.01
+
+        assert mg.at_node['topographic__elevation'].dtype == dtype
+        assert mg.at_node['drainage_area'].dtype == dtype
+        elevations[dtype] = z.copy()
+
+    assert_array_almost_equal(elevations[numpy.float32],
+                              elevations[numpy.float64], decimal=5)
+
+
+def test_fastscape_32_bit_ids():
+    """Test routing and eroding a grid whose ids are 32-bit integers."""
+    elevations = {}
+    for dtype in (numpy.int_, numpy.int32):
+        mg = RasterModelGrid((10, 12), 100., id_dtype=dtype)
+        mg.set_closed_boundaries_at_grid_edges(True, False, True, False)
+        z = mg.add_zeros('node', 'topographic__elevation')
+        z += mg.node_x * 0.001 + mg.node_y * 0.0005
+        fr = FlowRouter(mg)
+        sp = Fsc(mg, K_sp=1.e-5)
+        for _ in range(5):
+            fr.run_one_step()
+            sp.run_one_step(dt=100.)
+            z[mg.core_nodes] += 0.01
+
+        assert mg.links_at_node.dtype == dtype
+        elevations[dtype] = z.copy()
+
+    assert_array_equal(elevations[numpy.int32], elevations[numpy.int_])
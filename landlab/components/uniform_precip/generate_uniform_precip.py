@@ -16,6 +16,55 @@ import numpy as np
 from landlab import Component
 
 
+_STORM_DTYPE = np.dtype([('storm_start', float),
+                         ('storm_duration', float),
+                         ('interstorm_duration', float),
+                         ('storm_depth', float),
+                         ('intensity', float)])
+
+
+def _random_sample(size):
+    """Draw uniform random numbers from the standard library generator.
+
+    Both the standard library and numpy use the Mersenne Twister, and
+    construct floats from it in the same way. The state of the
+    :mod:`random` generator is passed to a numpy generator, the numbers
+    drawn in one go, and the advanced state passed back. The result is the
+    same as *size* calls to ``random.random()``.
+
+    Parameters
+    ----------
+    size : int
+        Number of values to draw.
+
+    Returns
+    -------
+    ndarray of float
+        Random numbers on [0, 1).
+
+    Examples
+    --------
+    >>> import random
+    >>> from landlab.components.uniform_precip.generate_uniform_precip import (
+    ...     _random_sample)
+    >>> random.seed(42)
+    >>> expected = [random.random() for _ in range(5)]
+    >>> random.seed(42)
+    >>> list(_random_sample(5)) == expected
+    True
+    """
+    (version, internal_state, gauss_next) = random.getstate()
+    generator = np.random.RandomState()
+    generator.set_state(('MT19937',
+                         np.array(internal_state[:-1], dtype=np.uint32),
+                         internal_state[-1]))
+    sample = generator.random_sample(size)
+    (_, key, pos, _, _) = generator.get_state()
+    random.setstate((version, tuple(int(k) for k in key) + (int(pos), ),
+                     gauss_next))
+    return sample
+
+
 class PrecipitationDistribution(Component):
 
     """Generate precipitation events.
@@ -62,6 +111,19 @@ class PrecipitationDistribution(Component):
     ...     total_t = 100.0, delta_t = 1.)
     >>> for (dt, rate) in precip.yield_storm_interstorm_duration_intensity():
     ...     pass  # and so on
+
+    For long runs, storms can instead be generated in blocks, as structured
+    arrays.
+
+    >>> precip = PrecipitationDistribution(mean_storm_duration = 1.5,
+    ...     mean_interstorm_duration = 15.0, mean_storm_depth = 0.5,
+    ...     total_t = 100000.0)
+    >>> total_rain = 0.
+    >>> for storms in precip.yield_storm_blocks(block_size=1000):
+    ...     total_rain += np.sum(storms['intensity'] *
+    ...                          storms['storm_duration'])
+    >>> precip.elapsed_time
+    100000.0
     """
 
     _name = 'PrecipitationDistribution'
@@ -289,6 +351,167 @@ class PrecipitationDistribution(Component):
             storm_iterator = storm_helper
         return self.storm_time_series
 
+    def draw_storms(self, number_of_storms):
+        """Draw a block of storms.
+
+        The storms are those that would be generated by calling
+        :func:`update` *number_of_storms* times, and the random-number
+        generators are left in the same state. Values are the same as for
+        the scalar methods to within round-off.
+
+        Parameters
+        ----------
+        number_of_storms : int
+            Number of storms to draw.
+
+        Returns
+        -------
+        ndarray
+            Structured array of storms with fields *storm_start*,
+            *storm_duration*, *interstorm_duration*, *storm_depth* and
+            *intensity*. Start times are measured from the start of the
+            first storm, which is followed by its interstorm period.
+
+        Examples
+        --------
+        >>> from landlab.components import PrecipitationDistribution
+        >>> precip = PrecipitationDistribution(mean_storm_duration=1.5,
+        ...     mean_interstorm_duration=15.0, mean_storm_depth=0.5)
+        >>> precip.seed_generator(1)
+        >>> storms = precip.draw_storms(3)
+        >>> storms.dtype.names # doctest: +NORMALIZE_WHITESPACE
+        ('storm_start', 'storm_duration', 'interstorm_duration',
+         'storm_depth', 'intensity')
+        >>> precip.seed_generator(1)
+        >>> for storm in storms:
+        ...     precip.update()
+        ...     np.isclose(storm['storm_duration'], precip.storm_duration)
+        ...     np.isclose(storm['storm_depth'], precip.storm_depth)
+        True
+        True
+        True
+        True
+        True
+        True
+        """
+        return self._draw_storms(number_of_storms)
+
+    def _draw_storms(self, number_of_storms, last_interstorm=True):
+        """Draw a block of storms, without the last interstorm if asked.
+
+        If *last_interstorm* is False, the interstorm duration of the last
+        storm is not drawn (and is set to zero), just as the scalar
+        generator doesn't draw an interstorm after the end of a run.
+        """
+        storms = np.empty(number_of_storms, dtype=_STORM_DTYPE)
+        n_samples = 2 * number_of_storms
+        if not last_interstorm:
+            n_samples -= 1
+        rates = np.zeros(2 * number_of_storms)
+        rates[:n_samples] = _random_sample(n_samples)
+        rates = - np.log(1. - rates.reshape((-1, 2)))
+        storms['storm_duration'] = rates[:, 0] * self.mean_storm_duration
+        storms['interstorm_duration'] = (
+            rates[:, 1] * self.mean_interstorm_duration)
+        storms['storm_depth'] = np.random.gamma(
+            storms['storm_duration'] / self.mean_storm_duration,
+            self.mean_storm_depth)
+        storms['intensity'] = storms['storm_depth'] / storms['storm_duration']
+        storms['storm_start'][0] = 0.
+        np.cumsum(storms['storm_duration'][:-1] +
+                  storms['interstorm_duration'][:-1],
+                  out=storms['storm_start'][1:])
+        return storms
+
+    def yield_storm_blocks(self, block_size=10000):
+        """Iterator for a time series of storms, in blocks.
+
+        This is the block equivalent of
+        :func:`yield_storm_interstorm_duration_intensity`. Storms are drawn
+        *block_size* at a time, with :func:`draw_storms`, and yielded as
+        structured arrays until the total run time is reached. The last
+        storm (or interstorm) is cut short at the run time; a storm that is
+        cut keeps its intensity, and so loses some of its depth. Storms are
+        not subdivided by *delta_t*.
+
+        The block that reaches the run time is drawn twice: once to find
+        how many of its storms are needed, and again to draw only those.
+        The random-number generators are so left where the scalar generator
+        would leave them, and draws that follow are the same.
+
+        Parameters
+        ----------
+        block_size : int, optional
+            Number of storms to draw at a time.
+
+        Yields
+        ------
+        ndarray
+            Structured array of storms with fields *storm_start*,
+            *storm_duration*, *interstorm_duration*, *storm_depth* and
+            *intensity*. Start times are measured from the start of the run.
+
+        Examples
+        --------
+        >>> from landlab.components import PrecipitationDistribution
+        >>> precip = PrecipitationDistribution(mean_storm_duration=1.5,
+        ...     mean_interstorm_duration=15.0, mean_storm_depth=0.5,
+        ...     total_t=100.)
+        >>> precip.seed_generator(1)
+        >>> storms = np.concatenate(list(precip.yield_storm_blocks(2)))
+        >>> storms['storm_start'][0]
+        0.0
+        >>> np.isclose(storms['storm_start'][-1] +
+        ...            storms['storm_duration'][-1] +
+        ...            storms['interstorm_duration'][-1], 100.)
+        True
+
+        The storms are the same as those from the scalar generator.
+
+        >>> precip.seed_generator(1)
+        >>> intervals = np.array(
+        ...     list(precip.yield_storm_interstorm_duration_intensity()))
+        >>> np.allclose(intervals[::2, 0], storms['storm_duration'])
+        True
+        >>> np.allclose(intervals[1::2, 0], storms['interstorm_duration'])
+        True
+        """
+        self._elapsed_time = 0.
+        while self._elapsed_time < self.run_time:
+            state = (random.getstate(), np.random.get_state())
+            storms = self.draw_storms(block_size)
+            storms['storm_start'] += self._elapsed_time
+
+            if (storms['storm_start'][-1] + storms['storm_duration'][-1] +
+                    storms['interstorm_duration'][-1] >= self.run_time):
+                # Draw the last block again with only the storms that are
+                # needed, so the generators are left as by the scalar calls.
+                n_storms = np.searchsorted(storms['storm_start'],
+                                           self.run_time)
+                storm_end = (storms['storm_start'][n_storms - 1] +
+                             storms['storm_duration'][n_storms - 1])
+                random.setstate(state[0])
+                np.random.set_state(state[1])
+                storms = self._draw_storms(
+                    n_storms, last_interstorm=storm_end < self.run_time)
+                storms['storm_start'] += self._elapsed_time
+
+            storm_end = storms['storm_start'] + storms['storm_duration']
+            is_cut = storm_end > self.run_time
+            storms['storm_duration'][is_cut] = (
+                self.run_time - storms['storm_start'][is_cut])
+            storms['storm_depth'][is_cut] = (
+                storms['intensity'][is_cut] *
+                storms['storm_duration'][is_cut])
+            np.minimum(storms['interstorm_duration'],
+                       (self.run_time - storm_end).clip(0.),
+                       out=storms['interstorm_duration'])
+
+            self._elapsed_time = (storms['storm_start'][-1] +
+                                  storms['storm_duration'][-1] +
+                                  storms['interstorm_duration'][-1])
+            yield storms
+
     def yield_storm_interstorm_duration_intensity(self,
                                                   subdivide_interstorms=False):
         """Iterator for a time series of storms.
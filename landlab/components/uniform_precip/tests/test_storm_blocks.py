@@ -0,0 +1,92 @@
+"""Test drawing storms in blocks."""
+import random
+
+import numpy as np
+from numpy.testing import assert_array_almost_equal
+from nose.tools import assert_equal, assert_almost_equal
+
+from landlab.components import PrecipitationDistribution
+
+
+def _scalar_storms(precip):
+    """Draw storms one at a time, cut short at the run time.
+
+    Storms are drawn as by *update*, and cut short as by
+    *yield_storm_interstorm_duration_intensity*: a cut storm keeps its
+    intensity, and no interstorm is drawn after the end of the run.
+    """
+    storms = []
+    elapsed_time = 0.
+    while elapsed_time < precip.run_time:
+        precip.storm_duration = precip.get_precipitation_event_duration()
+        precip.get_storm_depth()
+        intensity = precip.get_storm_intensity()
+        duration = min(precip.storm_duration, precip.run_time - elapsed_time)
+        elapsed_time += duration
+
+        interstorm = 0.
+        if elapsed_time < precip.run_time:
+            interstorm = min(precip.get_interstorm_event_duration(),
+                             precip.run_time - elapsed_time)
+            elapsed_time += interstorm
+        storms.append((duration, interstorm, intensity))
+    return np.array(storms)
+
+
+def _block_storms(precip, block_size):
+    """Storms from the block generator, joined into one array."""
+    return np.concatenate(list(precip.yield_storm_blocks(block_size)))
+
+
+def test_blocks_match_scalar_generator():
+    """Blocks give the same storms as the scalar generator."""
+    precip = PrecipitationDistribution(mean_storm_duration=1.5,
+                                       mean_interstorm_duration=15.0,
+                                       mean_storm_depth=0.5, total_t=1000.)
+    for seed in range(20):
+        precip.seed_generator(seed)
+        intervals = np.array(
+            list(precip.yield_storm_interstorm_duration_intensity()))
+        after_generator = random.random()
+
+        precip.seed_generator(seed)
+        storms = _scalar_storms(precip)
+        after_scalar = (random.random(), np.random.random())
+
+        precip.seed_generator(seed)
+        blocks = _block_storms(precip, block_size=7)
+        after_blocks = (random.random(), np.random.random())
+
+        assert_equal(len(blocks), len(storms))
+        assert_array_almost_equal(blocks['storm_duration'], intervals[::2, 0])
+        assert_array_almost_equal(
+            blocks['interstorm_duration'][:len(intervals) // 2],
+            intervals[1::2, 0])
+        assert_array_almost_equal(blocks['storm_duration'], storms[:, 0])
+        assert_array_almost_equal(blocks['interstorm_duration'],
+                                  storms[:, 1])
+        assert_array_almost_equal(blocks['intensity'], storms[:, 2])
+        assert_equal(after_blocks, after_scalar)
+        assert_equal(after_blocks[0], after_generator)
+
+
+def test_clipped_storm_keeps_intensity():
+    """A storm cut at the run time keeps its intensity, not its depth."""
+    precip = PrecipitationDistribution(mean_storm_duration=10.,
+                                       mean_interstorm_duration=1.,
+                                       mean_storm_depth=5., total_t=20.)
+    for seed in range(20):
+        precip.seed_generator(seed)
+        storms = _scalar_storms(precip)
+
+        precip.seed_generator(seed)
+        blocks = _block_storms(precip, block_size=1000)
+
+        assert_array_almost_equal(
+            blocks['storm_depth'],
+            blocks['intensity'] * blocks['storm_duration'])
+        assert_almost_equal(blocks['storm_depth'].sum(),
+                            np.sum(storms[:, 0] * storms[:, 2]))
+        assert_almost_equal(blocks['storm_start'][-1] +
+                            blocks['storm_duration'][-1] +
+                            blocks['interstorm_duration'][-1], 20.)
@@ -36,6 +36,8 @@ import textwrap
 import warnings
 import inspect
 
+import numpy as np
+
 
 _VAR_HELP_MESSAGE = """
 name: {name}
@@ -310,6 +312,13 @@ class Component(object):
         """
         return cls._var_mapping[name]
 
+    def _field_dtype(self, name):
+        """Data type of a new field, following the grid's float_dtype."""
+        dtype = self.var_type(name)
+        if np.dtype(dtype) == np.dtype(float):
+            dtype = getattr(self.grid, 'float_dtype', dtype)
+        return dtype
+
     def initialize_output_fields(self):
         """
         Create fields for a component based on its input and output var names.
@@ -318,13 +327,14 @@ class Component(object):
         output by, but not supplied to, the component. New fields are
         initialized to zero. Ignores optional fields, if specified by
         _optional_var_names. New fields are created as arrays of floats, unless
-        the component also contains the specifying property _var_type.
+        the component also contains the specifying property _var_type. Arrays
+        of floats are of the grid's *float_dtype*.
         """
         for field_to_set in (set(self.output_var_names) -
                              set(self.input_var_names) -
                              set(self.optional_var_names)):
             grp = self.var_loc(field_to_set)
-            type_in = self.var_type(field_to_set)
+            type_in = self._field_dtype(field_to_set)
             init_vals = self.grid.zeros(grp, dtype=type_in)
             units_in = self.var_units(field_to_set)
             self.grid.add_field(grp,
@@ -342,14 +352,15 @@ class Component(object):
         This method will create new fields (without overwrite) for any fields
         output by the component as optional. New fields are
         initialized to zero. New fields are created as arrays of floats, unless
-        the component also contains the specifying property _var_type.
+        the component also contains the specifying property _var_type. Arrays
+        of floats are of the grid's *float_dtype*.
         """
         for field_to_set in (set(self.optional_var_names) -
                              set(self.input_var_names)):
             self.grid.add_field(self.var_loc(field_to_set),
                                 field_to_set,
                                 self.grid.zeros(
-                                    dtype=self.var_type(field_to_set)),
+                                    dtype=self._field_dtype(field_to_set)),
                                 units=self.var_units(field_to_set),
                                 noclobber=True)
 
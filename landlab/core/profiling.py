@@ -0,0 +1,308 @@
+#! /usr/bin/env python
+"""Time, and measure the memory of, the components of a model.
+
+A :class:`ComponentProfiler` records each call to the methods that
+components do their work in (*run_one_step*, *update* and *erode*, by
+default). For each call it records the wall time and, optionally, the peak
+memory allocated during the call. Calls are summarized by component and
+method, and can be written as a trace to view with a trace viewer (such
+as ``chrome://tracing``).
+
+Methods are only wrapped while the profiler is enabled, so profiling costs
+nothing when it is not in use. Components are found among the subclasses
+of :class:`~landlab.core.model_component.Component` when the profiler is
+enabled; components imported later are not profiled.
+
+Component profiler
+++++++++++++++++++
+
+.. autosummary::
+    :toctree: generated/
+
+    ~landlab.core.profiling.ComponentProfiler
+"""
+from __future__ import print_function
+
+import json
+import os
+import threading
+from functools import wraps
+from timeit import default_timer
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+from .model_component import Component
+
+
+_PROFILED_METHODS = ('run_one_step', 'update', 'erode')
+
+
+def _subclasses_of(cls):
+    """All subclasses of a class, including subclasses of subclasses."""
+    found = []
+    for subclass in cls.__subclasses__():
+        found.append(subclass)
+        found.extend(_subclasses_of(subclass))
+    return found
+
+
+class _MemoryFrame(object):
+
+    """Peak memory of a call that is in progress."""
+
+    def __init__(self, start):
+        self.start = start
+        self.peak = start
+
+
+class ComponentProfiler(object):
+
+    """Record wall time, calls and peak memory of component methods.
+
+    Parameters
+    ----------
+    methods : iterable of str, optional
+        Names of the methods to profile.
+    track_memory : bool, optional
+        If True, also record the peak memory allocated by each call. This
+        uses :mod:`tracemalloc`, which slows down allocations.
+
+    Examples
+    --------
+    >>> from landlab import RasterModelGrid
+    >>> from landlab.components import FlowRouter, LinearDiffuser
+    >>> from landlab.core.profiling import ComponentProfiler
+
+    >>> grid = RasterModelGrid((10, 10))
+    >>> z = grid.add_field('node', 'topographic__elevation',
+    ...                    grid.node_x * grid.node_y)
+    >>> diffuse = LinearDiffuser(grid, linear_diffusivity=0.01)
+    >>> route = FlowRouter(grid)
+
+    >>> with ComponentProfiler(track_memory=True) as profiler:
+    ...     for _ in range(3):
+    ...         diffuse.run_one_step(1.)
+    ...         route.run_one_step()
+    >>> stats = profiler.stats
+    >>> stats[('LinearDiffuser', 'run_one_step')]['calls']
+    3
+    >>> stats[('FlowRouter', 'run_one_step')]['calls']
+    3
+    >>> stats[('FlowRouter', 'run_one_step')]['peak_bytes'] > 0
+    True
+
+    Once disabled, the methods are no longer wrapped.
+
+    >>> route.run_one_step()
+    >>> stats[('FlowRouter', 'run_one_step')]['calls']
+    3
+    >>> print(profiler.summary()) # doctest: +SKIP
+    component       method           calls   total (s)    mean (s)   peak (MB)
+    FlowRouter      run_one_step         3    0.002346    0.000782       0.052
+    LinearDiffuser  run_one_step         3    0.000504    0.000168       0.006
+    """
+
+    def __init__(self, methods=_PROFILED_METHODS, track_memory=False):
+        if track_memory and tracemalloc is None:
+            raise RuntimeError('tracking memory requires tracemalloc')
+
+        self._methods = tuple(methods)
+        self._track_memory = track_memory
+        self._originals = []
+        self._events = []
+        self._stats = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._started_tracemalloc = False
+        self._t0 = default_timer()
+
+    @property
+    def enabled(self):
+        """True if methods are being profiled."""
+        return len(self._originals) > 0
+
+    @property
+    def stats(self):
+        """Summary of calls, keyed by component and method name.
+
+        Returns
+        -------
+        dict
+            For each (component, method), a dict of the number of *calls*,
+            their *total_time* and *mean_time* (in seconds) and the largest
+            *peak_bytes* allocated by a call (``None`` if memory is not
+            tracked).
+        """
+        stats = {}
+        with self._lock:
+            for key, (calls, total, peak) in self._stats.items():
+                stats[key] = dict(calls=calls, total_time=total,
+                                  mean_time=total / calls, peak_bytes=peak)
+        return stats
+
+    def enable(self):
+        """Start profiling component methods."""
+        if self.enabled:
+            return
+
+        if self._track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+        for cls in [Component] + _subclasses_of(Component):
+            for name in self._methods:
+                func = cls.__dict__.get(name, None)
+                if callable(func):
+                    self._originals.append((cls, name, func))
+                    setattr(cls, name, self._wrap(cls, name, func))
+
+    def disable(self):
+        """Stop profiling, and restore the original methods."""
+        for cls, name, func in reversed(self._originals):
+            setattr(cls, name, func)
+        self._originals = []
+
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def reset(self):
+        """Discard the calls recorded so far."""
+        with self._lock:
+            self._events = []
+            self._stats = {}
+        self._t0 = default_timer()
+
+    def _memory_stack(self):
+        """Peak memory of the calls in progress on this thread."""
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = []
+            return self._local.stack
+
+    def _enter_memory(self):
+        """Start measuring the peak memory of a call."""
+        stack = self._memory_stack()
+        current, peak = tracemalloc.get_traced_memory()
+        if stack:
+            stack[-1].peak = max(stack[-1].peak, peak)
+        if hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+        stack.append(_MemoryFrame(current))
+
+    def _exit_memory(self):
+        """Stop measuring the peak memory of a call.
+
+        Returns
+        -------
+        int
+            Peak memory, in bytes, allocated during the call.
+        """
+        stack = self._memory_stack()
+        frame = stack.pop()
+        frame.peak = max(frame.peak, tracemalloc.get_traced_memory()[1])
+        if stack:
+            stack[-1].peak = max(stack[-1].peak, frame.peak)
+        return frame.peak - frame.start
+
+    def _record(self, key, start, duration, peak_bytes):
+        """Add a call to the statistics and the trace."""
+        with self._lock:
+            calls, total, peak = self._stats.get(key, (0, 0., None))
+            if peak_bytes is not None:
+                peak = max(peak or 0, peak_bytes)
+            self._stats[key] = (calls + 1, total + duration, peak)
+            self._events.append((key, start - self._t0, duration,
+                                 threading.current_thread().ident,
+                                 peak_bytes))
+
+    def _wrap(self, cls, name, func):
+        """Wrap a method so that its calls are recorded."""
+        profiler = self
+
+        @wraps(func)
+        def _profiled(self, *args, **kwds):
+            key = (type(self).__name__, name)
+            if profiler._track_memory:
+                profiler._enter_memory()
+            start = default_timer()
+            try:
+                return func(self, *args, **kwds)
+            finally:
+                duration = default_timer() - start
+                if profiler._track_memory:
+                    peak_bytes = profiler._exit_memory()
+                else:
+                    peak_bytes = None
+                profiler._record(key, start, duration, peak_bytes)
+
+        return _profiled
+
+    def summary(self):
+        """Table of calls, by component and method.
+
+        Returns
+        -------
+        str
+            The table, with rows in order of decreasing total time.
+        """
+        stats = self.stats
+        keys = sorted(stats, key=lambda key: -stats[key]['total_time'])
+        width = max([len('component')] + [len(key[0]) for key in keys])
+
+        lines = ['{0:{w}}  {1:14} {2:>7} {3:>11} {4:>11} {5:>11}'.format(
+            'component', 'method', 'calls', 'total (s)', 'mean (s)',
+            'peak (MB)', w=width)]
+        for key in keys:
+            row = stats[key]
+            if row['peak_bytes'] is None:
+                peak = '-'
+            else:
+                peak = '{0:.3f}'.format(row['peak_bytes'] / 2. ** 20)
+            lines.append(
+                '{0:{w}}  {1:14} {2:7d} {3:11.6f} {4:11.6f} {5:>11}'.format(
+                    key[0], key[1], row['calls'], row['total_time'],
+                    row['mean_time'], peak, w=width))
+        return os.linesep.join(lines)
+
+    def chrome_trace(self):
+        """Recorded calls in the Chrome trace event format.
+
+        Returns
+        -------
+        dict
+            Trace with one complete event for each call.
+        """
+        pid = os.getpid()
+        events = []
+        with self._lock:
+            for key, start, duration, tid, peak_bytes in self._events:
+                event = {'name': '.'.join(key), 'cat': key[0], 'ph': 'X',
+                         'ts': start * 1e6, 'dur': duration * 1e6,
+                         'pid': pid, 'tid': tid}
+                if peak_bytes is not None:
+                    event['args'] = {'peak_bytes': peak_bytes}
+                events.append(event)
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def write_chrome_trace(self, path):
+        """Write recorded calls as a Chrome trace file.
+
+        Parameters
+        ----------
+        path : str
+            Path of the JSON file to write.
+        """
+        with open(path, 'w') as fp:
+            json.dump(self.chrome_trace(), fp)
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.disable()
@@ -0,0 +1,74 @@
+#! /usr/bin/env python
+import json
+import os
+import tempfile
+
+from nose.tools import assert_equal, assert_true, assert_is
+
+from landlab import RasterModelGrid
+from landlab.components import FlowRouter, FastscapeEroder
+from landlab.core.profiling import ComponentProfiler
+
+
+def _setup_model():
+    grid = RasterModelGrid((6, 7))
+    grid.add_field('node', 'topographic__elevation',
+                   grid.node_x * 0.1 + grid.node_y * 0.01)
+    return FlowRouter(grid), FastscapeEroder(grid, K_sp=0.001)
+
+
+def test_disabled_restores_methods():
+    """Test methods are only wrapped while the profiler is enabled."""
+    run_one_step = FlowRouter.__dict__['run_one_step']
+    profiler = ComponentProfiler()
+    profiler.enable()
+    assert_true(profiler.enabled)
+    assert_true(FlowRouter.__dict__['run_one_step'] is not run_one_step)
+    profiler.disable()
+    assert_is(FlowRouter.__dict__['run_one_step'], run_one_step)
+
+
+def test_nested_calls():
+    """Test a method called from another method is recorded separately."""
+    router, eroder = _setup_model()
+    with ComponentProfiler() as profiler:
+        router.run_one_step()
+        eroder.run_one_step(1.)
+
+    stats = profiler.stats
+    assert_equal(stats[('FastscapeEroder', 'run_one_step')]['calls'], 1)
+    assert_equal(stats[('FastscapeEroder', 'erode')]['calls'], 1)
+    assert_is(stats[('FlowRouter', 'run_one_step')]['peak_bytes'], None)
+    assert_true(stats[('FastscapeEroder', 'run_one_step')]['total_time'] >=
+                stats[('FastscapeEroder', 'erode')]['total_time'])
+
+
+def test_write_chrome_trace():
+    """Test writing calls as a chrome trace."""
+    router, eroder = _setup_model()
+    with ComponentProfiler(track_memory=True) as profiler:
+        for _ in range(2):
+            router.run_one_step()
+
+    path = os.path.join(tempfile.mkdtemp(), 'trace.json')
+    profiler.write_chrome_trace(path)
+    with open(path, 'r') as fp:
+        trace = json.load(fp)
+
+    events = trace['traceEvents']
+    assert_equal(len(events), 2)
+    assert_equal(events[0]['name'], 'FlowRouter.run_one_step')
+    assert_equal(events[0]['ph'], 'X')
+    assert_true(events[1]['ts'] >= events[0]['ts'] + events[0]['dur'])
+    assert_true(events[0]['args']['peak_bytes'] > 0)
+
+
+def test_reset():
+    """Test discarding recorded calls."""
+    router, _ = _setup_model()
+    with ComponentProfiler() as profiler:
+        router.run_one_step()
+        profiler.reset()
+        router.run_one_step()
+    assert_equal(profiler.stats[('FlowRouter', 'run_one_step')]['calls'], 1)
+    assert_true('FlowRouter' in profiler.summary())
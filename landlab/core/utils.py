@@ -123,13 +123,15 @@ def extend_array(x, fill=0):
     return array(x)
 
 
-def as_id_array(array):
+def as_id_array(array, dtype=None):
     """Convert an array to an array of ids.
 
     Parameters
     ----------
     array : ndarray
         Array of IDs.
+    dtype : data-type, optional
+        Integer type of the ids (the platform integer, by default).
 
     Returns
     -------
@@ -170,14 +172,20 @@ def as_id_array(array):
     array([0, 1, 2, 3, 4])
     >>> y.dtype == np.int
     True
+
+    >>> x = np.arange(5)
+    >>> y = as_id_array(x, dtype=np.int32)
+    >>> y
+    array([0, 1, 2, 3, 4], dtype=int32)
     """
+    dtype = np.dtype(dtype or np.int)
     try:
-        if array.dtype == np.int:
-            return array.view(np.int)
+        if array.dtype == dtype:
+            return array.view(dtype)
         else:
-            return array.astype(np.int)
+            return array.astype(dtype)
     except AttributeError:
-        return np.asarray(array, dtype=np.int)
+        return np.asarray(array, dtype=dtype)
 
 
 if np.dtype(np.intp) == np.int:
@@ -1,6 +1,8 @@
 #! /usr/bin/env python
 """Store collections of data fields."""
 
+import numpy as np
+
 from .scalar_data_fields import ScalarDataFields
 
 
@@ -51,9 +53,17 @@ class ModelDataFields(object):
     the ScalarDataFields class but with the first argument being a string that
     defines the group name.
 
+    Parameters
+    ----------
+    float_dtype : data-type, optional
+        Data type of new floating-point fields, unless another is given when
+        they are created. The default is float64. Use float32 to halve the
+        memory used by fields of large grids.
+
     Attributes
     ----------
     groups
+    float_dtype
 
     See Also
     --------
@@ -98,13 +108,33 @@ class ModelDataFields(object):
 
     >>> list(fields.at_cell.keys())
     ['topographic__elevation']
+
+    New fields are single precision if so requested.
+
+    >>> import numpy as np
+    >>> fields = ModelDataFields(float_dtype=np.float32)
+    >>> fields.new_field_location('node', 12)
+    >>> fields.add_zeros('node', 'topographic__elevation').dtype
+    dtype('float32')
     """
 
     def __init__(self, **kwds):
         self._groups = dict()
         self._default_group = None
+        self._float_dtype = np.dtype(kwds.pop('float_dtype', None) or float)
         super(ModelDataFields, self).__init__(**kwds)
 
+    @property
+    def float_dtype(self):
+        """Data type of new floating-point fields.
+
+        Returns
+        -------
+        numpy.dtype
+            The data type.
+        """
+        return self._float_dtype
+
     @property
     def groups(self):
         """List of group names.
@@ -316,7 +346,8 @@ class ModelDataFields(object):
         if self.has_group(group):
             raise ValueError('ModelDataFields already contains %s' % group)
         else:
-            self._groups[group] = ScalarDataFields(size)
+            self._groups[group] = ScalarDataFields(size,
+                                                   dtype=self.float_dtype)
             setattr(self, 'at_' + group, self[group])
 
     def field_values(self, group, field):
@@ -838,6 +869,59 @@ class ModelDataFields(object):
         """
         self[group].set_units(name, units)
 
+    def field_version(self, group, name):
+        """Version number of a field.
+
+        The version of a field goes up each time the field is set or
+        marked as modified, so a component can tell if a field has changed
+        since it last used it.
+
+        Parameters
+        ----------
+        group : str
+            Name of the group.
+        name : str
+            Name of the field.
+
+        Returns
+        -------
+        int
+            The version of the field.
+
+        Examples
+        --------
+        >>> from landlab.field import ModelDataFields
+        >>> fields = ModelDataFields()
+        >>> fields.new_field_location('node', 4)
+        >>> z = fields.add_ones('node', 'topographic__elevation')
+        >>> fields.field_version('node', 'topographic__elevation')
+        1
+
+        Values changed in place must be marked as modified.
+
+        >>> z += 1.
+        >>> fields.mark_modified('node', 'topographic__elevation')
+        >>> fields.field_version('node', 'topographic__elevation')
+        2
+
+        LLCATS: FIELDINF
+        """
+        return self[group].version(name)
+
+    def mark_modified(self, group, name):
+        """Mark a field as having been modified in place.
+
+        Parameters
+        ----------
+        group : str
+            Name of the group.
+        name : str
+            Name of the field.
+
+        LLCATS: FIELDIO
+        """
+        self[group].mark_modified(name)
+
     def delete_field(self, group, name):
         """Erases an existing field.
 
@@ -1,6 +1,8 @@
 #! /usr/bin/env python
 """Container that holds a collection of named data-fields."""
 
+import threading
+
 import numpy as np
 
 
@@ -41,11 +43,15 @@ class ScalarDataFields(dict):
     ----------
     size : int
         The number of elements in each of the data fields.
+    dtype : data-type, optional
+        Default data type of arrays created by the collection (by *empty*,
+        *zeros*, *add_zeros*, etc.). The default is float64.
 
     Attributes
     ----------
     units
     size
+    dtype
 
     See Also
     --------
@@ -92,11 +98,26 @@ class ScalarDataFields(dict):
     LLCATS: FIELDCR, FIELDIO
     """
 
-    def __init__(self, size=None):
+    def __init__(self, size=None, dtype=None):
         self._size = size
+        self._dtype = np.dtype(dtype or float)
 
         super(ScalarDataFields, self).__init__()
         self._units = dict()
+        self._versions = dict()
+        # Components may run in threads that set or mark the same fields
+        self._version_lock = threading.Lock()
+
+    def __getstate__(self):
+        """Get the state to pickle, less the lock on field versions."""
+        state = self.__dict__.copy()
+        del state['_version_lock']
+        return state
+
+    def __setstate__(self, state):
+        """Restore pickled state with a new lock on field versions."""
+        self.__dict__.update(state)
+        self._version_lock = threading.Lock()
 
     @property
     def units(self):
@@ -127,6 +148,28 @@ class ScalarDataFields(dict):
         else:
             raise ValueError('size has already been set')
 
+    @property
+    def dtype(self):
+        """Default data type of new arrays.
+
+        Arrays created by the collection are of this type unless another
+        is given with the *dtype* keyword. Arrays added with *add_field* keep
+        their own type.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from landlab.field import ScalarDataFields
+        >>> fields = ScalarDataFields(4, dtype=np.float32)
+        >>> fields.dtype
+        dtype('float32')
+        >>> fields.add_zeros('topographic__elevation').dtype
+        dtype('float32')
+        >>> fields.zeros(dtype=int).dtype == np.dtype(int)
+        True
+        """
+        return self._dtype
+
     def empty(self, **kwds):
         """Uninitialized array whose size is that of the field.
 
@@ -155,6 +198,7 @@ class ScalarDataFields(dict):
         >>> list(field.keys())
         []
         """
+        kwds.setdefault('dtype', self.dtype)
         return np.empty(self.size, **kwds)
 
     def ones(self, **kwds):
@@ -185,6 +229,7 @@ class ScalarDataFields(dict):
         >>> list(field.keys())
         []
         """
+        kwds.setdefault('dtype', self.dtype)
         return np.ones(self.size, **kwds)
 
     def zeros(self, **kwds):
@@ -213,6 +258,7 @@ class ScalarDataFields(dict):
         >>> list(field.keys())
         []
         """
+        kwds.setdefault('dtype', self.dtype)
         return np.zeros(self.size, **kwds)
 
     def add_empty(self, name, units=_UNKNOWN_UNITS, noclobber=True, **kwds):
@@ -434,6 +480,62 @@ class ScalarDataFields(dict):
         """
         self._units[name] = units
 
+    def version(self, name):
+        """Version number of a field.
+
+        A field's version starts at one when it is added and goes up by one
+        each time it is set again or marked as modified. Values changed in
+        place (for example, ``fields['name'][0] = 1.``) do not change the
+        version unless :meth:`mark_modified` is called.
+
+        Parameters
+        ----------
+        name : str
+            Name of the field.
+
+        Returns
+        -------
+        int
+            The version of the field.
+
+        Examples
+        --------
+        >>> from landlab.field import ScalarDataFields
+        >>> fields = ScalarDataFields(4)
+        >>> z = fields.add_zeros('topographic__elevation')
+        >>> fields.version('topographic__elevation')
+        1
+        >>> z[0] = 1.
+        >>> fields.version('topographic__elevation')
+        1
+        >>> fields.mark_modified('topographic__elevation')
+        >>> fields.version('topographic__elevation')
+        2
+        >>> fields['topographic__elevation'] = [1., 2., 3., 4.]
+        >>> fields.version('topographic__elevation')
+        3
+
+        LLCATS: FIELDINF
+        """
+        if name not in self:
+            raise FieldError(name)
+        return self._versions[name]
+
+    def mark_modified(self, name):
+        """Mark a field as having been modified in place.
+
+        Parameters
+        ----------
+        name : str
+            Name of the field.
+
+        LLCATS: FIELDIO
+        """
+        if name not in self:
+            raise FieldError(name)
+        with self._version_lock:
+            self._versions[name] += 1
+
     def __setitem__(self, name, value_array):
         """Store a data field by name."""
         value_array = np.asarray(value_array)
@@ -449,6 +551,8 @@ class ScalarDataFields(dict):
             self.set_units(name, None)
 
         super(ScalarDataFields, self).__setitem__(name, value_array)
+        with self._version_lock:
+            self._versions[name] = self._versions.get(name, 0) + 1
 
     def __getitem__(self, name):
         """Get a data field by name."""
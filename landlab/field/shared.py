@@ -0,0 +1,294 @@
+#! /usr/bin/env python
+"""Share fields between processes through named shared memory.
+
+Fields that are shared are moved into named blocks of shared memory (on
+Linux, POSIX shared memory under ``/dev/shm``). Another process, running
+its own grid and components, attaches to the blocks by name and adds them
+to its own grid as fields. Both processes then read and write the same
+memory, so nothing is copied when values are exchanged.
+
+Each block is a numpy ``.npy`` file, so it carries its own data type and
+shape and a process that attaches to it needs to know only its name.
+
+Processes that run at different cadences keep in step with a
+:class:`StepBarrier`, which holds a step counter for each process in
+shared memory. A process advances its own counter once it has written its
+fields, and waits on another's counter before reading that process's
+fields.
+
+Shared fields
++++++++++++++
+
+.. autosummary::
+    :toctree: generated/
+
+    ~landlab.field.shared.SharedFields
+    ~landlab.field.shared.StepBarrier
+"""
+import os
+import tempfile
+import time
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+
+def _default_shm_dir():
+    """Directory in which to create shared memory blocks."""
+    if os.path.isdir('/dev/shm'):
+        return '/dev/shm'
+    else:
+        return tempfile.gettempdir()
+
+
+def _block_path(shm_dir, key, name):
+    """Path to the file that backs a named block of shared memory."""
+    return os.path.join(shm_dir,
+                        'landlab-{key}-{name}.npy'.format(key=key, name=name))
+
+
+class SharedFields(object):
+
+    """Fields of a grid backed by named shared memory.
+
+    Parameters
+    ----------
+    fields : field-like
+        Landlab field object, typically a grid, that holds the fields.
+    key : str
+        Name that the processes sharing fields agree upon. Blocks of
+        shared memory are named by the key, the group and the field name.
+    shm_dir : str, optional
+        Directory of the shared memory blocks. The default is ``/dev/shm``,
+        if it exists.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab import RasterModelGrid
+    >>> from landlab.field.shared import SharedFields
+
+    One process moves a field into shared memory.
+
+    >>> grid = RasterModelGrid((3, 4))
+    >>> _ = grid.add_field('node', 'topographic__elevation',
+    ...                    np.arange(12.))
+    >>> shared = SharedFields(grid, 'doctest')
+    >>> z = shared.share('node', 'topographic__elevation')
+    >>> grid.at_node['topographic__elevation'] is z
+    True
+
+    Another (here, the same) process attaches the field to its grid.
+
+    >>> other_grid = RasterModelGrid((3, 4))
+    >>> other = SharedFields(other_grid, 'doctest')
+    >>> other_z = other.attach('node', 'topographic__elevation')
+    >>> other_z[5] = 100.
+    >>> grid.at_node['topographic__elevation'][5]
+    100.0
+
+    The process that created the shared memory removes it once every
+    process is done with it.
+
+    >>> shared.unlink()
+    >>> other.unlink()
+    """
+
+    def __init__(self, fields, key, shm_dir=None):
+        self._fields = fields
+        self._key = key
+        self._shm_dir = shm_dir or _default_shm_dir()
+        self._created = []
+
+    @property
+    def key(self):
+        """Name of the shared fields."""
+        return self._key
+
+    def _path(self, group, name):
+        return _block_path(self._shm_dir, self._key,
+                           '{group}-{name}'.format(group=group, name=name))
+
+    def share(self, group, name):
+        """Move a field into shared memory.
+
+        The field's values are copied into a new block of shared memory,
+        which then replaces the field.
+
+        Parameters
+        ----------
+        group : str
+            Name of the group (e.g. 'node', 'link').
+        name : str
+            Name of the field.
+
+        Returns
+        -------
+        ndarray
+            The field, now backed by shared memory.
+        """
+        values = self._fields[group][name]
+        path = self._path(group, name)
+
+        shared = open_memmap(path, mode='w+', dtype=values.dtype,
+                             shape=values.shape)
+        self._created.append(path)
+        shared[:] = values
+
+        self._fields.add_field(group, name, shared, noclobber=False,
+                               units=self._fields.field_units(group, name))
+        return self._fields[group][name]
+
+    def attach(self, group, name, units=None):
+        """Add a field that another process has shared.
+
+        Parameters
+        ----------
+        group : str
+            Name of the group (e.g. 'node', 'link').
+        name : str
+            Name of the field.
+        units : str, optional
+            Units of the field.
+
+        Returns
+        -------
+        ndarray
+            The field, backed by shared memory.
+        """
+        shared = np.load(self._path(group, name), mmap_mode='r+')
+        kwds = dict(noclobber=False)
+        if units is not None:
+            kwds['units'] = units
+        self._fields.add_field(group, name, shared, **kwds)
+        return self._fields[group][name]
+
+    def unlink(self):
+        """Remove the blocks of shared memory created by :meth:`share`.
+
+        Processes that have already attached to the fields keep their
+        mappings, but no new process can attach.
+        """
+        for path in self._created:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self._created = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.unlink()
+
+
+class StepBarrier(object):
+
+    """Step counters, in shared memory, for processes that run together.
+
+    Each process owns one counter, which only it advances, and can wait
+    until another process's counter reaches a given step.
+
+    Parameters
+    ----------
+    key : str
+        Name that the processes agree upon.
+    participant : int
+        Index of the calling process.
+    n_participants : int, optional
+        Number of processes. Give this to create the counters. Other
+        processes leave it out and attach to existing counters.
+    shm_dir : str, optional
+        Directory of the shared memory blocks. The default is ``/dev/shm``,
+        if it exists.
+    poll_interval : float, optional
+        Time, in seconds, to sleep between checks of another counter.
+
+    Examples
+    --------
+    >>> from landlab.field.shared import StepBarrier
+    >>> barrier = StepBarrier('doctest', 0, n_participants=2)
+    >>> other = StepBarrier('doctest', 1)
+    >>> barrier.advance()
+    1
+    >>> other.step_of(0)
+    1
+    >>> other.wait_for(0, 1, timeout=1.)
+    >>> other.wait_for(0, 2, timeout=.01)
+    Traceback (most recent call last):
+    ...
+    RuntimeError: timed out waiting for process 0 to reach step 2
+    >>> barrier.unlink()
+    """
+
+    def __init__(self, key, participant, n_participants=None, shm_dir=None,
+                 poll_interval=.001):
+        self._path = _block_path(shm_dir or _default_shm_dir(), key, 'steps')
+        if n_participants is None:
+            self._steps = np.load(self._path, mmap_mode='r+')
+            self._created = False
+        else:
+            self._steps = open_memmap(self._path, mode='w+', dtype=np.int64,
+                                      shape=(n_participants, ))
+            self._steps[:] = 0
+            self._created = True
+
+        if participant < 0 or participant >= len(self._steps):
+            raise ValueError('participant out of range')
+        self._participant = participant
+        self._poll_interval = poll_interval
+
+    @property
+    def step(self):
+        """Step that the calling process has completed."""
+        return int(self._steps[self._participant])
+
+    def step_of(self, participant):
+        """Step that a process has completed."""
+        return int(self._steps[participant])
+
+    def advance(self):
+        """Mark the calling process's current step as done.
+
+        Returns
+        -------
+        int
+            The calling process's new step.
+        """
+        self._steps[self._participant] += 1
+        return self.step
+
+    def wait_for(self, participant, step, timeout=None):
+        """Wait until a process has completed a step.
+
+        Parameters
+        ----------
+        participant : int
+            Index of the process to wait for.
+        step : int
+            Step to wait for.
+        timeout : float, optional
+            Time, in seconds, after which to give up.
+
+        Raises
+        ------
+        RuntimeError
+            If *timeout* is reached.
+        """
+        start = time.time()
+        while self._steps[participant] < step:
+            if timeout is not None and time.time() - start > timeout:
+                raise RuntimeError(
+                    'timed out waiting for process {participant} to reach '
+                    'step {step}'.format(participant=participant, step=step))
+            time.sleep(self._poll_interval)
+
+    def unlink(self):
+        """Remove the counters, if they were created by this process."""
+        if self._created:
+            try:
+                os.remove(self._path)
+            except OSError:
+                pass
+            self._created = False
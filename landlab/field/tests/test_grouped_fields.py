@@ -1,5 +1,8 @@
 #! /usr/bin/env python
 
+import pickle
+import threading
+
 from nose.tools import assert_true, assert_false, assert_raises
 try:
     from nose.tools import assert_is_not, assert_is, assert_set_equal, assert_dict_equal
@@ -204,3 +207,87 @@ def test_grid_field_zeros_ones_empty():
     assert_raises(ValueError, fields.zeros, 'grid')
     assert_raises(ValueError, fields.empty, 'grid')
     assert_raises(ValueError, fields.ones, 'grid')
+
+
+def test_default_float_dtype():
+    """Test fields are double precision by default."""
+    fields = ModelDataFields()
+    fields.new_field_location('node', 4)
+    assert_true(fields.float_dtype == np.float64)
+    assert_true(fields.add_zeros('node', 'z').dtype == np.float64)
+
+
+def test_float_dtype_policy():
+    """Test new fields follow the float_dtype policy."""
+    fields = ModelDataFields(float_dtype=np.float32)
+    fields.new_field_location('node', 4)
+
+    assert_true(fields.zeros('node').dtype == np.float32)
+    assert_true(fields.add_empty('node', 'a').dtype == np.float32)
+    assert_true(fields.add_ones('node', 'b').dtype == np.float32)
+    assert_true(fields.add_zeros('node', 'c').dtype == np.float32)
+    assert_true(fields.add_zeros('node', 'd', dtype=int).dtype == np.int_)
+
+    values = np.arange(4.)
+    assert_is(fields.add_field('node', 'e', values), values)
+
+
+def test_field_version():
+    """Test field versions go up when fields are set or marked."""
+    fields = ModelDataFields()
+    fields.new_field_location('node', 4)
+    z = fields.add_zeros('node', 'z')
+    assert_true(fields.field_version('node', 'z') == 1)
+
+    z[0] = 1.
+    assert_true(fields.field_version('node', 'z') == 1)
+
+    fields.mark_modified('node', 'z')
+    assert_true(fields.field_version('node', 'z') == 2)
+
+    fields.at_node['z'] = np.ones(4)
+    assert_true(fields.field_version('node', 'z') == 3)
+
+    fields.add_field('node', 'z', np.ones(4), noclobber=False)
+    assert_true(fields.field_version('node', 'z') == 4)
+
+
+def test_field_version_from_threads():
+    """Test field versions count marks made from many threads."""
+    fields = ModelDataFields()
+    fields.new_field_location('node', 4)
+    fields.add_zeros('node', 'z')
+
+    def mark(n_times):
+        for _ in range(n_times):
+            fields.mark_modified('node', 'z')
+
+    threads = [threading.Thread(target=mark, args=(1000, ))
+               for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert_true(fields.field_version('node', 'z') == 4001)
+
+
+def test_pickle_fields():
+    """Test fields with version locks can be pickled."""
+    fields = ModelDataFields()
+    fields.new_field_location('node', 4)
+    fields.add_zeros('node', 'z')
+    state = fields.at_node.__getstate__()
+    assert_false('_version_lock' in state)
+
+    fields.at_node.__setstate__(state)
+    fields.mark_modified('node', 'z')
+    assert_true(fields.field_version('node', 'z') == 2)
+    assert_true(len(pickle.dumps(fields)) > 0)
+
+
+def test_field_version_missing_field():
+    """Test getting the version of a missing field."""
+    fields = ModelDataFields()
+    fields.new_field_location('node', 4)
+    assert_raises(FieldError, fields.field_version, 'node', 'z')
+    assert_raises(FieldError, fields.mark_modified, 'node', 'z')
@@ -0,0 +1,87 @@
+import multiprocessing
+import os
+import uuid
+
+import numpy as np
+from numpy.testing import assert_array_equal
+from nose.tools import assert_equal, assert_is, assert_false
+
+from landlab import RasterModelGrid
+from landlab.field.shared import SharedFields, StepBarrier
+
+
+N_STEPS = 6
+CADENCE = 3
+
+
+def _flexure_process(key):
+    """Stand-in for a model that reads elevations and writes a deflection.
+
+    It runs once for every CADENCE steps of the other process.
+    """
+    grid = RasterModelGrid((4, 5))
+    shared = SharedFields(grid, key)
+    z = shared.attach('node', 'topographic__elevation')
+    dz = shared.attach('node', 'lithosphere_surface__elevation_increment')
+    barrier = StepBarrier(key, 1)
+
+    for step in range(CADENCE, N_STEPS + 1, CADENCE):
+        barrier.wait_for(0, step, timeout=10.)
+        dz[:] = - z * .1
+        barrier.advance()
+
+
+def test_share_and_attach():
+    """Fields shared by one grid can be attached by another."""
+    key = uuid.uuid4().hex
+    grid = RasterModelGrid((3, 4))
+    grid.add_field('link', 'water__discharge', np.arange(17.), units='m3/s')
+
+    with SharedFields(grid, key) as shared:
+        q = shared.share('link', 'water__discharge')
+        assert_is(grid.at_link['water__discharge'], q)
+        assert_equal(grid.field_units('link', 'water__discharge'), 'm3/s')
+
+        other_grid = RasterModelGrid((3, 4))
+        other_q = SharedFields(other_grid, key).attach('link',
+                                                       'water__discharge')
+        assert_array_equal(other_q, np.arange(17.))
+        q[3] = 30.
+        assert_equal(other_grid.at_link['water__discharge'][3], 30.)
+
+        path = shared._path('link', 'water__discharge')
+        assert os.path.isfile(path)
+    assert_false(os.path.isfile(path))
+
+
+def test_two_processes():
+    """Processes exchange fields, in step, through shared memory."""
+    key = uuid.uuid4().hex
+    grid = RasterModelGrid((4, 5))
+    z = grid.add_zeros('node', 'topographic__elevation')
+    grid.add_zeros('node', 'lithosphere_surface__elevation_increment')
+
+    shared = SharedFields(grid, key)
+    z = shared.share('node', 'topographic__elevation')
+    dz = shared.share('node', 'lithosphere_surface__elevation_increment')
+    barrier = StepBarrier(key, 0, n_participants=2)
+
+    process = multiprocessing.Process(target=_flexure_process, args=(key, ))
+    process.start()
+    try:
+        for step in range(1, N_STEPS + 1):
+            if step > CADENCE:
+                barrier.wait_for(1, (step - 1) // CADENCE, timeout=10.)
+            z += 1.
+            barrier.advance()
+
+            if step % CADENCE == 0:
+                barrier.wait_for(1, step // CADENCE, timeout=10.)
+                assert_array_equal(dz, - z * .1)
+    finally:
+        process.join(10.)
+        shared.unlink()
+        barrier.unlink()
+
+    assert_equal(process.exitcode, 0)
+    assert_array_equal(dz, - N_STEPS * .1)
@@ -0,0 +1,305 @@
+#! /usr/bin/env python
+"""Run a set of components, in order of their data dependencies.
+
+A :class:`Scheduler` holds a list of component instances, in the order that
+a driver would call them. Components declare the fields they use and the
+fields they provide (their ``_input_var_names`` and ``_output_var_names``)
+and, from these, the scheduler finds which components must wait for others.
+By default components are run one after another. Optionally, components
+that do not depend on one another run at the same time, in a pool of
+threads. This pays off for components whose work is done by compiled code,
+or numpy, that releases the GIL.
+
+Components that run at the same time share a grid, and the scheduler only
+knows about the fields they declare. Running in threads is therefore only
+safe if each component lists every field that it reads or writes; a field
+that a component changes without declaring it may be changed by two
+threads at once.
+
+A component depends on an earlier one if it uses a field the earlier one
+provides, if it provides a field the earlier one uses, or if both provide
+the same field. The result of a step is therefore the same as calling the
+components one after another in the order they were added.
+
+Scheduler
++++++++++
+
+.. autosummary::
+    :toctree: generated/
+
+    ~landlab.framework.scheduler.Scheduler
+"""
+import inspect
+from multiprocessing.pool import ThreadPool
+from timeit import default_timer
+
+
+def _var_names(component, intent):
+    """Get the names of the fields a component uses or provides.
+
+    Parameters
+    ----------
+    component : Component
+        A component instance.
+    intent : {'input', 'output'}
+        Whether to get the fields used, or provided.
+
+    Returns
+    -------
+    set of str
+        Names of fields.
+    """
+    return set(getattr(component, '_' + intent + '_var_names', ()))
+
+
+def _takes_time_step(method):
+    """Check if a method can be passed a time step as *dt*.
+
+    Parameters
+    ----------
+    method : callable
+        A *run_one_step* method.
+
+    Returns
+    -------
+    bool
+        True if the method has a *dt* argument, or takes any keyword.
+
+    Examples
+    --------
+    >>> from landlab.framework.scheduler import _takes_time_step
+    >>> _takes_time_step(lambda dt: None)
+    True
+    >>> _takes_time_step(lambda **kwds: None)
+    True
+    >>> _takes_time_step(lambda: None)
+    False
+    """
+    try:
+        parameters = inspect.signature(method).parameters.values()
+    except AttributeError:
+        spec = inspect.getargspec(method)
+        return 'dt' in spec.args or spec.keywords is not None
+    return any(param.name == 'dt' or param.kind == param.VAR_KEYWORD
+               for param in parameters)
+
+
+class Scheduler(object):
+
+    """Run components in order of their data dependencies.
+
+    Parameters
+    ----------
+    components : iterable of Component, optional
+        Components to add, in the order that they would be run.
+    n_threads : int or None, optional
+        Number of threads used to run independent components. The default,
+        1, runs components one after another. If ``None``, use the number
+        of CPUs. Only use more than one thread if every component declares
+        all of the fields that it reads and writes.
+
+    Examples
+    --------
+    >>> from landlab import RasterModelGrid
+    >>> from landlab.components import FlowRouter, LinearDiffuser
+    >>> from landlab.framework.scheduler import Scheduler
+    >>> grid = RasterModelGrid((4, 5))
+    >>> z = grid.add_field('node', 'topographic__elevation',
+    ...                    grid.node_x * grid.node_y)
+    >>> diffuse = LinearDiffuser(grid, linear_diffusivity=0.01)
+    >>> route = FlowRouter(grid)
+    >>> scheduler = Scheduler([diffuse, route])
+    >>> scheduler.names
+    ('LinearDiffuser', 'DNFlowRouter')
+
+    The flow router uses the elevations that the diffuser changes, so it
+    must wait for the diffuser.
+
+    >>> scheduler.dependencies('DNFlowRouter')
+    ('LinearDiffuser',)
+    >>> scheduler.levels
+    (('LinearDiffuser',), ('DNFlowRouter',))
+
+    Diffuse ten times for each routing step.
+
+    >>> scheduler.set_substeps('LinearDiffuser', 10)
+    >>> scheduler.run_one_step(1.)
+    >>> sorted(scheduler.wall_time)
+    ['DNFlowRouter', 'LinearDiffuser']
+    >>> scheduler.close()
+    """
+
+    def __init__(self, components=None, n_threads=1):
+        self._components = []
+        self._names = []
+        self._takes_dt = {}
+        self._substeps = {}
+        self._levels = None
+        self._wall_time = {}
+        self._total_wall_time = {}
+        self._n_threads = n_threads
+        self._pool = None
+
+        for component in components or []:
+            self.add(component)
+
+    @property
+    def names(self):
+        """Names of the components, in the order they were added."""
+        return tuple(self._names)
+
+    def add(self, component, name=None, substeps=1):
+        """Add a component.
+
+        Parameters
+        ----------
+        component : Component
+            A component instance, with a *run_one_step* method.
+        name : str, optional
+            Name to refer to the component by. The default is the
+            component's name.
+        substeps : int, optional
+            Number of times to run the component for each step.
+
+        Examples
+        --------
+        >>> from landlab import RasterModelGrid
+        >>> from landlab.components import FlowRouter
+        >>> from landlab.framework.scheduler import Scheduler
+        >>> grid = RasterModelGrid((4, 5))
+        >>> _ = grid.add_zeros('node', 'topographic__elevation')
+        >>> scheduler = Scheduler()
+        >>> scheduler.add(FlowRouter(grid))
+        >>> scheduler.add(FlowRouter(grid), name='router')
+        >>> scheduler.names
+        ('DNFlowRouter', 'router')
+        >>> scheduler.add(FlowRouter(grid))
+        Traceback (most recent call last):
+        ...
+        ValueError: DNFlowRouter: component already added
+        """
+        name = name or component._name
+        if name in self._names:
+            raise ValueError('{name}: component already added'.format(
+                name=name))
+        self._components.append(component)
+        self._names.append(name)
+        self._takes_dt[name] = _takes_time_step(component.run_one_step)
+        self._wall_time[name] = 0.
+        self._total_wall_time[name] = 0.
+        self.set_substeps(name, substeps)
+        self._levels = None
+
+    def set_substeps(self, name, substeps):
+        """Set the number of times a component runs for each step.
+
+        Each substep is run with a time step of ``dt / substeps``.
+
+        Parameters
+        ----------
+        name : str
+            Name of the component.
+        substeps : int
+            Number of substeps.
+        """
+        if name not in self._names:
+            raise KeyError(name)
+        if substeps < 1:
+            raise ValueError('number of substeps must be at least one')
+        self._substeps[name] = int(substeps)
+
+    def dependencies(self, name):
+        """Get the components that a component must wait for.
+
+        Parameters
+        ----------
+        name : str
+            Name of the component.
+
+        Returns
+        -------
+        tuple of str
+            Names of the earlier components it depends on.
+        """
+        index = self._names.index(name)
+        uses = _var_names(self._components[index], 'input')
+        provides = _var_names(self._components[index], 'output')
+
+        depends_on = []
+        for before in range(index):
+            component = self._components[before]
+            before_uses = _var_names(component, 'input')
+            before_provides = _var_names(component, 'output')
+            if (uses & before_provides or provides & before_uses or
+                    provides & before_provides):
+                depends_on.append(self._names[before])
+        return tuple(depends_on)
+
+    @property
+    def levels(self):
+        """Groups of components that can run at the same time.
+
+        The groups are run one after another. A component is in the group
+        after the last of those it depends on.
+        """
+        if self._levels is None:
+            level_of = {}
+            for name in self._names:
+                level_of[name] = 1 + max(
+                    [level_of[dep] for dep in self.dependencies(name)] +
+                    [-1])
+            n_levels = max(list(level_of.values()) + [-1]) + 1
+            self._levels = tuple(
+                tuple(name for name in self._names if level_of[name] == level)
+                for level in range(n_levels))
+        return self._levels
+
+    @property
+    def wall_time(self):
+        """Wall time, in seconds, of each component over the last step."""
+        return dict(self._wall_time)
+
+    @property
+    def total_wall_time(self):
+        """Wall time, in seconds, of each component over all steps."""
+        return dict(self._total_wall_time)
+
+    def _run_component(self, name, dt):
+        """Run a component for one step, including its substeps."""
+        component = self._components[self._names.index(name)]
+        substeps = self._substeps[name]
+
+        start = default_timer()
+        for _ in range(substeps):
+            if self._takes_dt[name]:
+                component.run_one_step(dt=dt / substeps)
+            else:
+                component.run_one_step()
+        self._wall_time[name] = default_timer() - start
+        self._total_wall_time[name] += self._wall_time[name]
+
+    def run_one_step(self, dt):
+        """Run every component for one step.
+
+        Parameters
+        ----------
+        dt : float
+            Time step. Components whose *run_one_step* method has no *dt*
+            argument are run without one.
+        """
+        for level in self.levels:
+            if len(level) == 1 or self._n_threads == 1:
+                for name in level:
+                    self._run_component(name, dt)
+            else:
+                if self._pool is None:
+                    self._pool = ThreadPool(processes=self._n_threads)
+                self._pool.map(lambda name: self._run_component(name, dt),
+                               level)
+
+    def close(self):
+        """Shut down the pool of threads."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
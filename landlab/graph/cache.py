@@ -0,0 +1,304 @@
+"""Save graph topology to a file and memory-map it back.
+
+Building a graph from a set of nodes (triangulating them, sorting elements
+and ordering links around nodes and patches) is costly. When many models
+are run on the same mesh, the topology can be built once, saved, and then
+read by each model. Files are written as a sequence of numpy ``.npy``
+records so that, when read, arrays are memory-mapped rather than loaded.
+
+Cache files are named by a hash of the coordinates of the nodes, the type
+of graph and the keywords used to build it, so a changed mesh is never
+read from a stale file. Along with the topology, the other attributes of a
+graph (its shape, orientation and the like) are saved so that a graph of
+any class can be rebuilt from its file.
+
+Graph cache
++++++++++++
+
+.. autosummary::
+    :toctree: generated/
+
+    ~landlab.graph.cache.hash_of_nodes
+    ~landlab.graph.cache.save_topology
+    ~landlab.graph.cache.load_topology
+    ~landlab.graph.cache.load_attributes
+    ~landlab.graph.cache.load_class
+"""
+import hashlib
+import importlib
+import json
+import os
+
+import numpy as np
+from numpy.lib import format
+
+
+_GRAPH_TOPOLOGY = ('xy_of_node', 'nodes_at_link', 'links_at_patch',
+                   'nodes_at_patch', 'links_at_node', 'link_dirs_at_node',
+                   'patches_at_node', 'patches_at_link')
+_DUAL_TOPOLOGY = ('node_at_cell', 'nodes_at_face')
+
+
+def _update_hash(sha, value):
+    """Add a value to a hash, using the data of arrays and sequences."""
+    if isinstance(value, (list, tuple)):
+        sha.update(b'(')
+        for item in value:
+            _update_hash(sha, item)
+            sha.update(b',')
+        sha.update(b')')
+    elif isinstance(value, np.ndarray):
+        value = np.ascontiguousarray(value)
+        sha.update(str((value.dtype.str, value.shape)).encode('utf-8'))
+        sha.update(value.tobytes())
+    else:
+        sha.update(repr(value).encode('utf-8'))
+
+
+def hash_of_nodes(nodes, *args, **kwds):
+    """Hash node coordinates and the arguments used to build a graph.
+
+    Parameters
+    ----------
+    nodes : tuple of array_like
+        Coordinates of nodes as (*y*, *x*).
+    args, kwds
+        Any other arguments that change the graph built from the nodes.
+        Arrays are hashed by their data, other values by their string
+        representations.
+
+    Returns
+    -------
+    str
+        Hex digest of the hash.
+
+    Examples
+    --------
+    >>> from landlab.graph.cache import hash_of_nodes
+    >>> key = hash_of_nodes(([0, 0, 1], [0, 1, 0]))
+    >>> key == hash_of_nodes(([0., 0., 1.], [0., 1., 0.]))
+    True
+    >>> key == hash_of_nodes(([0, 0, 1], [0, 1, 0]), 'VoronoiGraph')
+    False
+    >>> key == hash_of_nodes(([0, 0, 1], [0, 1, 0.5]))
+    False
+    """
+    sha = hashlib.sha1()
+    for coord in nodes:
+        coord = np.ascontiguousarray(coord, dtype=np.float64)
+        sha.update(str(coord.shape).encode('utf-8'))
+        sha.update(coord.tobytes())
+    for arg in args:
+        _update_hash(sha, arg)
+    for name in sorted(kwds):
+        sha.update(name.encode('utf-8'))
+        _update_hash(sha, kwds[name])
+    return sha.hexdigest()
+
+
+def _topology_of(graph, prefix=''):
+    """Get the topology arrays of a graph, keyed by name."""
+    arrays = {}
+    for name in _GRAPH_TOPOLOGY:
+        try:
+            arrays[prefix + name] = np.asarray(getattr(graph, name))
+        except AttributeError:
+            pass
+    return arrays
+
+
+def _as_builtin(value):
+    """Convert a numpy scalar to a python one, for JSON."""
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError('{value!r} is not JSON serializable'.format(value=value))
+
+
+def _as_tuples(value):
+    """Convert lists read from JSON back into tuples."""
+    if isinstance(value, list):
+        return tuple(_as_tuples(item) for item in value)
+    elif isinstance(value, dict):
+        return dict((key, _as_tuples(item)) for key, item in value.items())
+    else:
+        return value
+
+
+def _attributes_of(graph):
+    """Encode the attributes of a graph, other than arrays, as JSON.
+
+    The dual and the sorting options (which are given again when the graph
+    is read) are not included.
+    """
+    attrs = {}
+    for name, value in graph.__dict__.items():
+        if isinstance(value, np.ndarray) or name in ('_dual', '_sorting'):
+            continue
+        try:
+            json.dumps(value, default=_as_builtin)
+        except TypeError:
+            raise ValueError(
+                'unable to cache {cls}: attribute {name} is not a number, '
+                'string or sequence'.format(cls=type(graph).__name__,
+                                            name=name))
+        attrs[name] = value
+    return json.dumps(attrs, sort_keys=True, default=_as_builtin)
+
+
+def load_attributes(text):
+    """Decode graph attributes saved with :func:`save_topology`.
+
+    Parameters
+    ----------
+    text : str or ndarray of str
+        Attributes encoded as JSON.
+
+    Returns
+    -------
+    dict
+        Attributes, keyed by name. Sequences are returned as tuples.
+
+    Examples
+    --------
+    >>> from landlab.graph.cache import load_attributes
+    >>> attrs = load_attributes('{"_origin": [0.0, 1.0], "_shape": [3, 4]}')
+    >>> attrs['_origin'], attrs['_shape']
+    ((0.0, 1.0), (3, 4))
+    """
+    return _as_tuples(json.loads(np.asarray(text).item()))
+
+
+def load_class(text):
+    """Import a class saved with :func:`save_topology`.
+
+    Parameters
+    ----------
+    text : str or ndarray of str
+        Class named as *module:name*.
+
+    Returns
+    -------
+    type
+        The class.
+
+    Examples
+    --------
+    >>> from landlab.graph.cache import load_class
+    >>> load_class('landlab.graph.graph:Graph').__name__
+    'Graph'
+    """
+    module, name = np.asarray(text).item().split(':')
+    return getattr(importlib.import_module(module), name)
+
+
+def _name_of_class(obj):
+    """Name of the class of an object as *module:name*."""
+    return '{module}:{name}'.format(module=type(obj).__module__,
+                                    name=type(obj).__name__)
+
+
+def save_topology(graph, path):
+    """Save the topology of a graph.
+
+    The arrays that define how nodes, links and patches connect to one
+    another are saved, along with node coordinates. For a graph with a dual,
+    its node-cell and node-face connectivity and the topology of the dual
+    are saved too, as is the class of the dual. Other attributes of the
+    graphs, such as their shape, are saved as JSON, so they must be numbers,
+    strings or sequences of them. The file is written under a temporary
+    name and then moved into place so that other processes never read a
+    partial file.
+
+    Parameters
+    ----------
+    graph : Graph
+        The graph to save.
+    path : str
+        Path of the file to write.
+
+    Examples
+    --------
+    >>> import os, tempfile
+    >>> import numpy as np
+    >>> from landlab.graph import Graph
+    >>> from landlab.graph.cache import save_topology, load_topology
+    >>> graph = Graph(([0, 0, 1, 1], [0, 1, 0, 1]),
+    ...               links=((0, 1), (0, 2), (1, 3), (2, 3)))
+    >>> path = os.path.join(tempfile.mkdtemp(), 'square.graph')
+    >>> save_topology(graph, path)
+    >>> arrays = load_topology(path)
+    >>> isinstance(arrays['nodes_at_link'], np.memmap)
+    True
+    >>> np.all(arrays['nodes_at_link'] == graph.nodes_at_link)
+    True
+    >>> sorted(arrays) # doctest: +NORMALIZE_WHITESPACE
+    ['attrs', 'link_dirs_at_node', 'links_at_node', 'nodes_at_link',
+     'xy_of_node']
+    """
+    arrays = _topology_of(graph)
+    arrays['attrs'] = np.array(_attributes_of(graph))
+    if hasattr(graph, '_dual'):
+        for name in _DUAL_TOPOLOGY:
+            arrays[name] = getattr(graph, '_' + name)
+        arrays.update(_topology_of(graph._dual, prefix='dual/'))
+        arrays['dual/attrs'] = np.array(_attributes_of(graph._dual))
+        arrays['dual/class'] = np.array(_name_of_class(graph._dual))
+
+    names = sorted(arrays)
+    temp_path = '{path}.{pid}.tmp'.format(path=path, pid=os.getpid())
+    with open(temp_path, 'wb') as fp:
+        format.write_array(fp, np.array(names, dtype='U'))
+        for name in names:
+            format.write_array(fp, np.ascontiguousarray(arrays[name]))
+    os.rename(temp_path, path)
+
+
+def _read_header(fp):
+    """Read the header of a ``.npy`` record."""
+    version = format.read_magic(fp)
+    if version == (1, 0):
+        return format.read_array_header_1_0(fp)
+    else:
+        return format.read_array_header_2_0(fp)
+
+
+def load_topology(path, mmap_mode='r'):
+    """Read topology saved with :func:`save_topology`.
+
+    Parameters
+    ----------
+    path : str
+        Path to a saved topology file.
+    mmap_mode : {'r', 'c'}, optional
+        Memory-map the arrays read-only (``'r'``), or copy-on-write
+        (``'c'``).
+
+    Returns
+    -------
+    dict
+        Topology arrays, keyed by name. Arrays of the dual graph are named
+        with a ``dual/`` prefix. Attributes and class names are strings,
+        which are read into memory rather than memory-mapped.
+    """
+    arrays = {}
+    with open(path, 'rb') as fp:
+        (shape, fortran_order, dtype) = _read_header(fp)
+        count = int(np.prod(shape))
+        names = np.frombuffer(fp.read(count * dtype.itemsize), dtype=dtype,
+                              count=count)
+        for name in (str(name) for name in names):
+            (shape, fortran_order, dtype) = _read_header(fp)
+            offset = fp.tell()
+            if dtype.kind == 'U':
+                count = int(np.prod(shape))
+                arrays[name] = np.frombuffer(
+                    fp.read(count * dtype.itemsize), dtype=dtype,
+                    count=count).reshape(shape)
+            elif np.prod(shape) == 0:
+                arrays[name] = np.empty(shape, dtype=dtype)
+            else:
+                arrays[name] = np.memmap(
+                    path, dtype=dtype, mode=mmap_mode, offset=offset,
+                    shape=shape, order='F' if fortran_order else 'C')
+            fp.seek(offset + int(np.prod(shape)) * dtype.itemsize)
+    return arrays
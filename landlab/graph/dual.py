@@ -62,13 +62,11 @@ class DualGraph(object):
     def _create_link_at_face(self):
         link_at_nodes = {}
         for link, pair in enumerate(self.nodes_at_link):
-            pair.sort()
-            link_at_nodes[tuple(pair)] = link
+            link_at_nodes[tuple(sorted(pair))] = link
 
         link_at_face = np.full((self.number_of_faces, ), -1, dtype=int)
         for face, pair in enumerate(self._nodes_at_face):
-            pair.sort()
-            link_at_face[face] = link_at_nodes[tuple(pair)]
+            link_at_face[face] = link_at_nodes[tuple(sorted(pair))]
         self._link_at_face = link_at_face
         return self._link_at_face
 
@@ -52,6 +52,8 @@ array([[4, 3, 0, 1],
        [7, 6, 3, 4],
        [8, 7, 4, 5]])
 """
+import os
+
 from six.moves import range
 
 import numpy as np
@@ -154,6 +156,97 @@ class Graph(object):
 
         self._origin = (0., 0.)
 
+    @classmethod
+    def from_cache(cls, nodes, cache_dir, **kwds):
+        """Create a graph, reading its topology from a cache if possible.
+
+        The cache is a directory of files, each holding the topology of a
+        graph and named by a hash of *nodes*, the type of graph and *kwds*.
+        If a file is found for this graph its arrays are memory-mapped,
+        read-only, rather than computed. Otherwise the graph is built in the
+        usual way and its topology added to the cache. Either way, the
+        graph's other attributes (its shape, orientation and so on) are
+        those of a newly-built graph.
+
+        Parameters
+        ----------
+        nodes : tuple
+            First argument of the calling class, from which the graph is
+            built. For a Graph or VoronoiGraph, this is the coordinates of
+            nodes as (*y*, *x*); for classes like HexGraph or
+            UniformRectilinearGraph it is the shape of the graph.
+        cache_dir : str
+            Directory that holds cached graphs.
+        **kwds
+            Other keywords used to build the graph.
+
+        Returns
+        -------
+        Graph
+            A graph of the calling class.
+
+        Examples
+        --------
+        >>> import os, tempfile
+        >>> from landlab.graph import Graph
+        >>> cache_dir = tempfile.mkdtemp()
+        >>> node_x, node_y = [0, 1, 2, 0, 1, 2], [0, 0, 0, 1, 1, 1]
+        >>> links = ((0, 1), (1, 2), (0, 3), (1, 4), (2, 5), (3, 4), (4, 5))
+        >>> graph = Graph.from_cache((node_y, node_x), cache_dir, links=links)
+        >>> len(os.listdir(cache_dir))
+        1
+        >>> graph = Graph.from_cache((node_y, node_x), cache_dir, links=links)
+        >>> graph.links_at_node # doctest: +NORMALIZE_WHITESPACE
+        memmap([[ 0,  2, -1], [ 1,  3,  0], [ 4,  1, -1],
+                [ 5,  2, -1], [ 6,  5,  3], [ 6,  4, -1]])
+
+        Graphs that are built from a shape keep it.
+
+        >>> from landlab.graph import HexGraph
+        >>> graph = HexGraph.from_cache((3, 4), cache_dir, node_layout='hex')
+        >>> graph = HexGraph.from_cache((3, 4), cache_dir, node_layout='hex')
+        >>> graph.shape, graph.node_layout
+        ((3, 4), 'hex')
+        """
+        from .cache import hash_of_nodes, save_topology, load_topology
+
+        path = os.path.join(
+            cache_dir, hash_of_nodes(nodes, cls.__name__, **kwds) + '.graph')
+        if not os.path.isfile(path):
+            save_topology(cls(nodes, **kwds), path)
+
+        return cls._from_topology(load_topology(path),
+                                  sorting=kwds.get('sorting', True))
+
+    @classmethod
+    def _from_topology(cls, arrays, sorting=True, prefix=''):
+        """Create a graph from arrays read by *load_topology*."""
+        from .cache import load_attributes, load_class
+
+        graph = cls.__new__(cls)
+        graph._sorting = _parse_sorting_opt(sorting)
+        graph._origin = (0., 0.)
+        if prefix + 'attrs' in arrays:
+            graph.__dict__.update(load_attributes(arrays[prefix + 'attrs']))
+        graph._xy_of_node = arrays[prefix + 'xy_of_node']
+        graph._nodes = np.arange(len(graph._xy_of_node), dtype=int)
+        for name in ('nodes_at_link', 'links_at_patch', 'nodes_at_patch',
+                     'links_at_node', 'link_dirs_at_node', 'patches_at_node',
+                     'patches_at_link'):
+            if prefix + name in arrays:
+                setattr(graph, '_' + name, arrays[prefix + name])
+
+        if prefix + 'node_at_cell' in arrays:
+            graph._node_at_cell = arrays[prefix + 'node_at_cell']
+            graph._nodes_at_face = arrays[prefix + 'nodes_at_face']
+            if 'dual/class' in arrays:
+                dual_class = load_class(arrays['dual/class'])
+            else:
+                dual_class = Graph
+            graph._dual = dual_class._from_topology(arrays, prefix='dual/')
+
+        return graph
+
     def _create_nodes_at_link(self, links):
         """Set up node-link data structures."""
         if links is not None:
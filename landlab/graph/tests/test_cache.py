@@ -0,0 +1,146 @@
+import os
+import tempfile
+
+import numpy as np
+from numpy.testing import assert_array_equal
+from nose.tools import assert_equal, assert_is_instance, assert_raises
+
+from landlab.graph import (Graph, VoronoiGraph, DualVoronoiGraph, HexGraph,
+                           UniformRectilinearGraph,
+                           DualUniformRectilinearGraph)
+from landlab.graph.structured_quad.structured_quad import RectilinearGraph
+from landlab.graph.cache import hash_of_nodes, save_topology
+
+
+def _random_nodes(n_nodes=100, seed=1945):
+    np.random.seed(seed)
+    return (np.random.rand(n_nodes), np.random.rand(n_nodes))
+
+
+def test_voronoi_graph_from_cache():
+    """Cached topology matches that of a new graph."""
+    cache_dir = tempfile.mkdtemp()
+    nodes = _random_nodes()
+    expected = VoronoiGraph(nodes)
+
+    VoronoiGraph.from_cache(nodes, cache_dir)
+    graph = VoronoiGraph.from_cache(nodes, cache_dir)
+
+    assert_is_instance(graph, VoronoiGraph)
+    assert_is_instance(graph.nodes_at_link, np.memmap)
+    for name in ('xy_of_node', 'nodes_at_link', 'links_at_patch',
+                 'nodes_at_patch', 'links_at_node', 'link_dirs_at_node',
+                 'patches_at_link', 'length_of_link', 'area_of_patch'):
+        assert_array_equal(getattr(graph, name), getattr(expected, name))
+
+
+def test_dual_voronoi_graph_from_cache():
+    """The topology of a dual graph is cached."""
+    cache_dir = tempfile.mkdtemp()
+    nodes = _random_nodes()
+    expected = DualVoronoiGraph(nodes)
+
+    DualVoronoiGraph.from_cache(nodes, cache_dir)
+    graph = DualVoronoiGraph.from_cache(nodes, cache_dir)
+
+    assert_is_instance(graph, DualVoronoiGraph)
+    for name in ('nodes_at_link', 'links_at_node', 'node_at_cell',
+                 'cell_at_node', 'corners_at_face', 'faces_at_cell',
+                 'faces_at_corner', 'xy_of_corner',
+                 'area_of_cell'):
+        assert_array_equal(getattr(graph, name), getattr(expected, name))
+
+
+def test_cache_is_keyed_by_nodes():
+    """Different nodes or graph types use different files."""
+    cache_dir = tempfile.mkdtemp()
+    VoronoiGraph.from_cache(_random_nodes(seed=1), cache_dir)
+    VoronoiGraph.from_cache(_random_nodes(seed=2), cache_dir)
+    DualVoronoiGraph.from_cache(_random_nodes(seed=1), cache_dir)
+    VoronoiGraph.from_cache(_random_nodes(seed=1), cache_dir)
+    assert_equal(len(os.listdir(cache_dir)), 3)
+
+
+def test_hash_of_array_keywords():
+    """Array keywords are hashed by value."""
+    nodes = ([0, 0, 1, 1], [0, 1, 0, 1])
+    links = np.arange(2000).reshape((-1, 2))
+    other_links = links.copy()
+    other_links[500, 0] = -1
+    assert hash_of_nodes(nodes, links=links) != hash_of_nodes(
+        nodes, links=other_links)
+
+
+def test_cached_topology_is_read_only():
+    """Cached arrays can't be changed."""
+    cache_dir = tempfile.mkdtemp()
+    nodes = ([0, 0, 1, 1], [0, 1, 0, 1])
+    links = ((0, 1), (0, 2), (1, 3), (2, 3))
+    Graph.from_cache(nodes, cache_dir, links=links)
+    graph = Graph.from_cache(nodes, cache_dir, links=links)
+    with assert_raises(ValueError):
+        graph.nodes_at_link[0, 0] = 3
+
+
+def test_hex_graph_from_cache():
+    """A cached hex graph keeps its shape, orientation and layout."""
+    cache_dir = tempfile.mkdtemp()
+    kwds = dict(spacing=2., orientation='vertical', node_layout='hex')
+    expected = HexGraph((3, 4), **kwds)
+
+    HexGraph.from_cache((3, 4), cache_dir, **kwds)
+    graph = HexGraph.from_cache((3, 4), cache_dir, **kwds)
+
+    assert_is_instance(graph, HexGraph)
+    assert_equal(graph.shape, (3, 4))
+    assert_equal(graph.orientation, 'vertical')
+    assert_equal(graph.node_layout, 'hex')
+    for name in ('xy_of_node', 'nodes_at_link', 'links_at_patch',
+                 'perimeter_nodes', 'length_of_link'):
+        assert_array_equal(getattr(graph, name), getattr(expected, name))
+
+
+def test_structured_quad_graphs_from_cache():
+    """Cached structured-quad graphs keep their shape."""
+    cache_dir = tempfile.mkdtemp()
+    for cls, nodes, kwds in (
+            (UniformRectilinearGraph, (4, 5), dict(spacing=(2., 3.))),
+            (RectilinearGraph, ([0., 1., 3.], [0., 2., 3., 5.]), {})):
+        expected = cls(nodes, **kwds)
+        cls.from_cache(nodes, cache_dir, **kwds)
+        graph = cls.from_cache(nodes, cache_dir, **kwds)
+
+        assert_is_instance(graph, cls)
+        assert_equal(graph.shape, expected.shape)
+        for name in ('xy_of_node', 'nodes_at_link', 'links_at_node',
+                     'nodes_at_patch', 'perimeter_nodes'):
+            assert_array_equal(getattr(graph, name),
+                               getattr(expected, name))
+
+
+def test_dual_structured_quad_graph_from_cache():
+    """The dual of a cached graph is of its original class."""
+    cache_dir = tempfile.mkdtemp()
+    expected = DualUniformRectilinearGraph((4, 5))
+
+    DualUniformRectilinearGraph.from_cache((4, 5), cache_dir)
+    graph = DualUniformRectilinearGraph.from_cache((4, 5), cache_dir)
+
+    assert_equal(graph.shape, (4, 5))
+    assert_is_instance(graph.dual, UniformRectilinearGraph)
+    assert_equal(graph.dual.shape, (3, 4))
+    for name in ('node_at_cell', 'faces_at_cell', 'xy_of_corner',
+                 'corners_at_face', 'area_of_cell', 'perimeter_nodes'):
+        assert_array_equal(getattr(graph, name), getattr(expected, name))
+    assert_array_equal(graph.dual.perimeter_nodes,
+                       expected.dual.perimeter_nodes)
+
+
+def test_uncachable_attribute():
+    """Graphs with attributes that can't be saved aren't cached."""
+    graph = Graph(([0, 0, 1, 1], [0, 1, 0, 1]),
+                  links=((0, 1), (0, 2), (1, 3), (2, 3)))
+    graph._helper = object()
+    path = os.path.join(tempfile.mkdtemp(), 'square.graph')
+    assert_raises(ValueError, save_topology, graph, path)
+    assert_equal(os.path.exists(path), False)
@@ -35,6 +35,7 @@ Information about the grid as a whole
 
     ~landlab.grid.base.ModelGrid.axis_name
     ~landlab.grid.base.ModelGrid.axis_units
+    ~landlab.grid.base.ModelGrid.memory_footprint
     ~landlab.grid.base.ModelGrid.move_origin
     ~landlab.grid.base.ModelGrid.ndim
     ~landlab.grid.base.ModelGrid.node_axis_coordinates
@@ -375,7 +376,12 @@ Identifying node subsets
 These methods are useful in identifying subsets of nodes, e.g., closest node
 to a point; nodes at edges.
 
-(None are available for this grid type)
+.. autosummary::
+    :toctree: generated/
+
+    ~landlab.grid.base.ModelGrid.find_nearest_node
+    ~landlab.grid.base.ModelGrid.is_point_on_grid
+    ~landlab.grid.base.ModelGrid.spatial_index
 
 Surface analysis
 ----------------
@@ -389,6 +395,7 @@ find in GIS software.
     ~landlab.grid.base.ModelGrid.calc_aspect_at_node
     ~landlab.grid.base.ModelGrid.calc_slope_at_node
     ~landlab.grid.base.ModelGrid.calc_hillshade_at_node
+    ~landlab.grid.base.ModelGrid.calc_slope_aspect_hillshade_at_node
 
 Notes
 -----
@@ -792,6 +799,11 @@ class ModelGrid(ModelDataFieldsMixIn):
         Name of axes
     axis_units : tuple, optional
         Units of coordinates
+    float_dtype : data-type, optional
+        Data type of new floating-point fields (float64, by default).
+    id_dtype : data-type, optional
+        Integer type of the arrays that hold element ids and connectivity
+        (the platform integer, by default).
     """
     # Debugging flags (if True, activates some output statements)
     _DEBUG_VERBOSE = False
@@ -809,8 +821,37 @@ class ModelGrid(ModelDataFieldsMixIn):
     # : Nodes on the other end of links pointing out of a node.
     _node_outlink_matrix = numpy.array([], dtype=numpy.int32)
 
+    # : Integer type of element ids, until a grid is given its own.
+    _id_dtype = numpy.dtype(numpy.int_)
+    # Attributes that hold element ids. Subclasses build connectivity before
+    # calling ModelGrid.__init__, which converts these to the grid's id_dtype.
+    _id_arrays = (
+        '_nodes', '_node_at_link_tail', '_node_at_link_head',
+        '_links_at_node', '_neighbors_at_node', '_node_at_cell',
+        '_cell_at_node', '_face_at_link', '_link_at_face', '_faces_at_cell',
+        '_nodes_at_patch', '_links_at_patch', '_patches_at_node',
+        '_patches_at_link', '_active_links', '_fixed_links',
+        '_activelink_fromnode', '_activelink_tonode', '_active_faces',
+        '_core_nodes', '_core_cells', '_boundary_nodes',
+        '_node_inlink_matrix', '_node_outlink_matrix',
+        '_node_active_inlink_matrix', '_node_active_outlink_matrix',
+        '_node_active_inlink_matrix2', '_node_active_outlink_matrix2',
+    )
+
     def __init__(self, **kwds):
-        super(ModelGrid, self).__init__()
+        self._id_dtype = numpy.dtype(kwds.get('id_dtype') or numpy.int_)
+        # Diagonal links of rasters are numbered after the other links.
+        max_id = 2 * max(self.number_of_elements(loc) for loc in _SIZED_FIELDS)
+        if max_id > numpy.iinfo(self._id_dtype).max:
+            raise ValueError(
+                'id_dtype {dtype} is too small for the grid'.format(
+                    dtype=self._id_dtype))
+        for name in self._id_arrays:
+            if isinstance(self.__dict__.get(name), numpy.ndarray):
+                setattr(self, name, as_id_array(getattr(self, name),
+                                                dtype=self._id_dtype))
+
+        super(ModelGrid, self).__init__(float_dtype=kwds.get('float_dtype'))
 
         self.axis_name = kwds.get('axis_name', _default_axis_names(self.ndim))
         self.axis_units = kwds.get(
@@ -838,6 +879,41 @@ class ModelGrid(ModelDataFieldsMixIn):
         #     ModelDataFields.new_field_location(self, loc, size=None)
         ModelDataFields.set_default_group(self, 'node')
 
+    @property
+    def id_dtype(self):
+        """Integer type of the grid's id and connectivity arrays.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from landlab import RasterModelGrid
+        >>> grid = RasterModelGrid((4, 5))
+        >>> grid.id_dtype == np.int_
+        True
+        >>> grid.links_at_node.dtype == np.int_
+        True
+
+        Grids can store their ids as 32-bit integers, which halves the
+        memory used by their connectivity.
+
+        >>> grid = RasterModelGrid((4, 5), id_dtype=np.int32)
+        >>> grid.links_at_node.dtype
+        dtype('int32')
+        >>> grid.set_closed_boundaries_at_grid_edges(True, True, True, True)
+        >>> grid.active_links.dtype
+        dtype('int32')
+
+        The type must be able to hold the ids of all of the grid's elements.
+
+        >>> RasterModelGrid((200, 200), id_dtype=np.int16)
+        Traceback (most recent call last):
+        ...
+        ValueError: id_dtype int16 is too small for the grid
+
+        LLCATS: GINF
+        """
+        return self._id_dtype
+
     def _create_link_face_coords(self):
         """Create x, y coordinates for link-face intersections.
 
@@ -900,7 +976,7 @@ class ModelGrid(ModelDataFieldsMixIn):
 
     def _setup_nodes(self):
         """Set up the node id array."""
-        self._nodes = np.arange(self.number_of_nodes, dtype=int)
+        self._nodes = np.arange(self.number_of_nodes, dtype=self.id_dtype)
         return self._nodes
 
     @property
@@ -1814,6 +1890,64 @@ class ModelGrid(ModelDataFieldsMixIn):
             raise TypeError(
                 '{name}: element name not understood'.format(name=name))
 
+    def memory_footprint(self):
+        """Memory used by the arrays of a grid.
+
+        Report the number of bytes used by each of the fields of a grid and
+        by the arrays that hold its geometry and connectivity. Fields are
+        named as *at_<group>:<name>*, other arrays by the name of the
+        grid attribute that holds them. Arrays that are views of an array
+        already counted are not counted again.
+
+        Returns
+        -------
+        dict
+            Number of bytes used by each array.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from landlab import RasterModelGrid
+        >>> grid = RasterModelGrid((4, 5))
+        >>> _ = grid.add_zeros('node', 'topographic__elevation')
+        >>> footprint = grid.memory_footprint()
+        >>> footprint['at_node:topographic__elevation']
+        160
+
+        Single-precision fields use half the memory.
+
+        >>> grid = RasterModelGrid((4, 5), float_dtype=np.float32)
+        >>> _ = grid.add_zeros('node', 'topographic__elevation')
+        >>> grid.memory_footprint()['at_node:topographic__elevation']
+        80
+        >>> sum(grid.memory_footprint().values()) > 80
+        True
+
+        LLCATS: GINF
+        """
+        footprint = {}
+        counted = set()
+
+        def _count(name, array):
+            owner = array
+            while isinstance(owner.base, numpy.ndarray):
+                owner = owner.base
+            if id(owner) not in counted:
+                counted.add(id(owner))
+                footprint[name] = owner.nbytes
+
+        for group in sorted(self.groups):
+            for name in sorted(self[group]):
+                _count('at_{group}:{name}'.format(group=group, name=name),
+                       self[group][name])
+
+        for attr in sorted(self.__dict__):
+            value = self.__dict__[attr]
+            if isinstance(value, numpy.ndarray):
+                _count(attr.lstrip('_'), value)
+
+        return footprint
+
     @property
     @make_return_array_immutable
     def node_x(self):
@@ -2200,11 +2334,11 @@ class ModelGrid(ModelDataFieldsMixIn):
         >>> mg.number_of_links_at_node
         array([2, 3, 3, 2, 3, 4, 4, 3, 2, 3, 3, 2])
         """
-        self._number_of_links_at_node = np.zeros(self.number_of_nodes,
-                                                 dtype=np.int)
-        for ln in range(self.number_of_links):
-            self._number_of_links_at_node[self.node_at_link_tail[ln]] += 1
-            self._number_of_links_at_node[self.node_at_link_head[ln]] += 1
+        self._number_of_links_at_node = (
+            np.bincount(self.node_at_link_tail,
+                        minlength=self.number_of_nodes) +
+            np.bincount(self.node_at_link_head,
+                        minlength=self.number_of_nodes))
 
     @property
     def number_of_links_at_node(self):
@@ -2259,29 +2393,29 @@ class ModelGrid(ModelDataFieldsMixIn):
         nlpn = self.number_of_links_at_node
         # ^this fn should become member and property
         max_num_links = np.amax(nlpn)
-        nlpn[:] = 0  # we'll zero it out, then rebuild it
 
         # Create arrays for link-at-node information
         self._links_at_node = - np.ones((self.number_of_nodes, max_num_links),
-                                        dtype=int)
+                                        dtype=self.id_dtype)
         self._link_dirs_at_node = np.zeros((self.number_of_nodes,
                                             max_num_links), dtype=np.int8)
 
-        # Sweep over all links
-        for lk in range(self.number_of_links):
-            # Find the IDs of the tail and head nodes
-            t = self.node_at_link_tail[lk]
-            h = self.node_at_link_head[lk]
-
-            # Add this link to the list for this node, set the direction
-            # (outgoing, indicated by -1), and increment the number found so
-            # far
-            self._links_at_node[t][nlpn[t]] = lk
-            self._links_at_node[h][nlpn[h]] = lk
-            self._link_dirs_at_node[t][nlpn[t]] = -1
-            self._link_dirs_at_node[h][nlpn[h]] = 1
-            nlpn[t] += 1
-            nlpn[h] += 1
+        # Each link is attached to its tail (as outgoing, indicated by -1) and
+        # to its head (incoming, 1). Group these by node, with the links at
+        # each node in order of link ID, and place them one after the other
+        # in the node's row.
+        links = np.arange(self.number_of_links)
+        nodes = np.concatenate((self.node_at_link_tail,
+                                self.node_at_link_head))
+        by_node = np.lexsort((np.concatenate((links, links)), nodes))
+        first_at_node = np.cumsum(nlpn) - nlpn
+        nodes = nodes[by_node]
+        column = np.arange(len(nodes)) - first_at_node[nodes]
+
+        self._links_at_node[nodes, column] = np.concatenate(
+            (links, links))[by_node]
+        self._link_dirs_at_node[nodes, column] = np.repeat(
+            np.array([-1, 1], dtype=np.int8), self.number_of_links)[by_node]
 
         # Sort the links at each node by angle, counter-clockwise from +x
         self._sort_links_at_node_by_angle()
@@ -2872,7 +3006,8 @@ class ModelGrid(ModelDataFieldsMixIn):
         """
         num_faces = self.number_of_faces_at_cell()
         self._faces_at_cell = np.zeros((self.number_of_cells,
-                                        np.amax(num_faces)), dtype=int)
+                                        np.amax(num_faces)),
+                                       dtype=self.id_dtype)
         num_faces[:] = 0  # Zero out and count again, to use as index
         for ln in range(self.number_of_links):
             cell = self.cell_at_node[self.node_at_link_tail[ln]]
@@ -3116,7 +3251,8 @@ class ModelGrid(ModelDataFieldsMixIn):
         a grid field name (defaults to 'topographic__elevation') or an
         nnodes-long array of elevation values. In this case, the method will
         calculate local slopes and aspects internally as part of the hillshade
-        production.
+        production, using ``calc_slope_aspect_hillshade_at_node``. On a
+        raster this uses the Horn 3x3 stencil, as ArcGIS does.
 
         Returns
         -------
@@ -3164,26 +3300,14 @@ class ModelGrid(ModelDataFieldsMixIn):
             else:
                 raise TypeError("unit must be 'degrees' or 'radians'")
         elif slp is None and asp is None:
-            if unit == 'degrees':
-                (alt, az) = (numpy.radians(alt), numpy.radians(az))
-            elif unit == 'radians':
-                pass
-            else:
-                raise TypeError("unit must be 'degrees' or 'radians'")
-            slp, slp_comps = self.calc_slope_at_node(
-                elevs, return_components=True)
-
-            asp = self.calc_aspect_at_node(slope_component_tuple=slp_comps,
-                                           unit='radians')
+            (_, _, shaded) = self.calc_slope_aspect_hillshade_at_node(
+                elevs=elevs, alt=alt, az=az, unit=unit)
+            return shaded
         else:
             raise TypeError('Either both slp and asp must be set, or neither!')
 
-        shaded = (
-            numpy.sin(alt) * numpy.cos(slp) +
-            numpy.cos(alt) * numpy.sin(slp) * numpy.cos(az - asp)
-        )
-
-        return shaded.clip(0.)
+        from .gradients import _calc_hillshade_from_slope_aspect
+        return _calc_hillshade_from_slope_aspect(alt, az, slp, asp)
 
     @deprecated(use='calc_flux_div_at_node', version=1.0)
     def calculate_flux_divergence_at_core_nodes(self, active_link_flux,
@@ -3390,14 +3514,10 @@ class ModelGrid(ModelDataFieldsMixIn):
                -1, -1, -1])
         """
         self._face_at_link = numpy.full(self.number_of_links, BAD_INDEX_VALUE,
-                                        dtype=int)
-        face_id = 0
-        for link in range(self.number_of_links):
-            tc = self.cell_at_node[self.node_at_link_tail[link]]
-            hc = self.cell_at_node[self.node_at_link_head[link]]
-            if tc != BAD_INDEX_VALUE or hc != BAD_INDEX_VALUE:
-                self._face_at_link[link] = face_id
-                face_id += 1
+                                        dtype=self.id_dtype)
+        has_face = self._link_has_face()
+        self._face_at_link[has_face] = numpy.arange(
+            numpy.count_nonzero(has_face))
 
         return self._face_at_link
 
@@ -3411,18 +3531,20 @@ class ModelGrid(ModelDataFieldsMixIn):
         >>> hg.link_at_face
         array([ 3,  4,  5,  6,  8,  9, 10, 12, 13, 14, 15])
         """
-        num_faces = len(self.width_of_face)
-        self._link_at_face = numpy.empty(num_faces, dtype=int)
-        face_id = 0
-        for link in range(self.number_of_links):
-            tc = self.cell_at_node[self.node_at_link_tail[link]]
-            hc = self.cell_at_node[self.node_at_link_head[link]]
-            if tc != BAD_INDEX_VALUE or hc != BAD_INDEX_VALUE:
-                self._link_at_face[face_id] = link
-                face_id += 1
+        self._link_at_face = as_id_array(
+            numpy.where(self._link_has_face())[0], dtype=self.id_dtype)
 
         return self._link_at_face
 
+    def _link_has_face(self):
+        """Find links that cross a face.
+
+        A link has a face if either of its nodes has a cell.
+        """
+        cell_at_node = self.cell_at_node
+        return ((cell_at_node[self.node_at_link_tail] != BAD_INDEX_VALUE) |
+                (cell_at_node[self.node_at_link_head] != BAD_INDEX_VALUE))
+
     def _create_cell_areas_array_force_inactive(self):
         """Set up an array of cell areas that is n_nodes long.
 
@@ -3689,8 +3811,10 @@ class ModelGrid(ModelDataFieldsMixIn):
         active_links = self._status_at_link == ACTIVE_LINK  # now it's correct
         (self._active_links, ) = numpy.where(active_links)
         (self._fixed_links, ) = numpy.where(fixed_links)
-        self._active_links = as_id_array(self._active_links)
-        self._fixed_links = as_id_array(self._fixed_links)
+        self._active_links = as_id_array(self._active_links,
+                                         dtype=self.id_dtype)
+        self._fixed_links = as_id_array(self._fixed_links,
+                                        dtype=self.id_dtype)
 
         self._activelink_fromnode = self.node_at_link_tail[active_links]
         self._activelink_tonode = self.node_at_link_head[active_links]
@@ -3718,12 +3842,15 @@ class ModelGrid(ModelDataFieldsMixIn):
         >>> grid.core_cells
         array([0, 2, 3, 4, 5])
         """
-        (self._core_nodes, ) = numpy.where(self._node_status == CORE_NODE)
+        self._core_nodes = as_id_array(
+            numpy.where(self._node_status == CORE_NODE)[0],
+            dtype=self.id_dtype)
 
         self._core_cells = self.cell_at_node[self._core_nodes]
 
         self._boundary_nodes = as_id_array(
-            numpy.where(self._node_status != CORE_NODE)[0])
+            numpy.where(self._node_status != CORE_NODE)[0],
+            dtype=self.id_dtype)
 
     def _update_links_nodes_cells_to_new_BCs(self):
         """Update grid element connectivity, status.
@@ -4009,15 +4136,15 @@ class ModelGrid(ModelDataFieldsMixIn):
         accordingly. Assumes that self.number_of_nodes, self.node_at_link_tail,
         and self.node_at_link_head have already been set up.
 
-        Algorithm works by simply looping through all links; for each, the
-        endpoints are neighbors of one another, so we increment the number of
-        neighbors for both the endpoint nodes.
+        Algorithm works by simply counting the links; for each, the endpoints
+        are neighbors of one another, so each link adds a neighbor to both of
+        its endpoint nodes.
         """
-        num_nbrs = numpy.zeros(self.number_of_nodes, dtype=int)
-        for link in range(self.number_of_links):
-            num_nbrs[self.node_at_link_tail[link]] += 1
-            num_nbrs[self.node_at_link_head[link]] += 1
-        return num_nbrs
+        return (
+            numpy.bincount(self.node_at_link_tail,
+                           minlength=self.number_of_nodes) +
+            numpy.bincount(self.node_at_link_head,
+                           minlength=self.number_of_nodes))
 
     def _create_active_faces(self):
         self._active_faces = self.face_at_link[self.active_links]
@@ -4061,9 +4188,9 @@ class ModelGrid(ModelDataFieldsMixIn):
 
         # Create active in-link and out-link matrices.
         self._node_inlink_matrix = - numpy.ones(
-            (self.max_num_nbrs, self.number_of_nodes), dtype=numpy.int)
+            (self.max_num_nbrs, self.number_of_nodes), dtype=self.id_dtype)
         self._node_outlink_matrix = - numpy.ones(
-            (self.max_num_nbrs, self.number_of_nodes), dtype=numpy.int)
+            (self.max_num_nbrs, self.number_of_nodes), dtype=self.id_dtype)
 
         # Set up the inlink arrays
         tonodes = self.node_at_link_head
@@ -4116,9 +4243,9 @@ class ModelGrid(ModelDataFieldsMixIn):
         """
         # Create active in-link and out-link matrices.
         self._node_active_inlink_matrix = - numpy.ones(
-            (self.max_num_nbrs, self.number_of_nodes), dtype=numpy.int)
+            (self.max_num_nbrs, self.number_of_nodes), dtype=self.id_dtype)
         self._node_active_outlink_matrix = - numpy.ones(
-            (self.max_num_nbrs, self.number_of_nodes), dtype=numpy.int)
+            (self.max_num_nbrs, self.number_of_nodes), dtype=self.id_dtype)
 
         # Set up the inlink arrays
         tonodes = self._activelink_tonode
@@ -4149,9 +4276,9 @@ class ModelGrid(ModelDataFieldsMixIn):
         # RENAMED TO GET RID OF THE "2")
         # TODO: MAKE THIS CHANGE ONCE CODE THAT USES IT HAS BEEN PREPPED
         self._node_active_inlink_matrix2 = - numpy.ones(
-            (self.max_num_nbrs, self.number_of_nodes), dtype=numpy.int)
+            (self.max_num_nbrs, self.number_of_nodes), dtype=self.id_dtype)
         self._node_active_outlink_matrix2 = - numpy.ones(
-            (self.max_num_nbrs, self.number_of_nodes), dtype=numpy.int)
+            (self.max_num_nbrs, self.number_of_nodes), dtype=self.id_dtype)
 
         # Set up the inlink arrays
         tonodes = self.node_at_link_head[self.active_links]
@@ -4981,7 +5108,9 @@ class ModelGrid(ModelDataFieldsMixIn):
 
         This is useful if your module needs to make repeated lookups of
         distances between the same nodes, but does potentially use up a lot
-        of memory so should be used with caution.
+        of memory so should be used with caution. For large grids, the
+        ``spatial_index`` attribute offers radius and nearest-neighbor
+        queries without storing all node pairs.
 
         The map is symmetrical, so it does not matter whether rows are
         "from" or "to".
@@ -4995,25 +5124,125 @@ class ModelGrid(ModelDataFieldsMixIn):
         tuple of ndarrays
             Tuple of (distances, azimuths)
         """
-        self._all_node_distances_map = numpy.empty((self.number_of_nodes,
-                                                    self.number_of_nodes))
-        self._all_node_azimuths_map = numpy.empty((self.number_of_nodes,
-                                                   self.number_of_nodes))
-
-        node_coords = numpy.empty((self.number_of_nodes, 2))
-        node_coords[:, 0] = self.node_x
-        node_coords[:, 1] = self.node_y
+        dx = numpy.subtract(self.node_x, self.node_x.reshape((-1, 1)))
+        dy = numpy.subtract(self.node_y, self.node_y.reshape((-1, 1)))
 
-        for i in range(self.number_of_nodes):
-            (self._all_node_distances_map[i, :],
-             self._all_node_azimuths_map[i, :]) = (
-                 self.calc_distances_of_nodes_to_point(
-                     (node_coords[i, 0], node_coords[i, 1]), get_az='angles'))
+        self._all_node_distances_map = numpy.hypot(dx, dy)
+        self._all_node_azimuths_map = numpy.arctan2(dx, dy, out=dx)
+        self._all_node_azimuths_map[self._all_node_azimuths_map < 0.] += (
+            2. * numpy.pi)
 
         assert numpy.all(self._all_node_distances_map >= 0.)
 
         return self._all_node_distances_map, self._all_node_azimuths_map
 
+    @property
+    def spatial_index(self):
+        """Spatial index of the locations of grid elements.
+
+        The index holds k-d trees over the locations of nodes, cells, links
+        and faces that are built when first needed and then reused.
+
+        Examples
+        --------
+        >>> from landlab import HexModelGrid
+        >>> grid = HexModelGrid(3, 3)
+        >>> grid.spatial_index.within_radius((1., 0.), 1.)
+        array([0, 1, 2, 4, 5])
+        >>> grid.spatial_index is grid.spatial_index
+        True
+
+        LLCATS: GINF SUBSET
+        """
+        try:
+            index = self._spatial_index
+        except AttributeError:
+            index = None
+        if index is None:
+            from .spatial_index import SpatialIndex
+            index = self._spatial_index = SpatialIndex(self)
+        return index
+
+    def find_nearest_node(self, coords):
+        """Node nearest a point.
+
+        Find the index to the node nearest the given x, y coordinates.
+        Coordinates are provided as numpy arrays in the *coords* tuple.
+
+        Parameters
+        ----------
+        coords : tuple of array-like
+            Coordinates of points.
+
+        Returns
+        -------
+        array-like
+            IDs of the nearest nodes.
+
+        Examples
+        --------
+        >>> from landlab import HexModelGrid
+        >>> grid = HexModelGrid(3, 3)
+        >>> grid.find_nearest_node((1.9, 0.7))
+        5
+        >>> grid.find_nearest_node(([0.1, 1.4], [0.2, 1.7]))
+        array([0, 8])
+
+        LLCATS: NINF SUBSET
+        """
+        return self.spatial_index.nearest(coords, at='node')[1]
+
+    def is_point_on_grid(self, xcoord, ycoord):
+        """Check if a point is on the grid.
+
+        A point is on the grid if it lies within the area covered by the
+        grid's nodes (that is, their convex hull).
+
+        Parameters
+        ----------
+        xcoord : float or array_like
+            The point's x-coordinate.
+        ycoord : float or array_like
+            The point's y-coordinate.
+
+        Returns
+        -------
+        bool
+            ``True`` if the point is on the grid. Otherwise, ``False``.
+
+        Examples
+        --------
+        >>> from landlab import HexModelGrid
+        >>> grid = HexModelGrid(3, 3)
+        >>> grid.is_point_on_grid(1., 1.)
+        True
+        >>> grid.is_point_on_grid((1., 1., -.4), (1., 2., 1.5))
+        array([ True, False, False], dtype=bool)
+
+        LLCATS: GINF MEAS SUBSET
+        """
+        return self.spatial_index.is_within_hull((xcoord, ycoord))
+
+    @deprecated(use='find_nearest_node', version='0.2')
+    def snap_coords_to_grid(self, xcoord, ycoord):
+        """Snap coordinates to the nearest node.
+
+        This method takes existing coordinates, inside the grid, and returns
+        the ID of the closest grid node. That node can be a boundary node.
+
+        Examples
+        --------
+        >>> from landlab import RasterModelGrid
+        >>> grid = RasterModelGrid((3, 4))
+        >>> grid.snap_coords_to_grid(1.2, 1.4)
+        5
+        >>> grid.snap_coords_to_grid([0.1, 2.6], [0.4, 1.7])
+        array([ 0, 11])
+
+        LLCATS: DEPR NINF SUBSET
+        """
+        return self.find_nearest_node((xcoord, ycoord))
+
     def _sort_links_by_midpoint(self):
         """Sort links in order first by midpoint x coordinate, then y.
 
@@ -5065,6 +5294,7 @@ class ModelGrid(ModelDataFieldsMixIn):
         """
         self._node_x += origin[0]
         self._node_y += origin[1]
+        self._spatial_index = None
 
 
 add_module_functions_to_class(ModelGrid, 'mappers.py', pattern='map_*')
@@ -0,0 +1,45 @@
+"""Benchmark the construction of grids of Voronoi cells.
+
+Run this module as a script to print construction times for increasing
+numbers of nodes::
+
+    $ python benchmark_voronoi.py
+"""
+from timeit import default_timer
+
+import numpy as np
+
+from landlab import VoronoiDelaunayGrid, HexModelGrid
+
+
+def _random_points(n_nodes):
+    np.random.seed(1945)
+    return np.random.rand(n_nodes), np.random.rand(n_nodes)
+
+
+def bench_voronoi_grid_10k():
+    (x, y) = _random_points(10000)
+    VoronoiDelaunayGrid(x, y)
+
+
+def bench_voronoi_grid_1m():
+    (x, y) = _random_points(1000000)
+    VoronoiDelaunayGrid(x, y)
+
+
+def bench_hex_grid_1m():
+    HexModelGrid(1000, 1000)
+
+
+def bench_vertical_rect_hex_grid_1m():
+    HexModelGrid(1000, 1000, orientation='vertical', shape='rect')
+
+
+if __name__ == '__main__':
+    for n_nodes in (10000, 100000, 1000000):
+        (x, y) = _random_points(n_nodes)
+        start = default_timer()
+        grid = VoronoiDelaunayGrid(x, y)
+        grid.patches_at_link
+        print('{n_nodes:>8d} nodes: {time:.1f} s'.format(
+            n_nodes=n_nodes, time=default_timer() - start))
@@ -10,6 +10,14 @@ ctypedef np.intp_t DTYPE_INTP_t
 DTYPE_FLOAT = np.double
 ctypedef np.double_t DTYPE_FLOAT_t
 
+ctypedef fused DTYPE_ID_t:
+    np.int32_t
+    np.int64_t
+
+ctypedef fused DTYPE_OUT_ID_t:
+    np.int32_t
+    np.int64_t
+
 
 @cython.boundscheck(False)
 def find_rows_containing_ID(np.ndarray[DTYPE_INT_t, ndim=2] input_array,
@@ -38,9 +46,18 @@ def find_rows_containing_ID(np.ndarray[DTYPE_INT_t, ndim=2] input_array,
 
 @cython.boundscheck(False)
 def create_patches_at_element(
-        np.ndarray[DTYPE_INT_t, ndim=2] elements_at_patch,
-        int number_of_elements, np.ndarray[DTYPE_INT_t, ndim=2] out):
-    """
+        np.ndarray[DTYPE_ID_t, ndim=2] elements_at_patch,
+        int number_of_elements, np.ndarray[DTYPE_OUT_ID_t, ndim=2] out):
+    """Find the patches that each element is part of.
+
+    Parameters
+    ----------
+    elements_at_patch : ndarray of int
+        Elements of each patch, as either 32 or 64-bit integers.
+    number_of_elements : int
+        Number of elements.
+    out : ndarray of int
+        Patches of each element, as either 32 or 64-bit integers.
     """
     cdef int i
     cdef np.ndarray[DTYPE_INT_t, ndim=2] element_with_value = np.empty_like(
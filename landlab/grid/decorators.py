@@ -115,7 +115,8 @@ def return_id_array(func):
     @wraps(func)
     def _wrapped(self, *args, **kwds):
         """Create a function that returns an id array."""
-        return as_id_array(func(self, *args, **kwds))
+        return as_id_array(func(self, *args, **kwds),
+                           dtype=getattr(self, 'id_dtype', None))
     return _wrapped
 
 
@@ -135,7 +136,8 @@ def return_readonly_id_array(func):
     @wraps(func)
     def _wrapped(self, *args, **kwds):
         """Create a function that returns an id array."""
-        id_array = as_id_array(func(self, *args, **kwds))
+        id_array = as_id_array(func(self, *args, **kwds),
+                               dtype=getattr(self, 'id_dtype', None))
         try:
             immutable_array = id_array.view()
             immutable_array.flags.writeable = False
@@ -698,3 +698,157 @@ def calc_aspect_at_node(grid, slope_component_tuple=None,
         return angle_from_north_cw
     else:
         raise TypeError("unit must be 'degrees' or 'radians'")
+
+
+def _sun_position_in_radians(alt, az, unit):
+    """Convert a sun altitude and azimuth into radians."""
+    if unit == 'degrees':
+        return np.radians(alt), np.radians(az)
+    elif unit == 'radians':
+        return alt, az
+    else:
+        raise TypeError("unit must be 'degrees' or 'radians'")
+
+
+def _calc_hillshade_from_slope_aspect(alt, az, slope, aspect, out=None):
+    """Calculate hillshade from slope and aspect, all in radians.
+
+    Parameters
+    ----------
+    alt : float
+        Sun altitude above the horizon.
+    az : float
+        Sun azimuth clockwise from north.
+    slope : ndarray
+        Surface slope.
+    aspect : ndarray
+        Surface aspect clockwise from north.
+    out : ndarray, optional
+        Buffer to hold the result.
+
+    Returns
+    -------
+    ndarray
+        Hillshade, clipped to be non-negative.
+    """
+    out = np.subtract(az, aspect, out=out)
+    np.cos(out, out=out)
+    out *= np.sin(slope)
+    out *= np.cos(alt)
+    out += np.sin(alt) * np.cos(slope)
+    return np.clip(out, 0., None, out=out)
+
+
+def calc_slope_aspect_hillshade_at_node(grid,
+                                        elevs='topographic__elevation',
+                                        alt=45., az=315., unit='degrees',
+                                        ignore_closed_nodes=True, out=None):
+    """Calculate slope, aspect and hillshade at nodes in a single pass.
+
+    A fused version of ``calc_slope_at_node``, ``calc_aspect_at_node`` and
+    ``calc_hillshade_at_node``. The gradient of each patch is found directly
+    from the plane through its first three nodes, and these gradients are
+    then averaged onto the nodes. Slopes and aspects are identical to those
+    given by ``calc_slope_at_node`` and ``calc_aspect_at_node``.
+
+    Parameters
+    ----------
+    grid : ModelGrid
+        A ModelGrid.
+    elevs : str or ndarray, optional
+        Field name or array of node values.
+    alt : float
+        Sun altitude (from horizon) - defaults to 45 degrees
+    az : float
+        Sun azimuth (CW from north) - defaults to 315 degrees
+    unit : {'degrees', 'radians'}
+        Unit of *alt* and *az*.
+    ignore_closed_nodes : bool
+        If True, do not incorporate values at closed nodes into the calc.
+    out : tuple of ndarray, optional
+        Length-3 tuple of buffers, each number-of-nodes long, to hold the
+        slope, aspect and hillshade.
+
+    Returns
+    -------
+    (slope, aspect, hillshade) : tuple of ndarray
+        Slope in radians, aspect in radians clockwise from north, and
+        hillshade at each node.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab import HexModelGrid
+    >>> mg = HexModelGrid(4, 4)
+    >>> z = mg.node_x * np.tan(60. * np.pi / 180.)
+    >>> slope, aspect, shade = mg.calc_slope_aspect_hillshade_at_node(
+    ...     elevs=z, alt=30., az=210.)
+    >>> np.allclose(slope, np.pi / 3.)
+    True
+    >>> np.allclose(aspect, 3. * np.pi / 2.)
+    True
+    >>> np.allclose(shade, 0.625)
+    True
+
+    Buffers can be reused between calls.
+
+    >>> out = (mg.empty(at='node'), mg.empty(at='node'), mg.empty(at='node'))
+    >>> rtn = mg.calc_slope_aspect_hillshade_at_node(elevs=z, out=out)
+    >>> all(a is b for a, b in zip(rtn, out))
+    True
+
+    LLCATS: NINF GRAD SURF
+    """
+    (alt, az) = _sun_position_in_radians(alt, az, unit)
+    try:
+        z = grid.at_node[elevs]
+    except TypeError:
+        z = np.asarray(elevs)
+
+    if out is None:
+        out = (grid.empty(at='node', dtype=float),
+               grid.empty(at='node', dtype=float),
+               grid.empty(at='node', dtype=float))
+    (slope, aspect, shade) = out
+
+    nodes_at_patch = grid.nodes_at_patch
+    x = grid.node_x
+    y = grid.node_y
+    (p, q, r) = (nodes_at_patch[:, 0], nodes_at_patch[:, 1],
+                 nodes_at_patch[:, 2])
+    dx_pq, dx_pr = x[q] - x[p], x[r] - x[p]
+    dy_pq, dy_pr = y[q] - y[p], y[r] - y[p]
+    dz_pq, dz_pr = z[q] - z[p], z[r] - z[p]
+    det = dx_pq * dy_pr - dx_pr * dy_pq
+    grad_x = (dz_pq * dy_pr - dz_pr * dy_pq) / det
+    grad_y = (dx_pq * dz_pr - dx_pr * dz_pq) / det
+
+    # the slope components of calc_grad_at_patch point along the gradient
+    # but have the magnitude of the patch slope angle
+    grad_mag = np.hypot(grad_x, grad_y)
+    slope_at_patch = np.arctan(grad_mag)
+    scale = np.divide(slope_at_patch, grad_mag,
+                      out=np.zeros_like(grad_mag), where=grad_mag > 0.)
+
+    if ignore_closed_nodes:
+        present = np.asarray(grid.patches_present_at_node)
+    else:
+        present = np.asarray(grid.patches_at_node) != -1
+    n_present = np.count_nonzero(present, axis=1)
+    n_present[n_present == 0] = 1
+    patches_at_node = grid.patches_at_node
+
+    np.divide(np.where(present, slope_at_patch[patches_at_node], 0.).sum(
+        axis=1), n_present, out=slope)
+    slope_x = np.where(present, (grad_x * scale)[patches_at_node], 0.).sum(
+        axis=1) / n_present
+    slope_y = np.where(present, (grad_y * scale)[patches_at_node], 0.).sum(
+        axis=1) / n_present
+
+    np.arctan2(- slope_y, - slope_x, out=aspect)
+    np.subtract(5. * np.pi / 2., aspect, out=aspect)
+    np.mod(aspect, 2. * np.pi, out=aspect)
+
+    _calc_hillshade_from_slope_aspect(alt, az, slope, aspect, out=shade)
+
+    return slope, aspect, shade
@@ -79,6 +79,8 @@ Information about nodes
     ~landlab.grid.hex.HexModelGrid.node_x
     ~landlab.grid.hex.HexModelGrid.node_y
     ~landlab.grid.hex.HexModelGrid.nodes
+    ~landlab.grid.hex.HexModelGrid.find_nearest_node
+    ~landlab.grid.hex.HexModelGrid.is_point_on_grid
     ~landlab.grid.hex.HexModelGrid.nodes_at_bottom_edge
     ~landlab.grid.hex.HexModelGrid.nodes_at_left_edge
     ~landlab.grid.hex.HexModelGrid.nodes_at_patch
@@ -403,6 +405,7 @@ to a point; nodes at edges.
     ~landlab.grid.hex.HexModelGrid.nodes_at_left_edge
     ~landlab.grid.hex.HexModelGrid.nodes_at_right_edge
     ~landlab.grid.hex.HexModelGrid.nodes_at_top_edge
+    ~landlab.grid.hex.HexModelGrid.spatial_index
 
 Surface analysis
 ----------------
@@ -415,6 +418,7 @@ find in GIS software.
 
     ~landlab.grid.hex.HexModelGrid.calc_aspect_at_node
     ~landlab.grid.hex.HexModelGrid.calc_hillshade_at_node
+    ~landlab.grid.hex.HexModelGrid.calc_slope_aspect_hillshade_at_node
     ~landlab.grid.hex.HexModelGrid.calc_slope_at_node
 
 Notes
@@ -437,10 +441,171 @@ Without this, the new grid class will not have the ``at_*`` attributes.
 import numpy
 import six
 
+from landlab.core.utils import (as_id_array, sort_points_by_x_then_y,
+                                argsort_points_by_x_then_y)
+from landlab.grid.base import CORE_NODE, FIXED_VALUE_BOUNDARY
 from landlab.grid.voronoi import VoronoiDelaunayGrid
 from .decorators import return_readonly_id_array
 
 
+def _rows_and_columns(nodes_per_row):
+    """Row and column of each node of rows with the given numbers of nodes.
+
+    Examples
+    --------
+    >>> from landlab.grid.hex import _rows_and_columns
+    >>> (row, col) = _rows_and_columns([2, 3, 2])
+    >>> row
+    array([0, 0, 1, 1, 1, 2, 2])
+    >>> col
+    array([0, 1, 0, 1, 2, 0, 1])
+    """
+    nodes_per_row = numpy.asarray(nodes_per_row, dtype=int)
+    row = numpy.repeat(numpy.arange(len(nodes_per_row)), nodes_per_row)
+    first_of_row = numpy.cumsum(nodes_per_row) - nodes_per_row
+    return row, numpy.arange(len(row)) - first_of_row[row]
+
+
+def _hex_lattice_index(x, y, dx):
+    """Find the row and column of nodes on a hexagonal lattice.
+
+    Rows of the lattice are horizontal and columns are half the node spacing
+    apart, so that the neighbors of a node are two columns away on its own
+    row, and one column away on the rows above and below.
+
+    Parameters
+    ----------
+    x, y : ndarray of float
+        Coordinates of nodes.
+    dx : float
+        Node spacing.
+
+    Returns
+    -------
+    tuple of ndarray of int
+        Row and column of each node, counted from the lowest row and the
+        left-most column.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.grid.hex import _hex_lattice_index
+    >>> x = np.array([0., 1., -.5, .5, 1.5, 0., 1.])
+    >>> y = np.array([0., 0., 1., 1., 1., 2., 2.]) * np.sqrt(3.) / 2.
+    >>> (row, col) = _hex_lattice_index(x, y, 1.)
+    >>> row
+    array([0, 0, 1, 1, 1, 2, 2])
+    >>> col
+    array([1, 3, 0, 2, 4, 1, 3])
+    """
+    row = numpy.rint(y / (dx * numpy.sqrt(3.) / 2.)).astype(int)
+    col = numpy.rint(2. * x / dx).astype(int)
+    return row - row.min(), col - col.min()
+
+
+def _hex_lattice_links_and_patches(row, col):
+    """Find the links and patches of nodes on a hexagonal lattice.
+
+    Links join each node to its neighbors to the right, upper right and
+    upper left, and patches are the triangles between them. Where a row of
+    a rectangular lattice is indented from the rows above and below, the
+    perimeter of the grid is its convex hull and so a link joins the nodes
+    above and below the indent, and makes a patch with the indented node.
+
+    Parameters
+    ----------
+    row, col : ndarray of int
+        Row and column of each node (see :func:`_hex_lattice_index`).
+
+    Returns
+    -------
+    tuple of ndarray of int
+        Tail and head nodes of each link, and the nodes of each patch.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.grid.hex import _hex_lattice_links_and_patches
+    >>> row = np.array([0, 0, 1, 1, 2, 2])
+    >>> col = np.array([0, 2, 1, 3, 0, 2])
+    >>> (tail, head, nodes_at_patch) = _hex_lattice_links_and_patches(
+    ...     row, col)
+    >>> tail
+    array([0, 2, 4, 0, 1, 2, 1, 2, 3, 0])
+    >>> head
+    array([1, 3, 5, 2, 3, 5, 2, 4, 5, 4])
+    >>> nodes_at_patch
+    array([[0, 1, 2],
+           [2, 3, 5],
+           [1, 3, 2],
+           [2, 5, 4],
+           [0, 2, 4]])
+    """
+    n_nodes = len(row)
+    node_at = numpy.full((row.max() + 3, col.max() + 4), -1, dtype=int)
+    node_at[row, col + 1] = numpy.arange(n_nodes)
+
+    right = node_at[row, col + 3]
+    upper_right = node_at[row + 1, col + 2]
+    upper_left = node_at[row + 1, col]
+    above = node_at[row + 2, col + 1]
+
+    is_left_indent = (above >= 0) & (upper_right >= 0) & (upper_left < 0)
+    is_right_indent = (above >= 0) & (upper_left >= 0) & (upper_right < 0)
+    above[~(is_left_indent | is_right_indent)] = -1
+
+    nodes = numpy.arange(n_nodes)
+    (tail, head) = ([], [])
+    for neighbor in (right, upper_right, upper_left, above):
+        tail.append(nodes[neighbor >= 0])
+        head.append(neighbor[neighbor >= 0])
+
+    is_up = (right >= 0) & (upper_right >= 0)
+    is_down = (upper_right >= 0) & (upper_left >= 0)
+    nodes_at_patch = numpy.vstack((
+        numpy.column_stack((nodes, right, upper_right))[is_up],
+        numpy.column_stack((nodes, upper_right, upper_left))[is_down],
+        numpy.column_stack((nodes, upper_right, above))[is_left_indent],
+        numpy.column_stack((nodes, above, upper_left))[is_right_indent]))
+
+    return (as_id_array(numpy.concatenate(tail)),
+            as_id_array(numpy.concatenate(head)),
+            as_id_array(nodes_at_patch))
+
+
+def _circumcenters(x, y, nodes_at_patch):
+    """Find the centers of the circles through the corners of triangles.
+
+    Parameters
+    ----------
+    x, y : ndarray of float
+        Coordinates of nodes.
+    nodes_at_patch : ndarray of int, shape (n_patches, 3)
+        Nodes of each triangle.
+
+    Returns
+    -------
+    tuple of ndarray of float
+        Coordinates of the circumcenter of each triangle.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.grid.hex import _circumcenters
+    >>> x, y = np.array([0., 2., 0.]), np.array([0., 0., 2.])
+    >>> _circumcenters(x, y, np.array([[0, 1, 2]]))
+    (array([ 1.]), array([ 1.]))
+    """
+    (x0, x1, x2) = x[nodes_at_patch].T
+    (y0, y1, y2) = y[nodes_at_patch].T
+    (x1, y1, x2, y2) = (x1 - x0, y1 - y0, x2 - x0, y2 - y0)
+
+    d = 2. * (x1 * y2 - y1 * x2)
+    r1 = x1 * x1 + y1 * y1
+    r2 = x2 * x2 + y2 * y2
+    return x0 + (y2 * r1 - y1 * r2) / d, y0 + (x1 * r2 - x2 * r1) / d
+
+
 class HexModelGrid(VoronoiDelaunayGrid):
     """A grid of hexagonal cells.
 
@@ -644,14 +809,93 @@ class HexModelGrid(VoronoiDelaunayGrid):
                 self._nodes[:, col] = numpy.arange(
                     base_node, self._nrows * self._ncols, self._ncols)
 
-        # Call the VoronoiDelaunayGrid constructor to triangulate/Voronoi
-        # the nodes into a grid.
-        super(HexModelGrid, self)._initialize(
-            pts[:, 0], pts[:, 1], reorient_links)
-
         # Remember grid spacing
         self._dx = dx
 
+        self.pts = sort_points_by_x_then_y(pts)
+        self._node_x = self.pts[:, 0]
+        self._node_y = self.pts[:, 1]
+
+        # The nodes are on a lattice, so the triangulation of a
+        # VoronoiDelaunayGrid is found from where they are on it.
+        if self.orientation == 'horizontal':
+            (row, col) = _hex_lattice_index(self._node_x, self._node_y, dx)
+        else:
+            (row, col) = _hex_lattice_index(self._node_y, self._node_x, dx)
+        (tail, head, nodes_at_patch) = _hex_lattice_links_and_patches(
+            row, col)
+
+        midpoints = numpy.empty((len(tail), 2))
+        midpoints[:, 0] = (self._node_x[tail] + self._node_x[head]) / 2.
+        midpoints[:, 1] = (self._node_y[tail] + self._node_y[head]) / 2.
+        sorted_links = argsort_points_by_x_then_y(midpoints)
+        self._node_at_link_tail = tail[sorted_links]
+        self._node_at_link_head = head[sorted_links]
+
+        # A node's Voronoi region has a side for each of its patches, and
+        # one more if it's on the perimeter.
+        patches_per_node = numpy.bincount(nodes_at_patch.reshape((-1, )),
+                                          minlength=len(self.pts))
+        self._create_patches_from_triangles(nodes_at_patch,
+                                            patches_per_node.max() + 1)
+
+        # Links of the perimeter have one patch, others have two and cross
+        # the face that joins the circumcenters of their patches.
+        is_face = self._patches_at_link[:, 1] != -1
+        is_boundary = numpy.zeros(len(self.pts), dtype=bool)
+        is_boundary[self._node_at_link_tail[~is_face]] = True
+        is_boundary[self._node_at_link_head[~is_face]] = True
+        self._patches_at_node = self._patches_at_node[
+            :, :(patches_per_node + is_boundary).max()].copy()
+
+        self._node_status = numpy.where(
+            is_boundary, FIXED_VALUE_BOUNDARY, CORE_NODE).astype(numpy.int8)
+        self._boundary_nodes = as_id_array(numpy.where(is_boundary)[0])
+        self._core_nodes = as_id_array(numpy.where(~is_boundary)[0])
+        self._core_cells = numpy.arange(len(self._core_nodes), dtype=int)
+        self._node_at_cell = self._core_nodes
+        (self._cell_at_node, self._node_at_cell) = \
+            self._node_to_cell_connectivity(self._node_status,
+                                            self.number_of_cells)
+
+        (x_of_corner, y_of_corner) = _circumcenters(
+            self._node_x, self._node_y, self._nodes_at_patch)
+        (corner0, corner1) = self._patches_at_link[is_face].T
+        dx_of_face = x_of_corner[corner1] - x_of_corner[corner0]
+        dy_of_face = y_of_corner[corner1] - y_of_corner[corner0]
+        self._face_width = numpy.sqrt(dx_of_face * dx_of_face +
+                                      dy_of_face * dy_of_face)
+
+        # Each face and the nodes on either side of it make a triangle, and
+        # these triangles make up the cells.
+        area = numpy.zeros(len(self.pts))
+        for node in (self._node_at_link_tail[is_face],
+                     self._node_at_link_head[is_face]):
+            (dx0, dy0) = (x_of_corner[corner0] - self._node_x[node],
+                          y_of_corner[corner0] - self._node_y[node])
+            (dx1, dy1) = (x_of_corner[corner1] - self._node_x[node],
+                          y_of_corner[corner1] - self._node_y[node])
+            area += numpy.bincount(
+                node, weights=.5 * numpy.abs(dx0 * dy1 - dx1 * dy0),
+                minlength=len(self.pts))
+        self._area_of_cell = area[self._node_at_cell]
+
+        self._setup_links(reorient_links)
+
+    @property
+    def vor(self):
+        """Voronoi diagram of the nodes.
+
+        The grid is built without a Voronoi diagram, so it's only created
+        if asked for.
+        """
+        try:
+            return self._vor
+        except AttributeError:
+            from scipy.spatial import Voronoi
+            self._vor = Voronoi(self.pts)
+            return self._vor
+
     def _create_cell_areas_array(self):
         r"""Create an array of surface areas of hexagonal cells.
 
@@ -707,26 +951,18 @@ class HexModelGrid(VoronoiDelaunayGrid):
         dxv = dxh * numpy.sqrt(3.) / 2.
         half_dxh = dxh / 2.
 
-        if numpy.mod(num_rows, 2) == 0:  # even number of rows
-            npts = num_rows * base_num_cols + (num_rows * num_rows) // 4
-        else:  # odd number of rows
-            npts = num_rows * base_num_cols + \
-                ((num_rows - 1) // 2) * ((num_rows - 1) // 2)
-        pts = numpy.zeros((npts, 2))
+        # Rows get longer, by a node, up to the middle row and then shorter.
         middle_row = num_rows // 2
-        extra_cols = 0
-        xshift = 0.
-        i = 0
-        for r in range(num_rows):
-            for c in range(base_num_cols + extra_cols):
-                pts[i, 0] = c * dxh + xshift
-                pts[i, 1] = r * dxv
-                i += 1
-            if r < middle_row:
-                extra_cols += 1
-            else:
-                extra_cols -= 1
-            xshift = - half_dxh * extra_cols
+        rows = numpy.arange(num_rows)
+        extra_cols = numpy.where(rows <= middle_row, rows,
+                                 2 * middle_row - rows)
+        xshift = - half_dxh * extra_cols
+
+        (row, col) = _rows_and_columns(base_num_cols + extra_cols)
+
+        pts = numpy.empty((len(row), 2))
+        pts[:, 0] = col * dxh + xshift[row]
+        pts[:, 1] = row * dxv
 
         return pts
 
@@ -768,16 +1004,11 @@ class HexModelGrid(VoronoiDelaunayGrid):
         dxv = dxh * numpy.sqrt(3.) / 2.
         half_dxh = dxh / 2.
 
-        npts = num_rows * num_cols
-        pts = numpy.zeros((npts, 2))
-        xshift = 0.
-        i = 0
-        for r in range(num_rows):
-            for c in range(num_cols):
-                xshift = half_dxh * (r % 2)
-                pts[i, 0] = c * dxh + xshift
-                pts[i, 1] = r * dxv
-                i += 1
+        (row, col) = _rows_and_columns(numpy.full(num_rows, num_cols))
+
+        pts = numpy.empty((len(row), 2))
+        pts[:, 0] = col * dxh + half_dxh * (row % 2)
+        pts[:, 1] = row * dxv
 
         return pts
 
@@ -819,26 +1050,19 @@ class HexModelGrid(VoronoiDelaunayGrid):
         dxh = dxv * numpy.sqrt(3.) / 2.
         half_dxv = dxv / 2.
 
-        if numpy.mod(num_cols, 2) == 0:  # even number of columns
-            npts = base_num_rows * num_cols + (num_cols * num_cols) // 4
-        else:  # odd number of columns
-            npts = base_num_rows * num_cols + \
-                ((num_cols - 1) // 2) * ((num_cols - 1) // 2)
-        pts = numpy.zeros((npts, 2))
+        # Columns get longer, by a node, up to the middle column and then
+        # shorter.
         middle_col = num_cols // 2
-        extra_rows = 0
-        yshift = 0.
-        i = 0
-        for c in range(num_cols):
-            for r in range(base_num_rows + extra_rows):
-                pts[i, 1] = r * dxv + yshift
-                pts[i, 0] = c * dxh
-                i += 1
-            if c < middle_col:
-                extra_rows += 1
-            else:
-                extra_rows -= 1
-            yshift = - half_dxv * extra_rows
+        cols = numpy.arange(num_cols)
+        extra_rows = numpy.where(cols <= middle_col, cols,
+                                 2 * middle_col - cols)
+        yshift = - half_dxv * extra_rows
+
+        (col, row) = _rows_and_columns(base_num_rows + extra_rows)
+
+        pts = numpy.empty((len(col), 2))
+        pts[:, 1] = row * dxv + yshift[col]
+        pts[:, 0] = col * dxh
 
         return pts
 
@@ -879,16 +1103,11 @@ class HexModelGrid(VoronoiDelaunayGrid):
         dxh = dxv * numpy.sqrt(3.) / 2.
         half_dxv = dxv / 2.
 
-        npts = num_rows * num_cols
-        pts = numpy.zeros((npts, 2))
-        yshift = 0.
-        i = 0
-        for c in range(num_cols):
-            for r in range(num_rows):
-                yshift = half_dxv * (c % 2)
-                pts[i, 1] = r * dxv + yshift
-                pts[i, 0] = c * dxh
-                i += 1
+        (col, row) = _rows_and_columns(numpy.full(num_cols, num_rows))
+
+        pts = numpy.empty((len(col), 2))
+        pts[:, 1] = row * dxv + half_dxv * (col % 2)
+        pts[:, 0] = col * dxh
 
         return pts
 
@@ -390,7 +390,12 @@ Identifying node subsets
 These methods are useful in identifying subsets of nodes, e.g., closest node
 to a point; nodes at edges.
 
-(None are available for this grid type)
+.. autosummary::
+    :toctree: generated/
+
+    ~landlab.grid.radial.RadialModelGrid.find_nearest_node
+    ~landlab.grid.radial.RadialModelGrid.is_point_on_grid
+    ~landlab.grid.radial.RadialModelGrid.spatial_index
 
 Surface analysis
 ----------------
@@ -403,6 +408,7 @@ find in GIS software.
 
     ~landlab.grid.radial.RadialModelGrid.calc_aspect_at_node
     ~landlab.grid.radial.RadialModelGrid.calc_hillshade_at_node
+    ~landlab.grid.radial.RadialModelGrid.calc_slope_aspect_hillshade_at_node
     ~landlab.grid.radial.RadialModelGrid.calc_slope_at_node
 
 Notes
@@ -45,6 +45,7 @@ Information about the grid as a whole
     ~landlab.grid.raster.RasterModelGrid.grid_ydimension
     ~landlab.grid.raster.RasterModelGrid.imshow
     ~landlab.grid.raster.RasterModelGrid.is_point_on_grid
+    ~landlab.grid.raster.RasterModelGrid.spatial_index
     ~landlab.grid.raster.RasterModelGrid.move_origin
     ~landlab.grid.raster.RasterModelGrid.ndim
     ~landlab.grid.raster.RasterModelGrid.node_axis_coordinates
@@ -496,6 +497,7 @@ find in GIS software.
     ~landlab.grid.raster.RasterModelGrid.calc_aspect_at_cell_subtriangles
     ~landlab.grid.raster.RasterModelGrid.calc_aspect_at_node
     ~landlab.grid.raster.RasterModelGrid.calc_hillshade_at_node
+    ~landlab.grid.raster.RasterModelGrid.calc_slope_aspect_hillshade_at_node
     ~landlab.grid.raster.RasterModelGrid.calc_slope_at_node
 
 Notes
@@ -843,6 +845,9 @@ class RasterModelGrid(ModelGrid, RasterModelGridPlotter):
     or set it up such that one can create a zero-node grid.
     """
 
+    _id_arrays = ModelGrid._id_arrays + (
+        '_RasterModelGrid__diagonal_neighbors_at_node', )
+
     def __init__(self, *args, **kwds):
         """Create a 2D grid with equal spacing.
 
@@ -1191,7 +1196,7 @@ class RasterModelGrid(ModelGrid, RasterModelGridPlotter):
 
     def _setup_nodes(self):
         self._nodes = np.arange(self.number_of_nodes,
-                                dtype=int).reshape(self.shape)
+                                dtype=self.id_dtype).reshape(self.shape)
         return self._nodes
 
     @property
@@ -1609,8 +1614,10 @@ class RasterModelGrid(ModelGrid, RasterModelGridPlotter):
         methods like this may be soon superceded.
         """
         n_diagonal_links = 2 * (self._nrows - 1) * (self._ncols - 1)
-        self._diag_link_fromnode = np.zeros(n_diagonal_links, dtype=int)
-        self._diag_link_tonode = np.zeros(n_diagonal_links, dtype=int)
+        self._diag_link_fromnode = np.zeros(n_diagonal_links,
+                                            dtype=self.id_dtype)
+        self._diag_link_tonode = np.zeros(n_diagonal_links,
+                                          dtype=self.id_dtype)
         i = 0
         for r in range(self._nrows - 1):
             for c in range(self._ncols - 1):
@@ -1626,7 +1633,7 @@ class RasterModelGrid(ModelGrid, RasterModelGridPlotter):
         self._reset_list_of_active_diagonal_links()
 
         self._diag_links_at_node = np.empty((self.number_of_nodes, 4),
-                                            dtype=int)
+                                            dtype=self.id_dtype)
         self._diag_links_at_node.fill(-1)
 
         # Number of patches is number_of_diagonal_nodes / 2
@@ -1735,7 +1742,7 @@ class RasterModelGrid(ModelGrid, RasterModelGridPlotter):
             return self.node_patch_matrix
         except AttributeError:
             self.node_patch_matrix = np.full((self.number_of_nodes, 4),
-                                             -1, dtype=int)
+                                             -1, dtype=self.id_dtype)
             self.node_patch_matrix[:, 2][
                 np.setdiff1d(np.arange(self.number_of_nodes),
                              np.union1d(self.nodes_at_left_edge,
@@ -1784,7 +1791,7 @@ class RasterModelGrid(ModelGrid, RasterModelGridPlotter):
         LLCATS: NINF PINF CONN
         """
         self._patches_created = True
-        base = np.arange(self.number_of_patches)
+        base = np.arange(self.number_of_patches, dtype=self.id_dtype)
         bottom_left_corner = base + base // (self._ncols - 1)
         return np.column_stack((bottom_left_corner + self._ncols + 1,
                                 bottom_left_corner + self._ncols,
@@ -1810,7 +1817,7 @@ class RasterModelGrid(ModelGrid, RasterModelGridPlotter):
         LLCATS: PINF LINF CONN
         """
         self._patches_created = True
-        base = np.arange(self.number_of_patches)
+        base = np.arange(self.number_of_patches, dtype=self.id_dtype)
         bottom_edge = base + (base // (self._ncols - 1)) * self._ncols
         return np.column_stack((bottom_edge + self._ncols,
                                 bottom_edge + 2 * self._ncols - 1,
@@ -1858,7 +1865,7 @@ class RasterModelGrid(ModelGrid, RasterModelGridPlotter):
         from .cfuncs import create_patches_at_element
         self._patches_created = True
         self._patches_at_link = np.empty((self.number_of_links, 2),
-                                         dtype=int)
+                                         dtype=self.id_dtype)
         self._patches_at_link.fill(-1)
         create_patches_at_element(self.links_at_patch, self.number_of_links,
                                   self._patches_at_link)
@@ -2018,6 +2025,13 @@ class RasterModelGrid(ModelGrid, RasterModelGridPlotter):
          self._node_numactiveoutlink) = sgrid.setup_active_outlink_matrix2(
              self.shape, node_status=node_status)
 
+        for name in ('_node_active_inlink_matrix',
+                     '_node_active_outlink_matrix',
+                     '_node_active_inlink_matrix2',
+                     '_node_active_outlink_matrix2'):
+            setattr(self, name, as_id_array(getattr(self, name),
+                                            dtype=self.id_dtype))
+
     def _reset_list_of_active_diagonal_links(self):
         """Reset the active diagonal links.
 
@@ -2046,7 +2060,8 @@ class RasterModelGrid(ModelGrid, RasterModelGridPlotter):
                               (diag_fromnode_status == CLOSED_BOUNDARY)))
 
         (_diag_active_links, ) = np.where(diag_active_links)
-        _diag_active_links = as_id_array(_diag_active_links)
+        _diag_active_links = as_id_array(_diag_active_links,
+                                         dtype=self.id_dtype)
 
         diag_fixed_links = ((((diag_fromnode_status ==
                                FIXED_GRADIENT_BOUNDARY) &
@@ -2055,7 +2070,8 @@ class RasterModelGrid(ModelGrid, RasterModelGridPlotter):
                               (diag_fromnode_status == CORE_NODE))))
 
         (_diag_fixed_links, ) = np.where(diag_fixed_links)
-        _diag_fixed_links = as_id_array(_diag_fixed_links)
+        _diag_fixed_links = as_id_array(_diag_fixed_links,
+                                        dtype=self.id_dtype)
 
         self._diag_activelink_fromnode = self._diag_link_fromnode[
             _diag_active_links]
@@ -2341,7 +2357,8 @@ class RasterModelGrid(ModelGrid, RasterModelGridPlotter):
         >>> mg.link_at_face[(0, 4, 13), ]
         array([ 5, 10, 21])
         """
-        self._link_at_face = squad_faces.link_at_face(self.shape)
+        self._link_at_face = as_id_array(
+            squad_faces.link_at_face(self.shape), dtype=self.id_dtype)
         return self._link_at_face
 
     def _create_face_at_link(self):
@@ -2370,7 +2387,8 @@ class RasterModelGrid(ModelGrid, RasterModelGridPlotter):
         >>> faces
         array([-1, -1,  8, 11,  6, -1])
         """
-        self._face_at_link = squad_faces.face_at_link(self.shape)
+        self._face_at_link = as_id_array(
+            squad_faces.face_at_link(self.shape), dtype=self.id_dtype)
         return self._face_at_link
 
     @deprecated(use='extent', version=1.0)
@@ -2835,43 +2853,6 @@ class RasterModelGrid(ModelGrid, RasterModelGridPlotter):
         return np.array([id_, id_ + self.number_of_node_columns,
                          id_ + self.number_of_node_columns + 1, id_ + 1])
 
-    @deprecated(use='find_nearest_node', version='0.2')
-    def snap_coords_to_grid(self, xcoord, ycoord):
-        """Snap coordinates to the nearest node.
-
-        This method takes existing coordinates, inside the grid, and returns
-        the ID of the closest grid node. That node can be a boundary node.
-
-        LLCATS: DEPR NINF SUBSET
-        """
-        # DEJH, 9/24/13.
-        # This testing suppressed for speed. While suppressed, coordinates
-        # provided MUST be within the grid or silent instability will occur.
-        # if type(xcoord) == int:
-        #    if not self.is_point_on_grid(xcoord, ycoord):
-        #        raise LookupError(
-        #           'Coordinates specified are outside the grid area')
-        # else: #it's an array
-        #    if not np.all(self.is_point_on_grid(xcoord, ycoord)):
-        #        raise LookupError(
-        #           'One or more pairs of coordinates specified are outside '
-        #           'the grid area')
-        vertices_array = self.nodes_around_point(xcoord, ycoord)
-        # vertices_array.reshape((4,-1))
-        xdir_displacement = np.tile(
-            xcoord, (4, 1)) - self.node_x[vertices_array]
-        ydir_displacement = np.tile(
-            ycoord, (4, 1)) - self.node_y[vertices_array]
-        distances_to_vertices = np.sqrt(
-            xdir_displacement * xdir_displacement +
-            ydir_displacement * ydir_displacement)
-        try:
-            return vertices_array[(np.argmin(distances_to_vertices, axis=0),
-                                   range(distances_to_vertices.shape[1]))]
-        except:
-            return vertices_array[np.argmin(distances_to_vertices)]
-        # ...per fancy indexing
-
     def find_nearest_node(self, coords, mode='raise'):
         """Node nearest a point.
 
@@ -4416,38 +4397,8 @@ class RasterModelGrid(ModelGrid, RasterModelGridPlotter):
 
         LLCATS: DEPR NINF SURF
         """
-        # additional note, KRB has written three codes in raster.py
-        # one to calculate slope, one to calculate aspect, and one
-        # to calculate both
-
-        # get the list of neighboring nodes for the nodes given by id
-        n = self.active_neighbors_at_node[id]
-        a = []
-
-        # for each node in id make a list with the node id and the ids of
-        # its neighbors.
-
-        # determine the values for the x, y, and z coordinates of each node,
-        # pass these to rfuncs.calculate_slope_aspect_bfp to calculate the
-        # slope and aspect.
-
-        indBool = (n != BAD_INDEX_VALUE)
-
-        for i in range(len(id)):
-            # make a list of the neighbor nodes and
-            # check that none of the nodes are bad
-
-            ns = list(n[0][indBool[0]])
-            ns.append(id[i])
-
-            x = self.node_x[ns]
-            y = self.node_y[ns]
-            z = val[ns]
-            slope, aspect = rfuncs.calculate_slope_aspect_bfp(x, y, z)
-            a.append(aspect)
-            del ns
-        # return aspect alone
-        return a
+        _, aspect = self._calc_slope_aspect_bfp_at_nodes(id, val)
+        return list(aspect)
 
     @deprecated(use='calc_slope_at_node', version=1.0)
     def calculate_slope_at_nodes_bestFitPlane(self, id, val):
@@ -4473,40 +4424,8 @@ class RasterModelGrid(ModelGrid, RasterModelGridPlotter):
 
         LLCATS: DEPR NINF GRAD SURF
         """
-        #
-        # additional note, KRB has written three codes in raster.py
-        # one to calculate slope, one to calculate aspect, and one
-        # to calculate both
-
-        # get the list of neighboring nodes for the nodes given by id
-        n = self.active_neighbors_at_node[id]
-        s = []
-
-        # for each node in id make a list with the node id and the ids of
-        # its neighbors.
-
-        # determine the values for the x, y, and z coordinates of each node,
-        # pass these to rfuncs.calculate_slope_aspect_bfp to calculate the
-        # slope and aspect.
-
-        indBool = (n != BAD_INDEX_VALUE)
-
-        for i in range(len(id)):
-            # make a list of the neighbor nodes and
-            # check that none of the nodes are bad
-
-            ns = list(n[0][indBool[0]])
-            ns.append(id[i])
-
-            x = self.node_x[ns]
-            y = self.node_y[ns]
-            z = val[ns]
-
-            slope, _ = rfuncs.calculate_slope_aspect_bfp(x, y, z)
-            s.append(slope)
-            del ns
-        # return slope alone
-        return s
+        slope, _ = self._calc_slope_aspect_bfp_at_nodes(id, val)
+        return list(slope)
 
     @deprecated(use='calc_slope_at_node, calc_aspect_at_node', version=1.0)
     def calculate_slope_aspect_at_nodes_burrough(self, ids=None,
@@ -4573,33 +4492,10 @@ class RasterModelGrid(ModelGrid, RasterModelGridPlotter):
             if len(vals) != self.number_of_nodes:
                 raise IndexError('*vals* was not of a compatible length!')
 
-        neighbors = np.zeros([ids.shape[0], 4], dtype=int)
-        diagonals = np.zeros([ids.shape[0], 4], dtype=int)
-        # [right, top, left, bottom]
-        neighbors[:, ] = self.active_neighbors_at_node[ids]
-        # [topright, topleft, bottomleft, bottomright]
-        diagonals[:, ] = self._get_diagonal_list(ids)
-
-        right = vals[neighbors[:, 0]]
-        top = vals[neighbors[:, 1]]
-        left = vals[neighbors[:, 2]]
-        bottom = vals[neighbors[:, 3]]
-        top_right = vals[diagonals[:, 0]]
-        top_left = vals[diagonals[:, 1]]
-        bottom_left = vals[diagonals[:, 2]]
-        bottom_right = vals[diagonals[:, 3]]
-
-        dz_dx = ((top_right + 2 * right + bottom_right) -
-                 (top_left + 2 * left + bottom_left)) / (8. * self._dx)
-        dz_dy = ((bottom_left + 2 * bottom + bottom_right) -
-                 (top_left + 2 * top + top_right)) / (8. * self._dy)
-
-        slope = np.zeros([ids.shape[0]], dtype=float)
-        aspect = np.zeros([ids.shape[0]], dtype=float)
-        slope = np.arctan(np.sqrt(dz_dx ** 2 + dz_dy ** 2))
-        aspect = np.arctan2(dz_dy, - dz_dx)
-        aspect = np.pi * .5 - aspect
-        aspect[aspect < 0.] = aspect[aspect < 0.] + 2. * np.pi
+        slope, aspect, _ = self.calc_slope_aspect_hillshade_at_node(
+            elevs=vals, method='Horn')
+        slope = slope[ids]
+        aspect = aspect[ids]
         aspect[slope == 0.] = -1.
 
         return slope, aspect
@@ -4638,40 +4534,62 @@ class RasterModelGrid(ModelGrid, RasterModelGridPlotter):
 
         LLCATS: DEPR NINF GRAD SURF
         """
-        # additional note, KRB has written three codes in raster.py
-        # one to calculate slope, one to calculate aspect, and one
-        # to calculate both
-
-        # get the list of neighboring nodes for the nodes given by id
-        node_neighbors = self.active_neighbors_at_node[nodes]
-        aspects = []
-        slopes = []
+        slopes, aspects = self._calc_slope_aspect_bfp_at_nodes(nodes, val)
+        return list(slopes), list(aspects)
 
-        # for each node in id make a list with the node id and the ids of
-        # its neighbors.
+    def _calc_slope_aspect_bfp_at_nodes(self, nodes, val):
+        """Slope and aspect of best-fit planes through nodes and neighbors.
 
-        # determine the values for the x, y, and z coordinates of each node,
-        # pass these to rfuncs.calculate_slope_aspect_bfp to calculate the
-        # slope and aspect.
+        A vectorized version of ``raster_funcs.calculate_slope_aspect_bfp``
+        that fits a plane, by single value decomposition, to each node in
+        *nodes* and its active neighbors all at once.
 
-        indBool = (node_neighbors != BAD_INDEX_VALUE)
+        Parameters
+        ----------
+        nodes : array-like
+            IDs of nodes at which to calculate slope and aspect.
+        val : ndarray
+            Elevation at all nodes.
 
-        for id_ in range(len(nodes)):
-            # make a list of the neighbor nodes and
-            # check that none of the nodes are bad
-            neighbors = list(node_neighbors[0, indBool[0]])
-            neighbors.append(nodes[id_])
+        Returns
+        -------
+        (slope, aspect) : tuple of ndarray
+            Slope and aspect, both in degrees, at each of *nodes*.
 
-            node_x = self.node_x[neighbors]
-            node_y = self.node_y[neighbors]
-            node_z = val[neighbors]
-            slope, aspect = rfuncs.calculate_slope_aspect_bfp(node_x, node_y,
-                                                              node_z)
-            aspects.append(aspect)
-            slopes.append(slope)
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from landlab import RasterModelGrid
+        >>> grid = RasterModelGrid((3, 4))
+        >>> z = grid.node_y * np.tan(np.radians(30.))
+        >>> slope, aspect = grid._calc_slope_aspect_bfp_at_nodes([5, 6], z)
+        >>> np.allclose(slope, 30.), np.allclose(aspect % 180., 0.)
+        (True, True)
+        """
+        nodes = np.asarray(nodes, dtype=int).reshape((-1, ))
+        points = np.empty((len(nodes), 5), dtype=int)
+        points[:, :4] = self.active_neighbors_at_node[nodes]
+        points[:, 4] = nodes
+        is_point = points != BAD_INDEX_VALUE
+
+        xyz = np.empty((len(nodes), 3, 5), dtype=float)
+        xyz[:, 0] = self.node_x[points]
+        xyz[:, 1] = self.node_y[points]
+        xyz[:, 2] = np.asarray(val)[points]
+
+        # missing points sit on the centroid so they don't affect the fit
+        n_points = is_point.sum(axis=1).reshape((-1, 1))
+        centroid = (xyz * is_point[:, np.newaxis, :]).sum(axis=2) / n_points
+        xyz -= centroid[:, :, np.newaxis]
+        xyz *= is_point[:, np.newaxis, :]
+
+        normal = np.linalg.svd(xyz)[0][:, :, 2]
+
+        aspect = (90. - np.degrees(np.arctan2(normal[:, 1],
+                                              normal[:, 0]))) % 360.
+        slope = 90. - np.degrees(np.arcsin(normal[:, 2]))
 
-            del neighbors
-        return slopes, aspects
+        return slope, aspect
 
     def save(self, path, names=None, format=None, at=None):
         """Save a grid and fields.
@@ -4779,73 +4697,42 @@ class RasterModelGrid(ModelGrid, RasterModelGridPlotter):
         >>> neighbors[5]
         array([3, 0, 2, 1, 4, 1, 2, 0])
         """
-        # CAUTION: Some terminology concerning cells in this module
-        # is asynchronous to general understanding. This is intentionally
-        # left as is until further discussion among dev group.
-        # Any such instances are marked with (*TC - Terminoly Caution)
-        nrows, ncols = self.cell_grid_shape
-        interior_cells = sgrid.interior_nodes(self.cell_grid_shape)  # *TC
-        cells_at_corners_of_grid = self.cells_at_corners_of_grid  # *TC
+        # order = [E,NE,N,NW,W,SW,S,SE]
+        return self._looped_cells_at_offsets([(0, 1), (1, 1), (1, 0),
+                                              (1, -1), (0, -1), (-1, -1),
+                                              (-1, 0), (-1, 1)])
+
+    def _looped_cells_at_offsets(self, offsets):
+        """Find the cells offset from each cell, looping across the grid.
 
-        # The cells along the edges minus the corner cells.
-        top_edge_cells = self.cell_at_node[self.nodes[-2, :]][2:-2]
-        bottom_edge_cells = self.cell_at_node[self.nodes[1, :]][2:-2]
-        left_edge_cells = self.cell_at_node[self.nodes[:, 1]][2:-2]
-        right_edge_cells = self.cell_at_node[self.nodes[:, -2]][2:-2]
+        Parameters
+        ----------
+        offsets : list of tuple of int
+            Offsets, as (rows, columns), of the neighbors.
 
-        looped_cell_neighbors = np.empty([self.number_of_cells, 8], dtype=int)
+        Returns
+        -------
+        ndarray of int, shape (n_cells, n_offsets)
+            Looped neighbors of each cell, in the order of *offsets*.
 
-        # order = [E,NE,N,NW,W,SW,S,SE]
-        for cell in range(0, self.number_of_cells):
-            if cell in interior_cells:
-                neighbor_ = [
-                    cell + 1, cell + 1 + ncols, cell + ncols, cell + ncols - 1,
-                    cell - 1, cell - ncols - 1, cell - ncols, cell - ncols + 1]
-            elif cell in bottom_edge_cells:
-                neighbor_ = [
-                    cell + 1, cell + 1 + ncols, cell + ncols, cell + ncols - 1,
-                    cell - 1, cell + (nrows - 1) * ncols - 1,
-                    cell + (nrows - 1) * ncols, cell + (nrows - 1) * ncols + 1]
-            elif cell in top_edge_cells:
-                neighbor_ = [
-                    cell + 1, cell - (nrows - 1) * ncols + 1,
-                    cell - (nrows - 1) * ncols, cell - (nrows - 1) * ncols - 1,
-                    cell - 1, cell - ncols - 1, cell - ncols, cell - ncols + 1]
-            elif cell in right_edge_cells:
-                neighbor_ = [
-                    cell - ncols + 1, cell + 1, cell + ncols, cell + ncols - 1,
-                    cell - 1, cell - ncols - 1, cell - ncols,
-                    cell - 2 * ncols + 1]
-            elif cell in left_edge_cells:
-                neighbor_ = [
-                    cell + 1, cell + ncols + 1, cell + ncols,
-                    cell + 2 * ncols - 1, cell + ncols - 1, cell - 1,
-                    cell - ncols, cell - ncols + 1]
-            elif cell == cells_at_corners_of_grid[0]:  # SW corner
-                neighbor_ = [
-                    cell + 1, cell + ncols + 1, cell + ncols,
-                    cell + 2 * ncols - 1, cell + ncols - 1,
-                    cell + nrows * ncols - 1, cell + (nrows - 1) * ncols,
-                    cell + (nrows - 1) * ncols + 1]
-            elif cell == cells_at_corners_of_grid[1]:  # SE corner
-                neighbor_ = [
-                    cell - ncols + 1, cell + 1, cell + ncols, cell + ncols - 1,
-                    cell - 1, cell + (nrows - 1) * ncols - 1,
-                    cell + (nrows - 1) * ncols, cell + (nrows - 2) * ncols + 1]
-            elif cell == cells_at_corners_of_grid[2]:  # NW corner
-                neighbor_ = [
-                    cell + 1, cell - (nrows - 1) * ncols + 1,
-                    cell - (nrows - 1) * ncols, cell - (nrows - 2) * ncols - 1,
-                    cell + ncols - 1, cell - 1, cell - ncols, cell - ncols + 1]
-            elif cell == cells_at_corners_of_grid[3]:  # NE corner
-                neighbor_ = [
-                    cell - ncols + 1, cell - nrows * ncols + 1,
-                    cell - (nrows - 1) * ncols, cell - (nrows - 1) * ncols - 1,
-                    cell - 1, cell - ncols - 1, cell - ncols,
-                    cell - 2 * ncols + 1]
-            looped_cell_neighbors[cell] = neighbor_
-
-        return looped_cell_neighbors
+        Examples
+        --------
+        >>> from landlab import RasterModelGrid
+        >>> grid = RasterModelGrid((4, 5))
+        >>> grid._looped_cells_at_offsets([(0, 1), (1, 0)])
+        array([[1, 3],
+               [2, 4],
+               [0, 5],
+               [4, 0],
+               [5, 1],
+               [3, 2]])
+        """
+        nrows, ncols = self.cell_grid_shape
+        row, col = np.divmod(np.arange(self.number_of_cells), ncols)
+        row_offset, col_offset = np.array(offsets, dtype=int).T
+
+        return (((row[:, np.newaxis] + row_offset) % nrows) * ncols +
+                (col[:, np.newaxis] + col_offset) % ncols)
 
     @deprecated(use='second_ring_looped_neighbors_at_cell', version=1.0)
     def get_second_ring_looped_cell_neighbor_list(self, cell_ids):
@@ -4901,17 +4788,10 @@ class RasterModelGrid(ModelGrid, RasterModelGridPlotter):
         2D array of size ( self.number_of_cells, 16 ).
         Order or neighbors: Starts with E and goes counter clockwise
         """
-        inf = self.looped_neighbors_at_cell
-        second_ring = np.empty([self.number_of_cells, 16], dtype=int)
-        order = np.arange(-1, 15)
-        order[0] = 15
-        for cell in range(0, self.number_of_cells):
-            cell1, cell2, cell3, cell4 = (inf[cell][1], inf[cell][3],
-                                          inf[cell][5], inf[cell][7])
-            ring_tw = np.concatenate((inf[cell1][0:4], inf[cell2][2:6],
-                                      inf[cell3][4:8], inf[cell4][6:8],
-                                      inf[cell4][0:2]))[order]
-            second_ring[cell] = ring_tw
+        second_ring = self._looped_cells_at_offsets(
+            [(0, 2), (1, 2), (2, 2), (2, 1), (2, 0), (2, -1), (2, -2),
+             (1, -2), (0, -2), (-1, -2), (-2, -2), (-2, -1), (-2, 0),
+             (-2, 1), (-2, 2), (-1, 2)])
 
         self._looped_second_ring_cell_neighbor_list_created = True
         return second_ring
@@ -1396,3 +1396,229 @@ def calc_slope_at_node(grid, elevs='topographic__elevation',
 
     else:
         return slope_mag
+
+
+# Terms of the gradient stencils as (row, column) offsets into the padded
+# node values, the gradient component (0 for x, 1 for y) and the weight.
+_HORN_STENCIL = (
+    ((1, 2), 0, 2.), ((1, 0), 0, -2.), ((2, 2), 0, 1.), ((2, 0), 0, -1.),
+    ((0, 2), 0, 1.), ((0, 0), 0, -1.),
+    ((2, 1), 1, 2.), ((0, 1), 1, -2.), ((2, 2), 1, 1.), ((0, 2), 1, -1.),
+    ((2, 0), 1, 1.), ((0, 0), 1, -1.))
+_ZEVENBERGEN_THORNE_STENCIL = (
+    ((1, 2), 0, 1.), ((1, 0), 0, -1.), ((2, 1), 1, 1.), ((0, 1), 1, -1.))
+
+
+def _stencil_workspace(grid):
+    """Arrays reused by every call to _calc_stencil_grad_at_node.
+
+    The workspace is built the first time it is asked for and kept on the
+    grid. It holds the padded node values, a padded mask of closed nodes
+    (whose perimeter is always False) and a scratch array shaped like the
+    grid.
+    """
+    try:
+        return grid._stencil_workspace
+    except AttributeError:
+        padded_shape = (grid.shape[0] + 2, grid.shape[1] + 2)
+        grid._stencil_workspace = (np.empty(padded_shape, dtype=float),
+                                   np.zeros(padded_shape, dtype=bool),
+                                   np.empty(grid.shape, dtype=float))
+        return grid._stencil_workspace
+
+
+def _calc_stencil_grad_at_node(grid, z, method='Horn',
+                               ignore_closed_nodes=True, out=None):
+    """Calculate components of gradient at nodes with a 3x3 stencil.
+
+    Nodes beyond the grid perimeter are given values linearly extrapolated
+    from the two nearest rows (or columns) of nodes so that, for a planar
+    surface, perimeter gradients are exact. If *ignore_closed_nodes* is
+    True, values at closed nodes are replaced by that of the central node
+    of the stencil, as is done by GIS packages for no-data cells.
+
+    The padded values, closed-node mask and scratch space are kept on the
+    grid (see :func:`_stencil_workspace`) and every stencil term is added
+    in place, so, when *out* is given, a call allocates no node-sized
+    arrays. Because of this, calls for the same grid must not be made
+    from more than one thread at a time.
+
+    Parameters
+    ----------
+    grid : RasterModelGrid
+        A grid.
+    z : ndarray
+        Values at nodes.
+    method : {'Horn', 'Zevenbergen-Thorne'}
+        Horn (1981) uses a weighted difference over all eight neighbors;
+        Zevenbergen & Thorne (1987) use the four orthogonal neighbors only.
+    ignore_closed_nodes : bool
+        If True, do not incorporate values at closed nodes into the calc.
+    out : tuple of ndarray, optional
+        Buffers to hold the x and y components of the gradient.
+
+    Returns
+    -------
+    (grad_x, grad_y) : tuple of ndarray
+        Components of gradient (rise over run) at each node.
+    """
+    if method == 'Horn':
+        (stencil, denominator) = (_HORN_STENCIL, 8.)
+    elif method == 'Zevenbergen-Thorne':
+        (stencil, denominator) = (_ZEVENBERGEN_THORNE_STENCIL, 2.)
+    else:
+        raise ValueError('method name not understood')
+    if out is None:
+        out = (grid.empty(at='node', dtype=float),
+               grid.empty(at='node', dtype=float))
+    (grad_x, grad_y) = out
+
+    shape = grid.shape
+    (padded, padded_closed, scratch) = _stencil_workspace(grid)
+    padded[1:-1, 1:-1] = z.reshape(shape)
+    for (edge, inner, next_inner) in (
+            (padded[1:-1, 0], padded[1:-1, 1], padded[1:-1, 2]),
+            (padded[1:-1, -1], padded[1:-1, -2], padded[1:-1, -3]),
+            (padded[0, :], padded[1, :], padded[2, :]),
+            (padded[-1, :], padded[-2, :], padded[-3, :])):
+        np.multiply(inner, 2., out=edge)
+        edge -= next_inner
+    center = padded[1:-1, 1:-1]
+
+    has_closed = False
+    if ignore_closed_nodes:
+        np.equal(grid.status_at_node.reshape(shape), CLOSED_BOUNDARY,
+                 out=padded_closed[1:-1, 1:-1])
+        has_closed = padded_closed.any()
+
+    dz_dx = grad_x.reshape(shape)
+    dz_dy = grad_y.reshape(shape)
+    dz_dx.fill(0.)
+    dz_dy.fill(0.)
+    components = [dz_dx, dz_dy]
+    for ((row, col), axis, weight) in stencil:
+        values = padded[row:row + shape[0], col:col + shape[1]]
+        if has_closed:
+            # The weights of each component sum to zero, so using the
+            # difference from the center, zeroed at closed nodes, is the
+            # same as giving closed nodes the value of the center.
+            np.subtract(values, center, out=scratch)
+            np.copyto(scratch, 0.,
+                      where=padded_closed[row:row + shape[0],
+                                          col:col + shape[1]])
+            scratch *= weight
+        else:
+            np.multiply(values, weight, out=scratch)
+        components[axis] += scratch
+    dz_dx /= denominator * grid.dx
+    dz_dy /= denominator * grid.dy
+
+    return grad_x, grad_y
+
+
+def calc_slope_aspect_hillshade_at_node(grid, elevs='topographic__elevation',
+                                        alt=45., az=315., unit='degrees',
+                                        method='Horn',
+                                        ignore_closed_nodes=True, out=None):
+    """Calculate slope, aspect and hillshade at nodes in a single pass.
+
+    This is a version of this function specialized for a raster. Rather
+    than building gradients on patches, it finds the gradient at every node
+    from the 3x3 block of nodes around it, using strided views of the
+    elevation array, and derives slope, aspect and hillshade from it.
+
+    Parameters
+    ----------
+    grid : RasterModelGrid
+        A grid.
+    elevs : str or ndarray, optional
+        Field name or array of node values.
+    alt : float
+        Sun altitude (from horizon) - defaults to 45 degrees
+    az : float
+        Sun azimuth (CW from north) - defaults to 315 degrees
+    unit : {'degrees', 'radians'}
+        Unit of *alt* and *az*.
+    method : {'Horn', 'Zevenbergen-Thorne'}
+        Stencil used to calculate the gradient. 'Horn' is the standard
+        ArcGIS slope algorithm.
+    ignore_closed_nodes : bool
+        If True, do not incorporate values at closed nodes into the calc.
+    out : tuple of ndarray, optional
+        Length-3 tuple of buffers, each number-of-nodes long, to hold the
+        slope, aspect and hillshade.
+
+    Returns
+    -------
+    (slope, aspect, hillshade) : tuple of ndarray
+        Slope in radians, aspect in radians clockwise from north, and
+        hillshade at each node.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab import RasterModelGrid
+    >>> mg = RasterModelGrid((4, 5), (2., 1.))
+
+    Create a south-facing slope.
+
+    >>> z = mg.node_y * 0.5
+    >>> slope, aspect, shade = mg.calc_slope_aspect_hillshade_at_node(
+    ...     elevs=z, alt=30., az=180.)
+    >>> np.allclose(slope, np.arctan(0.5))
+    True
+    >>> np.allclose(aspect, np.pi)
+    True
+    >>> np.allclose(shade, np.sin(np.pi / 6. + np.arctan(0.5)))
+    True
+
+    Reuse buffers on repeated calls.
+
+    >>> out = (mg.empty(at='node'), mg.empty(at='node'), mg.empty(at='node'))
+    >>> rtn = mg.calc_slope_aspect_hillshade_at_node(elevs=z, out=out)
+    >>> all(a is b for a, b in zip(rtn, out))
+    True
+
+    Unlike Zevenbergen-Thorne, the Horn stencil uses diagonal neighbors.
+
+    >>> mg = RasterModelGrid((3, 3))
+    >>> z = np.array([0., 0., 8.,
+    ...               0., 0., 0.,
+    ...               0., 0., 0.])
+    >>> horn, aspect, _ = mg.calc_slope_aspect_hillshade_at_node(elevs=z)
+    >>> np.isclose(np.tan(horn[4]), np.sqrt(2.)), np.degrees(aspect[4])
+    (True, 315.0)
+    >>> zt, _, _ = mg.calc_slope_aspect_hillshade_at_node(
+    ...     elevs=z, method='Zevenbergen-Thorne')
+    >>> zt[4]
+    0.0
+
+    LLCATS: NINF GRAD SURF
+    """
+    (alt, az) = gradients._sun_position_in_radians(alt, az, unit)
+    try:
+        z = grid.at_node[elevs]
+    except TypeError:
+        z = np.asarray(elevs, dtype=float)
+
+    if out is None:
+        out = (grid.empty(at='node', dtype=float),
+               grid.empty(at='node', dtype=float),
+               grid.empty(at='node', dtype=float))
+    (slope, aspect, shade) = out
+
+    (grad_x, grad_y) = _calc_stencil_grad_at_node(
+        grid, z, method=method,
+        ignore_closed_nodes=ignore_closed_nodes, out=(aspect, shade))
+
+    np.hypot(grad_x, grad_y, out=slope)
+    np.arctan(slope, out=slope)
+
+    np.arctan2(grad_y, grad_x, out=aspect)
+    np.subtract(3. * np.pi / 2., aspect, out=aspect)
+    np.mod(aspect, 2. * np.pi, out=aspect)
+
+    gradients._calc_hillshade_from_slope_aspect(alt, az, slope, aspect,
+                                                out=shade)
+
+    return slope, aspect, shade
@@ -0,0 +1,277 @@
+#! /usr/bin/env python
+"""Spatial lookups of grid elements using k-d trees.
+
+A :class:`SpatialIndex` holds, for a grid, k-d trees built over the
+locations of nodes, cells, links and faces. Trees are built the first time
+they are needed and then reused, so repeated radius and nearest-neighbor
+queries cost ``O(log N)`` per point rather than a scan over every element.
+
+Spatial index
++++++++++++++
+
+.. autosummary::
+    :toctree: generated/
+
+    ~landlab.grid.spatial_index.SpatialIndex
+"""
+import numpy as np
+from scipy.spatial import cKDTree, Delaunay
+
+
+def _coords_as_points(coords):
+    """Convert a tuple of x and y coordinates into an array of points.
+
+    Parameters
+    ----------
+    coords : tuple of float or tuple of array_like
+        Coordinates of points as (x, y).
+
+    Returns
+    -------
+    (points, is_scalar) : (ndarray, bool)
+        Points as an (n, 2) array, and whether the coordinates were
+        scalars.
+
+    Examples
+    --------
+    >>> from landlab.grid.spatial_index import _coords_as_points
+    >>> _coords_as_points((1., 2.))
+    (array([[ 1.,  2.]]), True)
+    >>> _coords_as_points(([1., 3.], [2., 4.]))
+    (array([[ 1.,  2.],
+           [ 3.,  4.]]), False)
+    """
+    if len(coords) != 2:
+        raise ValueError('coordinates must be a tuple of (x, y)')
+    (x, y) = np.broadcast_arrays(np.asarray(coords[0], dtype=float),
+                                 np.asarray(coords[1], dtype=float))
+    points = np.empty((x.size, 2), dtype=float)
+    points[:, 0] = x.flat
+    points[:, 1] = y.flat
+    return points, x.ndim == 0
+
+
+class SpatialIndex(object):
+
+    """Cached k-d trees over the locations of a grid's elements.
+
+    Parameters
+    ----------
+    grid : ModelGrid
+        The grid to index.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab import HexModelGrid
+    >>> from landlab.grid.spatial_index import SpatialIndex
+    >>> grid = HexModelGrid(3, 3)
+    >>> index = SpatialIndex(grid)
+    >>> dist, node = index.nearest((0.6, 0.9))
+    >>> node
+    4
+    >>> np.isclose(dist, np.hypot(.1, .9 - np.sqrt(3.) / 2.))
+    True
+    >>> index.containing_cell((0.6, 0.9))
+    0
+    >>> index.containing_cell((0.1, 0.1))
+    -1
+
+    The index is also available as an attribute of every grid.
+
+    >>> grid.spatial_index.nearest(([0., 2.], [0., 0.]))[1]
+    array([0, 2])
+    """
+
+    def __init__(self, grid):
+        self._grid = grid
+        self._trees = {}
+        self._triangulation = None
+
+    @property
+    def grid(self):
+        """The grid being indexed."""
+        return self._grid
+
+    def _coords_at(self, at):
+        """Get an (n, 2) array of the coordinates of grid elements."""
+        grid = self._grid
+        if at == 'node':
+            (x, y) = (grid.x_of_node, grid.y_of_node)
+        elif at == 'cell':
+            (x, y) = (grid.x_of_cell, grid.y_of_cell)
+        elif at == 'link':
+            (x, y) = (grid.x_of_link, grid.y_of_link)
+        elif at == 'face':
+            (x, y) = (grid.x_of_face, grid.y_of_face)
+        else:
+            raise ValueError(
+                '{at}: element type not understood'.format(at=at))
+        points = np.empty((len(x), 2), dtype=float)
+        points[:, 0] = x
+        points[:, 1] = y
+        return points
+
+    def tree(self, at='node'):
+        """Get the k-d tree for a type of grid element.
+
+        Parameters
+        ----------
+        at : {'node', 'cell', 'link', 'face'}, optional
+            Grid element whose locations are indexed.
+
+        Returns
+        -------
+        scipy.spatial.cKDTree
+            A k-d tree of element locations.
+
+        Examples
+        --------
+        >>> from landlab import RasterModelGrid
+        >>> grid = RasterModelGrid((3, 4))
+        >>> tree = grid.spatial_index.tree(at='link')
+        >>> tree.n == grid.number_of_links
+        True
+        >>> tree is grid.spatial_index.tree(at='link')
+        True
+        """
+        try:
+            return self._trees[at]
+        except KeyError:
+            self._trees[at] = cKDTree(self._coords_at(at))
+            return self._trees[at]
+
+    def reset(self):
+        """Discard all trees, for instance after coordinates change."""
+        self._trees.clear()
+        self._triangulation = None
+
+    def nearest(self, coords, at='node', k=1):
+        """Find the elements nearest to points.
+
+        Parameters
+        ----------
+        coords : tuple of float or tuple of array_like
+            Coordinates of points as (x, y).
+        at : {'node', 'cell', 'link', 'face'}, optional
+            Grid element to search for.
+        k : int, optional
+            Number of nearest elements to find.
+
+        Returns
+        -------
+        (distances, ids) : tuple
+            Distances to, and IDs of, the nearest elements. If *k* is
+            greater than one, the last dimension is of length *k* and is
+            ordered by increasing distance.
+
+        Examples
+        --------
+        >>> from landlab import RasterModelGrid
+        >>> grid = RasterModelGrid((3, 4))
+        >>> grid.spatial_index.nearest((1.2, 0.9))[1]
+        5
+        >>> grid.spatial_index.nearest((1.2, 0.9), at='cell')[1]
+        0
+        >>> grid.spatial_index.nearest(([1.2, 2.6], [0.9, 0.]))[1]
+        array([5, 3])
+        >>> grid.spatial_index.nearest((1.1, 1.), k=2)[1]
+        array([5, 6])
+        """
+        (points, is_scalar) = _coords_as_points(coords)
+        (dist, ids) = self.tree(at=at).query(points, k=k)
+        if is_scalar:
+            return dist[0], ids[0]
+        else:
+            return dist, ids
+
+    def within_radius(self, coords, radius, at='node'):
+        """Find the elements within a distance of points.
+
+        Parameters
+        ----------
+        coords : tuple of float or tuple of array_like
+            Coordinates of points as (x, y).
+        radius : float
+            Search radius.
+        at : {'node', 'cell', 'link', 'face'}, optional
+            Grid element to search for.
+
+        Returns
+        -------
+        ndarray of int or list of ndarray of int
+            Sorted IDs of the elements within *radius* of each point.
+
+        Examples
+        --------
+        >>> from landlab import RasterModelGrid
+        >>> grid = RasterModelGrid((4, 5))
+        >>> grid.spatial_index.within_radius((2., 1.), 1.)
+        array([ 2,  6,  7,  8, 12])
+        >>> grid.spatial_index.within_radius(([0., 4.], [0., 3.]), .5)
+        [array([0]), array([19])]
+        """
+        (points, is_scalar) = _coords_as_points(coords)
+        found = self.tree(at=at).query_ball_point(points, radius)
+        found = [np.array(sorted(ids), dtype=int) for ids in found]
+        if is_scalar:
+            return found[0]
+        else:
+            return found
+
+    def containing_cell(self, coords):
+        """Find the cells that contain points.
+
+        The cells of a grid are the Voronoi regions of their nodes, so a
+        point lies within the cell of the node nearest to it. Points whose
+        nearest node has no cell are not within any cell.
+
+        Parameters
+        ----------
+        coords : tuple of float or tuple of array_like
+            Coordinates of points as (x, y).
+
+        Returns
+        -------
+        int or ndarray of int
+            IDs of containing cells, or ``BAD_INDEX_VALUE`` for points that
+            are not inside a cell.
+
+        Examples
+        --------
+        >>> from landlab import RasterModelGrid
+        >>> grid = RasterModelGrid((4, 5))
+        >>> grid.spatial_index.containing_cell(([1.2, 3.4, 0.2], [2.1, 1., 1.]))
+        array([ 3,  2, -1])
+        """
+        (_, nodes) = self.nearest(coords, at='node')
+        return self._grid.cell_at_node[nodes]
+
+    def is_within_hull(self, coords):
+        """Test if points lie within the area covered by the grid's nodes.
+
+        Parameters
+        ----------
+        coords : tuple of float or tuple of array_like
+            Coordinates of points as (x, y).
+
+        Returns
+        -------
+        bool or ndarray of bool
+            ``True`` for points within the convex hull of the nodes.
+
+        Examples
+        --------
+        >>> from landlab import HexModelGrid
+        >>> grid = HexModelGrid(3, 3)
+        >>> grid.spatial_index.is_within_hull(([1., 1., -1.], [.5, 5., .5]))
+        array([ True, False, False], dtype=bool)
+        """
+        if self._triangulation is None:
+            self._triangulation = Delaunay(self._coords_at('node'))
+        (points, is_scalar) = _coords_as_points(coords)
+        is_within = self._triangulation.find_simplex(points) != -1
+        if is_scalar:
+            return bool(is_within[0])
+        else:
+            return is_within
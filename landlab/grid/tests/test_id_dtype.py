@@ -0,0 +1,76 @@
+import numpy as np
+from numpy.testing import assert_array_equal
+from nose.tools import assert_equal, assert_less, assert_raises
+
+from landlab import RasterModelGrid, HexModelGrid, VoronoiDelaunayGrid
+
+
+_CONNECTIVITY = ('node_at_link_tail', 'node_at_link_head', 'links_at_node',
+                 'active_links', 'core_nodes', 'patches_at_node',
+                 'nodes_at_patch', 'links_at_patch', 'node_at_cell')
+
+
+def _random_voronoi_grid(**kwds):
+    np.random.seed(1973)
+    return VoronoiDelaunayGrid(np.random.rand(50) * 10.,
+                               np.random.rand(50) * 10., **kwds)
+
+
+def _grids(**kwds):
+    return (RasterModelGrid((5, 6), **kwds), HexModelGrid(5, 6, **kwds),
+            _random_voronoi_grid(**kwds))
+
+
+def test_default_id_dtype():
+    """Ids are platform integers by default."""
+    for grid in _grids():
+        assert_equal(grid.id_dtype, np.int_)
+        for name in _CONNECTIVITY:
+            assert_equal(getattr(grid, name).dtype, np.int_)
+
+
+def test_32_bit_ids_match_default():
+    """Grids with 32-bit ids have the same connectivity."""
+    for grid, grid32 in zip(_grids(), _grids(id_dtype=np.int32)):
+        assert_equal(grid32.id_dtype, np.int32)
+        for name in _CONNECTIVITY:
+            ids = getattr(grid32, name)
+            assert_equal(ids.dtype, np.int32)
+            assert_array_equal(ids, getattr(grid, name))
+
+
+def test_32_bit_ids_after_boundary_change():
+    """Resetting boundary conditions keeps the id type."""
+    grid = RasterModelGrid((5, 6), id_dtype=np.int32)
+    grid.set_closed_boundaries_at_grid_edges(True, False, True, False)
+    assert_equal(grid.active_links.dtype, np.int32)
+    assert_equal(grid.core_nodes.dtype, np.int32)
+    assert_array_equal(grid.active_links,
+                       np.where(grid.status_at_link == 0)[0])
+
+
+def test_32_bit_ids_memory_footprint():
+    """Connectivity of grids with 32-bit ids uses less memory."""
+    grid, grid32 = (RasterModelGrid((20, 30), id_dtype=dtype)
+                    for dtype in (np.int64, np.int32))
+    for grid_ in (grid, grid32):
+        grid_.links_at_node, grid_.patches_at_link
+    assert_less(sum(grid32.memory_footprint().values()),
+                sum(grid.memory_footprint().values()))
+    assert_equal(grid32.memory_footprint()['links_at_node'] * 2,
+                 grid.memory_footprint()['links_at_node'])
+
+
+def test_id_dtype_too_small():
+    """Id types must hold all of a grid's ids."""
+    assert_raises(ValueError, RasterModelGrid, (200, 200), id_dtype=np.int16)
+    assert_raises(ValueError, HexModelGrid, 200, 200, id_dtype=np.int16)
+
+
+def test_other_attributes_keep_their_type():
+    """Only id arrays are stored as the grid's id type."""
+    grid = RasterModelGrid((4, 5), id_dtype=np.int32)
+    grid.my_counts = np.array([2 ** 40, 3])
+    assert_equal(grid.my_counts.dtype, np.int64)
+    assert_array_equal(grid.my_counts, [2 ** 40, 3])
+    assert_equal(grid.status_at_link.dtype, np.int_)
@@ -0,0 +1,99 @@
+import numpy as np
+from numpy.testing import assert_array_almost_equal
+from nose.tools import assert_raises
+try:
+    from nose.tools import assert_is
+except ImportError:
+    from landlab.testing.tools import assert_is
+
+from landlab import RasterModelGrid, HexModelGrid, CLOSED_BOUNDARY
+
+
+def test_plane_is_exact_at_perimeter():
+    """Planar surfaces have the same slope at every node."""
+    grid = RasterModelGrid((4, 5), spacing=(2., 3.))
+    z = 0.5 * grid.node_x - 0.25 * grid.node_y
+    for method in ('Horn', 'Zevenbergen-Thorne'):
+        (slope, aspect, _) = grid.calc_slope_aspect_hillshade_at_node(
+            elevs=z, method=method)
+        assert_array_almost_equal(slope, np.arctan(np.hypot(0.5, 0.25)))
+        assert_array_almost_equal(aspect,
+                                  3. * np.pi / 2. - np.arctan2(-.25, .5))
+
+
+def test_matches_calc_hillshade():
+    """Hillshade matches that from slope and aspect."""
+    grid = RasterModelGrid((5, 6))
+    np.random.seed(42)
+    z = grid.add_field('node', 'topographic__elevation',
+                       np.random.rand(grid.number_of_nodes))
+    (slope, aspect, shade) = grid.calc_slope_aspect_hillshade_at_node(
+        alt=30., az=100.)
+    assert_array_almost_equal(
+        shade, grid.calc_hillshade_at_node(slp=slope, asp=aspect,
+                                           alt=np.radians(30.),
+                                           az=np.radians(100.),
+                                           unit='radians'))
+    assert_array_almost_equal(
+        shade, grid.calc_hillshade_at_node(elevs=z, alt=30., az=100.))
+
+
+def test_out_keyword():
+    """Results are written into buffers."""
+    grid = RasterModelGrid((4, 5))
+    out = (grid.empty(at='node'), grid.empty(at='node'),
+           grid.empty(at='node'))
+    rtn = grid.calc_slope_aspect_hillshade_at_node(elevs=grid.node_x,
+                                                   out=out)
+    for (buff, result) in zip(out, rtn):
+        assert_is(buff, result)
+    assert_array_almost_equal(out[0], np.pi / 4.)
+
+
+def test_closed_nodes_are_ignored():
+    """Closed neighbors do not contribute to the gradient."""
+    grid = RasterModelGrid((4, 5))
+    z = grid.node_x.copy()
+    z[7] = 1000.
+    grid.status_at_node[7] = CLOSED_BOUNDARY
+    (slope, _, _) = grid.calc_slope_aspect_hillshade_at_node(elevs=z)
+    assert_array_almost_equal(slope[12], np.pi / 4.)
+    (slope, _, _) = grid.calc_slope_aspect_hillshade_at_node(
+        elevs=z, ignore_closed_nodes=False)
+    assert slope[12] > np.pi / 4.
+
+
+def test_bad_method():
+    grid = RasterModelGrid((4, 5))
+    assert_raises(ValueError, grid.calc_slope_aspect_hillshade_at_node,
+                  elevs=grid.node_x, method='bad')
+
+
+def test_hex_matches_slope_and_aspect():
+    """Fused patch kernel matches the separate slope and aspect methods."""
+    grid = HexModelGrid(5, 6)
+    np.random.seed(42)
+    z = np.random.rand(grid.number_of_nodes)
+    (slope, aspect, shade) = grid.calc_slope_aspect_hillshade_at_node(
+        elevs=z)
+    assert_array_almost_equal(slope, grid.calc_slope_at_node(z))
+    assert_array_almost_equal(
+        aspect, grid.calc_aspect_at_node(elevs=z, unit='radians'))
+    assert_array_almost_equal(shade, grid.calc_hillshade_at_node(elevs=z))
+
+
+def test_closed_nodes_can_change_between_calls():
+    """Reused workspace follows changes to the closed nodes."""
+    grid = RasterModelGrid((4, 5))
+    z = grid.node_x.copy()
+    z[7] = 1000.
+    (expected, _, _) = grid.calc_slope_aspect_hillshade_at_node(elevs=z)
+    expected = expected.copy()
+
+    grid.status_at_node[7] = CLOSED_BOUNDARY
+    (slope, _, _) = grid.calc_slope_aspect_hillshade_at_node(elevs=z)
+    assert_array_almost_equal(slope[12], np.pi / 4.)
+
+    grid.status_at_node[7] = 0
+    (slope, _, _) = grid.calc_slope_aspect_hillshade_at_node(elevs=z)
+    assert_array_almost_equal(slope, expected)
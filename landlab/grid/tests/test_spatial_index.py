@@ -0,0 +1,64 @@
+import numpy as np
+from numpy.testing import assert_array_equal, assert_array_almost_equal
+from nose.tools import assert_equal, assert_raises, assert_is_not
+
+from landlab import VoronoiDelaunayGrid, RasterModelGrid, BAD_INDEX_VALUE
+
+
+def _random_voronoi_grid(n_nodes=200):
+    np.random.seed(1973)
+    return VoronoiDelaunayGrid(np.random.rand(n_nodes) * 10.,
+                               np.random.rand(n_nodes) * 10.)
+
+
+def test_nearest_matches_brute_force():
+    """Nearest nodes are those of least distance."""
+    grid = _random_voronoi_grid()
+    np.random.seed(42)
+    (x, y) = (np.random.rand(50) * 10., np.random.rand(50) * 10.)
+    (dist, nodes) = grid.spatial_index.nearest((x, y))
+
+    expected = [np.argmin(grid.calc_distances_of_nodes_to_point(point))
+                for point in zip(x, y)]
+    assert_array_equal(nodes, expected)
+    assert_array_equal(nodes, grid.find_nearest_node((x, y)))
+    assert_array_almost_equal(dist, np.hypot(grid.node_x[nodes] - x,
+                                             grid.node_y[nodes] - y))
+
+
+def test_within_radius_matches_brute_force():
+    """Radius queries find all nodes within the radius."""
+    grid = _random_voronoi_grid()
+    found = grid.spatial_index.within_radius((5., 5.), 2.)
+    dist = grid.calc_distances_of_nodes_to_point((5., 5.))
+    assert_array_equal(found, np.where(dist <= 2.)[0])
+
+
+def test_nearest_link_and_cell():
+    """Trees are available for links and cells."""
+    grid = RasterModelGrid((4, 5))
+    assert_equal(grid.spatial_index.nearest((0.5, 0.1), at='link')[1], 0)
+    assert_equal(grid.spatial_index.nearest((2.1, 1.1), at='cell')[1], 1)
+    assert_raises(ValueError, grid.spatial_index.nearest, (0., 0.),
+                  at='patch')
+
+
+def test_containing_cell():
+    """Points are in the cells of their nearest nodes."""
+    grid = _random_voronoi_grid()
+    np.random.seed(42)
+    (x, y) = (np.random.rand(50) * 10., np.random.rand(50) * 10.)
+    cells = grid.spatial_index.containing_cell((x, y))
+    nodes = grid.find_nearest_node((x, y))
+    has_cell = grid.cell_at_node[nodes] != BAD_INDEX_VALUE
+    assert_array_equal(grid.node_at_cell[cells[has_cell]], nodes[has_cell])
+    assert np.all(cells[~ has_cell] == BAD_INDEX_VALUE)
+
+
+def test_index_is_reset_by_move_origin():
+    """Moving the grid discards the old index."""
+    grid = RasterModelGrid((4, 5))
+    index = grid.spatial_index
+    grid.move_origin((10., 10.))
+    assert_is_not(grid.spatial_index, index)
+    assert_equal(grid.find_nearest_node((10.1, 10.2)), 0)
@@ -0,0 +1,95 @@
+import numpy as np
+from numpy.testing import assert_array_equal, assert_array_almost_equal
+
+from landlab import VoronoiDelaunayGrid, HexModelGrid, BAD_INDEX_VALUE
+from landlab.grid.voronoi import simple_poly_area
+
+
+def _random_voronoi_grid(n_nodes=300):
+    np.random.seed(1973)
+    return VoronoiDelaunayGrid(np.random.rand(n_nodes) * 10.,
+                               np.random.rand(n_nodes) * 10.)
+
+
+def test_cell_areas_match_polygon_areas():
+    """Cell areas are the areas of the nodes' Voronoi regions."""
+    grid = _random_voronoi_grid()
+    vor = grid.vor
+    expected = []
+    for node in grid.node_at_cell:
+        region = vor.regions[vor.point_region[node]]
+        expected.append(simple_poly_area(vor.vertices[region, 0],
+                                         vor.vertices[region, 1]))
+    assert_array_almost_equal(grid.area_of_cell, expected, decimal=12)
+
+
+def test_hex_cell_areas():
+    """Cells of a hex grid are regular hexagons."""
+    grid = HexModelGrid(6, 7, dx=2.)
+    assert_array_almost_equal(grid.area_of_cell, 2. * np.sqrt(3.))
+
+
+def test_links_at_patch_join_patch_nodes():
+    """The links of each patch join its nodes."""
+    grid = _random_voronoi_grid()
+    links = grid.links_at_patch
+    assert np.all(links != BAD_INDEX_VALUE)
+    for patch in range(grid.number_of_patches):
+        link_nodes = set(grid.node_at_link_tail[links[patch]]) | set(
+            grid.node_at_link_head[links[patch]])
+        assert link_nodes == set(grid.nodes_at_patch[patch])
+
+
+def test_patches_at_link_are_sorted():
+    """Patches of each link are listed in increasing order."""
+    grid = _random_voronoi_grid()
+    for link in range(grid.number_of_links):
+        patches = grid.patches_at_link[link]
+        patches = patches[patches != BAD_INDEX_VALUE]
+        expected = np.where(np.any(grid.links_at_patch == link, axis=1))[0]
+        assert_array_equal(patches, expected)
+
+
+def test_neighbors_are_other_ends_of_links():
+    """Neighbors of a node are at the far ends of its links."""
+    grid = _random_voronoi_grid()
+    links = grid.links_at_node
+    far_end = np.where(grid.link_dirs_at_node == -1,
+                       grid.node_at_link_head[links],
+                       grid.node_at_link_tail[links])
+    far_end[links == BAD_INDEX_VALUE] = BAD_INDEX_VALUE
+    assert_array_equal(grid.neighbors_at_node, far_end)
+
+
+def _assert_same_as_voronoi(hmg):
+    """A hex grid is the Voronoi grid of its nodes."""
+    vmg = VoronoiDelaunayGrid(hmg.node_x, hmg.node_y)
+
+    assert_array_equal(hmg.node_at_link_tail, vmg.node_at_link_tail)
+    assert_array_equal(hmg.node_at_link_head, vmg.node_at_link_head)
+    assert_array_equal(hmg.status_at_node, vmg.status_at_node)
+    assert_array_equal(hmg.node_at_cell, vmg.node_at_cell)
+    assert_array_almost_equal(hmg.area_of_cell, vmg.area_of_cell, decimal=12)
+    assert_array_almost_equal(hmg.width_of_face, vmg.width_of_face,
+                              decimal=12)
+    assert_array_equal(hmg.patches_at_node.shape, vmg.patches_at_node.shape)
+    assert (set(map(frozenset, hmg.nodes_at_patch)) ==
+            set(map(frozenset, vmg.nodes_at_patch)))
+
+
+def test_hex_grids_match_voronoi_grids():
+    """Hex grids are built without a triangulation."""
+    for orientation in ('horizontal', 'vertical'):
+        for shape in ('hex', 'rect'):
+            for dims in ((3, 2), (5, 4), (6, 5)):
+                _assert_same_as_voronoi(
+                    HexModelGrid(dims[0], dims[1], 1., orientation=orientation,
+                                 shape=shape))
+
+
+def test_large_hex_grid_patches():
+    """Patches of large hex grids don't include slivers along the edges."""
+    grid = HexModelGrid(9, 12, orientation='vertical')
+    assert grid.number_of_patches == 247
+    assert grid.patches_at_node.shape == (144, 6)
+    assert_array_almost_equal(grid.area_of_cell, .5 * np.sqrt(3.))
@@ -383,7 +383,12 @@ Identifying node subsets
 These methods are useful in identifying subsets of nodes, e.g., closest node
 to a point; nodes at edges.
 
-(None are available for this grid type)
+.. autosummary::
+    :toctree: generated/
+
+    ~landlab.grid.voronoi.VoronoiDelaunayGrid.find_nearest_node
+    ~landlab.grid.voronoi.VoronoiDelaunayGrid.is_point_on_grid
+    ~landlab.grid.voronoi.VoronoiDelaunayGrid.spatial_index
 
 Surface analysis
 ----------------
@@ -396,6 +401,7 @@ find in GIS software.
 
     ~landlab.grid.voronoi.VoronoiDelaunayGrid.calc_aspect_at_node
     ~landlab.grid.voronoi.VoronoiDelaunayGrid.calc_hillshade_at_node
+    ~landlab.grid.voronoi.VoronoiDelaunayGrid.calc_slope_aspect_hillshade_at_node
     ~landlab.grid.voronoi.VoronoiDelaunayGrid.calc_slope_at_node
 
 Notes
@@ -415,7 +421,6 @@ following code,
 Without this, the new grid class will not have the ``at_*`` attributes.
 """
 import numpy as np
-from six.moves import range
 
 from landlab.grid.base import (ModelGrid, CORE_NODE, BAD_INDEX_VALUE,
                                INACTIVE_LINK)
@@ -473,6 +478,60 @@ def simple_poly_area(x, y):
                     x[-1] * y[0] - x[0] * y[-1])
 
 
+def calc_area_of_voronoi_regions(vor):
+    """Calculate the area of the Voronoi region of each point.
+
+    Each region is a convex polygon that contains its point, so its area is
+    the sum of the areas of the triangles formed by the point and each of
+    the ridges that bound it. The shoelace terms of these triangles are
+    calculated for all ridges at once and summed by point. Regions that are
+    not closed have an area of zero.
+
+    Parameters
+    ----------
+    vor : scipy.spatial.Voronoi
+        A Voronoi diagram.
+
+    Returns
+    -------
+    ndarray of float
+        Area of the region of each of the points of the diagram.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from scipy.spatial import Voronoi
+    >>> from landlab.grid.voronoi import calc_area_of_voronoi_regions
+    >>> x, y = np.meshgrid([0., 1., 2.], [0., 2., 4.])
+    >>> vor = Voronoi(np.vstack((x.flat, y.flat)).T)
+    >>> calc_area_of_voronoi_regions(vor)
+    array([ 0.,  0.,  0.,  0.,  2.,  0.,  0.,  0.,  0.])
+    """
+    ridge_points = np.asarray(vor.ridge_points)
+    ridge_vertices = np.asarray(vor.ridge_vertices)
+    n_points = len(vor.points)
+
+    # A point's region is open if any of its ridges run off to infinity.
+    is_open = np.zeros(n_points, dtype=bool)
+    is_open[ridge_points[np.any(ridge_vertices == -1, axis=1)]] = True
+
+    is_closed_ridge = np.all(ridge_vertices != -1, axis=1)
+    ridge_points = ridge_points[is_closed_ridge]
+    ridge_vertices = ridge_vertices[is_closed_ridge]
+
+    area = np.zeros(n_points, dtype=float)
+    for side in (0, 1):
+        point = vor.points[ridge_points[:, side]]
+        (dx0, dy0) = (vor.vertices[ridge_vertices[:, 0]] - point).T
+        (dx1, dy1) = (vor.vertices[ridge_vertices[:, 1]] - point).T
+        area += np.bincount(ridge_points[:, side],
+                            weights=.5 * np.abs(dx0 * dy1 - dx1 * dy0),
+                            minlength=n_points)
+    area[is_open] = 0.
+
+    return area
+
+
 def calculate_link_lengths(pts, link_from, link_to):
     """Calculates and returns length of links between nodes.
 
@@ -505,6 +564,101 @@ def calculate_link_lengths(pts, link_from, link_to):
     return link_length
 
 
+def _fill_patches_at_element(elements_at_patch, out):
+    """Fill an array with the patches that touch each element.
+
+    Patches of each element are listed in increasing order. Entries of
+    *elements_at_patch* that are negative are ignored.
+
+    Parameters
+    ----------
+    elements_at_patch : ndarray of int, shape (n_patches, n_elements)
+        Elements (nodes or links) of each patch.
+    out : ndarray of int, shape (n_total_elements, max_patches)
+        Patches of each element. Entries past the last patch of an element
+        are left unchanged.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.grid.voronoi import _fill_patches_at_element
+    >>> nodes_at_patch = np.array([[0, 1, 2], [1, 3, 2], [3, 4, 2]])
+    >>> out = np.full((5, 3), -1, dtype=int)
+    >>> _fill_patches_at_element(nodes_at_patch, out)
+    >>> out
+    array([[ 0, -1, -1],
+           [ 0,  1, -1],
+           [ 0,  1,  2],
+           [ 1,  2, -1],
+           [ 2, -1, -1]])
+    """
+    elements = elements_at_patch.reshape((-1, ))
+    patches = np.repeat(np.arange(elements_at_patch.shape[0]),
+                        elements_at_patch.shape[1])
+    is_element = elements >= 0
+    (elements, patches) = (elements[is_element], patches[is_element])
+
+    # A stable sort keeps the patches of each element in increasing order.
+    sorted_by_element = np.argsort(elements, kind='mergesort')
+    elements = elements[sorted_by_element]
+    patches = patches[sorted_by_element]
+
+    patches_per_element = np.bincount(elements, minlength=out.shape[0])
+    first_of_element = np.cumsum(patches_per_element) - patches_per_element
+    out[elements, np.arange(len(elements)) -
+        first_of_element[elements]] = patches
+
+
+def _links_at_patch(nodes_at_patch, node_at_link_tail, node_at_link_head):
+    """Find the links that join the nodes of each triangular patch.
+
+    Links of each patch are listed in increasing order.
+
+    Parameters
+    ----------
+    nodes_at_patch : ndarray of int, shape (n_patches, 3)
+        Nodes of each patch.
+    node_at_link_tail, node_at_link_head : ndarray of int
+        Tail and head nodes of each link.
+
+    Returns
+    -------
+    ndarray of int, shape (n_patches, 3)
+        Links of each patch, or ``BAD_INDEX_VALUE`` where two nodes of a
+        patch are not joined by a link.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.grid.voronoi import _links_at_patch
+    >>> nodes_at_patch = np.array([[0, 1, 2], [1, 3, 2]])
+    >>> _links_at_patch(nodes_at_patch, np.array([0, 0, 1, 1, 2]),
+    ...                 np.array([1, 2, 2, 3, 3]))
+    array([[0, 1, 2],
+           [2, 3, 4]])
+    """
+    n_nodes = max(nodes_at_patch.max(), node_at_link_tail.max(),
+                  node_at_link_head.max()) + 1
+
+    # Identify each pair of nodes by a single key that doesn't depend on the
+    # order of the nodes and look up the link with the same key.
+    link_key = (np.minimum(node_at_link_tail, node_at_link_head) * n_nodes +
+                np.maximum(node_at_link_tail, node_at_link_head))
+    sorted_links = np.argsort(link_key)
+    link_key = link_key[sorted_links]
+
+    nodes = nodes_at_patch
+    next_nodes = np.roll(nodes_at_patch, -1, axis=1)
+    patch_key = (np.minimum(nodes, next_nodes) * n_nodes +
+                 np.maximum(nodes, next_nodes))
+
+    index = np.searchsorted(link_key, patch_key).clip(max=len(link_key) - 1)
+    links_at_patch = np.where(link_key[index] == patch_key,
+                              sorted_links[index], BAD_INDEX_VALUE)
+
+    return as_id_array(np.sort(links_at_patch, axis=1))
+
+
 class VoronoiDelaunayGrid(ModelGrid):
     """
     This inherited class implements an unstructured grid in which cells are
@@ -639,12 +793,8 @@ class VoronoiDelaunayGrid(ModelGrid):
         # each active cell.
         vor = Voronoi(self.pts)
         self.vor = vor
-        self._area_of_cell = np.zeros(self.number_of_cells)
-        for node in self._node_at_cell:
-            xv = vor.vertices[vor.regions[vor.point_region[node]], 0]
-            yv = vor.vertices[vor.regions[vor.point_region[node]], 1]
-            self._area_of_cell[self.cell_at_node[node]] = (
-                simple_poly_area(xv, yv))
+        self._area_of_cell = calc_area_of_voronoi_regions(
+            vor)[self._node_at_cell]
 
         # LINKS: Construct Delaunay triangulation and construct lists of link
         # "from" and "to" nodes.
@@ -653,6 +803,11 @@ class VoronoiDelaunayGrid(ModelGrid):
          _,
          self._face_width) = \
             self._create_links_and_faces_from_voronoi_diagram(vor)
+        self._setup_links(reorient_links)
+
+    def _setup_links(self, reorient_links=True):
+        """Set up links, and their connectivity, from their tails and heads.
+        """
         self._status_at_link = np.full(len(self._node_at_link_tail),
                                        INACTIVE_LINK, dtype=int)
 
@@ -898,16 +1053,11 @@ class VoronoiDelaunayGrid(ModelGrid):
         assert ncells == np.count_nonzero(node_status == CORE_NODE), \
             'ncells must equal number of CORE_NODE values in node_status'
 
-        cell = 0
-        node_cell = np.ones(len(node_status), dtype=int) * BAD_INDEX_VALUE
-        cell_node = np.zeros(ncells, dtype=int)
-        for node in range(len(node_cell)):
-            if node_status[node] == CORE_NODE:
-                node_cell[node] = cell
-                cell_node[cell] = node
-                cell += 1
+        (cell_node, ) = np.where(node_status == CORE_NODE)
+        node_cell = np.full(len(node_status), BAD_INDEX_VALUE, dtype=int)
+        node_cell[cell_node] = np.arange(ncells)
 
-        return node_cell, cell_node
+        return node_cell, as_id_array(cell_node)
 
     @staticmethod
     def _create_links_from_triangulation(tri):
@@ -944,40 +1094,19 @@ class VoronoiDelaunayGrid(ModelGrid):
         # sharing an edge).
         num_shared_links = np.count_nonzero(tri.neighbors > -1)
         num_links = 3 * tri.nsimplex - num_shared_links // 2
-        link_fromnode = np.zeros(num_links, dtype=int)
-        link_tonode = np.zeros(num_links, dtype=int)
 
-        # Sweep through the list of triangles, assigning "from" and "to" nodes
-        # to the list of links.
-        #
-        # The basic algorithm works as follows. For each triangle, we will add
-        # its 3 edges as links. However, we have to make sure that each shared
-        # edge is added only once. To do this, we keep track of whether or not
-        # each triangle has been processed yet using a boolean array called
-        # "tridone". When we look at a given triangle, we check each vertex in
-        # turn. If there is no neighboring triangle opposite that vertex, then
-        # we need to add the corresponding edge. If there is a neighboring
-        # triangle but we haven't processed it yet, we also need to add the
-        # edge. If neither condition is true, then this edge has already been
-        # added, so we skip it.
-        link_id = 0
-        tridone = np.zeros(tri.nsimplex, dtype=bool)
-        for t in range(tri.nsimplex):  # loop over triangles
-            for i in range(0, 3):       # loop over vertices & neighbors
-                if tri.neighbors[t, i] == -1 or not tridone[
-                        tri.neighbors[t, i]]:
-                    link_fromnode[link_id] = tri.simplices[
-                        t, np.mod(i + 1, 3)]
-                    link_tonode[link_id] = tri.simplices[
-                        t, np.mod(i + 2, 3)]
-                    link_id += 1
-            tridone[t] = True
-
-        # save the results
-        # self.node_at_link_tail = link_fromnode
-        # self.node_at_link_head = link_tonode
+        # Each triangle adds the edges opposite each of its vertices as links.
+        # To add shared edges only once, an edge is added by a triangle only
+        # if there is no neighboring triangle opposite the vertex, or if the
+        # neighbor comes later in the list of triangles (the edge would
+        # otherwise have already been added when the neighbor was processed).
+        # Links are ordered by triangle and then by vertex.
+        neighbors = tri.neighbors
+        is_new_edge = (neighbors == -1) | (
+            neighbors > np.arange(tri.nsimplex).reshape((-1, 1)))
+        link_fromnode = np.roll(tri.simplices, -1, axis=1)[is_new_edge]
+        link_tonode = np.roll(tri.simplices, -2, axis=1)[is_new_edge]
 
-        # Return the results
         return link_fromnode, link_tonode, num_links
 
     @staticmethod
@@ -989,6 +1118,20 @@ class VoronoiDelaunayGrid(ModelGrid):
                 np.amax(np.abs(vor.vertices[
                     vor.ridge_vertices[n]])) < SUSPICIOUSLY_BIG)
 
+    @staticmethod
+    def _is_valid_voronoi_ridges(vertices, ridge_vertices):
+        """Find the ridges of a Voronoi diagram that are faces.
+
+        This is :meth:`_is_valid_voronoi_ridge` for all ridges at once.
+        Ridges that run off to infinity, or that have a vertex at an
+        unreasonable distance, are not valid faces.
+        """
+        SUSPICIOUSLY_BIG = 40000000.0
+        is_finite = np.all(ridge_vertices != -1, axis=1)
+        is_small = np.amax(np.abs(vertices[ridge_vertices]),
+                           axis=(1, 2)) < SUSPICIOUSLY_BIG
+        return is_finite & is_small
+
     @staticmethod
     def _create_links_and_faces_from_voronoi_diagram(vor):
         """
@@ -1035,55 +1178,26 @@ class VoronoiDelaunayGrid(ModelGrid):
         # Each Voronoi "ridge" corresponds to a link. The Voronoi object has an
         # attribute ridge_points that contains the IDs of the nodes on either
         # side (including ridges that have one of their endpoints undefined).
-        # So, we set the number of links equal to the number of ridges.
-        num_links = len(vor.ridge_points)
+        # Links are sorted by the coordinates of their midpoints.
+        ridge_points = np.asarray(vor.ridge_points)
+        link_midpoints = (vor.points[ridge_points[:, 0]] +
+                          vor.points[ridge_points[:, 1]]) / 2.
+        ind = argsort_points_by_x_then_y(link_midpoints)
 
-        # Create the arrays for link from and to nodes
-        link_fromnode = -np.ones(num_links, dtype=int)
-        link_tonode = -np.ones(num_links, dtype=int)
+        link_fromnode = as_id_array(ridge_points[ind, 0])
+        link_tonode = as_id_array(ridge_points[ind, 1])
 
         # Ridges along the perimeter of the grid will have one of their
-        # endpoints undefined. The endpoints of each ridge are contained in
-        # vor.ridge_vertices, and an undefined vertex is flagged with -1.
-        # Ridges with both vertices defined correspond to faces and active
-        # links, while ridges with an undefined vertex correspond to inactive
-        # links. So, to find the number of active links, we subtract from the
-        # total number of links the number of occurrences of an undefined
-        # vertex.
-        num_active_links = num_links \
-            - np.count_nonzero(np.array(vor.ridge_vertices) == -1)
-
-        # Create arrays for active links and width of faces (which are Voronoi
-        # ridges).
-        active_links = -np.ones(num_active_links, dtype=int)
-        face_width = -np.ones(num_active_links)
-
-        # Find the order to sort by link midpoints
-        link_midpoints = np.zeros((num_links, 2))
-        for i in range(num_links):
-            link_midpoints[i][:] = (vor.points[vor.ridge_points[i, 0]] +
-                                    vor.points[vor.ridge_points[i, 1]])/2.
-        ind = argsort_points_by_x_then_y(link_midpoints)
+        # endpoints undefined (flagged with -1 in vor.ridge_vertices). Ridges
+        # with both vertices defined correspond to faces and active links.
+        ridge_vertices = np.asarray(vor.ridge_vertices)[ind]
+        is_face = VoronoiDelaunayGrid._is_valid_voronoi_ridges(
+            vor.vertices, ridge_vertices)
+        (active_links, ) = np.where(is_face)
 
-        # Loop through the list of ridges. For each ridge, there is a link, and
-        # its "from" and "to" nodes are the associated "points". In addition,
-        # if the ridge endpoints are defined, we have a face and an active
-        # link, so we add them to our arrays as well.
-        j = 0
-        for i in range(num_links):
-            link_fromnode[i] = vor.ridge_points[ind[i], 0]
-            link_tonode[i] = vor.ridge_points[ind[i], 1]
-            face_corner1 = vor.ridge_vertices[ind[i]][0]
-            face_corner2 = vor.ridge_vertices[ind[i]][1]
-            # means it's a valid face
-            if VoronoiDelaunayGrid._is_valid_voronoi_ridge(vor, ind[i]):
-                dx = vor.vertices[face_corner2, 0] - \
-                    vor.vertices[face_corner1, 0]
-                dy = vor.vertices[face_corner2, 1] - \
-                    vor.vertices[face_corner1, 1]
-                face_width[j] = np.sqrt(dx * dx + dy * dy)
-                active_links[j] = i
-                j += 1
+        corners = vor.vertices[ridge_vertices[is_face]]
+        (dx, dy) = (corners[:, 1] - corners[:, 0]).T
+        face_width = np.sqrt(dx * dx + dy * dy)
 
         return link_fromnode, link_tonode, active_links, face_width
 
@@ -1152,15 +1266,30 @@ class VoronoiDelaunayGrid(ModelGrid):
         DEJH, 10/3/14, modified May 16.
         """
         from scipy.spatial import Delaunay
-        from landlab.core.utils import anticlockwise_argsort_points_multiline
-        from .cfuncs import find_rows_containing_ID, \
-            create_patches_at_element, create_links_at_patch
         tri = Delaunay(pts)
         assert np.array_equal(tri.points, vor.points)
+
+        # need to build a squared off, masked array of the patches_at_node
+        # the max number of patches for a node in the grid is the max sides of
+        # the side-iest voronoi region.
+        max_dimension = len(max(vor.regions, key=len))
+
+        self._create_patches_from_triangles(tri.simplices, max_dimension)
+
+    def _create_patches_from_triangles(self, nodes_at_patch, max_dimension):
+        """Set up patches, and their connectivity, from triangles of nodes.
+
+        Parameters
+        ----------
+        nodes_at_patch : ndarray of int, shape (n_patches, 3)
+            Nodes of each triangle, in any order.
+        max_dimension : int
+            Number of columns of *patches_at_node*.
+        """
+        from landlab.core.utils import anticlockwise_argsort_points_multiline
         nodata = -1
-        self._nodes_at_patch = as_id_array(tri.simplices)
-        # self._nodes_at_patch = np.empty_like(_nodes_at_patch)
-        self._number_of_patches = tri.simplices.shape[0]
+        self._nodes_at_patch = as_id_array(nodes_at_patch)
+        self._number_of_patches = nodes_at_patch.shape[0]
         # get the patches in order:
         patches_xy = np.empty((self._number_of_patches, 2), dtype=float)
         patches_xy[:, 0] = np.mean(self.node_x[self._nodes_at_patch],
@@ -1169,9 +1298,6 @@ class VoronoiDelaunayGrid(ModelGrid):
                                    axis=1)
         orderforsort = argsort_points_by_x_then_y(patches_xy)
         self._nodes_at_patch = self._nodes_at_patch[orderforsort, :]
-        patches_xy = patches_xy[orderforsort, :]
-        # get the nodes around the patch in order:
-        nodes_xy = np.empty((3, 2), dtype=float)
 
         # perform a CCW sort without a line-by-line loop:
         patch_nodes_x = self.node_x[self._nodes_at_patch]
@@ -1179,36 +1305,27 @@ class VoronoiDelaunayGrid(ModelGrid):
         anticlockwise_argsort_points_multiline(patch_nodes_x, patch_nodes_y,
                                                out=self._nodes_at_patch)
 
-        # need to build a squared off, masked array of the patches_at_node
-        # the max number of patches for a node in the grid is the max sides of
-        # the side-iest voronoi region.
-        max_dimension = len(max(vor.regions, key=len))
-
         self._patches_at_node = np.full(
-            (self.number_of_nodes, max_dimension), nodata, dtype=int)
+            (len(self.node_x), max_dimension), nodata, dtype=int)
 
         self._nodes_at_patch = as_id_array(self._nodes_at_patch)
         self._patches_at_node = as_id_array(self._patches_at_node)
 
-        create_patches_at_element(self._nodes_at_patch,
-                                  self.number_of_nodes,
-                                  self._patches_at_node)
+        _fill_patches_at_element(self._nodes_at_patch, self._patches_at_node)
 
         # build the patch-link connectivity:
-        self._links_at_patch = np.empty((self._number_of_patches, 3),
-                                        dtype=int)
-        create_links_at_patch(self._nodes_at_patch, self._links_at_node,
-                              self._number_of_patches, self._links_at_patch)
+        self._links_at_patch = _links_at_patch(
+            self._nodes_at_patch, self.node_at_link_tail,
+            self.node_at_link_head)
         patch_links_x = self.x_of_link[self._links_at_patch]
         patch_links_y = self.y_of_link[self._links_at_patch]
         anticlockwise_argsort_points_multiline(patch_links_x, patch_links_y,
                                                out=self._links_at_patch)
 
-        self._patches_at_link = np.empty((self.number_of_links, 2),
+        self._patches_at_link = np.empty((len(self.node_at_link_tail), 2),
                                          dtype=int)
         self._patches_at_link.fill(-1)
-        create_patches_at_element(self._links_at_patch, self.number_of_links,
-                                  self._patches_at_link)
+        _fill_patches_at_element(self._links_at_patch, self._patches_at_link)
 # a sort of the links will be performed here once we have corners
 
         self._patches_created = True
@@ -1216,26 +1333,17 @@ class VoronoiDelaunayGrid(ModelGrid):
     def _create_neighbors(self):
         """Create the _neighbors_at_node property.
         """
-        self._neighbors_at_node = self.links_at_node.copy()
-        nodes_at_link = np.empty((self.number_of_links, 2))
-        nodes_at_link[:, 0] = self.node_at_link_tail
-        nodes_at_link[:, 1] = self.node_at_link_head
-        both_nodes = nodes_at_link[self.links_at_node]
-
-        nodes = np.arange(self.number_of_nodes, dtype=int)
-        # ^we have to do this, as for a hex it's possible that mg.nodes is
-        # returned not just in ID order.
-
-        for i in range(both_nodes.shape[1]):
-            centernottail = np.not_equal(both_nodes[:, i, 0], nodes)
-            centernothead = np.not_equal(both_nodes[:, i, 1], nodes)
-            self._neighbors_at_node[centernottail, i] = both_nodes[
-                centernottail, i, 0]
-            self._neighbors_at_node[centernothead, i] = both_nodes[
-                centernothead, i, 1]
+        links_at_node = self.links_at_node
+        tail = self.node_at_link_tail[links_at_node]
+        head = self.node_at_link_head[links_at_node]
+        # ^we compare against node IDs, as for a hex it's possible that
+        # mg.nodes is returned not just in ID order.
+        nodes = np.arange(self.number_of_nodes, dtype=int).reshape((-1, 1))
+
+        self._neighbors_at_node = np.where(tail == nodes, head, tail)
         # restamp the missing links:
         self._neighbors_at_node[
-            self.links_at_node == BAD_INDEX_VALUE] = BAD_INDEX_VALUE
+            links_at_node == BAD_INDEX_VALUE] = BAD_INDEX_VALUE
 
     def save(self, path, clobber=False):
         """Save a grid and fields.
@@ -7,7 +7,8 @@ from nose import SkipTest
 from numpy.testing import assert_array_equal
 
 from landlab import RasterModelGrid
-from landlab.io.netcdf import write_netcdf, NotRasterGridError, WITH_NETCDF4
+from landlab.io.netcdf import (write_netcdf, NetcdfWriter, NotRasterGridError,
+                               WITH_NETCDF4)
 from landlab.io.netcdf.read import _get_raster_spacing
 from landlab.testing.tools import cdtemp
 
@@ -301,3 +302,68 @@ def test_netcdf_write_at_cells():
                      set(['x_bnds', 'y_bnds', 'topographic__elevation',
                           'uplift_rate']))
         root.close()
+
+
+def test_netcdf_writer_time_series():
+    """Test NetcdfWriter appending snapshots at nodes."""
+    if not WITH_NETCDF4:
+        raise SkipTest('netCDF4 package not installed')
+
+    field = RasterModelGrid((4, 3))
+    z = field.add_field('node', 'topographic__elevation', np.arange(12.))
+    field.add_field('node', 'uplift_rate', np.ones(12))
+
+    with cdtemp() as _:
+        writer = NetcdfWriter('test.nc', field, names='topographic__elevation',
+                              flush_every=2)
+        for time in range(5):
+            writer.write(time=time * .5)
+            z += 1.
+        writer.close()
+        assert_raises(ValueError, writer.write)
+
+        root = nc.Dataset('test.nc', 'r', format='NETCDF4')
+        assert_true(root.dimensions['nt'].isunlimited())
+        assert_equal(len(root.dimensions['nt']), 5)
+        assert_true('uplift_rate' not in root.variables)
+        assert_array_equal(root.variables['t'][:].data, [0., .5, 1., 1.5, 2.])
+
+        var = root.variables['topographic__elevation']
+        assert_equal(var.shape, (5, 4, 3))
+        assert_equal(var.chunking(), [1, 4, 3])
+        assert_true(var.filters()['zlib'])
+        assert_true(var.filters()['shuffle'])
+        for time in range(5):
+            assert_array_equal(var[time].data.flat, np.arange(12.) + time)
+        root.close()
+
+
+def test_netcdf_writer_at_cells():
+    """Test NetcdfWriter with cell fields."""
+    if not WITH_NETCDF4:
+        raise SkipTest('netCDF4 package not installed')
+
+    field = RasterModelGrid((4, 3))
+    field.add_field('cell', 'air__temperature', np.arange(2.))
+
+    with cdtemp() as _:
+        with NetcdfWriter('test.nc', field, at='cell', zlib=False) as writer:
+            writer.write()
+            writer.write()
+
+        root = nc.Dataset('test.nc', 'r', format='NETCDF4')
+        var = root.variables['air__temperature']
+        assert_equal(var.shape, (2, 2, 1))
+        assert_true(not var.filters()['zlib'])
+        assert_array_equal(root.variables['t'][:].data, [0., 1.])
+        assert_array_equal(var[1].data.flat,
+                           field.at_cell['air__temperature'])
+        root.close()
+
+
+def test_netcdf_writer_bad_format():
+    """Test NetcdfWriter only writes netcdf4."""
+    field = RasterModelGrid((4, 3))
+    field.add_field('node', 'topographic__elevation', np.arange(12.))
+    assert_raises(ValueError, NetcdfWriter, 'test.nc', field,
+                  format='NETCDF3_64BIT')
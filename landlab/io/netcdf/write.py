@@ -8,6 +8,7 @@ Write netcdf
     :toctree: generated/
 
     ~landlab.io.netcdf.write.write_netcdf
+    ~landlab.io.netcdf.write.NetcdfWriter
 """
 
 
@@ -579,3 +580,189 @@ def write_netcdf(path, fields, attrs=None, append=False,
         _set_netcdf_cell_variables(root, fields, names=names)
 
     root.close()
+
+
+class NetcdfWriter(object):
+
+    """Write a time series of landlab fields to a netcdf file.
+
+    Unlike :func:`write_netcdf`, which opens and closes the file each time
+    it is called, a writer keeps the file open. The grid, its dimensions
+    (including an unlimited time dimension, ``nt``) and a variable for each
+    field are set up once, when the writer is created. Each call to
+    :meth:`write` then adds a snapshot of the fields at a new time. Field
+    variables are chunked by time step and, by default, compressed with
+    zlib and the shuffle filter.
+
+    Parameters
+    ----------
+    path : str
+        Path to output file. An existing file is clobbered.
+    fields : field-like
+        Landlab field object that holds a grid and associated values.
+    names : iterable of str, optional
+        Names of the fields to write. If not provided, write all fields.
+    at : {'node', 'cell'}, optional
+        The location where values are defined.
+    attrs : dict, optional
+        Attributes to add to netcdf file.
+    format : {'NETCDF4', 'NETCDF4_CLASSIC'}, optional
+        Format of output netcdf file.
+    zlib : bool, optional
+        Compress field variables with zlib.
+    complevel : int, optional
+        Level of zlib compression (1 to 9).
+    shuffle : bool, optional
+        Apply the HDF5 shuffle filter before compressing.
+    flush_every : int, optional
+        Flush to disk after this number of calls to :meth:`write`. The file
+        is always flushed when it is closed.
+    time_units : str, optional
+        Units of time.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab import RasterModelGrid
+    >>> from landlab.io.netcdf import NetcdfWriter
+
+    >>> rmg = RasterModelGrid(4, 3)
+    >>> z = rmg.add_field('node', 'topographic__elevation', np.arange(12.))
+
+    >>> import tempfile, os
+    >>> temp_dir = tempfile.mkdtemp()
+    >>> os.chdir(temp_dir)
+
+    >>> with NetcdfWriter('test.nc', rmg, flush_every=10) as writer:
+    ...     for time in range(3):
+    ...         z += 1.
+    ...         writer.write(time=10. * time)
+    >>> writer.number_of_times
+    3
+
+    >>> import netCDF4 as nc4
+    >>> root = nc4.Dataset('test.nc', 'r')
+    >>> root.variables['t'][:].data
+    array([  0.,  10.,  20.])
+    >>> root.variables['topographic__elevation'][:, 0, 0].data
+    array([ 1.,  2.,  3.])
+    >>> root.close()
+    """
+
+    def __init__(self, path, fields, names=None, at=None, attrs=None,
+                 format='NETCDF4', zlib=True, complevel=4, shuffle=True,
+                 flush_every=1, time_units='days'):
+        if format not in ('NETCDF4', 'NETCDF4_CLASSIC'):
+            raise ValueError('format must be NETCDF4 or NETCDF4_CLASSIC')
+        if at not in (None, 'cell', 'node'):
+            raise ValueError('value location not understood')
+        if flush_every < 1:
+            raise ValueError('flush_every must be at least one')
+
+        if isinstance(names, six.string_types):
+            names = (names, )
+
+        at = at or _guess_at_location(fields, names) or 'node'
+        names = tuple(names or fields[at].keys())
+
+        if not set(fields[at].keys()).issuperset(names):
+            raise ValueError(
+                'values must be on either cells or nodes, not both')
+
+        self._fields = fields
+        self._names = names
+        self._at = at
+        self._flush_every = flush_every
+        self._n_times = 0
+        self._n_unflushed = 0
+
+        root = nc4.Dataset(path, 'w', format=format)
+        _set_netcdf_attributes(root, attrs or {})
+
+        if at == 'node':
+            shape = fields.shape
+            _set_netcdf_structured_dimensions(root, shape)
+            _add_spatial_variables(root, fields)
+        else:
+            shape = [dim - 2 for dim in fields.shape]
+            _set_netcdf_cell_structured_dimensions(root, fields.shape)
+            _add_cell_spatial_variables(root, fields)
+        dimensions = ['nt'] + _get_dimension_names(shape)
+
+        self._time_var = root.createVariable('t', 'f8', ('nt', ))
+        self._time_var.units = ' '.join([time_units, 'since',
+                                         '00:00:00 UTC'])
+        self._time_var.long_name = 'time'
+
+        self._vars = {}
+        for name in names:
+            values = fields[at][name]
+            var = root.createVariable(
+                name, _NP_TO_NC_TYPE[str(values.dtype)], dimensions,
+                zlib=zlib, complevel=complevel, shuffle=shuffle,
+                chunksizes=[1] + list(shape))
+            var.units = fields[at].units[name] or '?'
+            var.long_name = name
+            self._vars[name] = var
+        self._shape = tuple(shape)
+
+        self._root = root
+
+    @property
+    def names(self):
+        """Names of the fields being written."""
+        return self._names
+
+    @property
+    def number_of_times(self):
+        """Number of snapshots written."""
+        return self._n_times
+
+    def write(self, time=None, values=None):
+        """Write a snapshot of the fields.
+
+        Parameters
+        ----------
+        time : float, optional
+            Time of the snapshot. If not given, use the number of the
+            snapshot.
+        values : dict, optional
+            Values to write, keyed by field name. If not given, write the
+            current values of the fields.
+        """
+        if self._root is None:
+            raise ValueError('writer is closed')
+
+        if time is None:
+            time = self._n_times
+        self._time_var[self._n_times] = time
+
+        if values is None:
+            values = self._fields[self._at]
+        for name in self._names:
+            self._vars[name][self._n_times] = (
+                values[name].reshape(self._shape))
+
+        self._n_times += 1
+        self._n_unflushed += 1
+        if self._n_unflushed >= self._flush_every:
+            self.flush()
+
+    def flush(self):
+        """Flush buffered snapshots to disk."""
+        if self._root is not None and self._n_unflushed > 0:
+            self._root.sync()
+            self._n_unflushed = 0
+
+    def close(self):
+        """Flush any buffered snapshots and close the file."""
+        if self._root is not None:
+            self._root.close()
+            self._root = None
+            self._n_unflushed = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
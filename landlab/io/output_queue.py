@@ -0,0 +1,197 @@
+#! /usr/bin/env python
+"""Write output on a background thread.
+
+An :class:`OutputQueue` takes snapshots of grid fields and hands them to a
+writer on a separate thread, so that a model can get on with its next time
+step while the last one is being encoded and written to disk. Snapshots are
+copied into a fixed number of buffers that are reused. If the writer falls
+behind and every buffer is waiting to be written, taking another snapshot
+blocks until a buffer is free. Queues that are still open when the
+interpreter exits write what they have queued before it does.
+
+Output queue
+++++++++++++
+
+.. autosummary::
+    :toctree: generated/
+
+    ~landlab.io.output_queue.OutputQueue
+"""
+import atexit
+import threading
+import warnings
+import weakref
+
+import six
+from six.moves import queue
+
+import numpy as np
+
+
+_OPEN_QUEUES = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_queues():
+    """Write the snapshots of queues left open at exit."""
+    for output in list(_OPEN_QUEUES):
+        try:
+            output.close()
+        except Exception as error:
+            warnings.warn('unable to write queued output: {error}'.format(
+                error=error))
+
+
+class OutputQueue(object):
+
+    """Queue snapshots of fields to be written on a worker thread.
+
+    Parameters
+    ----------
+    fields : field-like
+        Landlab field object that holds a grid and associated values.
+    writer : callable
+        Function that writes a snapshot. It is called, on the worker
+        thread, as ``writer(time, values)``, where *values* is a dict of
+        field names and arrays. The arrays are reused once *writer*
+        returns so it must not keep references to them.
+    names : iterable of str, optional
+        Names of the fields to write. If not provided, snapshot all fields
+        at *at*.
+    at : str, optional
+        Grid element where the fields are defined.
+    max_pending : int, optional
+        Number of snapshot buffers. This is the most snapshots that can be
+        waiting to be written before :meth:`put` blocks.
+
+    Notes
+    -----
+    Close a queue, or use it as a context manager, to know that its
+    snapshots have been written. A queue that is left open is closed when
+    the interpreter exits.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab import RasterModelGrid
+    >>> from landlab.io.output_queue import OutputQueue
+    >>> grid = RasterModelGrid((3, 4))
+    >>> z = grid.add_zeros('node', 'topographic__elevation')
+
+    >>> written = []
+    >>> def save_max(time, values):
+    ...     written.append((time, values['topographic__elevation'].max()))
+    >>> with OutputQueue(grid, save_max, max_pending=2) as output:
+    ...     for time in range(4):
+    ...         z += 1.
+    ...         output.put(time)
+    >>> written
+    [(0, 1.0), (1, 2.0), (2, 3.0), (3, 4.0)]
+
+    Snapshots can be written to a :class:`~landlab.io.netcdf.NetcdfWriter`.
+
+    >>> import tempfile, os
+    >>> from landlab.io.netcdf import NetcdfWriter
+    >>> os.chdir(tempfile.mkdtemp())
+    >>> netcdf = NetcdfWriter('test.nc', grid, names='topographic__elevation')
+    >>> output = OutputQueue(grid, netcdf.write,
+    ...                      names=['topographic__elevation'])
+    >>> output.put(10.)
+    >>> output.close()
+    >>> netcdf.close()
+    >>> netcdf.number_of_times
+    1
+    """
+
+    def __init__(self, fields, writer, names=None, at='node', max_pending=2):
+        if max_pending < 1:
+            raise ValueError('max_pending must be at least one')
+        if isinstance(names, six.string_types):
+            names = (names, )
+
+        self._fields = fields
+        self._writer = writer
+        self._names = tuple(names or fields[at].keys())
+        self._at = at
+
+        self._free = queue.Queue()
+        for _ in range(max_pending):
+            self._free.put(dict(
+                (name, np.empty_like(fields[at][name]))
+                for name in self._names))
+        self._pending = queue.Queue()
+        self._error = None
+
+        self._worker = threading.Thread(target=self._write_pending)
+        self._worker.daemon = True
+        self._worker.start()
+        _OPEN_QUEUES.add(self)
+
+    @property
+    def names(self):
+        """Names of the fields in each snapshot."""
+        return self._names
+
+    def _write_pending(self):
+        """Write snapshots until told to stop."""
+        while True:
+            item = self._pending.get()
+            try:
+                if item is None:
+                    return
+                (time, values) = item
+                if self._error is None:
+                    try:
+                        self._writer(time, values)
+                    except Exception as error:
+                        self._error = error
+                self._free.put(values)
+            finally:
+                self._pending.task_done()
+
+    def _raise_writer_error(self):
+        """Raise, in the calling thread, an error from the writer."""
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def put(self, time=None):
+        """Take a snapshot of the fields and queue it to be written.
+
+        If all buffers are waiting to be written, block until the worker
+        frees one.
+
+        Parameters
+        ----------
+        time : float, optional
+            Time of the snapshot, passed on to the writer.
+        """
+        if self._worker is None:
+            raise ValueError('output queue is closed')
+        self._raise_writer_error()
+
+        values = self._free.get()
+        values_at = self._fields[self._at]
+        for name in self._names:
+            np.copyto(values[name], values_at[name])
+        self._pending.put((time, values))
+
+    def join(self):
+        """Block until every queued snapshot has been written."""
+        self._pending.join()
+        self._raise_writer_error()
+
+    def close(self):
+        """Write every queued snapshot and stop the worker thread."""
+        if self._worker is not None:
+            self._pending.put(None)
+            self._worker.join()
+            self._worker = None
+            _OPEN_QUEUES.discard(self)
+        self._raise_writer_error()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
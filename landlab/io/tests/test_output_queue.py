@@ -0,0 +1,116 @@
+#! /usr/bin/env python
+"""Unit tests for landlab.io.output_queue module."""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from nose.tools import assert_equal, assert_raises, assert_true
+from numpy.testing import assert_array_equal
+
+from landlab import RasterModelGrid
+from landlab.io import OutputQueue
+
+
+def test_snapshots_are_copies():
+    """Values written are those at the time of the snapshot."""
+    grid = RasterModelGrid((3, 4))
+    z = grid.add_zeros('node', 'topographic__elevation')
+    grid.add_ones('node', 'uplift_rate')
+
+    written = []
+
+    def writer(time, values):
+        assert_equal(set(values), set(['topographic__elevation']))
+        written.append((time, values['topographic__elevation'].copy()))
+
+    with OutputQueue(grid, writer, names='topographic__elevation',
+                     max_pending=3) as output:
+        for step in range(10):
+            output.put(step)
+            z += 1.
+
+    assert_equal([t for (t, _) in written], list(range(10)))
+    for (step, values) in written:
+        assert_array_equal(values, step)
+
+
+def test_put_blocks_when_full():
+    """Taking a snapshot waits for a free buffer."""
+    grid = RasterModelGrid((3, 4))
+    grid.add_zeros('node', 'topographic__elevation')
+    release = threading.Event()
+
+    def writer(time, values):
+        release.wait()
+
+    output = OutputQueue(grid, writer, max_pending=1)
+    output.put()
+
+    blocked = threading.Thread(target=output.put)
+    blocked.start()
+    time.sleep(.1)
+    assert_true(blocked.is_alive())
+
+    release.set()
+    blocked.join()
+    output.close()
+    assert_raises(ValueError, output.put)
+
+
+def test_writer_errors_are_raised():
+    """Errors on the worker are raised in the caller."""
+    grid = RasterModelGrid((3, 4))
+    grid.add_zeros('node', 'topographic__elevation')
+
+    def writer(time, values):
+        raise RuntimeError('unable to write')
+
+    output = OutputQueue(grid, writer)
+    output.put()
+    assert_raises(RuntimeError, output.join)
+    output.close()
+
+
+_WRITE_WITHOUT_CLOSING = """
+import time
+from landlab import RasterModelGrid
+from landlab.io import OutputQueue
+
+def writer(time_, values):
+    time.sleep(.05)
+    with open('snapshots.txt', 'a') as fp:
+        fp.write('{{0}}\\n'.format(time_))
+
+grid = RasterModelGrid((3, 4))
+grid.add_zeros('node', 'topographic__elevation')
+output = OutputQueue(grid, writer, max_pending={n_snapshots})
+for step in range({n_snapshots}):
+    output.put(step)
+"""
+
+
+def test_snapshots_written_at_exit():
+    """Queued snapshots are written if the interpreter exits first."""
+    n_snapshots = 5
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        [os.path.dirname(os.path.dirname(os.path.dirname(
+            os.path.dirname(os.path.abspath(__file__)))))] +
+        [path for path in (env.get('PYTHONPATH'), ) if path])
+
+    tmpdir = tempfile.mkdtemp()
+    try:
+        subprocess.check_call(
+            [sys.executable, '-c',
+             _WRITE_WITHOUT_CLOSING.format(n_snapshots=n_snapshots)],
+            cwd=tmpdir, env=env)
+        with open(os.path.join(tmpdir, 'snapshots.txt'), 'r') as fp:
+            written = fp.read().split()
+    finally:
+        shutil.rmtree(tmpdir)
+
+    assert_equal(written, [str(step) for step in range(n_snapshots)])
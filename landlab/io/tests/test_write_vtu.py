@@ -0,0 +1,106 @@
+#! /usr/bin/env python
+"""Unit tests for landlab.io.vtk.vtu module."""
+import zlib
+import xml.etree.ElementTree as ET
+
+import numpy as np
+from nose.tools import assert_equal, assert_raises
+from numpy.testing import assert_array_equal
+
+from landlab import RasterModelGrid, HexModelGrid, RadialModelGrid
+from landlab.io.vtk.vtu import write_vtu, VtkTimeSeries
+from landlab.testing.tools import cdtemp
+
+
+_VTK_TO_NUMPY = {'Float64': '<f8', 'Int64': '<i8', 'UInt8': 'u1',
+                 'Int32': '<i4'}
+
+
+def _read_vtu(path):
+    """Read the data arrays of a vtu file, keyed by name."""
+    with open(path, 'rb') as fp:
+        contents = fp.read()
+    (header, data) = contents.split(b'<AppendedData encoding="raw">')
+    data = data[data.index(b'_') + 1:]
+    root = ET.fromstring(header + b'</VTKFile>')
+
+    compressed = 'compressor' in root.attrib
+    arrays = {}
+    for element in root.iter('DataArray'):
+        offset = int(element.get('offset'))
+        if compressed:
+            sizes = np.frombuffer(data, dtype='<u8', count=4, offset=offset)
+            block = zlib.decompress(
+                data[offset + 32:offset + 32 + int(sizes[3])])
+        else:
+            size = np.frombuffer(data, dtype='<u8', count=1, offset=offset)
+            block = data[offset + 8:offset + 8 + int(size[0])]
+        arrays[element.get('Name')] = np.frombuffer(
+            block, dtype=_VTK_TO_NUMPY[element.get('type')])
+    return root, arrays
+
+
+def _check_round_trip(grid, compress):
+    z = grid.add_field('node', 'topographic__elevation',
+                       np.arange(grid.number_of_nodes, dtype=float))
+    grid.add_field('patch', 'patch_id',
+                   np.arange(grid.number_of_patches, dtype=np.int64))
+
+    with cdtemp() as _:
+        write_vtu('grid.vtu', grid, z_coord='topographic__elevation',
+                  compress=compress)
+        (root, arrays) = _read_vtu('grid.vtu')
+
+    piece = root.find('UnstructuredGrid/Piece')
+    assert_equal(int(piece.get('NumberOfPoints')), grid.number_of_nodes)
+    assert_equal(int(piece.get('NumberOfCells')), grid.number_of_patches)
+
+    assert_array_equal(arrays['topographic__elevation'], z)
+    assert_array_equal(arrays['patch_id'], np.arange(grid.number_of_patches))
+
+    points = arrays['Points'].reshape((-1, 3))
+    assert_array_equal(points[:, 0], grid.x_of_node)
+    assert_array_equal(points[:, 1], grid.y_of_node)
+    assert_array_equal(points[:, 2], z)
+
+    n_vertices = grid.nodes_at_patch.shape[1]
+    assert_array_equal(arrays['connectivity'], grid.nodes_at_patch.flat)
+    assert_array_equal(arrays['offsets'],
+                       n_vertices * np.arange(1, grid.number_of_patches + 1))
+    assert_array_equal(arrays['types'], 9 if n_vertices == 4 else 5)
+
+
+def test_round_trip_raster():
+    _check_round_trip(RasterModelGrid((3, 4)), compress=False)
+
+
+def test_round_trip_hex():
+    _check_round_trip(HexModelGrid(3, 4), compress=False)
+
+
+def test_round_trip_radial_compressed():
+    _check_round_trip(RadialModelGrid(2), compress=True)
+
+
+def test_bad_field_name():
+    grid = RasterModelGrid((3, 4))
+    grid.add_zeros('cell', 'air__temperature')
+    assert_raises(ValueError, write_vtu, 'grid.vtu', grid,
+                  names=['air__temperature'])
+
+
+def test_time_series_collection():
+    grid = HexModelGrid(3, 3)
+    grid.add_zeros('node', 'topographic__elevation')
+
+    with cdtemp() as _:
+        series = VtkTimeSeries('run.pvd', grid, compress=True)
+        series.write(.5)
+        series.write(1.5)
+        root = ET.parse('run.pvd').getroot()
+
+    datasets = root.findall('Collection/DataSet')
+    assert_equal([d.get('file') for d in datasets],
+                 ['run_0000.vtu', 'run_0001.vtu'])
+    assert_equal([float(d.get('timestep')) for d in datasets], [.5, 1.5])
+    assert_equal(series.times, [.5, 1.5])
@@ -0,0 +1,4 @@
+from .vtu import write_vtu, VtkTimeSeries
+
+
+__all__ = ['write_vtu', 'VtkTimeSeries']
@@ -0,0 +1,388 @@
+#! /usr/bin/env python
+"""Write grids and their fields as VTK unstructured grids.
+
+Grids are written as VTK XML unstructured grid (``.vtu``) files. Nodes are
+the points of the VTK grid and patches are its cells, so any landlab grid
+with patches can be written: rasters, as quadrilaterals, and hex, radial
+and Voronoi-Delaunay grids, as triangles. Fields defined at nodes are
+written as point data, and fields defined at patches as cell data.
+
+The XML header is written as text and the data follow, in the appended
+section of the file, as raw little-endian binary that is optionally zlib
+compressed. Arrays are written straight from their buffers, without
+building a document tree or converting values to text.
+
+A :class:`VtkTimeSeries` writes a ``.vtu`` file for each of a series of
+times along with a ``.pvd`` collection file that ties them together.
+
+Write VTK
++++++++++
+
+.. autosummary::
+    :toctree: generated/
+
+    ~landlab.io.vtk.vtu.write_vtu
+    ~landlab.io.vtk.vtu.VtkTimeSeries
+"""
+import os
+import zlib
+
+import six
+import numpy as np
+
+from landlab.io.vtk.vtktypes import (NUMPY_TO_VTK_TYPE, EDGE_COUNT_TO_TYPE,
+                                     VtkPolygon)
+
+
+_HEADER_DTYPE = np.dtype('<u8')
+
+
+def _as_little_endian(array):
+    """Get a contiguous, little-endian version of an array.
+
+    Arrays that are already contiguous and little-endian are not copied.
+    Booleans are written as unsigned bytes.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.io.vtk.vtu import _as_little_endian
+    >>> values = np.arange(4.)
+    >>> _as_little_endian(values) is values
+    True
+    >>> _as_little_endian(values.astype('>f8')).dtype.str
+    '<f8'
+    >>> _as_little_endian(np.array([True, False])).dtype
+    dtype('uint8')
+    """
+    array = np.asarray(array)
+    if array.dtype == bool:
+        array = array.astype(np.uint8)
+    return np.ascontiguousarray(array,
+                                dtype=array.dtype.newbyteorder('<'))
+
+
+def _encode_block(array, compress=False):
+    """Encode an array as a block of appended data.
+
+    Parameters
+    ----------
+    array : ndarray
+        Little-endian, contiguous array.
+    compress : bool, optional
+        Compress the data with zlib.
+
+    Returns
+    -------
+    list of bytes-like
+        The header and data of the block.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.io.vtk.vtu import _encode_block
+    >>> (header, data) = _encode_block(np.arange(3, dtype='<i4'))
+    >>> np.frombuffer(header, dtype='<u8')
+    array([12], dtype=uint64)
+    >>> (header, data) = _encode_block(np.arange(3, dtype='<i4'),
+    ...                                compress=True)
+    >>> np.frombuffer(header, dtype='<u8')[:3]
+    array([ 1, 12, 12], dtype=uint64)
+    """
+    data = array.reshape(-1).view(np.uint8)
+    if compress:
+        data = zlib.compress(data)
+        header = np.array([1, array.nbytes, array.nbytes, len(data)],
+                          dtype=_HEADER_DTYPE)
+    else:
+        header = np.array([array.nbytes], dtype=_HEADER_DTYPE)
+    return [header.tobytes(), data]
+
+
+def _vtk_type_name(array):
+    """Get the name of the VTK type of an array."""
+    try:
+        return NUMPY_TO_VTK_TYPE[str(array.dtype.newbyteorder('='))].name
+    except KeyError:
+        raise ValueError(
+            '{dtype}: data type not supported by VTK writer'.format(
+                dtype=array.dtype))
+
+
+def _get_cells(grid):
+    """Get the connectivity, offsets and types of patches as VTK cells.
+
+    Examples
+    --------
+    >>> from landlab import RasterModelGrid
+    >>> from landlab.io.vtk.vtu import _get_cells
+    >>> grid = RasterModelGrid((3, 3))
+    >>> (connectivity, offsets, types) = _get_cells(grid)
+    >>> connectivity[:8]
+    array([4, 3, 0, 1, 5, 4, 1, 2])
+    >>> offsets
+    array([ 4,  8, 12, 16])
+    >>> types
+    array([9, 9, 9, 9], dtype=uint8)
+    """
+    nodes_at_patch = np.asarray(grid.nodes_at_patch)
+    is_node = nodes_at_patch != -1
+
+    n_vertices = is_node.sum(axis=1)
+    connectivity = nodes_at_patch[is_node].astype(np.int64)
+    offsets = np.cumsum(n_vertices).astype(np.int64)
+
+    types = np.full(len(n_vertices), int(VtkPolygon), dtype=np.uint8)
+    for (n_edges, cell_type) in EDGE_COUNT_TO_TYPE.items():
+        types[n_vertices == n_edges] = int(cell_type)
+
+    return connectivity, offsets, types
+
+
+def _get_points(grid, z_coord=None):
+    """Get node coordinates as VTK points."""
+    points = np.zeros((grid.number_of_nodes, 3), dtype=float)
+    points[:, 0] = grid.x_of_node
+    points[:, 1] = grid.y_of_node
+    if z_coord is not None:
+        points[:, 2] = grid.at_node[z_coord]
+    return points
+
+
+def _get_data_arrays(grid, names=None):
+    """Get the fields to write as point and cell data.
+
+    Parameters
+    ----------
+    grid : ModelGrid
+        A landlab grid.
+    names : iterable of str, optional
+        Names of the fields to write. Node fields are looked for first,
+        then patch fields. If not provided, write all node and patch
+        fields.
+
+    Returns
+    -------
+    (point_data, cell_data) : tuple of list
+        Lists of (name, array) for node and patch fields.
+    """
+    if names is None:
+        point_names = list(grid.at_node.keys())
+        cell_names = list(grid.at_patch.keys())
+    else:
+        if isinstance(names, six.string_types):
+            names = [names]
+        point_names = [name for name in names if name in grid.at_node]
+        cell_names = [name for name in names
+                      if name in grid.at_patch and name not in grid.at_node]
+        missing = set(names) - set(point_names) - set(cell_names)
+        if missing:
+            raise ValueError(
+                '{names}: fields must be at nodes or patches'.format(
+                    names=', '.join(sorted(missing))))
+
+    point_data = [(name, _as_little_endian(grid.at_node[name]))
+                  for name in sorted(point_names)]
+    cell_data = [(name, _as_little_endian(grid.at_patch[name]))
+                 for name in sorted(cell_names)]
+    return point_data, cell_data
+
+
+def write_vtu(path, grid, names=None, z_coord=None, compress=False):
+    """Write a grid and its fields as a VTK unstructured grid.
+
+    Parameters
+    ----------
+    path : str
+        Path to output ``.vtu`` file.
+    grid : ModelGrid
+        A landlab grid with patches.
+    names : iterable of str, optional
+        Names of node and patch fields to write. If not provided, write all
+        of them.
+    z_coord : str, optional
+        Name of a node field to use as the vertical coordinate of the
+        points (elevation, for instance). Otherwise points are at zero.
+    compress : bool, optional
+        Compress the data with zlib.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab import HexModelGrid
+    >>> from landlab.io.vtk.vtu import write_vtu
+    >>> grid = HexModelGrid(3, 3)
+    >>> z = grid.add_field('node', 'topographic__elevation',
+    ...                    np.arange(grid.number_of_nodes, dtype=float))
+
+    >>> import tempfile, os
+    >>> os.chdir(tempfile.mkdtemp())
+    >>> write_vtu('hex.vtu', grid, z_coord='topographic__elevation',
+    ...           compress=True)
+    >>> with open('hex.vtu', 'rb') as fp:
+    ...     fp.readline().strip() == b'<?xml version="1.0"?>'
+    True
+    """
+    point_data, cell_data = _get_data_arrays(grid, names=names)
+    (connectivity, offsets, types) = _get_cells(grid)
+    points = _get_points(grid, z_coord=z_coord)
+
+    arrays = []
+    offset = [0]
+
+    def data_array(name, array, n_components=None):
+        blocks = _encode_block(array, compress=compress)
+        arrays.extend(blocks)
+        attrs = 'type="{type}" Name="{name}" format="appended" ' \
+                'offset="{offset}"'.format(type=_vtk_type_name(array),
+                                           name=name, offset=offset[0])
+        if n_components is not None:
+            attrs += ' NumberOfComponents="{n}"'.format(n=n_components)
+        offset[0] += sum(len(block) for block in blocks)
+        return '<DataArray {attrs}/>'.format(attrs=attrs)
+
+    lines = ['<?xml version="1.0"?>']
+    if compress:
+        lines.append('<VTKFile type="UnstructuredGrid" version="1.0" '
+                     'byte_order="LittleEndian" header_type="UInt64" '
+                     'compressor="vtkZLibDataCompressor">')
+    else:
+        lines.append('<VTKFile type="UnstructuredGrid" version="1.0" '
+                     'byte_order="LittleEndian" header_type="UInt64">')
+    lines.append('  <UnstructuredGrid>')
+    lines.append('    <Piece NumberOfPoints="{n_points}" '
+                 'NumberOfCells="{n_cells}">'.format(
+                     n_points=len(points), n_cells=len(types)))
+
+    lines.append('      <PointData>')
+    for (name, array) in point_data:
+        lines.append('        ' + data_array(name, array))
+    lines.append('      </PointData>')
+
+    lines.append('      <CellData>')
+    for (name, array) in cell_data:
+        lines.append('        ' + data_array(name, array))
+    lines.append('      </CellData>')
+
+    lines.append('      <Points>')
+    lines.append('        ' + data_array('Points', points, n_components=3))
+    lines.append('      </Points>')
+
+    lines.append('      <Cells>')
+    lines.append('        ' + data_array('connectivity', connectivity))
+    lines.append('        ' + data_array('offsets', offsets))
+    lines.append('        ' + data_array('types', types))
+    lines.append('      </Cells>')
+
+    lines.append('    </Piece>')
+    lines.append('  </UnstructuredGrid>')
+    lines.append('  <AppendedData encoding="raw">')
+    lines.append('   _')
+
+    with open(path, 'wb') as fp:
+        fp.write('\n'.join(lines).encode('ascii'))
+        for block in arrays:
+            fp.write(block)
+        fp.write(b'\n  </AppendedData>\n</VTKFile>\n')
+
+
+class VtkTimeSeries(object):
+
+    """Write a time series of VTK unstructured grid files.
+
+    Each call to :meth:`write` writes a ``.vtu`` file, numbered in order,
+    and rewrites a ``.pvd`` collection file that lists every file written
+    so far, with its time.
+
+    Parameters
+    ----------
+    path : str
+        Path to the ``.pvd`` collection file. The ``.vtu`` files are written
+        alongside it.
+    grid : ModelGrid
+        A landlab grid with patches.
+    names : iterable of str, optional
+        Names of node and patch fields to write. If not provided, write all
+        of them.
+    z_coord : str, optional
+        Name of a node field to use as the vertical coordinate of the
+        points.
+    compress : bool, optional
+        Compress the data with zlib.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab import RasterModelGrid
+    >>> from landlab.io.vtk.vtu import VtkTimeSeries
+    >>> grid = RasterModelGrid((3, 4))
+    >>> z = grid.add_zeros('node', 'topographic__elevation')
+
+    >>> import tempfile, os
+    >>> os.chdir(tempfile.mkdtemp())
+    >>> series = VtkTimeSeries('run.pvd', grid)
+    >>> for time in range(3):
+    ...     z += 1.
+    ...     series.write(time * 10.)
+    >>> series.files
+    ['run_0000.vtu', 'run_0001.vtu', 'run_0002.vtu']
+    >>> sorted(os.listdir('.'))
+    ['run.pvd', 'run_0000.vtu', 'run_0001.vtu', 'run_0002.vtu']
+    """
+
+    def __init__(self, path, grid, names=None, z_coord=None, compress=False):
+        self._path = path
+        self._grid = grid
+        self._names = names
+        self._z_coord = z_coord
+        self._compress = compress
+        self._times = []
+        self._files = []
+
+    @property
+    def files(self):
+        """Names of the files written so far."""
+        return list(self._files)
+
+    @property
+    def times(self):
+        """Times of the files written so far."""
+        return list(self._times)
+
+    def write(self, time=None):
+        """Write the grid's fields at a new time.
+
+        Parameters
+        ----------
+        time : float, optional
+            Time of the fields. If not given, use the number of the file.
+        """
+        (base, file_name) = os.path.split(self._path)
+        (root, _) = os.path.splitext(file_name)
+        vtu_file = '{root}_{count:04d}.vtu'.format(root=root,
+                                                  count=len(self._files))
+        write_vtu(os.path.join(base, vtu_file), self._grid,
+                  names=self._names, z_coord=self._z_coord,
+                  compress=self._compress)
+
+        if time is None:
+            time = len(self._times)
+        self._times.append(time)
+        self._files.append(vtu_file)
+        self._write_collection()
+
+    def _write_collection(self):
+        """Write the .pvd file that lists each time and file."""
+        lines = ['<?xml version="1.0"?>',
+                 '<VTKFile type="Collection" version="0.1" '
+                 'byte_order="LittleEndian">',
+                 '  <Collection>']
+        for (time, vtu_file) in zip(self._times, self._files):
+            lines.append('    <DataSet timestep="{time!r}" part="0" '
+                         'file="{file}"/>'.format(time=float(time),
+                                                  file=vtu_file))
+        lines.append('  </Collection>')
+        lines.append('</VTKFile>')
+
+        with open(self._path, 'w') as fp:
+            fp.write('\n'.join(lines) + '\n')
@@ -0,0 +1,116 @@
+#! /usr/bin/env python
+"""
+Unit tests for landlab.framework.scheduler
+"""
+from nose.tools import assert_equal, assert_raises, assert_true
+try:
+    from nose.tools import assert_tuple_equal
+except ImportError:
+    from landlab.testing.tools import assert_tuple_equal
+
+from landlab.framework.scheduler import Scheduler
+
+
+class Sample(object):
+
+    """A sample component that records its time steps."""
+
+    _name = 'Sample'
+
+    def __init__(self, uses=(), provides=()):
+        self._input_var_names = uses
+        self._output_var_names = provides
+        self.time_steps = []
+
+    def run_one_step(self, dt, **kwds):
+        self.time_steps.append(dt)
+
+
+def test_independent_components_share_a_level():
+    scheduler = Scheduler()
+    scheduler.add(Sample(uses=('a', ), provides=('b', )), name='first')
+    scheduler.add(Sample(uses=('a', ), provides=('c', )), name='second')
+    scheduler.add(Sample(uses=('b', 'c'), provides=('d', )), name='third')
+
+    assert_tuple_equal(scheduler.dependencies('second'), ())
+    assert_tuple_equal(scheduler.dependencies('third'), ('first', 'second'))
+    assert_tuple_equal(scheduler.levels,
+                       (('first', 'second'), ('third', )))
+
+
+def test_write_after_read_is_ordered():
+    scheduler = Scheduler()
+    scheduler.add(Sample(uses=('a', )), name='reader')
+    scheduler.add(Sample(provides=('a', )), name='writer')
+    scheduler.add(Sample(provides=('a', )), name='another_writer')
+
+    assert_tuple_equal(scheduler.levels,
+                       (('reader', ), ('writer', ), ('another_writer', )))
+
+
+def test_run_with_substeps():
+    components = [Sample(provides=('a', )), Sample(provides=('b', ))]
+    scheduler = Scheduler()
+    scheduler.add(components[0], name='first', substeps=4)
+    scheduler.add(components[1], name='second')
+
+    scheduler.run_one_step(2.)
+    scheduler.run_one_step(2.)
+    scheduler.close()
+
+    assert_equal(components[0].time_steps, [.5] * 8)
+    assert_equal(components[1].time_steps, [2.] * 2)
+    for name in ('first', 'second'):
+        assert_true(scheduler.total_wall_time[name] >=
+                    scheduler.wall_time[name] >= 0.)
+
+
+def test_bad_substeps():
+    scheduler = Scheduler([Sample()])
+    assert_raises(ValueError, scheduler.set_substeps, 'Sample', 0)
+    assert_raises(KeyError, scheduler.set_substeps, 'not_a_component', 1)
+
+
+class NoTimeStep(object):
+
+    """A sample component that takes no time step."""
+
+    _name = 'NoTimeStep'
+
+    def __init__(self):
+        self.calls = 0
+
+    def run_one_step(self):
+        self.calls += 1
+
+
+def test_component_without_time_step():
+    component = NoTimeStep()
+    scheduler = Scheduler([component, Sample()])
+    scheduler.set_substeps('NoTimeStep', 3)
+    scheduler.run_one_step(1.)
+    assert_equal(component.calls, 3)
+
+
+def test_serial_by_default():
+    scheduler = Scheduler()
+    scheduler.add(Sample(provides=('a', )), name='first')
+    scheduler.add(Sample(provides=('b', )), name='second')
+    assert_tuple_equal(scheduler.levels, (('first', 'second'), ))
+
+    scheduler.run_one_step(1.)
+    assert_true(scheduler._pool is None)
+
+
+def test_run_in_threads():
+    components = [Sample(provides=('a', )), Sample(provides=('b', ))]
+    scheduler = Scheduler(n_threads=2)
+    scheduler.add(components[0], name='first', substeps=2)
+    scheduler.add(components[1], name='second')
+    assert_tuple_equal(scheduler.levels, (('first', 'second'), ))
+
+    scheduler.run_one_step(1.)
+    scheduler.close()
+
+    assert_equal(components[0].time_steps, [.5, .5])
+    assert_equal(components[1].time_steps, [1.])
@@ -8,6 +8,7 @@ General Landlab decorators
 
     ~landlab.utils.decorators.use_file_name_or_kwds
     ~landlab.utils.decorators.use_field_name_or_array
+    ~landlab.utils.decorators.memoize_on_fields
     ~landlab.utils.decorators.make_return_array_immutable
     ~landlab.utils.decorators.deprecated
 """
@@ -219,6 +220,96 @@ class use_field_name_or_array(object):
         return _wrapped
 
 
+class memoize_on_fields(object):
+
+    """Decorate a method so that it only runs when its input fields change.
+
+    The decorated method is one of a component (or of anything else with a
+    *grid* attribute), or of a grid. Its result is saved along with the
+    versions of the named fields, the grid's boundary conditions and the
+    arguments it was called with. If, when next called, none of these have
+    changed, the saved result is returned without running the method.
+
+    Field versions only change when a field is set or marked as modified
+    (see :meth:`~landlab.field.ModelDataFields.mark_modified`), so values
+    changed in place must be marked as modified for the method to run
+    again.
+
+    Parameters
+    ----------
+    names : str
+        Names of the input fields.
+    at : str, optional
+        Grid element on which the fields are defined.
+
+    Examples
+    --------
+    >>> from landlab import RasterModelGrid
+    >>> from landlab.utils.decorators import memoize_on_fields
+    >>> class Relief(object):
+    ...     def __init__(self, grid):
+    ...         self.grid = grid
+    ...         self.calls = 0
+    ...     @memoize_on_fields('topographic__elevation')
+    ...     def calc(self):
+    ...         self.calls += 1
+    ...         z = self.grid.at_node['topographic__elevation']
+    ...         return z.max() - z.min()
+    >>> grid = RasterModelGrid((3, 4))
+    >>> z = grid.add_field('node', 'topographic__elevation', np.arange(12.))
+    >>> relief = Relief(grid)
+    >>> relief.calc(), relief.calc()
+    (11.0, 11.0)
+    >>> relief.calls
+    1
+
+    >>> z[0] = -1.
+    >>> grid.mark_modified('node', 'topographic__elevation')
+    >>> relief.calc()
+    12.0
+    >>> relief.calls
+    2
+    """
+
+    def __init__(self, *names, **kwds):
+        self._names = names
+        self._at = kwds.pop('at', 'node')
+        if kwds:
+            raise TypeError('unexpected keyword: {name}'.format(
+                name=sorted(kwds)[0]))
+
+    def _state_of(self, grid):
+        """Versions of the input fields, and the grid's boundary conditions.
+        """
+        versions = []
+        for name in self._names:
+            try:
+                versions.append(grid.field_version(self._at, name))
+            except KeyError:
+                versions.append(None)
+        return (tuple(versions), getattr(grid, 'bc_set_code', None))
+
+    def __call__(self, func):
+        """Wrap the method."""
+        memo_name = '_memo_' + func.__name__
+
+        @wraps(func)
+        def _wrapped(obj, *args, **kwds):
+            grid = getattr(obj, 'grid', obj)
+            key = (self._state_of(grid), args, tuple(sorted(kwds.items())))
+            try:
+                hash(key)
+            except TypeError:
+                return func(obj, *args, **kwds)
+
+            memo = getattr(obj, memo_name, None)
+            if memo is None or memo[0] != key:
+                memo = (key, func(obj, *args, **kwds))
+                setattr(obj, memo_name, memo)
+            return memo[1]
+        return _wrapped
+
+
 def make_return_array_immutable(func):
     """Decorate a function so that its return array is read-only.
 
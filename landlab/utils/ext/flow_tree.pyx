@@ -0,0 +1,270 @@
+import numpy as np
+cimport numpy as np
+cimport cython
+
+
+ctypedef np.int_t INT_t
+ctypedef np.float_t FLOAT_t
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def integrate_downstream(const INT_t [:] upstream_order,
+                         const INT_t [:] receiver,
+                         const FLOAT_t [:] value,
+                         const np.uint8_t [:] is_sink,
+                         FLOAT_t [:] out):
+    """Sum values along flow paths, from each node to its sink.
+
+    Parameters
+    ----------
+    upstream_order : ndarray of int
+        Nodes ordered so that each comes after its receiver.
+    receiver : ndarray of int
+        Receiver of each node.
+    value : ndarray of float
+        Value to add for the step from each node to its receiver.
+    is_sink : ndarray of uint8
+        Nodes at which to stop, in addition to nodes that are their own
+        receivers.
+    out : ndarray of float
+        Sum of values from each node to its sink.
+    """
+    cdef Py_ssize_t n_nodes = upstream_order.shape[0]
+    cdef Py_ssize_t i
+    cdef INT_t node
+    cdef INT_t downstream
+
+    with nogil:
+        for i in range(n_nodes):
+            node = upstream_order[i]
+            downstream = receiver[node]
+            if downstream == node or is_sink[node]:
+                out[node] = 0.
+            else:
+                out[node] = out[downstream] + value[node]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def accumulate_upstream(const INT_t [:] upstream_order,
+                        const INT_t [:, :] receivers,
+                        FLOAT_t [:] out):
+    """Add values at each node to those at its receivers, upstream first.
+
+    Parameters
+    ----------
+    upstream_order : ndarray of int
+        Nodes ordered so that each comes after its receivers.
+    receivers : ndarray of int, shape (n_nodes, n_receivers)
+        Receivers of each node. Negative receivers are ignored.
+    out : ndarray of float
+        Values at each node, which are replaced by their sums over the node
+        and all of the nodes upstream of it.
+    """
+    cdef Py_ssize_t n_nodes = upstream_order.shape[0]
+    cdef Py_ssize_t n_receivers = receivers.shape[1]
+    cdef Py_ssize_t i
+    cdef Py_ssize_t k
+    cdef INT_t node
+    cdef INT_t downstream
+
+    with nogil:
+        for i in range(n_nodes - 1, -1, -1):
+            node = upstream_order[i]
+            for k in range(n_receivers):
+                downstream = receivers[node, k]
+                if downstream >= 0 and downstream != node:
+                    out[downstream] += out[node]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def accumulate_upstream_weighted(const INT_t [:] upstream_order,
+                                 const INT_t [:, :] receivers,
+                                 const FLOAT_t [:, :] proportions,
+                                 FLOAT_t [:] out):
+    """Add values at each node to its receivers, in proportion.
+
+    This is :func:`accumulate_upstream` where each receiver gets only a
+    proportion of the value at each of its donors.
+
+    Parameters
+    ----------
+    upstream_order : ndarray of int
+        Nodes ordered so that each comes after its receivers.
+    receivers : ndarray of int, shape (n_nodes, n_receivers)
+        Receivers of each node. Negative receivers are ignored.
+    proportions : ndarray of float, shape (n_nodes, n_receivers)
+        Proportion of the value at each node that goes to each receiver.
+    out : ndarray of float
+        Values at each node, which are replaced by their accumulations.
+    """
+    cdef Py_ssize_t n_nodes = upstream_order.shape[0]
+    cdef Py_ssize_t n_receivers = receivers.shape[1]
+    cdef Py_ssize_t i
+    cdef Py_ssize_t k
+    cdef INT_t node
+    cdef INT_t downstream
+
+    with nogil:
+        for i in range(n_nodes - 1, -1, -1):
+            node = upstream_order[i]
+            for k in range(n_receivers):
+                downstream = receivers[node, k]
+                if downstream >= 0 and downstream != node:
+                    out[downstream] += out[node] * proportions[node, k]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def reduce_upstream(const INT_t [:] upstream_order,
+                    const INT_t [:, :] receivers, int use_max,
+                    FLOAT_t [:] out):
+    """Find the largest, or smallest, value upstream of each node.
+
+    Parameters
+    ----------
+    upstream_order : ndarray of int
+        Nodes ordered so that each comes after its receivers.
+    receivers : ndarray of int, shape (n_nodes, n_receivers)
+        Receivers of each node. Negative receivers are ignored.
+    use_max : int
+        Find largest values if non-zero, otherwise smallest values.
+    out : ndarray of float
+        Values at each node, which are replaced by the largest (or
+        smallest) of the values at the node and all nodes upstream of it.
+    """
+    cdef Py_ssize_t n_nodes = upstream_order.shape[0]
+    cdef Py_ssize_t n_receivers = receivers.shape[1]
+    cdef Py_ssize_t i
+    cdef Py_ssize_t k
+    cdef INT_t node
+    cdef INT_t downstream
+
+    with nogil:
+        for i in range(n_nodes - 1, -1, -1):
+            node = upstream_order[i]
+            for k in range(n_receivers):
+                downstream = receivers[node, k]
+                if downstream < 0 or downstream == node:
+                    continue
+                if use_max:
+                    if out[node] > out[downstream]:
+                        out[downstream] = out[node]
+                elif out[node] < out[downstream]:
+                    out[downstream] = out[node]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def reduce_downstream(const INT_t [:] upstream_order,
+                      const INT_t [:, :] receivers, int use_max,
+                      FLOAT_t [:] out):
+    """Find the largest, or smallest, value downstream of each node.
+
+    Parameters
+    ----------
+    upstream_order : ndarray of int
+        Nodes ordered so that each comes after its receivers.
+    receivers : ndarray of int, shape (n_nodes, n_receivers)
+        Receivers of each node. Negative receivers are ignored.
+    use_max : int
+        Find largest values if non-zero, otherwise smallest values.
+    out : ndarray of float
+        Values at each node, which are replaced by the largest (or
+        smallest) of the values at the node and all nodes downstream of it.
+    """
+    cdef Py_ssize_t n_nodes = upstream_order.shape[0]
+    cdef Py_ssize_t n_receivers = receivers.shape[1]
+    cdef Py_ssize_t i
+    cdef Py_ssize_t k
+    cdef INT_t node
+    cdef INT_t downstream
+
+    with nogil:
+        for i in range(n_nodes):
+            node = upstream_order[i]
+            for k in range(n_receivers):
+                downstream = receivers[node, k]
+                if downstream < 0 or downstream == node:
+                    continue
+                if use_max:
+                    if out[downstream] > out[node]:
+                        out[node] = out[downstream]
+                elif out[downstream] < out[node]:
+                    out[node] = out[downstream]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def sort_upstream(const INT_t [:, :] receivers, INT_t [:] out):
+    """Order nodes so that each comes after all of its receivers.
+
+    This is a topological (Kahn) sort of the receiver graph. Nodes with no
+    receivers come first, then nodes whose receivers have all been
+    ordered, and so on upstream.
+
+    Parameters
+    ----------
+    receivers : ndarray of int, shape (n_nodes, n_receivers)
+        Receivers of each node. Negative receivers, and nodes that are their
+        own receivers, are ignored.
+    out : ndarray of int
+        Buffer to place the ordered nodes into.
+
+    Returns
+    -------
+    int
+        Number of nodes ordered. This is less than the number of nodes if
+        the receivers contain a cycle.
+    """
+    cdef Py_ssize_t n_nodes = receivers.shape[0]
+    cdef Py_ssize_t n_receivers = receivers.shape[1]
+    cdef INT_t [:] n_unordered = np.zeros(n_nodes, dtype=int)
+    cdef INT_t [:] offset_to_donors = np.zeros(n_nodes + 1, dtype=int)
+    cdef INT_t [:] next_donor = np.empty(n_nodes, dtype=int)
+    cdef INT_t [:] donors = np.empty(n_nodes * n_receivers, dtype=int)
+    cdef Py_ssize_t node
+    cdef Py_ssize_t k
+    cdef Py_ssize_t i
+    cdef Py_ssize_t first = 0
+    cdef Py_ssize_t last = 0
+    cdef INT_t downstream
+    cdef INT_t donor
+
+    with nogil:
+        for node in range(n_nodes):
+            for k in range(n_receivers):
+                downstream = receivers[node, k]
+                if downstream >= 0 and downstream != node:
+                    n_unordered[node] += 1
+                    offset_to_donors[downstream + 1] += 1
+
+        for node in range(n_nodes):
+            offset_to_donors[node + 1] += offset_to_donors[node]
+            next_donor[node] = offset_to_donors[node]
+
+        for node in range(n_nodes):
+            for k in range(n_receivers):
+                downstream = receivers[node, k]
+                if downstream >= 0 and downstream != node:
+                    donors[next_donor[downstream]] = node
+                    next_donor[downstream] += 1
+
+        for node in range(n_nodes):
+            if n_unordered[node] == 0:
+                out[last] = node
+                last += 1
+
+        while first < last:
+            node = out[first]
+            first += 1
+            for i in range(offset_to_donors[node], offset_to_donors[node + 1]):
+                donor = donors[i]
+                n_unordered[donor] -= 1
+                if n_unordered[donor] == 0:
+                    out[last] = donor
+                    last += 1
+
+    return last
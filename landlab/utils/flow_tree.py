@@ -0,0 +1,384 @@
+#! /usr/bin/env python
+"""Accumulate values along the paths that flow takes across a grid.
+
+A flow router (such as :class:`~landlab.components.FlowRouter`) gives each
+node a receiver, the node its flow goes to, and orders the nodes from
+downstream to upstream so that every node comes after its receiver
+(the *flow__upstream_node_order* field). Values that add up along flow
+paths are then found in a single pass over the nodes, in that order.
+
+Passing over the nodes in the reverse order, from upstream to downstream,
+accumulates values from the nodes that drain to each node. Nodes may have
+more than one receiver, given as a 2D array with a column for each
+receiver, in which case values can be split among them by proportion.
+
+Flow paths
+++++++++++
+
+.. autosummary::
+    :toctree: generated/
+
+    ~landlab.utils.flow_tree.integrate_downstream
+    ~landlab.utils.flow_tree.calc_flow_length
+    ~landlab.utils.flow_tree.reduce_downstream
+
+Drainage
+++++++++
+
+.. autosummary::
+    :toctree: generated/
+
+    ~landlab.utils.flow_tree.calc_upstream_order
+    ~landlab.utils.flow_tree.accumulate_upstream
+    ~landlab.utils.flow_tree.reduce_upstream
+"""
+import numpy as np
+
+from .ext.flow_tree import integrate_downstream as _integrate_downstream
+from .ext.flow_tree import accumulate_upstream as _accumulate_upstream
+from .ext.flow_tree import (accumulate_upstream_weighted as
+                            _accumulate_upstream_weighted)
+from .ext.flow_tree import reduce_upstream as _reduce_upstream
+from .ext.flow_tree import reduce_downstream as _reduce_downstream
+from .ext.flow_tree import sort_upstream as _sort_upstream
+
+
+_USE_MAX = {'max': 1, 'min': 0}
+
+
+def _as_receivers(receiver):
+    """Receivers of each node as a 2D array, with a column per receiver."""
+    receiver = np.asarray(receiver, dtype=int)
+    if receiver.ndim == 1:
+        receiver = receiver.reshape((-1, 1))
+    return np.ascontiguousarray(receiver)
+
+
+def _start_with(value, n_nodes, out=None):
+    """Copy values into the buffer that a kernel updates in place."""
+    if out is None:
+        out = np.empty(n_nodes, dtype=float)
+    out[:] = value
+    return out
+
+
+def _use_max(how):
+    try:
+        return _USE_MAX[how]
+    except KeyError:
+        raise ValueError('how must be one of {names}'.format(
+            names=', '.join(sorted(_USE_MAX))))
+
+
+def integrate_downstream(upstream_order, receiver, value, is_sink=None,
+                         out=None):
+    """Sum values along flow paths, from each node down to its sink.
+
+    The sum at a node is its own value plus the sum at its receiver.
+    Flow paths end at nodes that are their own receivers, and at nodes
+    marked as sinks, where the sum is zero.
+
+    Parameters
+    ----------
+    upstream_order : array_like of int
+        Nodes ordered so that each node comes after its receiver.
+    receiver : array_like of int
+        Receiver of each node.
+    value : array_like of float
+        Value for the step from each node to its receiver.
+    is_sink : array_like of bool, optional
+        Nodes, other than those that are their own receivers, at which flow
+        paths end.
+    out : ndarray of float, optional
+        Buffer to place the result into.
+
+    Returns
+    -------
+    ndarray of float
+        Sum of values from each node to its sink.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.utils.flow_tree import integrate_downstream
+    >>> receiver = np.array([0, 0, 1, 2, 1])
+    >>> upstream_order = np.array([0, 1, 2, 3, 4])
+    >>> integrate_downstream(upstream_order, receiver, [0., 1., 2., 3., 4.])
+    array([ 0.,  1.,  3.,  6.,  5.])
+
+    Stop at node 1.
+
+    >>> integrate_downstream(upstream_order, receiver, [0., 1., 2., 3., 4.],
+    ...                      is_sink=[False, True, False, False, False])
+    array([ 0.,  0.,  2.,  5.,  4.])
+    """
+    receiver = np.asarray(receiver, dtype=int)
+    if out is None:
+        out = np.zeros(len(receiver), dtype=float)
+    if is_sink is None:
+        is_sink = np.zeros(len(receiver), dtype=np.uint8)
+    else:
+        is_sink = np.asarray(is_sink, dtype=bool).view(np.uint8)
+
+    _integrate_downstream(np.asarray(upstream_order, dtype=int), receiver,
+                          np.asarray(value, dtype=float), is_sink, out)
+
+    return out
+
+
+def calc_flow_length(grid, is_sink=None, out=None):
+    """Length of the flow path from each node to where it ends.
+
+    With no sinks given, this is the distance along the flow path to the
+    outlet. With channel nodes as sinks, it is the length of the hillslope
+    above the channel.
+
+    Parameters
+    ----------
+    grid : ModelGrid
+        A grid with the *flow__receiver_node*,
+        *flow__upstream_node_order* and *flow__link_to_receiver_node*
+        fields, as set by a flow router.
+    is_sink : array_like of bool, optional
+        Nodes, other than outlets, at which flow paths end.
+    out : ndarray of float, optional
+        Buffer to place the result into.
+
+    Returns
+    -------
+    ndarray of float
+        Flow length at each node.
+
+    Examples
+    --------
+    >>> from landlab import RasterModelGrid
+    >>> from landlab.components import FlowRouter
+    >>> from landlab.utils.flow_tree import calc_flow_length
+    >>> grid = RasterModelGrid((3, 5), spacing=2.)
+    >>> _ = grid.add_field('node', 'topographic__elevation', grid.node_x)
+    >>> grid.set_closed_boundaries_at_grid_edges(True, True, False, True)
+    >>> FlowRouter(grid).run_one_step()
+    >>> calc_flow_length(grid).reshape(grid.shape)
+    array([[ 0.,  0.,  0.,  0.,  0.],
+           [ 0.,  2.,  4.,  6.,  0.],
+           [ 0.,  0.,  0.,  0.,  0.]])
+
+    >>> channel = grid.node_x <= 2.
+    >>> calc_flow_length(grid, is_sink=channel).reshape(grid.shape)
+    array([[ 0.,  0.,  0.,  0.,  0.],
+           [ 0.,  0.,  2.,  4.,  0.],
+           [ 0.,  0.,  0.,  0.,  0.]])
+    """
+    link_to_receiver = grid.at_node['flow__link_to_receiver_node']
+    length_of_step = grid._length_of_link_with_diagonals[link_to_receiver]
+
+    return integrate_downstream(grid.at_node['flow__upstream_node_order'],
+                                grid.at_node['flow__receiver_node'],
+                                length_of_step, is_sink=is_sink, out=out)
+
+
+def calc_upstream_order(receiver, out=None):
+    """Order nodes from downstream to upstream.
+
+    Each node comes after all of its receivers, so that the order can be
+    used to pass values along flow paths. Nodes with no receivers (outlets
+    and pits) come first.
+
+    Parameters
+    ----------
+    receiver : array_like of int
+        Receiver of each node or, as a 2D array, receivers of each node.
+        Nodes that are their own receiver, and negative receivers, are
+        ignored.
+    out : ndarray of int, optional
+        Buffer to place the result into.
+
+    Returns
+    -------
+    ndarray of int
+        Nodes in downstream to upstream order.
+
+    Raises
+    ------
+    ValueError
+        If the receivers form a cycle.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.utils.flow_tree import calc_upstream_order
+    >>> calc_upstream_order([0, 0, 1, 2, 1])
+    array([0, 1, 2, 4, 3])
+
+    Node 4 drains to nodes 1 and 3, so must come after both.
+
+    >>> receivers = [[0, -1], [0, -1], [1, -1], [2, -1], [1, 3]]
+    >>> calc_upstream_order(receivers)
+    array([0, 1, 2, 3, 4])
+
+    >>> calc_upstream_order([1, 2, 0])
+    Traceback (most recent call last):
+    ...
+    ValueError: receivers form a cycle
+    """
+    receivers = _as_receivers(receiver)
+    if out is None:
+        out = np.empty(len(receivers), dtype=int)
+
+    if _sort_upstream(receivers, out) < len(receivers):
+        raise ValueError('receivers form a cycle')
+
+    return out
+
+
+def accumulate_upstream(upstream_order, receiver, value, proportion=None,
+                        out=None):
+    """Sum values over each node and all of the nodes that drain to it.
+
+    Drainage area, for instance, is the accumulation of cell areas, and
+    discharge the accumulation of runoff times cell area.
+
+    Parameters
+    ----------
+    upstream_order : array_like of int
+        Nodes ordered so that each node comes after its receivers.
+    receiver : array_like of int
+        Receiver of each node or, as a 2D array, receivers of each node.
+        Nodes that are their own receiver, and negative receivers, do not
+        pass values on.
+    value : array_like of float
+        Value at each node.
+    proportion : array_like of float, optional
+        Proportion of each node's accumulated value passed to each of its
+        receivers (the same shape as *receiver*). By default, each receiver
+        gets all of it.
+    out : ndarray of float, optional
+        Buffer to place the result into.
+
+    Returns
+    -------
+    ndarray of float
+        Accumulated value at each node.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.utils.flow_tree import accumulate_upstream
+
+    Nodes 2 and 4 drain to node 1, node 3 to node 2, and node 1 to the
+    outlet, node 0.
+
+    >>> receiver = np.array([0, 0, 1, 2, 1])
+    >>> upstream_order = np.array([0, 1, 2, 3, 4])
+    >>> accumulate_upstream(upstream_order, receiver, [1., 1., 1., 1., 1.])
+    array([ 5.,  4.,  2.,  1.,  1.])
+
+    Node 4 now drains to nodes 1 and 3, splitting its value among them.
+
+    >>> receivers = np.array([[0, -1], [0, -1], [1, -1], [2, -1], [1, 3]])
+    >>> proportions = np.array([[1., 0.], [1., 0.], [1., 0.], [1., 0.],
+    ...                         [.25, .75]])
+    >>> upstream_order = np.array([0, 1, 2, 3, 4])
+    >>> accumulate_upstream(upstream_order, receivers, [1., 1., 1., 1., 1.],
+    ...                     proportion=proportions)
+    array([ 5.  ,  4.  ,  2.75,  1.75,  1.  ])
+    """
+    receivers = _as_receivers(receiver)
+    upstream_order = np.asarray(upstream_order, dtype=int)
+    out = _start_with(value, len(receivers), out=out)
+
+    if proportion is None:
+        _accumulate_upstream(upstream_order, receivers, out)
+    else:
+        proportion = np.ascontiguousarray(proportion, dtype=float).reshape(
+            receivers.shape)
+        _accumulate_upstream_weighted(upstream_order, receivers, proportion,
+                                      out)
+
+    return out
+
+
+def reduce_upstream(upstream_order, receiver, value, how='max', out=None):
+    """Largest, or smallest, value over each node and the nodes upstream.
+
+    Parameters
+    ----------
+    upstream_order : array_like of int
+        Nodes ordered so that each node comes after its receivers.
+    receiver : array_like of int
+        Receiver of each node or, as a 2D array, receivers of each node.
+    value : array_like of float
+        Value at each node.
+    how : {'max', 'min'}, optional
+        Find the largest or the smallest value.
+    out : ndarray of float, optional
+        Buffer to place the result into.
+
+    Returns
+    -------
+    ndarray of float
+        Largest (or smallest) value upstream of each node.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.utils.flow_tree import reduce_upstream
+    >>> receiver = np.array([0, 0, 1, 2, 1])
+    >>> upstream_order = np.array([0, 1, 2, 3, 4])
+    >>> reduce_upstream(upstream_order, receiver, [0., 1., 2., 3., 4.])
+    array([ 4.,  4.,  3.,  3.,  4.])
+    >>> reduce_upstream(upstream_order, receiver, [5., 1., 2., 3., 4.],
+    ...                 how='min')
+    array([ 1.,  1.,  2.,  3.,  4.])
+    """
+    use_max = _use_max(how)
+    receivers = _as_receivers(receiver)
+    out = _start_with(value, len(receivers), out=out)
+
+    _reduce_upstream(np.asarray(upstream_order, dtype=int), receivers,
+                     use_max, out)
+
+    return out
+
+
+def reduce_downstream(upstream_order, receiver, value, how='max', out=None):
+    """Largest, or smallest, value over each node and the nodes downstream.
+
+    Parameters
+    ----------
+    upstream_order : array_like of int
+        Nodes ordered so that each node comes after its receivers.
+    receiver : array_like of int
+        Receiver of each node or, as a 2D array, receivers of each node.
+    value : array_like of float
+        Value at each node.
+    how : {'max', 'min'}, optional
+        Find the largest or the smallest value.
+    out : ndarray of float, optional
+        Buffer to place the result into.
+
+    Returns
+    -------
+    ndarray of float
+        Largest (or smallest) value downstream of each node.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab.utils.flow_tree import reduce_downstream
+    >>> receiver = np.array([0, 0, 1, 2, 1])
+    >>> upstream_order = np.array([0, 1, 2, 3, 4])
+    >>> reduce_downstream(upstream_order, receiver, [0., 5., 2., 3., 4.])
+    array([ 0.,  5.,  5.,  5.,  5.])
+    >>> reduce_downstream(upstream_order, receiver, [9., 5., 2., 3., 4.],
+    ...                   how='min')
+    array([ 9.,  5.,  2.,  2.,  4.])
+    """
+    use_max = _use_max(how)
+    receivers = _as_receivers(receiver)
+    out = _start_with(value, len(receivers), out=out)
+
+    _reduce_downstream(np.asarray(upstream_order, dtype=int), receivers,
+                       use_max, out)
+
+    return out
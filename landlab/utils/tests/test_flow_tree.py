@@ -0,0 +1,116 @@
+import numpy as np
+from numpy.testing import assert_array_almost_equal
+from nose.tools import assert_raises
+
+from landlab import RasterModelGrid
+from landlab.components import FlowRouter
+from landlab.utils.flow_tree import (calc_flow_length, accumulate_upstream,
+                                     reduce_upstream, reduce_downstream)
+
+
+def _walk_to_sink(grid, node, is_sink):
+    """Flow length found by stepping down the flow path."""
+    receiver = grid.at_node['flow__receiver_node']
+    link = grid.at_node['flow__link_to_receiver_node']
+    length = 0.
+    while receiver[node] != node and not is_sink[node]:
+        length += grid._length_of_link_with_diagonals[link[node]]
+        node = receiver[node]
+    return length
+
+
+def _routed_grid():
+    """A grid, with random topography, over which flow has been routed."""
+    grid = RasterModelGrid((20, 30), spacing=2.)
+    np.random.seed(1945)
+    grid.add_field('node', 'topographic__elevation',
+                   np.random.rand(grid.number_of_nodes) + grid.node_y)
+    FlowRouter(grid).run_one_step()
+    return grid
+
+
+def _nodes_upstream(receiver, node):
+    """The node, and all nodes whose flow paths pass through it."""
+    upstream = []
+    for donor in range(len(receiver)):
+        downstream = donor
+        while True:
+            if downstream == node:
+                upstream.append(donor)
+                break
+            if receiver[downstream] == downstream:
+                break
+            downstream = receiver[downstream]
+    return upstream
+
+
+def test_flow_length_matches_walk():
+    """Flow lengths are those found by walking down each flow path."""
+    grid = RasterModelGrid((20, 30), spacing=2.)
+    np.random.seed(1945)
+    grid.add_field('node', 'topographic__elevation',
+                   np.random.rand(grid.number_of_nodes) + grid.node_y)
+    FlowRouter(grid).run_one_step()
+    is_channel = grid.at_node['drainage_area'] > 20.
+
+    for is_sink in (np.zeros(grid.number_of_nodes, dtype=bool), is_channel):
+        expected = [_walk_to_sink(grid, node, is_sink)
+                    for node in range(grid.number_of_nodes)]
+        assert_array_almost_equal(calc_flow_length(grid, is_sink=is_sink),
+                                  expected)
+
+
+def test_flow_length_out_keyword():
+    """Flow lengths are placed into a buffer."""
+    grid = RasterModelGrid((4, 5))
+    grid.add_field('node', 'topographic__elevation', grid.node_x)
+    FlowRouter(grid).run_one_step()
+    out = np.empty(grid.number_of_nodes)
+    assert calc_flow_length(grid, out=out) is out
+
+
+def test_accumulate_upstream_is_drainage_area():
+    """Accumulated cell areas are the router's drainage areas."""
+    grid = _routed_grid()
+    area = accumulate_upstream(grid.at_node['flow__upstream_node_order'],
+                               grid.at_node['flow__receiver_node'],
+                               grid.cell_area_at_node)
+    assert_array_almost_equal(area, grid.at_node['drainage_area'])
+
+
+def test_accumulate_upstream_proportions_of_one():
+    """Giving all of a node's value to one receiver changes nothing."""
+    grid = _routed_grid()
+    order = grid.at_node['flow__upstream_node_order']
+    receiver = grid.at_node['flow__receiver_node']
+    receivers = np.column_stack((receiver, np.full_like(receiver, -1)))
+    proportions = np.zeros(receivers.shape)
+    proportions[:, 0] = 1.
+    value = np.random.rand(grid.number_of_nodes)
+
+    assert_array_almost_equal(
+        accumulate_upstream(order, receivers, value, proportion=proportions),
+        accumulate_upstream(order, receiver, value))
+
+
+def test_reduce_matches_walk():
+    """Largest and smallest values are those found up and down flow paths."""
+    grid = _routed_grid()
+    order = grid.at_node['flow__upstream_node_order']
+    receiver = grid.at_node['flow__receiver_node']
+    value = np.random.rand(grid.number_of_nodes)
+
+    upstream_max = reduce_upstream(order, receiver, value, how='max')
+    downstream_min = reduce_downstream(order, receiver, value, how='min')
+    for node in range(0, grid.number_of_nodes, 7):
+        assert upstream_max[node] == value[_nodes_upstream(receiver,
+                                                           node)].max()
+        path = [node]
+        while receiver[path[-1]] != path[-1]:
+            path.append(receiver[path[-1]])
+        assert downstream_min[node] == value[path].min()
+
+
+def test_reduce_bad_how():
+    """Only max and min reductions are allowed."""
+    assert_raises(ValueError, reduce_upstream, [0], [0], [1.], how='sum')
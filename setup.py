@@ -24,10 +24,10 @@ ext_modules = [
               ['landlab/components/flow_routing/cfuncs.pyx']),
     Extension('landlab.components.stream_power.cfuncs',
               ['landlab/components/stream_power/cfuncs.pyx']),
-    Extension('landlab.components.drainage_density.cfuncs',
-              ['landlab/components/drainage_density/cfuncs.pyx']),
     Extension('landlab.utils.ext.jaggedarray',
               ['landlab/utils/ext/jaggedarray.pyx']),
+    Extension('landlab.utils.ext.flow_tree',
+              ['landlab/utils/ext/flow_tree.pyx']),
     Extension('landlab.graph.structured_quad.ext.at_node',
               ['landlab/graph/structured_quad/ext/at_node.pyx']),
     Extension('landlab.graph.structured_quad.ext.at_link',